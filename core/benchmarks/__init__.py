@@ -0,0 +1,10 @@
+"""Performance benchmarks for the framework runtime.
+
+Benchmarks are standalone scripts, not part of the pytest suite::
+
+    cd core && python -m benchmarks.event_bus_publish
+
+``runtime_throughput`` drives whole graphs through AgentRuntime with the
+deterministic provider in ``scripted_llm`` and the graphs in ``scenarios``;
+CI runs it with ``--check`` against ``baselines/runtime_throughput.json``.
+"""
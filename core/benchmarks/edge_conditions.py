@@ -0,0 +1,88 @@
+"""Edge-condition evaluation benchmark.
+
+Evaluates typical ``condition_expr`` strings against a realistic memory
+snapshot with the compiled evaluator (``safe_eval``), the AST-walking
+reference (``safe_eval_uncompiled``) and through ``EdgeSpec`` itself.
+
+Usage::
+
+    cd core && python -m benchmarks.edge_conditions
+    python -m benchmarks.edge_conditions --iterations 50000 --memory-keys 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from framework.graph.edge import EdgeCondition, EdgeSpec
+from framework.graph.safe_eval import safe_eval, safe_eval_uncompiled
+
+EXPRESSIONS = [
+    "needs_more_research == True",
+    "str(approved).lower() == 'true'",
+    "output.get('confidence', 0) >= 0.7 and len(findings) > 2",
+    "1 <= attempt < 5 or memory.get('force_retry')",
+]
+
+
+def _memory(keys: int) -> dict:
+    memory = {f"key_{i}": f"value {i}" * 10 for i in range(keys)}
+    memory.update(
+        needs_more_research=False,
+        approved="True",
+        findings=["a", "b", "c"],
+        attempt=2,
+    )
+    return memory
+
+
+def _time(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run(iterations: int, memory_keys: int) -> dict[str, float]:
+    """Run the benchmark and return mean microseconds per evaluation per variant."""
+    memory = _memory(memory_keys)
+    output = {"confidence": 0.9}
+    context = {"output": output, "memory": memory, **memory}
+    edges = [
+        EdgeSpec(
+            id=f"e{i}",
+            source="a",
+            target="b",
+            condition=EdgeCondition.CONDITIONAL,
+            condition_expr=expr,
+        )
+        for i, expr in enumerate(EXPRESSIONS)
+    ]
+
+    results = {
+        "uncompiled": _time(
+            lambda: [safe_eval_uncompiled(e, context) for e in EXPRESSIONS], iterations
+        ),
+        "compiled": _time(lambda: [safe_eval(e, context) for e in EXPRESSIONS], iterations),
+        # Includes building the per-edge context from output and memory
+        "edge": _time(
+            lambda: [edge._evaluate_condition(output, memory) for edge in edges], iterations
+        ),
+    }
+    for name, us in results.items():
+        print(f"{name:10s} {us / len(EXPRESSIONS):8.2f} us/condition")
+    print(f"speedup (compiled vs uncompiled): {results['uncompiled'] / results['compiled']:.1f}x")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--memory-keys", type=int, default=50, help="Extra keys in shared memory")
+    args = parser.parse_args()
+    run(args.iterations, args.memory_keys)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""EventBus publish microbenchmark.
+
+Publishes a stream of events (mostly ``LLM_TEXT_DELTA``, like a busy
+runtime) to a bus with many per-execution subscriptions — the shape
+``wait_for`` and the TUI produce — and reports publish throughput.
+
+Usage::
+
+    cd core && python -m benchmarks.event_bus_publish
+    python -m benchmarks.event_bus_publish --events 200000 --subscribers 500 --baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from framework.runtime.event_bus import AgentEvent, EventBus, EventType, Subscription
+
+
+class LinearScanEventBus(EventBus):
+    """Reference bus that scans every subscription, for comparison."""
+
+    def _matching_subscriptions(self, event: AgentEvent) -> list[Subscription]:
+        return [s for s in self._subscriptions.values() if self._matches(s, event)]
+
+
+def _build_bus(bus_cls: type[EventBus], subscribers: int, executions: int) -> tuple[EventBus, list]:
+    bus = bus_cls()
+    hits = [0]
+
+    async def handler(event: AgentEvent) -> None:
+        hits[0] += 1
+
+    # A couple of global observers (TUI, runtime logger)
+    bus.subscribe([EventType.LLM_TEXT_DELTA, EventType.TOOL_CALL_COMPLETED], handler)
+    bus.subscribe([EventType.EXECUTION_COMPLETED, EventType.EXECUTION_FAILED], handler)
+    # Per-execution waiters spread over the live executions
+    for i in range(subscribers - 2):
+        bus.subscribe(
+            [EventType.EXECUTION_COMPLETED, EventType.CLIENT_INPUT_REQUESTED],
+            handler,
+            filter_execution=f"exec-{i % executions}",
+            filter_stream="default",
+        )
+    return bus, hits
+
+
+def _build_events(count: int, executions: int) -> list[AgentEvent]:
+    events = []
+    for i in range(count):
+        # ~98% deltas, the rest tool/lifecycle events
+        if i % 50 == 0:
+            event_type = EventType.TOOL_CALL_COMPLETED
+        elif i % 997 == 0:
+            event_type = EventType.EXECUTION_COMPLETED
+        else:
+            event_type = EventType.LLM_TEXT_DELTA
+        events.append(
+            AgentEvent(
+                type=event_type,
+                stream_id="default",
+                node_id="node",
+                execution_id=f"exec-{i % executions}",
+                data={"content": "x", "snapshot": "x"},
+            )
+        )
+    return events
+
+
+async def _run(bus: EventBus, events: list[AgentEvent]) -> float:
+    start = time.perf_counter()
+    for event in events:
+        await bus.publish(event)
+    return time.perf_counter() - start
+
+
+def run(events: int, subscribers: int, executions: int, baseline: bool) -> dict[str, float]:
+    """Run the benchmark and return events/sec per bus implementation."""
+    payload = _build_events(events, executions)
+    variants: list[tuple[str, type[EventBus]]] = [("indexed", EventBus)]
+    if baseline:
+        variants.append(("linear_scan", LinearScanEventBus))
+
+    results: dict[str, float] = {}
+    for name, bus_cls in variants:
+        bus, hits = _build_bus(bus_cls, subscribers, executions)
+        elapsed = asyncio.run(_run(bus, payload))
+        results[name] = events / elapsed
+        print(
+            f"{name:12s} {events:>9,d} events  {subscribers} subs  "
+            f"{elapsed:7.2f}s  {events / elapsed:>12,.0f} events/s  ({hits[0]:,d} deliveries)"
+        )
+    if baseline:
+        print(f"speedup: {results['indexed'] / results['linear_scan']:.1f}x")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--subscribers", type=int, default=500)
+    parser.add_argument("--executions", type=int, default=100)
+    parser.add_argument(
+        "--baseline", action="store_true", help="Also run a linear-scan bus for comparison"
+    )
+    args = parser.parse_args()
+    run(args.events, args.subscribers, args.executions, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""hive-tools MCP server cold-start benchmark.
+
+Spawns ``tools/mcp_server.py --stdio`` through ``MCPClient`` the way an agent
+does and times connect + first ``list_tools`` (and the first tool call) for
+lazy registration, eager registration and a ``--tools`` subset.
+
+Usage::
+
+    cd core && python -m benchmarks.mcp_server_startup
+    python -m benchmarks.mcp_server_startup --repeat 5 --tools "web_*,save_data"
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from framework.runner.mcp_client import MCPClient, MCPServerConfig
+
+TOOLS_DIR = Path(__file__).resolve().parents[2] / "tools"
+
+
+def _cold_start(args: list[str]) -> tuple[float, float, int]:
+    """Return (seconds to list_tools, seconds to first call, tool count)."""
+    config = MCPServerConfig(
+        name="hive-tools",
+        transport="stdio",
+        command=sys.executable,
+        args=["mcp_server.py", "--stdio", *args],
+        cwd=str(TOOLS_DIR),
+    )
+    start = time.perf_counter()
+    client = MCPClient(config)
+    try:
+        client.connect()
+        tools = client.list_tools()
+        listed = time.perf_counter() - start
+        client.call_tool("get_current_time", {"timezone": "UTC"})
+        called = time.perf_counter() - start
+    finally:
+        client.disconnect()
+    return listed, called, len(tools)
+
+
+def run(repeat: int, tools: str) -> dict[str, float]:
+    """Run the benchmark and return median seconds to ``list_tools`` per variant."""
+    variants = {
+        "lazy": [],
+        "eager": ["--eager"],
+        "subset": ["--tools", f"get_current_time,{tools}"],
+    }
+    results: dict[str, float] = {}
+    for name, args in variants.items():
+        samples = [_cold_start(args) for _ in range(repeat)]
+        listed = statistics.median(s[0] for s in samples)
+        called = statistics.median(s[1] for s in samples)
+        results[name] = listed
+        print(
+            f"{name:8s} {samples[0][2]:>4d} tools  list_tools {listed:6.2f}s  "
+            f"first call {called:6.2f}s"
+        )
+    print(f"speedup (lazy vs eager): {results['eager'] / results['lazy']:.1f}x")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--tools", default="web_search,web_scrape,save_data,load_data", help="Subset variant tools"
+    )
+    args = parser.parse_args()
+    run(args.repeat, args.tools)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+"""End-to-end runtime throughput benchmark.
+
+Pushes scenario graphs (see ``benchmarks.scenarios``) through
+AgentRuntime -> ExecutionStream -> GraphExecutor -> EventLoopNode with a
+``ScriptedLLMProvider``, configured the way AgentRunner configures
+production agents (buffered runtime logs, checkpoints after each node).
+Runs offline and reports, per scenario:
+
+- throughput (executions/sec) and p50/p99 execution latency
+- p50/p99 turn latency: time from one LLM call to the next within a node
+  visit (scripted model latency plus tool execution, persistence, event
+  publishing and judging)
+- event-bus overhead: events published and time spent publishing them
+- storage write amplification: files opened for writing, files left on disk
+  and bytes written, per execution and per turn
+- RSS after the run and its growth during it
+
+``--save`` writes the results as JSON; ``--check`` compares a run with a
+saved baseline and exits non-zero when a metric in it regresses by more
+than ``--tolerance``. The checked-in baseline holds only the counters that
+do not depend on the machine (calls, events, writes), so CI can gate on it.
+
+Usage::
+
+    cd core && python -m benchmarks.runtime_throughput
+    python -m benchmarks.runtime_throughput --scenarios linear,hitl --executions 500 \\
+        --concurrency 50 --latency-ms 20
+    python -m benchmarks.runtime_throughput --check benchmarks/baselines/runtime_throughput.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.scenarios import LOOKUP_TOOL, SCENARIOS, Scenario, lookup_executor
+from benchmarks.scripted_llm import ScriptedLLMProvider
+from framework.graph.checkpoint_config import CheckpointConfig
+from framework.runtime.agent_runtime import AgentRuntime, AgentRuntimeConfig
+from framework.runtime.event_bus import EventType
+from framework.runtime.execution_stream import EntryPointSpec
+from framework.runtime.runtime_log_store import RuntimeLogStore
+
+BASELINE = Path(__file__).parent / "baselines" / "runtime_throughput.json"
+
+# Metrics compared by --check, and whether a higher value is better
+CHECKED_METRICS = {
+    "executions_per_sec": True,
+    "execution_p99_ms": False,
+    "turn_p99_ms": False,
+    "llm_calls_per_execution": False,
+    "events_per_execution": False,
+    "file_writes_per_execution": False,
+    "files_per_execution": False,
+    "kb_per_execution": False,
+}
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_RDWR | os.O_APPEND | os.O_CREAT
+
+
+class FileWriteCounter:
+    """Counts files opened for writing under a directory, from any thread.
+
+    Uses an audit hook, so it sees every ``open()`` / ``os.open()`` the
+    framework makes without patching it. Hooks cannot be removed; the
+    counter installs one per process and ignores events while no directory
+    is being watched.
+    """
+
+    _installed: FileWriteCounter | None = None
+
+    def __init__(self) -> None:
+        self.root: str | None = None
+        self.count = 0
+
+    @classmethod
+    def get(cls) -> FileWriteCounter:
+        if cls._installed is None:
+            cls._installed = cls()
+            sys.addaudithook(cls._installed._hook)
+        return cls._installed
+
+    def watch(self, root: Path | None) -> None:
+        self.root = str(root) if root is not None else None
+        self.count = 0
+
+    def _hook(self, event: str, args: tuple) -> None:
+        if event != "open" or self.root is None:
+            return
+        path, mode, flags = args
+        if isinstance(path, int):
+            return
+        writing = any(c in mode for c in "wax+") if mode else bool(flags & _WRITE_FLAGS)
+        if writing and os.fsdecode(path).startswith(self.root):
+            self.count += 1
+
+
+def _rss_mb() -> float:
+    """Current resident set size in MB (peak RSS where /proc is unavailable; 0 on Windows)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+def _disk_usage(root: Path) -> tuple[int, int]:
+    files = size = 0
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            files += 1
+            size += os.path.getsize(os.path.join(dirpath, name))
+    return files, size
+
+
+async def run_scenario(
+    scenario: Scenario,
+    storage_path: Path,
+    executions: int,
+    concurrency: int,
+    latency_ms: float = 0.0,
+    chunk_latency_ms: float = 0.0,
+    tool_result_chars: int = 400,
+    timeout: float = 60.0,
+) -> dict[str, Any]:
+    """Run ``executions`` executions of a scenario and return its metrics."""
+    # NodeResult.to_summary() asks the Anthropic API for node summaries when
+    # a key is set; keep runs offline and deterministic.
+    api_key = os.environ.pop("ANTHROPIC_API_KEY", None)
+    try:
+        return await _run_scenario(
+            scenario,
+            storage_path,
+            executions,
+            concurrency,
+            latency_ms,
+            chunk_latency_ms,
+            tool_result_chars,
+            timeout,
+        )
+    finally:
+        if api_key is not None:
+            os.environ["ANTHROPIC_API_KEY"] = api_key
+
+
+async def _run_scenario(
+    scenario: Scenario,
+    storage_path: Path,
+    executions: int,
+    concurrency: int,
+    latency_ms: float,
+    chunk_latency_ms: float,
+    tool_result_chars: int,
+    timeout: float,
+) -> dict[str, Any]:
+    llm = ScriptedLLMProvider(
+        scenario.scripts, latency_ms=latency_ms, chunk_latency_ms=chunk_latency_ms
+    )
+    runtime = AgentRuntime(
+        graph=scenario.graph,
+        goal=scenario.goal,
+        storage_path=storage_path,
+        llm=llm,
+        tools=[LOOKUP_TOOL],
+        tool_executor=lookup_executor(tool_result_chars),
+        config=AgentRuntimeConfig(max_concurrent_executions=concurrency),
+        runtime_log_store=RuntimeLogStore(storage_path / "runtime_logs", buffered=True),
+        checkpoint_config=CheckpointConfig(
+            enabled=True,
+            checkpoint_on_node_start=False,
+            checkpoint_on_node_complete=True,
+            async_checkpoint=True,
+        ),
+    )
+    runtime.register_entry_point(
+        EntryPointSpec(
+            id="start",
+            name="Start",
+            entry_node=scenario.graph.entry_node,
+            trigger_type="manual",
+            isolation_level="isolated",
+        )
+    )
+
+    # Time every publish (emit_* helpers and scoped buses all go through it)
+    bus = runtime.event_bus
+    publish = bus.publish
+    bus_stats = {"events": 0, "seconds": 0.0}
+
+    async def timed_publish(event):
+        start = time.perf_counter()
+        try:
+            return await publish(event)
+        finally:
+            bus_stats["events"] += 1
+            bus_stats["seconds"] += time.perf_counter() - start
+
+    bus.publish = timed_publish
+
+    if scenario.client_facing:
+
+        async def answer(event):
+            await runtime.inject_input(
+                event.node_id, "Yes, go ahead.", execution_id=event.execution_id
+            )
+
+        runtime.subscribe_to_events([EventType.CLIENT_INPUT_REQUESTED], answer)
+
+    writes = FileWriteCounter.get()
+    writes.watch(storage_path)
+    rss_before = _rss_mb()
+    latencies: list[float] = []
+    failures = 0
+    slots = asyncio.Semaphore(concurrency)
+
+    async def one(index: int) -> None:
+        nonlocal failures
+        async with slots:
+            start = time.perf_counter()
+            result = await runtime.trigger_and_wait(
+                "start", {**scenario.input_data, "index": str(index)}, timeout=timeout
+            )
+            latencies.append(time.perf_counter() - start)
+            if result is None or not result.success:
+                failures += 1
+
+    await runtime.start()
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(one(i) for i in range(executions)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await runtime.stop()
+    rss_after = _rss_mb()
+    file_writes = writes.count
+    writes.watch(None)
+    files, size = _disk_usage(storage_path)
+
+    return {
+        "executions": executions,
+        "failures": failures,
+        "elapsed_s": round(elapsed, 3),
+        "executions_per_sec": round(executions / elapsed, 2),
+        "execution_p50_ms": round(_percentile(latencies, 50) * 1000, 2),
+        "execution_p99_ms": round(_percentile(latencies, 99) * 1000, 2),
+        "turn_p50_ms": round(_percentile(llm.turn_latencies, 50) * 1000, 3),
+        "turn_p99_ms": round(_percentile(llm.turn_latencies, 99) * 1000, 3),
+        "llm_calls_per_execution": round(llm.calls / executions, 2),
+        "events_per_execution": round(bus_stats["events"] / executions, 2),
+        "event_publish_us": round(bus_stats["seconds"] / max(bus_stats["events"], 1) * 1e6, 1),
+        "file_writes_per_execution": round(file_writes / executions, 2),
+        "file_writes_per_turn": round(file_writes / max(llm.calls, 1), 2),
+        "files_per_execution": round(files / executions, 2),
+        "kb_per_execution": round(size / executions / 1024, 2),
+        "rss_mb": round(rss_after, 1),
+        "rss_growth_mb": round(rss_after - rss_before, 1),
+    }
+
+
+def run(
+    scenarios: list[str],
+    executions: int,
+    concurrency: int,
+    latency_ms: float = 0.0,
+    chunk_latency_ms: float = 0.0,
+    tool_result_chars: int = 400,
+    storage: Path | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Run the benchmark and return metrics per scenario."""
+    results: dict[str, dict[str, Any]] = {}
+    for name in scenarios:
+        with tempfile.TemporaryDirectory(prefix=f"bench-{name}-", dir=storage) as tmp:
+            metrics = asyncio.run(
+                run_scenario(
+                    SCENARIOS[name](),
+                    Path(tmp),
+                    executions,
+                    concurrency,
+                    latency_ms,
+                    chunk_latency_ms,
+                    tool_result_chars,
+                )
+            )
+        results[name] = metrics
+        print(
+            f"{name:9s} {executions:,d} executions  {metrics['elapsed_s']:7.2f}s  "
+            f"{metrics['executions_per_sec']:>8,.1f} exec/s  "
+            f"exec p50 {metrics['execution_p50_ms']:.1f}ms "
+            f"p99 {metrics['execution_p99_ms']:.1f}ms  "
+            f"turn p50 {metrics['turn_p50_ms']:.2f}ms p99 {metrics['turn_p99_ms']:.2f}ms"
+        )
+        print(
+            f"{'':9s} {metrics['llm_calls_per_execution']:g} turns, "
+            f"{metrics['events_per_execution']:g} events "
+            f"({metrics['event_publish_us']:g}us each), "
+            f"{metrics['file_writes_per_execution']:g} file writes "
+            f"({metrics['file_writes_per_turn']:g}/turn), "
+            f"{metrics['kb_per_execution']:g}KB on disk per execution  "
+            f"RSS {metrics['rss_mb']:.0f}MB (+{metrics['rss_growth_mb']:.1f})  "
+            f"failures {metrics['failures']}"
+        )
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]], tolerance: float
+) -> list[str]:
+    """Regressions of ``results`` against ``baseline``, as readable lines."""
+    problems = []
+    for scenario, metrics in results.items():
+        if metrics["failures"]:
+            problems.append(f"{scenario}: {metrics['failures']} executions failed")
+        for metric, expected in baseline.get(scenario, {}).items():
+            higher_is_better = CHECKED_METRICS.get(metric)
+            if higher_is_better is None or metric not in metrics:
+                continue
+            actual = metrics[metric]
+            if higher_is_better:
+                regressed = actual < expected * (1 - tolerance)
+            else:
+                regressed = actual > expected * (1 + tolerance)
+            if regressed:
+                problems.append(f"{scenario}: {metric} {actual:g} vs baseline {expected:g}")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated")
+    parser.add_argument("--executions", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Scripted LLM call latency")
+    parser.add_argument(
+        "--chunk-latency-ms", type=float, default=0.0, help="Delay between streamed chunks"
+    )
+    parser.add_argument("--tool-result-chars", type=int, default=400)
+    parser.add_argument("--storage", type=Path, help="Directory for the per-run storage")
+    parser.add_argument("--save", type=Path, help="Write results as JSON")
+    parser.add_argument("--check", type=Path, nargs="?", const=BASELINE, help="Baseline JSON")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed relative regression for --check"
+    )
+    args = parser.parse_args()
+    # The runtime logs routine warnings per execution; keep the report readable
+    logging.getLogger("framework").setLevel(logging.ERROR)
+
+    names = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(
+            f"unknown scenarios: {', '.join(unknown)} (choose from {', '.join(SCENARIOS)})"
+        )
+    results = run(
+        names,
+        args.executions,
+        args.concurrency,
+        args.latency_ms,
+        args.chunk_latency_ms,
+        args.tool_result_chars,
+        args.storage,
+    )
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+    if args.check:
+        problems = compare(results, json.loads(args.check.read_text()), args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            sys.exit(1)
+        print(f"no regressions against {args.check}")
+
+
+if __name__ == "__main__":
+    main()
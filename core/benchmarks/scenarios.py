@@ -0,0 +1,222 @@
+"""Scenario graphs for runtime benchmarks.
+
+Each scenario pairs a graph with the ``NodeScript`` for every node, so a
+``ScriptedLLMProvider`` can drive it end to end:
+
+- ``linear``: intake -> research (rounds of parallel tool calls) -> report
+- ``fanout``: plan -> N parallel branches with tool calls -> merge
+- ``feedback``: draft <-> review until the reviewer approves, then publish
+- ``hitl``: client-facing greet (asks the user) -> work -> client-facing
+  confirm; the runner answers every ``ask_user`` as soon as it is requested
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+
+from benchmarks.scripted_llm import NodeScript, node_marker
+from framework.graph import Goal, NodeSpec, SuccessCriterion
+from framework.graph.edge import EdgeCondition, EdgeSpec, GraphSpec
+from framework.llm.provider import Tool, ToolResult, ToolUse
+
+LOOKUP_TOOL = Tool(
+    name="lookup",
+    description="Look up reference data for a query.",
+    parameters={
+        "type": "object",
+        "properties": {"query": {"type": "string", "description": "What to look up"}},
+        "required": ["query"],
+    },
+)
+
+
+def lookup_executor(result_chars: int = 400):
+    """Tool executor answering ``lookup`` calls with a ``result_chars``-sized JSON payload."""
+    filler = "x" * max(result_chars - 40, 0)
+
+    def execute(tool_use: ToolUse) -> ToolResult:
+        content = json.dumps({"query": tool_use.input.get("query", ""), "data": filler})
+        return ToolResult(tool_use_id=tool_use.id, content=content)
+
+    return execute
+
+
+@dataclass
+class Scenario:
+    """A benchmark graph and the scripts that drive its nodes."""
+
+    name: str
+    graph: GraphSpec
+    goal: Goal
+    scripts: dict[str, NodeScript]
+    input_data: dict[str, str] = field(default_factory=dict)
+    client_facing: bool = False  # Executions wait for user input
+
+
+def _goal(name: str) -> Goal:
+    return Goal(
+        id=f"bench-{name}",
+        name=f"Benchmark {name}",
+        description=f"Drive the {name} benchmark graph to completion",
+        success_criteria=[
+            SuccessCriterion(
+                id="done",
+                description="Final output produced",
+                metric="output_contains",
+                target="done",
+            )
+        ],
+        constraints=[],
+    )
+
+
+def _node(
+    node_id: str,
+    input_keys: list[str],
+    output_keys: list[str],
+    client_facing: bool = False,
+) -> NodeSpec:
+    return NodeSpec(
+        id=node_id,
+        name=node_id.replace("_", " ").title(),
+        description=f"Benchmark node {node_id}",
+        node_type="event_loop",
+        input_keys=input_keys,
+        output_keys=output_keys,
+        client_facing=client_facing,
+        system_prompt=f"{node_marker(node_id)} Produce {', '.join(output_keys) or 'a reply'}.",
+    )
+
+
+def _edge(source: str, target: str, condition_expr: str | None = None) -> EdgeSpec:
+    return EdgeSpec(
+        id=f"{source}-to-{target}",
+        source=source,
+        target=target,
+        condition=EdgeCondition.CONDITIONAL if condition_expr else EdgeCondition.ON_SUCCESS,
+        condition_expr=condition_expr,
+    )
+
+
+def _graph(name: str, nodes: list[NodeSpec], edges: list[EdgeSpec], terminal: str) -> GraphSpec:
+    return GraphSpec(
+        id=f"bench-{name}",
+        goal_id=f"bench-{name}",
+        version="1.0.0",
+        entry_node=nodes[0].id,
+        entry_points={"start": nodes[0].id},
+        terminal_nodes=[terminal],
+        pause_nodes=[],
+        nodes=nodes,
+        edges=edges,
+        default_model="scripted",
+        max_tokens=1024,
+        max_steps=50,
+    )
+
+
+def linear(tool_rounds: int = 2, tools_per_round: int = 2) -> Scenario:
+    nodes = [
+        _node("intake", ["request"], ["topic"]),
+        _node("research", ["topic"], ["findings"]),
+        _node("report", ["findings"], ["result"]),
+    ]
+    scripts = {
+        "intake": NodeScript(outputs=({"topic": "benchmarks"},)),
+        "research": NodeScript(
+            outputs=({"findings": "three findings"},),
+            tool_rounds=tool_rounds,
+            tools_per_round=tools_per_round,
+        ),
+        "report": NodeScript(outputs=({"result": "done"},), reply_chunks=16),
+    }
+    edges = [_edge("intake", "research"), _edge("research", "report")]
+    return Scenario(
+        "linear",
+        _graph("linear", nodes, edges, "report"),
+        _goal("linear"),
+        scripts,
+        input_data={"request": "summarize runtime performance"},
+    )
+
+
+def fanout(branches: int = 3, tool_rounds: int = 1, tools_per_round: int = 2) -> Scenario:
+    branch_ids = [f"branch_{i}" for i in range(branches)]
+    nodes = [_node("plan", ["request"], ["plan"])]
+    nodes += [_node(b, ["plan"], [f"{b}_out"]) for b in branch_ids]
+    nodes.append(_node("merge", [f"{b}_out" for b in branch_ids], ["result"]))
+    scripts = {
+        "plan": NodeScript(outputs=({"plan": "split"},)),
+        "merge": NodeScript(outputs=({"result": "done"},)),
+    }
+    for b in branch_ids:
+        scripts[b] = NodeScript(
+            outputs=({f"{b}_out": f"{b} result"},),
+            tool_rounds=tool_rounds,
+            tools_per_round=tools_per_round,
+        )
+    edges = [_edge("plan", b) for b in branch_ids] + [_edge(b, "merge") for b in branch_ids]
+    return Scenario(
+        "fanout",
+        _graph("fanout", nodes, edges, "merge"),
+        _goal("fanout"),
+        scripts,
+        input_data={"request": "research three angles"},
+    )
+
+
+def feedback(revisions: int = 2) -> Scenario:
+    nodes = [
+        _node("draft", ["request", "feedback"], ["draft"]),
+        _node("review", ["draft"], ["verdict", "feedback"]),
+        _node("publish", ["draft"], ["result"]),
+    ]
+    verdicts = tuple(
+        {"verdict": "revise", "feedback": f"round {i}: tighten it"} for i in range(revisions)
+    ) + ({"verdict": "approve", "feedback": "ship it"},)
+    scripts = {
+        "draft": NodeScript(
+            outputs=tuple({"draft": f"draft v{i}"} for i in range(revisions + 1)),
+            tool_rounds=1,
+        ),
+        "review": NodeScript(outputs=verdicts),
+        "publish": NodeScript(outputs=({"result": "done"},)),
+    }
+    edges = [
+        _edge("draft", "review"),
+        _edge("review", "draft", "output.get('verdict') == 'revise'"),
+        _edge("review", "publish", "output.get('verdict') == 'approve'"),
+    ]
+    return Scenario(
+        "feedback",
+        _graph("feedback", nodes, edges, "publish"),
+        _goal("feedback"),
+        scripts,
+        input_data={"request": "write release notes", "feedback": ""},
+    )
+
+
+def hitl(tool_rounds: int = 1) -> Scenario:
+    nodes = [
+        _node("greet", ["request"], ["brief"], client_facing=True),
+        _node("work", ["brief"], ["answer"]),
+        _node("confirm", ["answer"], ["result"], client_facing=True),
+    ]
+    scripts = {
+        "greet": NodeScript(outputs=({"brief": "user wants a summary"},), ask_user=True),
+        "work": NodeScript(outputs=({"answer": "summary"},), tool_rounds=tool_rounds),
+        "confirm": NodeScript(outputs=({"result": "done"},), ask_user=True),
+    }
+    edges = [_edge("greet", "work"), _edge("work", "confirm")]
+    return Scenario(
+        "hitl",
+        _graph("hitl", nodes, edges, "confirm"),
+        _goal("hitl"),
+        scripts,
+        input_data={"request": "help me summarize"},
+        client_facing=True,
+    )
+
+
+SCENARIOS = {"linear": linear, "fanout": fanout, "feedback": feedback, "hitl": hitl}
@@ -0,0 +1,221 @@
+"""Scripted LLM provider for runtime benchmarks.
+
+A deterministic stand-in for a real model: every node in a benchmark graph
+gets a ``NodeScript`` describing what the "model" does on each visit, and
+the provider plays it back with configurable latency. Unlike
+``framework.llm.mock.MockLLMProvider`` it drives the full EventLoopNode
+protocol (real tool calls, ``set_output``, ``ask_user``, streamed text), so
+runs exercise the same paths as production agents without network access.
+
+- Nodes are identified by a marker in their system prompt (see
+  ``node_marker``); concurrent executions are told apart by the trace
+  context's ``execution_id``, so one provider serves any number of them.
+- Each visit to a node plays: an optional ``ask_user`` turn, ``tool_rounds``
+  turns of ``tools_per_round`` parallel calls to ``tool_name``, one turn
+  setting the node's outputs, and a streamed text reply that ends the turn.
+- ``outputs`` lists the values set on successive visits (the last entry
+  repeats), which is how feedback loops decide when to stop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from framework.llm.provider import LLMProvider, LLMResponse, Tool
+from framework.llm.stream_events import (
+    FinishEvent,
+    StreamEvent,
+    TextDeltaEvent,
+    TextEndEvent,
+    ToolCallEvent,
+)
+from framework.observability import get_trace_context
+
+_MARKER_RE = re.compile(r"\[scripted-node:([\w.-]+)\]")
+
+
+def node_marker(node_id: str) -> str:
+    """System prompt marker that tells the provider which node is calling."""
+    return f"[scripted-node:{node_id}]"
+
+
+@dataclass(frozen=True)
+class NodeScript:
+    """What the scripted model does on each visit to one node."""
+
+    outputs: tuple[dict[str, str], ...] = ()
+    tool_rounds: int = 0
+    tools_per_round: int = 1
+    tool_name: str = "lookup"
+    ask_user: bool = False
+    reply_chunks: int = 8  # Text deltas in the final reply
+    words_per_chunk: int = 4
+
+
+@dataclass
+class _Visit:
+    turns: list[str]
+    index: int  # Visit number for this node in this execution
+    turn: int = 0
+    last_call: float = 0.0
+
+
+class ScriptedLLMProvider(LLMProvider):
+    """
+    Deterministic streaming provider that plays back per-node scripts.
+
+    Args:
+        scripts: NodeScript per node id
+        latency_ms: Delay before the first event of every call
+        chunk_latency_ms: Delay between streamed text chunks
+        model: Model name reported in responses
+    """
+
+    def __init__(
+        self,
+        scripts: dict[str, NodeScript],
+        latency_ms: float = 0.0,
+        chunk_latency_ms: float = 0.0,
+        model: str = "scripted",
+    ):
+        self.scripts = scripts
+        self.latency = latency_ms / 1000
+        self.chunk_latency = chunk_latency_ms / 1000
+        self.model = model
+        # (execution, node) -> visit in progress / visits finished so far
+        self._active: dict[tuple[str, str], _Visit] = {}
+        self._visits: dict[tuple[str, str], int] = {}
+        self.calls = 0
+        self.output_tokens = 0
+        # Seconds from one LLM call to the next within a node visit
+        self.turn_latencies: list[float] = []
+
+    def reset(self) -> None:
+        """Forget per-execution state and collected measurements."""
+        self._active.clear()
+        self._visits.clear()
+        self.calls = 0
+        self.output_tokens = 0
+        self.turn_latencies.clear()
+
+    def _plan(self, script: NodeScript) -> list[str]:
+        turns = ["ask"] if script.ask_user else []
+        turns += ["tools"] * script.tool_rounds
+        if script.outputs:
+            turns.append("outputs")
+        turns.append("reply")
+        return turns
+
+    def _next_turn(self, system: str) -> tuple[str, NodeScript, _Visit, int]:
+        """Advance the calling node's visit; returns (turn kind, script, visit, round)."""
+        markers = _MARKER_RE.findall(system)
+        node_id = markers[-1] if markers else ""
+        script = self.scripts.get(node_id, NodeScript())
+        key = (get_trace_context().get("execution_id", ""), node_id)
+
+        now = time.perf_counter()
+        visit = self._active.get(key)
+        if visit is None:
+            visit = _Visit(turns=self._plan(script), index=self._visits.get(key, 0))
+            self._active[key] = visit
+        else:
+            self.turn_latencies.append(now - visit.last_call)
+        visit.last_call = now
+
+        kind = visit.turns[min(visit.turn, len(visit.turns) - 1)]
+        tool_round = visit.turn - (1 if script.ask_user else 0)
+        visit.turn += 1
+        if visit.turn >= len(visit.turns):
+            del self._active[key]
+            self._visits[key] = visit.index + 1
+        return kind, script, visit, tool_round
+
+    async def stream(
+        self,
+        messages: list[dict[str, Any]],
+        system: str = "",
+        tools: list[Tool] | None = None,
+        max_tokens: int = 4096,
+    ) -> AsyncIterator[StreamEvent]:
+        kind, script, visit, tool_round = self._next_turn(system)
+        self.calls += 1
+        input_tokens = sum(len(str(m.get("content") or "")) for m in messages) // 4
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        tag = f"v{visit.index}t{visit.turn}"
+        if kind == "ask":
+            yield ToolCallEvent(
+                tool_use_id=f"ask_{tag}",
+                tool_name="ask_user",
+                tool_input={"question": "Shall I continue?"},
+            )
+        elif kind == "tools":
+            for i in range(script.tools_per_round):
+                yield ToolCallEvent(
+                    tool_use_id=f"{script.tool_name}_{tag}_{i}",
+                    tool_name=script.tool_name,
+                    tool_input={"query": f"{tag}-r{tool_round}-{i}"},
+                )
+        elif kind == "outputs":
+            values = script.outputs[min(visit.index, len(script.outputs) - 1)]
+            for i, (key, value) in enumerate(values.items()):
+                yield ToolCallEvent(
+                    tool_use_id=f"set_{tag}_{i}",
+                    tool_name="set_output",
+                    tool_input={"key": key, "value": value},
+                )
+        if kind != "reply":
+            self.output_tokens += 20
+            yield FinishEvent(
+                stop_reason="tool_use",
+                input_tokens=input_tokens,
+                output_tokens=20,
+                model=self.model,
+            )
+            return
+
+        snapshot = ""
+        for i in range(script.reply_chunks):
+            if self.chunk_latency and i:
+                await asyncio.sleep(self.chunk_latency)
+            chunk = f"{tag} chunk {i} " + "word " * max(script.words_per_chunk - 3, 0)
+            snapshot += chunk
+            yield TextDeltaEvent(content=chunk, snapshot=snapshot)
+        output_tokens = script.reply_chunks * script.words_per_chunk
+        self.output_tokens += output_tokens
+        yield TextEndEvent(full_text=snapshot)
+        yield FinishEvent(
+            stop_reason="end_turn",
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model=self.model,
+        )
+
+    def complete(
+        self,
+        messages: list[dict[str, Any]],
+        system: str = "",
+        tools: list[Tool] | None = None,
+        max_tokens: int = 1024,
+        response_format: dict[str, Any] | None = None,
+        json_mode: bool = False,
+        max_retries: int | None = None,
+    ) -> LLMResponse:
+        # Only reached by compaction summaries and judges, which scripts don't drive
+        return LLMResponse(content="Scripted summary.", model=self.model)
+
+    def complete_with_tools(
+        self,
+        messages: list[dict[str, Any]],
+        system: str,
+        tools: list[Tool],
+        tool_executor: Callable,
+        max_iterations: int = 10,
+    ) -> LLMResponse:
+        return LLMResponse(content="Scripted summary.", model=self.model)
@@ -0,0 +1,139 @@
+"""SharedStateManager contention benchmark.
+
+Runs many concurrent executions against one state manager, the way a busy
+runtime does: each execution writes its own keys, writes stream state,
+reads global state and snapshots, and does locked read-modify-write
+updates of shared counters (sleeping ``--hold-ms`` inside the critical
+section, as real code awaiting I/O would). Reports operation throughput,
+lock wait latency, and the registry/history sizes left behind.
+
+Usage::
+
+    cd core && python -m benchmarks.shared_state_contention
+    python -m benchmarks.shared_state_contention --executions 1000 --hot-keys 10 --baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from framework.runtime.shared_state import IsolationLevel, SharedStateManager, StateScope
+
+
+class GlobalLockStateManager(SharedStateManager):
+    """Reference manager that puts every locked write behind one lock, for comparison."""
+
+    def lock(self, keys, execution_id, stream_id, scope=StateScope.GLOBAL):
+        return self._locks.hold("global")
+
+
+async def _execution(
+    manager: SharedStateManager,
+    index: int,
+    streams: int,
+    hot_keys: int,
+    ops: int,
+    hold: float,
+    waits: list[float],
+) -> None:
+    execution_id = f"exec-{index}"
+    memory = manager.create_memory(
+        execution_id, f"stream-{index % streams}", IsolationLevel.SYNCHRONIZED
+    )
+    for op in range(ops):
+        await memory.write(f"step_{op % 8}", op)
+        await memory.write(f"last_{index % 16}", op, scope=StateScope.STREAM)
+        await memory.read("config")
+        if op % 10 == 0:
+            memory.snapshot()
+
+        key = f"counter_{(index + op) % hot_keys}"
+        requested = time.perf_counter()
+        async with memory.lock(key, scope=StateScope.GLOBAL):
+            waits.append(time.perf_counter() - requested)
+            count = await memory.read(key) or 0
+            await asyncio.sleep(hold)
+            await memory.write(key, count + 1, scope=StateScope.GLOBAL)
+    manager.cleanup_execution(execution_id)
+
+
+async def _run(
+    manager: SharedStateManager,
+    executions: int,
+    streams: int,
+    hot_keys: int,
+    ops: int,
+    hold: float,
+) -> tuple[float, list[float]]:
+    await manager.write(
+        "config", {"mode": "bench"}, "setup", "setup", IsolationLevel.SHARED, "global"
+    )
+    waits: list[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(_execution(manager, i, streams, hot_keys, ops, hold, waits) for i in range(executions))
+    )
+    return time.perf_counter() - start, waits
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+def run(
+    executions: int, streams: int, hot_keys: int, ops: int, hold_ms: float, baseline: bool
+) -> dict[str, float]:
+    """Run the benchmark and return operations/sec per manager implementation."""
+    variants: list[tuple[str, type[SharedStateManager]]] = [("key_locks", SharedStateManager)]
+    if baseline:
+        variants.append(("global_lock", GlobalLockStateManager))
+
+    # write, stream write, read, locked read + write per op
+    total_ops = executions * ops * 5
+    results: dict[str, float] = {}
+    for name, manager_cls in variants:
+        manager = manager_cls()
+        elapsed, waits = asyncio.run(
+            _run(manager, executions, streams, hot_keys, ops, hold_ms / 1000)
+        )
+        results[name] = total_ops / elapsed
+        stats = manager.get_stats()
+        counted = sum(
+            v
+            for k, v in manager.snapshot("check", "check", IsolationLevel.SHARED).items()
+            if k.startswith("counter_")
+        )
+        assert counted == executions * ops, f"lost updates: {counted} != {executions * ops}"
+        print(
+            f"{name:12s} {executions:,d} executions  {elapsed:7.2f}s  "
+            f"{total_ops / elapsed:>10,.0f} ops/s  "
+            f"lock wait p50 {_percentile(waits, 50) * 1000:.2f}ms "
+            f"p99 {_percentile(waits, 99) * 1000:.2f}ms  "
+            f"locks left {stats['key_locks']['active']}  history {stats['total_changes']}"
+        )
+    if baseline:
+        print(f"speedup: {results['key_locks'] / results['global_lock']:.1f}x")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--executions", type=int, default=1000)
+    parser.add_argument("--streams", type=int, default=10)
+    parser.add_argument("--hot-keys", type=int, default=100)
+    parser.add_argument("--ops", type=int, default=20, help="Operations per execution")
+    parser.add_argument(
+        "--hold-ms", type=float, default=0.2, help="Time spent inside each locked update"
+    )
+    parser.add_argument(
+        "--baseline", action="store_true", help="Also run a single-global-lock manager"
+    )
+    args = parser.parse_args()
+    run(args.executions, args.streams, args.hot_keys, args.ops, args.hold_ms, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
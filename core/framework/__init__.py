@@ -20,25 +20,65 @@
 - Debug tools with fix suggestions
 
 See `framework.testing` for details.
+
+The top-level names below are imported lazily (PEP 562), so importing a
+light subpackage such as ``framework.credentials`` does not pull in the
+runtime, the LLM providers and litellm.
 """
 
-from framework.builder.query import BuilderQuery
-from framework.llm import AnthropicProvider, LLMProvider
-from framework.runner import AgentOrchestrator, AgentRunner
-from framework.runtime.core import Runtime
-from framework.schemas.decision import Decision, DecisionEvaluation, Option, Outcome
-from framework.schemas.run import Problem, Run, RunSummary
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from framework.builder.query import BuilderQuery
+    from framework.llm import AnthropicProvider, LLMProvider
+    from framework.runner import AgentOrchestrator, AgentRunner
+    from framework.runtime.core import Runtime
+    from framework.schemas.decision import Decision, DecisionEvaluation, Option, Outcome
+    from framework.schemas.run import Problem, Run, RunSummary
+    from framework.testing import (
+        ApprovalStatus,
+        DebugTool,
+        ErrorCategory,
+        Test,
+        TestResult,
+        TestStorage,
+        TestSuiteResult,
+    )
+
+_LAZY_EXPORTS = {
+    "BuilderQuery": "framework.builder.query",
+    "AnthropicProvider": "framework.llm",
+    "LLMProvider": "framework.llm",
+    "AgentOrchestrator": "framework.runner",
+    "AgentRunner": "framework.runner",
+    "Runtime": "framework.runtime.core",
+    "Decision": "framework.schemas.decision",
+    "DecisionEvaluation": "framework.schemas.decision",
+    "Option": "framework.schemas.decision",
+    "Outcome": "framework.schemas.decision",
+    "Problem": "framework.schemas.run",
+    "Run": "framework.schemas.run",
+    "RunSummary": "framework.schemas.run",
+    # Testing framework
+    "ApprovalStatus": "framework.testing",
+    "DebugTool": "framework.testing",
+    "ErrorCategory": "framework.testing",
+    "Test": "framework.testing",
+    "TestResult": "framework.testing",
+    "TestStorage": "framework.testing",
+    "TestSuiteResult": "framework.testing",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
 
-# Testing framework
-from framework.testing import (
-    ApprovalStatus,
-    DebugTool,
-    ErrorCategory,
-    Test,
-    TestResult,
-    TestStorage,
-    TestSuiteResult,
-)
 
 __all__ = [
     # Schemas
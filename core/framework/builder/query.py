@@ -224,61 +224,27 @@ def find_patterns(self, goal_id: str) -> PatternAnalysis | None:
         Find patterns across runs for a goal.
 
         This helps me understand systemic issues vs one-off failures.
+        Aggregates come from the run analytics store, not the run files.
         """
-        run_ids = self.storage.get_runs_by_goal(goal_id)
-        if not run_ids:
-            return None
-
-        runs = []
-        for run_id in run_ids:
-            run = self.storage.load_run(run_id)
-            if run:
-                runs.append(run)
-
-        if not runs:
+        analytics = self.storage.analytics
+        run_count, completed = analytics.goal_outcomes(goal_id)
+        if run_count == 0:
             return None
 
-        # Calculate success rate
-        completed = [r for r in runs if r.status == RunStatus.COMPLETED]
-        success_rate = len(completed) / len(runs) if runs else 0.0
-
-        # Find common failures
-        failure_counts: dict[str, int] = defaultdict(int)
-        for run in runs:
-            for decision in run.decisions:
-                if not decision.was_successful and decision.outcome:
-                    error = decision.outcome.error or "Unknown error"
-                    failure_counts[error] += 1
-
-        common_failures = sorted(failure_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-
-        # Find problematic nodes
-        node_stats: dict[str, dict[str, int]] = defaultdict(lambda: {"total": 0, "failed": 0})
-        for run in runs:
-            for decision in run.decisions:
-                node_stats[decision.node_id]["total"] += 1
-                if not decision.was_successful:
-                    node_stats[decision.node_id]["failed"] += 1
-
-        problematic_nodes = []
-        for node_id, stats in node_stats.items():
-            if stats["total"] > 0:
-                failure_rate = stats["failed"] / stats["total"]
-                if failure_rate > 0.1:  # More than 10% failure rate
-                    problematic_nodes.append((node_id, failure_rate))
-
-        problematic_nodes.sort(key=lambda x: x[1], reverse=True)
-
-        # Decision patterns
-        decision_patterns = self._analyze_decision_patterns(runs)
+        # Nodes with more than 10% failed decisions
+        problematic_nodes = [
+            (node_id, rate)
+            for node_id, rate in analytics.decision_failure_rates(goal_id)
+            if rate > 0.1
+        ]
 
         return PatternAnalysis(
             goal_id=goal_id,
-            run_count=len(runs),
-            success_rate=success_rate,
-            common_failures=common_failures,
+            run_count=run_count,
+            success_rate=completed / run_count,
+            common_failures=analytics.decision_failures(goal_id),
             problematic_nodes=problematic_nodes,
-            decision_patterns=decision_patterns,
+            decision_patterns=self._analyze_decision_patterns(goal_id),
         )
 
     def compare_runs(self, run_id_1: str, run_id_2: str) -> dict[str, Any]:
@@ -365,36 +331,32 @@ def suggest_improvements(self, goal_id: str) -> list[dict[str, Any]]:
 
     def get_node_performance(self, node_id: str) -> dict[str, Any]:
         """Get performance metrics for a specific node across all runs."""
-        run_ids = self.storage.get_runs_by_node(node_id)
-
-        total_decisions = 0
-        successful_decisions = 0
-        total_latency = 0
-        total_tokens = 0
-        decision_types: dict[str, int] = defaultdict(int)
-
-        for run_id in run_ids:
-            run = self.storage.load_run(run_id)
-            if run:
-                for decision in run.decisions:
-                    if decision.node_id == node_id:
-                        total_decisions += 1
-                        if decision.was_successful:
-                            successful_decisions += 1
-                        if decision.outcome:
-                            total_latency += decision.outcome.latency_ms
-                            total_tokens += decision.outcome.tokens_used
-                        decision_types[decision.decision_type.value] += 1
+        analytics = self.storage.analytics
+        total_decisions, successful, total_latency, total_tokens = analytics.node_decisions(node_id)
 
         return {
             "node_id": node_id,
             "total_decisions": total_decisions,
-            "success_rate": successful_decisions / total_decisions if total_decisions > 0 else 0,
+            "success_rate": successful / total_decisions if total_decisions > 0 else 0,
             "avg_latency_ms": total_latency / total_decisions if total_decisions > 0 else 0,
             "total_tokens": total_tokens,
-            "decision_type_distribution": dict(decision_types),
+            "decision_type_distribution": analytics.decision_types(node_id=node_id),
         }
 
+    # === RUNTIME AGGREGATES ===
+
+    def get_node_failure_rates(self, goal_id: str | None = None) -> list[dict[str, Any]]:
+        """Failure rate, latency and tokens per node from the runtime logs."""
+        return self.storage.analytics.node_stats(goal_id)
+
+    def get_tool_latency(self, goal_id: str | None = None) -> list[dict[str, Any]]:
+        """Calls, error rate and avg/p95 latency per tool, slowest first."""
+        return self.storage.analytics.tool_stats(goal_id)
+
+    def get_goal_token_usage(self) -> list[dict[str, Any]]:
+        """Runs, failure rate and token usage per goal, most tokens first."""
+        return self.storage.analytics.goal_stats()
+
     # === PRIVATE HELPERS ===
 
     def _generate_suggestions(
@@ -436,33 +398,27 @@ def _generate_suggestions(
 
         return suggestions
 
-    def _analyze_decision_patterns(self, runs: list[Run]) -> dict[str, Any]:
+    def _analyze_decision_patterns(self, goal_id: str) -> dict[str, Any]:
         """Analyze decision patterns across runs."""
-        type_counts: dict[str, int] = defaultdict(int)
-        option_counts: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        analytics = self.storage.analytics
 
-        for run in runs:
-            for decision in run.decisions:
-                type_counts[decision.decision_type.value] += 1
-
-                # Track which options are chosen for similar intents
-                intent_key = decision.intent[:50]  # Truncate for grouping
-                if decision.chosen_option:
-                    option_counts[intent_key][decision.chosen_option.description] += 1
+        # Which options are chosen for similar intents (first 50 chars)
+        option_counts: dict[str, dict[str, int]] = defaultdict(dict)
+        for intent_key, choice, count in analytics.decision_choices(goal_id):
+            option_counts[intent_key][choice] = count
 
         # Find most common choices per intent
         common_choices = {}
         for intent, choices in option_counts.items():
-            if choices:
-                most_common = max(choices.items(), key=lambda x: x[1])
-                common_choices[intent] = {
-                    "choice": most_common[0],
-                    "count": most_common[1],
-                    "alternatives": len(choices) - 1,
-                }
+            most_common = max(choices.items(), key=lambda x: x[1])
+            common_choices[intent] = {
+                "choice": most_common[0],
+                "count": most_common[1],
+                "alternatives": len(choices) - 1,
+            }
 
         return {
-            "decision_type_distribution": dict(type_counts),
+            "decision_type_distribution": analytics.decision_types(goal_id=goal_id),
             "common_choices": common_choices,
         }
 
@@ -32,6 +32,9 @@ class CheckpointConfig:
     include_full_memory: bool = True
     include_metrics: bool = True
 
+    # Delta checkpoints: store full memory every N checkpoints, changed keys in between
+    full_snapshot_every: int = 10  # 1 = always store full memory
+
     def should_checkpoint_node_start(self) -> bool:
         """Check if should checkpoint before node execution."""
         return self.enabled and self.checkpoint_on_node_start
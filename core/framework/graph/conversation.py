@@ -4,6 +4,7 @@
 
 import json
 import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, Literal, Protocol, runtime_checkable
 
@@ -178,6 +179,12 @@ class NodeConversation:
     When a :class:`ConversationStore` is supplied every mutation is
     persisted via write-through (meta is lazily written on the first
     ``_persist`` call).
+
+    Token accounting is incremental: running character (and, when a
+    *token_counter* is supplied, per-message token) totals are updated on
+    every add/prune/compact, so ``estimate_tokens`` and ``needs_compaction``
+    are O(1).  The OpenAI-format message list is cached the same way and
+    only the trailing tool-call block is re-checked for orphans per call.
     """
 
     def __init__(
@@ -187,6 +194,7 @@ def __init__(
         compaction_threshold: float = 0.8,
         output_keys: list[str] | None = None,
         store: ConversationStore | None = None,
+        token_counter: Callable[[str], int] | None = None,
     ) -> None:
         self._system_prompt = system_prompt
         self._max_history_tokens = max_history_tokens
@@ -198,6 +206,17 @@ def __init__(
         self._meta_persisted: bool = False
         self._last_api_input_tokens: int | None = None
         self._current_phase: str | None = None
+        # Incremental accounting (see _track / _untrack)
+        self._token_counter = token_counter
+        self._total_chars: int = 0
+        self._total_tokens: int = 0
+        self._message_tokens: dict[int, int] = {}
+        self._user_turns: int = 0
+        # Cached LLM dicts: repaired messages before the trailing block, plus
+        # the raw dicts of that block (last non-tool message + its tool results).
+        # ``None`` means invalidated; rebuilt lazily by to_llm_messages().
+        self._llm_sealed: list[dict[str, Any]] | None = []
+        self._llm_tail: list[dict[str, Any]] = []
 
     # --- Properties --------------------------------------------------------
 
@@ -222,8 +241,11 @@ async def switch_store(self, new_store: ConversationStore) -> None:
 
         Subsequent messages are written to *new_store*.  Meta (system
         prompt, config) is re-persisted on the next write so the new
-        store's ``meta.json`` reflects the updated prompt.
+        store's ``meta.json`` reflects the updated prompt.  The previous
+        store is closed so any buffered writes are flushed.
         """
+        if self._store is not None and self._store is not new_store:
+            await self._store.close()
         self._store = new_store
         self._meta_persisted = False
         await new_store.write_cursor({"next_seq": self._next_seq})
@@ -240,7 +262,7 @@ def messages(self) -> list[Message]:
     @property
     def turn_count(self) -> int:
         """Number of conversational turns (one turn = one user message)."""
-        return sum(1 for m in self._messages if m.role == "user")
+        return self._user_turns
 
     @property
     def message_count(self) -> int:
@@ -266,8 +288,7 @@ async def add_user_message(
             phase_id=self._current_phase,
             is_transition_marker=is_transition_marker,
         )
-        self._messages.append(msg)
-        self._next_seq += 1
+        self._append(msg)
         await self._persist(msg)
         return msg
 
@@ -283,8 +304,7 @@ async def add_assistant_message(
             tool_calls=tool_calls,
             phase_id=self._current_phase,
         )
-        self._messages.append(msg)
-        self._next_seq += 1
+        self._append(msg)
         await self._persist(msg)
         return msg
 
@@ -302,11 +322,60 @@ async def add_tool_result(
             is_error=is_error,
             phase_id=self._current_phase,
         )
-        self._messages.append(msg)
-        self._next_seq += 1
+        self._append(msg)
         await self._persist(msg)
         return msg
 
+    def _append(self, msg: Message) -> None:
+        self._messages.append(msg)
+        self._next_seq += 1
+        self._track(msg)
+        self._cache_llm_dict(msg)
+
+    # --- Incremental accounting --------------------------------------------
+
+    def _track(self, msg: Message) -> None:
+        """Add *msg* to the running char/token/turn totals."""
+        self._total_chars += len(msg.content)
+        if msg.role == "user":
+            self._user_turns += 1
+        if self._token_counter is not None:
+            tokens = self._token_counter(msg.content)
+            self._message_tokens[msg.seq] = tokens
+            self._total_tokens += tokens
+
+    def _untrack(self, msg: Message) -> None:
+        """Remove *msg* from the running totals (inverse of :meth:`_track`)."""
+        self._total_chars -= len(msg.content)
+        if msg.role == "user":
+            self._user_turns -= 1
+        if self._token_counter is not None:
+            self._total_tokens -= self._message_tokens.pop(msg.seq, 0)
+
+    def _retrack_all(self) -> None:
+        """Recompute every running total from scratch (restore path)."""
+        self._total_chars = 0
+        self._total_tokens = 0
+        self._message_tokens = {}
+        self._user_turns = 0
+        for msg in self._messages:
+            self._track(msg)
+        self._llm_sealed = None
+
+    def _cache_llm_dict(self, msg: Message) -> None:
+        """Append *msg* to the cached LLM dict list.
+
+        A non-tool message closes the previous block: the tool results
+        following an assistant message can no longer change, so the block
+        is repaired once and moved into the sealed prefix.
+        """
+        if self._llm_sealed is None:
+            return  # invalidated; to_llm_messages() rebuilds from scratch
+        if msg.role != "tool" and self._llm_tail:
+            self._llm_sealed.extend(self._repair_orphaned_tool_calls(self._llm_tail))
+            self._llm_tail = []
+        self._llm_tail.append(msg.to_llm_dict())
+
     # --- Query -------------------------------------------------------------
 
     def to_llm_messages(self) -> list[dict[str, Any]]:
@@ -315,9 +384,16 @@ def to_llm_messages(self) -> list[dict[str, Any]]:
         Automatically repairs orphaned tool_use blocks (assistant messages
         with tool_calls that lack corresponding tool-result messages).  This
         can happen when a loop is cancelled mid-tool-execution.
+
+        The returned list is new, but the dicts inside it are cached and
+        shared between calls — copy a dict before mutating it.
         """
-        msgs = [m.to_llm_dict() for m in self._messages]
-        return self._repair_orphaned_tool_calls(msgs)
+        if self._llm_sealed is None:
+            self._llm_sealed = []
+            self._llm_tail = []
+            for m in self._messages:
+                self._cache_llm_dict(m)
+        return self._llm_sealed + self._repair_orphaned_tool_calls(self._llm_tail)
 
     @staticmethod
     def _repair_orphaned_tool_calls(
@@ -356,13 +432,16 @@ def estimate_tokens(self) -> int:
         """Best available token estimate.
 
         Uses actual API input token count when available (set via
-        :meth:`update_token_count`), otherwise falls back to the rough
-        ``total_chars / 4`` heuristic.
+        :meth:`update_token_count`), otherwise the running per-message
+        total from *token_counter*, falling back to the rough
+        ``total_chars / 4`` heuristic.  O(1): totals are kept up to date
+        as messages are added, pruned and compacted.
         """
         if self._last_api_input_tokens is not None:
             return self._last_api_input_tokens
-        total_chars = sum(len(m.content) for m in self._messages)
-        return total_chars // 4
+        if self._token_counter is not None:
+            return self._total_tokens
+        return self._total_chars // 4
 
     def update_token_count(self, actual_input_tokens: int) -> None:
         """Store actual API input token count for more accurate compaction.
@@ -493,7 +572,7 @@ async def prune_old_tool_results(
             else:
                 placeholder = f"[Pruned tool result: {orig_len} chars cleared from context.]"
 
-            self._messages[i] = Message(
+            pruned = Message(
                 seq=msg.seq,
                 role=msg.role,
                 content=placeholder,
@@ -503,13 +582,17 @@ async def prune_old_tool_results(
                 phase_id=msg.phase_id,
                 is_transition_marker=msg.is_transition_marker,
             )
+            self._untrack(msg)
+            self._messages[i] = pruned
+            self._track(pruned)
             count += 1
 
             if self._store:
-                await self._store.write_part(msg.seq, self._messages[i].to_storage_dict())
+                await self._store.write_part(msg.seq, pruned.to_storage_dict())
 
         # Reset token estimate — content lengths changed
         self._last_api_input_tokens = None
+        self._llm_sealed = None
         return count
 
     async def compact(
@@ -587,7 +670,11 @@ async def compact(
             await self._store.write_part(summary_msg.seq, summary_msg.to_storage_dict())
             await self._store.write_cursor({"next_seq": self._next_seq})
 
+        for msg in old_messages:
+            self._untrack(msg)
         self._messages = [summary_msg] + recent_messages
+        self._track(summary_msg)
+        self._llm_sealed = None
         self._last_api_input_tokens = None  # reset; next LLM call will recalibrate
 
     def _find_phase_graduated_split(self) -> int | None:
@@ -623,6 +710,7 @@ async def clear(self) -> None:
             await self._store.delete_parts_before(self._next_seq)
             await self._store.write_cursor({"next_seq": self._next_seq})
         self._messages.clear()
+        self._retrack_all()
         self._last_api_input_tokens = None
 
     def export_summary(self) -> str:
@@ -703,6 +791,7 @@ async def restore(cls, store: ConversationStore) -> NodeConversation | None:
 
         parts = await store.read_parts()
         conv._messages = [Message.from_storage_dict(p) for p in parts]
+        conv._retrack_all()
 
         cursor = await store.read_cursor()
         if cursor:
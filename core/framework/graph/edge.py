@@ -24,12 +24,13 @@
 import json
 import logging
 import re
+from collections import ChainMap
 from enum import StrEnum
 from typing import Any
 
 from pydantic import BaseModel, Field, model_validator
 
-from framework.graph.safe_eval import safe_eval
+from framework.graph.safe_eval import compile_expression, validate_expression
 
 logger = logging.getLogger(__name__)
 
@@ -168,34 +169,32 @@ def _evaluate_condition(
             return True
 
         # Build evaluation context
-        # Include memory keys directly for easier access in conditions
-        context = {
+        # Include memory keys directly for easier access in conditions;
+        # a ChainMap avoids copying memory on every evaluation.
+        fixed = {
             "output": output,
             "memory": memory,
             "result": output.get("result"),
             "true": True,  # Allow lowercase true/false in conditions
             "false": False,
-            **memory,  # Unpack memory keys directly into context
         }
+        context = ChainMap(memory, fixed)  # memory keys shadow the fixed names
 
         try:
-            # Safe evaluation using AST-based whitelist
-            result = bool(safe_eval(self.condition_expr, context))
+            # Safe evaluation using AST-based whitelist (compiled once per expression)
+            compiled = compile_expression(self.condition_expr)
+            result = bool(compiled(context))
             # Log the evaluation for visibility
-            # Extract the variable names used in the expression for debugging
-            expr_vars = {
-                k: repr(context[k])
-                for k in context
-                if k not in ("output", "memory", "result", "true", "false")
-                and k in self.condition_expr
-            }
-            logger.info(
-                "  Edge %s: condition '%s' → %s  (vars: %s)",
-                self.id,
-                self.condition_expr,
-                result,
-                expr_vars or "none matched",
-            )
+            if logger.isEnabledFor(logging.INFO):
+                # Only the memory variables the expression actually reads
+                expr_vars = {k: repr(memory[k]) for k in compiled.names if k in memory}
+                logger.info(
+                    "  Edge %s: condition '%s' → %s  (vars: %s)",
+                    self.id,
+                    self.condition_expr,
+                    result,
+                    expr_vars or "none matched",
+                )
             return result
         except Exception as e:
             logger.warning(f"      ⚠ Condition evaluation failed: {self.condition_expr}")
@@ -615,6 +614,11 @@ def validate(self) -> list[str]:
                 errors.append(f"Edge '{edge.id}' references missing source '{edge.source}'")
             if not self.get_node(edge.target):
                 errors.append(f"Edge '{edge.id}' references missing target '{edge.target}'")
+            if edge.condition == EdgeCondition.CONDITIONAL and edge.condition_expr:
+                for problem in validate_expression(edge.condition_expr):
+                    errors.append(
+                        f"Edge '{edge.id}' has invalid condition '{edge.condition_expr}': {problem}"
+                    )
 
         # Check for unreachable nodes
         # Start with main entry node and all entry points (for pause/resume architecture)
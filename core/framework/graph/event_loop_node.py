@@ -22,6 +22,7 @@
 
 from framework.graph.conversation import ConversationStore, NodeConversation
 from framework.graph.node import NodeContext, NodeProtocol, NodeResult
+from framework.graph.spillover import build_preview, spill_tool_result
 from framework.llm.provider import Tool, ToolResult, ToolUse
 from framework.llm.stream_events import (
     FinishEvent,
@@ -87,6 +88,9 @@ class LoopConfig:
     # ``None`` the result is simply truncated with an explanatory note.
     max_tool_result_chars: int = 3_000
     spillover_dir: str | None = None  # Path string; created on first use
+    # Gzip spilled files (load_data reads them transparently; other file
+    # tools such as view_file cannot).
+    spillover_compress: bool = False
 
     # --- Stream retry (transient error recovery within EventLoopNode) ---
     # When _run_single_turn() raises a transient error (network, rate limit,
@@ -1082,6 +1086,7 @@ async def _await_user_input(self, ctx: NodeContext) -> bool:
                 stream_id=ctx.node_id,
                 node_id=ctx.node_id,
                 prompt="",
+                execution_id=ctx.execution_id or None,
             )
 
         self._awaiting_input = True
@@ -1353,9 +1358,11 @@ async def _run_single_turn(
                         pending_real.append(tc)
 
             # Phase 2: execute real tools in parallel.
+            tool_latency_ms: dict[str, int] = {}
+            tool_cache_status: dict[str, str] = {}
             if pending_real:
                 raw_results = await asyncio.gather(
-                    *(self._execute_tool(tc) for tc in pending_real),
+                    *(self._execute_tool_timed(tc, tool_latency_ms) for tc in pending_real),
                     return_exceptions=True,
                 )
                 for tc, raw in zip(pending_real, raw_results, strict=True):
@@ -1367,7 +1374,10 @@ async def _run_single_turn(
                         )
                     else:
                         result = raw
-                    results_by_id[tc.tool_use_id] = self._truncate_tool_result(result, tc.tool_name)
+                        tool_cache_status[tc.tool_use_id] = result.cache_status
+                    results_by_id[tc.tool_use_id] = await self._truncate_tool_result(
+                        result, tc.tool_name
+                    )
 
             # Phase 3: record results into conversation in original order,
             # build logged/real lists, and publish completed events.
@@ -1384,6 +1394,8 @@ async def _run_single_turn(
                         "tool_input": tc.tool_input,
                         "content": result.content,
                         "is_error": result.is_error,
+                        "latency_ms": tool_latency_ms.get(tc.tool_use_id, 0),
+                        "cache_status": tool_cache_status.get(tc.tool_use_id, ""),
                     }
                     real_tool_results.append(tool_entry)
                     logged_tool_calls.append(tool_entry)
@@ -1970,7 +1982,17 @@ async def _execute_tool(self, tc: ToolCallEvent) -> ToolResult:
             result = await result
         return result
 
-    def _truncate_tool_result(
+    async def _execute_tool_timed(
+        self, tc: ToolCallEvent, latency_ms: dict[str, int]
+    ) -> ToolResult:
+        """Execute a tool call, recording its wall time in *latency_ms* (even if it raises)."""
+        start = time.perf_counter()
+        try:
+            return await self._execute_tool(tc)
+        finally:
+            latency_ms[tc.tool_use_id] = int((time.perf_counter() - start) * 1000)
+
+    async def _truncate_tool_result(
         self,
         result: ToolResult,
         tool_name: str,
@@ -1981,6 +2003,8 @@ def _truncate_tool_result(
         *max_tool_result_chars*, the full content is written to a file and
         the in-context result is replaced with a preview + filename reference.
         Without *spillover_dir*, large results are truncated with a note.
+        JSON results get a structured preview (keys, record schema, leading
+        records); parsing and writing run in a worker thread.
 
         Small results (and errors) pass through unchanged.
         """
@@ -2012,36 +2036,36 @@ def _truncate_tool_result(
                 is_error=False,
             )
 
-        # Determine a preview size — leave room for the metadata wrapper
+        # Size the preview to leave room for the metadata wrapper
         preview_chars = max(limit - 300, limit // 2)
-        preview = result.content[:preview_chars]
+        preview_tokens = preview_chars // 4
 
         spill_dir = self._config.spillover_dir
         if spill_dir:
-            spill_path = Path(spill_dir)
-            spill_path.mkdir(parents=True, exist_ok=True)
             # Use tool_use_id for uniqueness, sanitise for filesystem
             safe_id = result.tool_use_id.replace("/", "_")[:60]
-            filename = f"tool_{tool_name}_{safe_id}.txt"
-
-            # Pretty-print JSON content so load_data's line-based
-            # pagination works correctly.  Compact JSON (no newlines)
-            # would produce a single line that defeats pagination.
-            write_content = result.content
-            try:
-                parsed = json.loads(result.content)
-                write_content = json.dumps(parsed, indent=2, ensure_ascii=False)
-            except (json.JSONDecodeError, TypeError, ValueError):
-                pass  # Not JSON — write as-is
-
-            (spill_path / filename).write_text(write_content, encoding="utf-8")
+            spill = await asyncio.to_thread(
+                spill_tool_result,
+                spill_dir,
+                f"tool_{tool_name}_{safe_id}.txt",
+                result.content,
+                preview_tokens,
+                self._config.spillover_compress,
+            )
+            filename = spill.filename
 
+            if spill.records is not None:
+                how = (
+                    f"Use load_data(filename='{filename}', offset_records=0, "
+                    f"limit_records=20) to page through its {spill.records} records "
+                    f"(at {spill.record_path})"
+                )
+            else:
+                how = f"Use load_data(filename='{filename}') to read the full result"
             truncated = (
                 f"[Result from {tool_name}: {len(result.content)} chars — "
-                f"too large for context, saved to '{filename}'. "
-                f"Use load_data(filename='{filename}') "
-                f"to read the full result.]\n\n"
-                f"Preview:\n{preview}…"
+                f"too large for context, saved to '{filename}'. {how}.]\n\n"
+                f"Preview:\n{spill.preview}"
             )
             logger.info(
                 "Tool result spilled to file: %s (%d chars → %s)",
@@ -2050,10 +2074,11 @@ def _truncate_tool_result(
                 filename,
             )
         else:
+            preview = await asyncio.to_thread(build_preview, result.content, preview_tokens)
             truncated = (
                 f"[Result from {tool_name}: {len(result.content)} chars — "
-                f"truncated to fit context budget. Only the first "
-                f"{preview_chars} chars are shown.]\n\n{preview}…"
+                f"truncated to fit context budget. Only a preview of about "
+                f"{preview_chars} chars is shown.]\n\n{preview}"
             )
             logger.info(
                 "Tool result truncated in-place: %s (%d → %d chars)",
@@ -2293,7 +2318,11 @@ def _build_emergency_summary(
 
                 data_dir = Path(self._config.spillover_dir)
                 if data_dir.is_dir():
-                    files = sorted(f.name for f in data_dir.iterdir() if f.is_file())
+                    files = sorted(
+                        f.name
+                        for f in data_dir.iterdir()
+                        if f.is_file() and not f.name.startswith(".")
+                    )
                     if files:
                         file_list = "\n".join(f"  - {f}" for f in files[:30])
                         parts.append("DATA FILES (use load_data to read):\n" + file_list)
@@ -2513,6 +2542,7 @@ async def _publish_text_delta(
                     node_id=node_id,
                     content=content,
                     snapshot=snapshot,
+                    execution_id=ctx.execution_id or None,
                 )
             else:
                 await self._event_bus.emit_llm_text_delta(
@@ -2520,6 +2550,7 @@ async def _publish_text_delta(
                     node_id=node_id,
                     content=content,
                     snapshot=snapshot,
+                    execution_id=ctx.execution_id or None,
                 )
 
     async def _publish_tool_started(
@@ -11,6 +11,7 @@
 
 import asyncio
 import logging
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -33,6 +34,7 @@
 from framework.runtime.core import Runtime
 from framework.schemas.checkpoint import Checkpoint
 from framework.storage.checkpoint_store import CheckpointStore
+from framework.storage.persistence import PersistencePipeline
 
 
 @dataclass
@@ -59,6 +61,9 @@ class ExecutionResult:
     # Visit tracking (for feedback/callback edges)
     node_visit_counts: dict[str, int] = field(default_factory=dict)  # {node_id: visit_count}
 
+    # Parallel fan-out stats: {branch_id: {tokens_used, latency_ms, wall_ms, queued_ms, ...}}
+    branch_stats: dict[str, dict[str, Any]] = field(default_factory=dict)
+
     @property
     def is_clean_success(self) -> bool:
         """True only if execution succeeded with no retries or failures."""
@@ -81,6 +86,22 @@ class ParallelBranch:
     status: str = "pending"  # pending, running, completed, failed
     retry_count: int = 0
     error: str | None = None
+    memory: SharedMemory | None = None  # Branch-local overlay (isolate_branch_memory)
+    queued_ms: int = 0  # Time waiting for a free concurrency slot
+    wall_ms: int = 0  # Time from branch start to finish
+
+    def stats(self) -> dict[str, Any]:
+        """Per-branch latency and token stats for ExecutionResult.branch_stats."""
+        return {
+            "node_id": self.node_id,
+            "status": self.status,
+            "tokens_used": self.result.tokens_used if self.result else 0,
+            "latency_ms": self.result.latency_ms if self.result else 0,
+            "wall_ms": self.wall_ms,
+            "queued_ms": self.queued_ms,
+            "retries": self.retry_count,
+            "error": self.error,
+        }
 
 
 @dataclass
@@ -92,12 +113,25 @@ class ParallelExecutionConfig:
     # "wait_all" waits for all and reports all failures
     on_branch_failure: str = "fail_all"
 
-    # Memory conflict handling when branches write same key
-    memory_conflict_strategy: str = "last_wins"  # "last_wins", "first_wins", "error"
+    # Memory conflict handling when branches write same key:
+    # "last_wins" / "first_wins" (by completion order), "priority" (the
+    # earliest-launched branch wins) or "error"
+    memory_conflict_strategy: str = "last_wins"
 
     # Timeout per branch in seconds
     branch_timeout_seconds: float = 300.0
 
+    # Maximum branches running at once (0 = unlimited)
+    max_in_flight: int = 0
+
+    # Launch order: these node IDs first, in order; the rest by descending
+    # EdgeSpec.priority, then graph order
+    priority_order: list[str] = field(default_factory=list)
+
+    # Give each branch a copy-on-write memory overlay, merged into shared
+    # memory (per memory_conflict_strategy) when the branches converge
+    isolate_branch_memory: bool = True
+
 
 class GraphExecutor:
     """
@@ -135,6 +169,7 @@ def __init__(
         storage_path: str | Path | None = None,
         loop_config: dict[str, Any] | None = None,
         accounts_prompt: str = "",
+        persistence: PersistencePipeline | None = None,
     ):
         """
         Initialize the executor.
@@ -155,6 +190,7 @@ def __init__(
             storage_path: Optional base path for conversation persistence
             loop_config: Optional EventLoopNode configuration (max_iterations, etc.)
             accounts_prompt: Connected accounts block for system prompt injection
+            persistence: Optional pipeline for progress and checkpoint writes
         """
         self.runtime = runtime
         self.llm = llm
@@ -168,6 +204,7 @@ def __init__(
         self._stream_id = stream_id
         self.runtime_logger = runtime_logger
         self._storage_path = Path(storage_path) if storage_path else None
+        self._persistence = persistence
         self._loop_config = loop_config or {}
         self.accounts_prompt = accounts_prompt
 
@@ -185,6 +222,64 @@ def __init__(
         # Pause/resume control
         self._pause_requested = asyncio.Event()
 
+        # Conversation store per node directory, shared by every user of that
+        # directory (two instances would append over each other's segments);
+        # closed when execute() returns and reopened lazily on the next write
+        self._conversation_stores: dict[str, Any] = {}
+
+        # Session index refreshed by progress writes (opened on first use)
+        self._session_index: Any = None
+
+    def _open_conversation_store(self, node_id: str) -> Any:
+        """Return the conversation store of *node_id*, opening it on first use."""
+        store = self._conversation_stores.get(node_id)
+        if store is None:
+            from framework.storage.conversation_store import open_conversation_store
+
+            store = open_conversation_store(
+                self._storage_path / "conversations" / node_id,
+                self._loop_config.get("conversation_backend"),
+            )
+            self._conversation_stores[node_id] = store
+        return store
+
+    async def _close_conversation_stores(self) -> None:
+        """Flush and close every conversation store opened by this executor.
+
+        The instances stay cached: cached nodes keep using them, and a
+        closed store reopens on its next write.
+        """
+        for store in self._conversation_stores.values():
+            try:
+                await store.close()
+            except Exception:
+                self.logger.debug("Failed to close conversation store", exc_info=True)
+
+    async def _flush_wip_outputs(self, node_id: str, memory: SharedMemory) -> list[str]:
+        """Copy the accumulator outputs in *node_id*'s conversation cursor into memory.
+
+        The accumulator persists outputs to the cursor on every set() call,
+        but only writes them to SharedMemory when the judge ACCEPTs. Reading
+        through the store covers both layouts (cursor.json, or cursor
+        records inside segments).
+
+        Returns:
+            The keys written
+        """
+        if not (self._storage_path / "conversations" / node_id).is_dir():
+            return []
+        store = self._open_conversation_store(node_id)
+        try:
+            cursor = await store.read_cursor() or {}
+        finally:
+            await store.close()
+        written = []
+        for key, value in cursor.get("outputs", {}).items():
+            if value is not None:
+                memory.write(key, value, validate=False)
+                written.append(key)
+        return written
+
     def _write_progress(
         self,
         current_node: str,
@@ -199,7 +294,10 @@ def _write_progress(
         state.json as the single source of truth — readers always see
         current progress, not stale initial values.
 
-        The write is synchronous and best-effort: never blocks execution.
+        The write is best-effort: never blocks execution.  With a persistence
+        pipeline it runs in the background and is coalesced with the next
+        progress write if that follows within the pipeline's window;
+        otherwise it is synchronous.
         """
         if not self._storage_path:
             return
@@ -208,32 +306,67 @@ def _write_progress(
             from datetime import datetime
 
             state_path = self._storage_path / "state.json"
-            if state_path.exists():
-                state_data = _json.loads(state_path.read_text(encoding="utf-8"))
-            else:
-                state_data = {}
-
-            # Patch progress fields
-            progress = state_data.setdefault("progress", {})
-            progress["current_node"] = current_node
-            progress["path"] = list(path)
-            progress["node_visit_counts"] = dict(node_visit_counts)
-            progress["steps_executed"] = len(path)
-
-            # Update timestamp
-            timestamps = state_data.setdefault("timestamps", {})
-            timestamps["updated_at"] = datetime.now().isoformat()
-
-            # Persist full memory so state.json is sufficient for resume
-            # even if the process dies before the final write.
+            # Snapshot now; the patch may run after execution has moved on
             memory_snapshot = memory.read_all()
-            state_data["memory"] = memory_snapshot
-            state_data["memory_keys"] = list(memory_snapshot.keys())
+            path = list(path)
+            node_visit_counts = dict(node_visit_counts)
+            updated_at = datetime.now().isoformat()
 
-            state_path.write_text(_json.dumps(state_data, indent=2), encoding="utf-8")
+            def _patch() -> None:
+                try:
+                    if state_path.exists():
+                        state_data = _json.loads(state_path.read_text(encoding="utf-8"))
+                    else:
+                        state_data = {}
+
+                    # Patch progress fields
+                    progress = state_data.setdefault("progress", {})
+                    progress["current_node"] = current_node
+                    progress["path"] = path
+                    progress["node_visit_counts"] = node_visit_counts
+                    progress["steps_executed"] = len(path)
+
+                    # Update timestamp
+                    timestamps = state_data.setdefault("timestamps", {})
+                    timestamps["updated_at"] = updated_at
+
+                    # Persist full memory so state.json is sufficient for resume
+                    # even if the process dies before the final write.
+                    state_data["memory"] = memory_snapshot
+                    state_data["memory_keys"] = list(memory_snapshot.keys())
+
+                    state_path.write_text(_json.dumps(state_data, indent=2), encoding="utf-8")
+                    self._index_progress(state_data)
+                except Exception:
+                    pass  # Best-effort — never block execution
+
+            if self._persistence is not None:
+                self._persistence.submit(state_path, _patch, patch="progress")
+            else:
+                _patch()
         except Exception:
             pass  # Best-effort — never block execution
 
+    def _index_progress(self, state_data: dict[str, Any]) -> None:
+        """Refresh this session's row in the session index after a progress patch.
+
+        Only applies when the storage path is ``{base}/sessions/{id}`` and
+        ``{base}`` already has an index; otherwise listings would keep
+        ordering the session by its start time.
+        """
+        from framework.schemas.session_state import SessionState
+        from framework.storage.session_index import INDEX_FILENAME, SessionIndex
+
+        if self._session_index is None:
+            base_path = self._storage_path.parent.parent
+            if self._storage_path.parent.name != "sessions":
+                return
+            if not (base_path / INDEX_FILENAME).exists():
+                return
+            self._session_index = SessionIndex(base_path)
+        state = SessionState.model_validate(state_data)
+        self._session_index.upsert(self._storage_path.name, state)
+
     def _validate_tools(self, graph: GraphSpec) -> list[str]:
         """
         Validate that all tools declared by nodes are available.
@@ -315,7 +448,11 @@ async def execute(
         # Initialize checkpoint store if checkpointing is enabled
         checkpoint_store: CheckpointStore | None = None
         if checkpoint_config and checkpoint_config.enabled and self._storage_path:
-            checkpoint_store = CheckpointStore(self._storage_path)
+            checkpoint_store = CheckpointStore(
+                self._storage_path,
+                full_snapshot_every=checkpoint_config.full_snapshot_every,
+                persistence=self._persistence,
+            )
             self.logger.info("✓ Checkpointing enabled")
 
         # Restore session state if provided
@@ -353,6 +490,7 @@ async def execute(
         total_latency = 0
         node_retry_counts: dict[str, int] = {}  # Track retries per node
         node_visit_counts: dict[str, int] = {}  # Track visits for feedback loops
+        branch_stats: dict[str, dict[str, Any]] = {}  # Fan-out branch stats
         _is_retry = False  # True when looping back for a retry (not a new visit)
 
         # Restore node_visit_counts from session state if available
@@ -473,11 +611,9 @@ async def execute(
         )
         if _is_fresh_shared and is_continuous and self._storage_path:
             try:
-                from framework.storage.conversation_store import FileConversationStore
-
                 entry_conv_path = self._storage_path / "conversations" / current_node_id
                 if entry_conv_path.exists():
-                    _store = FileConversationStore(base_path=entry_conv_path)
+                    _store = self._open_conversation_store(current_node_id)
 
                     # Read cursor to find next seq for the transition marker.
                     _cursor = await _store.read_cursor() or {}
@@ -509,6 +645,7 @@ async def execute(
                             "is_transition_marker": True,
                         },
                     )
+                    await _store.close()
                     self.logger.info(
                         "🔄 Cleared stale cursor and added transition marker "
                         "for shared-session entry node '%s'",
@@ -608,6 +745,7 @@ async def execute(
                         error="Execution paused by user request",
                         session_state=pause_session_state,
                         node_visit_counts=dict(node_visit_counts),
+                        branch_stats=dict(branch_stats),
                     )
 
                 # Get current node
@@ -955,6 +1093,7 @@ async def execute(
                                 execution_quality="failed",
                                 node_visit_counts=dict(node_visit_counts),
                                 session_state=failure_session_state,
+                                branch_stats=dict(branch_stats),
                             )
 
                 # Check if we just executed a pause node - if so, save state and return
@@ -1014,6 +1153,7 @@ async def execute(
                         had_partial_failures=len(nodes_failed) > 0,
                         execution_quality=exec_quality,
                         node_visit_counts=dict(node_visit_counts),
+                        branch_stats=dict(branch_stats),
                     )
 
                 # Check if this is a terminal node - if so, we're done
@@ -1075,6 +1215,7 @@ async def execute(
                             _branch_results,
                             branch_tokens,
                             branch_latency,
+                            fanout_stats,
                         ) = await self._execute_parallel_branches(
                             graph=graph,
                             goal=goal,
@@ -1087,6 +1228,7 @@ async def execute(
 
                         total_tokens += branch_tokens
                         total_latency += branch_latency
+                        branch_stats.update(fanout_stats)
 
                         # Continue from fan-in node
                         if fan_in_node:
@@ -1204,12 +1346,7 @@ async def execute(
                         # so the transition marker and all subsequent messages are
                         # persisted there instead of the first node's directory.
                         if self._storage_path:
-                            from framework.storage.conversation_store import (
-                                FileConversationStore,
-                            )
-
-                            next_store_path = self._storage_path / "conversations" / next_spec.id
-                            next_store = FileConversationStore(base_path=next_store_path)
+                            next_store = self._open_conversation_store(next_spec.id)
                             await continuous_conversation.switch_store(next_store)
 
                         # Insert transition marker into conversation
@@ -1310,6 +1447,7 @@ async def execute(
                     "execution_path": list(path),
                     "node_visit_counts": dict(node_visit_counts),
                 },
+                branch_stats=dict(branch_stats),
             )
 
         except asyncio.CancelledError:
@@ -1317,29 +1455,18 @@ async def execute(
             self.logger.info("⏸ Execution cancelled - saving state for resume")
 
             # Flush WIP accumulator outputs from the interrupted node's
-            # cursor.json into SharedMemory so they survive resume.  The
-            # accumulator writes to cursor.json on every set() call, but
-            # only writes to SharedMemory when the judge ACCEPTs.  Without
-            # this, edge conditions checking these keys see None on resume.
+            # conversation cursor into SharedMemory so they survive resume.
+            # Without this, edge conditions checking these keys see None on
+            # resume.
             if current_node_id and self._storage_path:
                 try:
-                    import json as _json
-
-                    cursor_path = (
-                        self._storage_path / "conversations" / current_node_id / "cursor.json"
-                    )
-                    if cursor_path.exists():
-                        cursor_data = _json.loads(cursor_path.read_text(encoding="utf-8"))
-                        wip_outputs = cursor_data.get("outputs", {})
-                        for key, value in wip_outputs.items():
-                            if value is not None:
-                                memory.write(key, value, validate=False)
-                        if wip_outputs:
-                            self.logger.info(
-                                "Flushed %d WIP accumulator outputs to memory: %s",
-                                len(wip_outputs),
-                                list(wip_outputs.keys()),
-                            )
+                    wip_keys = await self._flush_wip_outputs(current_node_id, memory)
+                    if wip_keys:
+                        self.logger.info(
+                            "Flushed %d WIP accumulator outputs to memory: %s",
+                            len(wip_keys),
+                            wip_keys,
+                        )
                 except Exception:
                     self.logger.debug(
                         "Could not flush accumulator outputs from cursor",
@@ -1384,6 +1511,7 @@ async def execute(
                 had_partial_failures=len(nodes_failed) > 0,
                 execution_quality=exec_quality,
                 node_visit_counts=dict(node_visit_counts),
+                branch_stats=dict(branch_stats),
             )
 
         except Exception as e:
@@ -1426,16 +1554,7 @@ async def execute(
             # Flush WIP accumulator outputs (same as CancelledError path)
             if current_node_id and self._storage_path:
                 try:
-                    import json as _json
-
-                    cursor_path = (
-                        self._storage_path / "conversations" / current_node_id / "cursor.json"
-                    )
-                    if cursor_path.exists():
-                        cursor_data = _json.loads(cursor_path.read_text(encoding="utf-8"))
-                        for key, value in cursor_data.get("outputs", {}).items():
-                            if value is not None:
-                                memory.write(key, value, validate=False)
+                    await self._flush_wip_outputs(current_node_id, memory)
                 except Exception:
                     self.logger.debug(
                         "Could not flush accumulator outputs from cursor",
@@ -1486,9 +1605,11 @@ async def execute(
                 execution_quality="failed",
                 node_visit_counts=dict(node_visit_counts),
                 session_state=session_state_out,
+                branch_stats=dict(branch_stats),
             )
 
         finally:
+            await self._close_conversation_stores()
             if _ctx_token is not None:
                 from framework.runner.tool_registry import ToolRegistry
 
@@ -1586,13 +1707,12 @@ def _get_node_implementation(
             # Custom configs can still be pre-registered via node_registry.
             from framework.graph.event_loop_node import EventLoopNode, LoopConfig
 
-            # Create a FileConversationStore if a storage path is available
+            # Create a conversation store if a storage path is available.
+            # loop_config["conversation_backend"] = "segmented" opts new
+            # conversations into the segmented append-only log.
             conv_store = None
             if self._storage_path:
-                from framework.storage.conversation_store import FileConversationStore
-
-                store_path = self._storage_path / "conversations" / node_spec.id
-                conv_store = FileConversationStore(base_path=store_path)
+                conv_store = self._open_conversation_store(node_spec.id)
 
             # Auto-configure spillover directory for large tool results.
             # When a tool result exceeds max_tool_result_chars, the full
@@ -1617,6 +1737,7 @@ def _get_node_implementation(
                     max_history_tokens=lc.get("max_history_tokens", 32000),
                     max_tool_result_chars=lc.get("max_tool_result_chars", 3_000),
                     spillover_dir=spillover,
+                    spillover_compress=lc.get("spillover_compress", False),
                 ),
                 tool_executor=self.tool_executor,
                 conversation_store=conv_store,
@@ -1798,9 +1919,14 @@ async def _execute_parallel_branches(
         source_result: NodeResult,
         source_node_spec: Any,
         path: list[str],
-    ) -> tuple[dict[str, NodeResult], int, int]:
+    ) -> tuple[dict[str, NodeResult], int, int, dict[str, dict[str, Any]]]:
         """
-        Execute multiple branches in parallel using asyncio.gather.
+        Execute multiple branches in parallel.
+
+        At most ``max_in_flight`` branches run at once, launched in priority
+        order. With ``isolate_branch_memory`` each branch writes to its own
+        memory overlay; the overlays of successful branches are merged into
+        *memory* once all branches have finished (the fan-in point).
 
         Args:
             graph: The graph specification
@@ -1812,8 +1938,9 @@ async def _execute_parallel_branches(
             path: Execution path list to update
 
         Returns:
-            Tuple of (branch_results dict, total_tokens, total_latency)
+            Tuple of (branch_results dict, total_tokens, total_latency, branch_stats)
         """
+        config = self._parallel_config
         branches: dict[str, ParallelBranch] = {}
 
         # Create branches for each edge
@@ -1823,10 +1950,19 @@ async def _execute_parallel_branches(
                 branch_id=branch_id,
                 node_id=edge.target,
                 edge=edge,
+                memory=memory.fork() if config.isolate_branch_memory else memory,
             )
 
-        self.logger.info(f"   ⑂ Fan-out: executing {len(branches)} branches in parallel")
-        for branch in branches.values():
+        launch_order = self._order_branches(list(branches.values()))
+        in_flight = len(launch_order)
+        if config.max_in_flight > 0:
+            in_flight = min(in_flight, config.max_in_flight)
+
+        self.logger.info(
+            f"   ⑂ Fan-out: executing {len(branches)} branches in parallel "
+            f"(max {in_flight} at once)"
+        )
+        for branch in launch_order:
             target_spec = graph.get_node(branch.node_id)
             self.logger.info(f"      • {target_spec.name if target_spec else branch.node_id}")
 
@@ -1834,6 +1970,7 @@ async def execute_single_branch(
             branch: ParallelBranch,
         ) -> tuple[ParallelBranch, NodeResult | Exception]:
             """Execute a single branch with retry logic."""
+            memory = branch.memory
             node_spec = graph.get_node(branch.node_id)
             if node_spec is None:
                 branch.status = "failed"
@@ -1977,17 +2114,38 @@ async def execute_single_branch(
 
                 return branch, e
 
-        # Execute all branches concurrently
-        tasks = [execute_single_branch(b) for b in branches.values()]
-        results = await asyncio.gather(*tasks, return_exceptions=False)
-
-        # Process results
+        # Workers pull branches in priority order, bounding concurrency
+        start = time.monotonic()
+        pending = iter(launch_order)
+        completed: list[tuple[ParallelBranch, NodeResult | Exception]] = []
+        # Set on the first failure under fail_all; stops every worker launching more
+        doomed = asyncio.Event()
+
+        async def worker() -> None:
+            for branch in pending:
+                if doomed.is_set():
+                    return  # Don't launch more branches into a doomed fan-out
+                began = time.monotonic()
+                branch.queued_ms = int((began - start) * 1000)
+                outcome = await execute_single_branch(branch)
+                branch.wall_ms = int((time.monotonic() - began) * 1000)
+                completed.append(outcome)
+                if branch.status == "failed" and config.on_branch_failure == "fail_all":
+                    doomed.set()
+
+        await asyncio.gather(*(worker() for _ in range(in_flight)))
+
+        # Process results in graph order (completion order is kept for merging)
         total_tokens = 0
         total_latency = 0
         branch_results: dict[str, NodeResult] = {}
         failed_branches: list[ParallelBranch] = []
+        outcomes = {branch.branch_id: result for branch, result in completed}
 
-        for branch, result in results:
+        for branch in branches.values():
+            if branch.branch_id not in outcomes:
+                continue  # Never launched (fail_all)
+            result = outcomes[branch.branch_id]
             path.append(branch.node_id)
 
             if isinstance(result, Exception):
@@ -2009,10 +2167,67 @@ async def execute_single_branch(
                     f"⚠ Some branches failed ({failed_names}), continuing with successful ones"
                 )
 
+        if config.isolate_branch_memory:
+            self._merge_branch_memory(
+                memory,
+                [b for b, _ in completed if b.status == "completed"],
+                launch_order,
+            )
+
         self.logger.info(
             f"   ⑃ Fan-out complete: {len(branch_results)}/{len(branches)} branches succeeded"
         )
-        return branch_results, total_tokens, total_latency
+        branch_stats = {b.branch_id: b.stats() for b in branches.values() if b.status != "pending"}
+        return branch_results, total_tokens, total_latency, branch_stats
+
+    def _order_branches(self, branches: list[ParallelBranch]) -> list[ParallelBranch]:
+        """Sort branches into launch order (see ParallelExecutionConfig.priority_order)."""
+        explicit = {node_id: i for i, node_id in enumerate(self._parallel_config.priority_order)}
+        return sorted(
+            branches,
+            key=lambda b: (explicit.get(b.node_id, len(explicit)), -b.edge.priority),
+        )
+
+    def _merge_branch_memory(
+        self,
+        memory: SharedMemory,
+        completed: list[ParallelBranch],
+        launch_order: list[ParallelBranch],
+    ) -> None:
+        """
+        Merge branch overlays into shared memory.
+
+        Args:
+            memory: Shared memory the branches forked from
+            completed: Successful branches, in completion order
+            launch_order: All branches, in launch (priority) order
+
+        Raises:
+            RuntimeError: On conflicting writes with the "error" strategy
+        """
+        strategy = self._parallel_config.memory_conflict_strategy
+        if strategy == "priority":
+            rank = {b.branch_id: i for i, b in enumerate(launch_order)}
+            completed = sorted(completed, key=lambda b: rank[b.branch_id])
+            strategy = "first_wins"
+
+        merged: dict[str, Any] = {}
+        writers: dict[str, str] = {}
+        for branch in completed:
+            for key, value in branch.memory.local_writes().items():
+                if key in merged:
+                    if strategy == "first_wins":
+                        continue
+                    if strategy == "error" and merged[key] != value:
+                        raise RuntimeError(
+                            f"Memory conflict: branches {writers[key]} and {branch.node_id} "
+                            f"wrote different values to '{key}'"
+                        )
+                merged[key] = value
+                writers[key] = branch.node_id
+
+        for key, value in merged.items():
+            memory.write(key, value, validate=False)
 
     def register_node(self, node_id: str, implementation: NodeProtocol) -> None:
         """Register a custom node implementation."""
@@ -19,6 +19,7 @@
 import json
 import logging
 from abc import ABC, abstractmethod
+from collections import ChainMap
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -433,6 +434,25 @@ def read_all(self) -> dict[str, Any]:
             return {k: v for k, v in self._data.items() if k in self._allowed_read}
         return dict(self._data)
 
+    def fork(self) -> "SharedMemory":
+        """Create a branch-local overlay for parallel fan-out.
+
+        Reads fall through to this memory; writes stay in the overlay (see
+        local_writes()) until the executor merges them back, so concurrent
+        branches neither see nor contend with each other's writes.
+        """
+        return SharedMemory(
+            _data=ChainMap({}, self._data),  # type: ignore[arg-type]
+            _allowed_read=set(self._allowed_read),
+            _allowed_write=set(self._allowed_write),
+        )
+
+    def local_writes(self) -> dict[str, Any]:
+        """Keys written to this overlay since fork() (empty for non-overlays)."""
+        if isinstance(self._data, ChainMap):
+            return dict(self._data.maps[0])
+        return {}
+
     def with_permissions(
         self,
         read_keys: list[str],
@@ -200,7 +200,9 @@ def build_transition_marker(
             files = sorted(data_path.iterdir())
             if files:
                 file_lines = [
-                    f"  {f.name} ({f.stat().st_size:,} bytes)" for f in files if f.is_file()
+                    f"  {f.name} ({f.stat().st_size:,} bytes)"
+                    for f in files
+                    if f.is_file() and not f.name.startswith(".")
                 ]
                 if file_lines:
                     sections.append(
@@ -1,5 +1,17 @@
+"""
+Safe evaluation of Python expressions (edge conditions, router rules).
+
+Only a whitelist of syntax, operators, builtins and methods is allowed.
+``safe_eval`` compiles each expression string once into a tree of closures
+(cached per string) instead of re-parsing and walking the AST on every call.
+The compiled form follows exactly the same rules as ``SafeEvalVisitor``,
+which remains as the reference interpreter.
+"""
+
 import ast
 import operator
+from collections.abc import Callable, Mapping
+from functools import lru_cache
 from typing import Any
 
 # Safe operators whitelist
@@ -53,6 +65,10 @@
 }
 
 
+# Methods callable on any object (e.g. ``output.get("key")``, ``str(x).lower()``)
+SAFE_METHODS = frozenset({"get", "keys", "values", "items", "lower", "upper", "strip", "split"})
+
+
 class SafeEvalVisitor(ast.NodeVisitor):
     def __init__(self, context: dict[str, Any]):
         self.context = context
@@ -196,16 +212,7 @@ def visit_Call(self, node: ast.Call) -> Any:
             # For security, start strict. Only helper functions.
             # Re-visiting: User might want 'output.get("key")'.
             method_name = node.func.attr
-            if method_name in [
-                "get",
-                "keys",
-                "values",
-                "items",
-                "lower",
-                "upper",
-                "strip",
-                "split",
-            ]:
+            if method_name in SAFE_METHODS:
                 is_safe = True
 
         if not is_safe and func not in SAFE_FUNCTIONS.values():
@@ -221,13 +228,240 @@ def visit_Index(self, node: ast.Index) -> Any:
         return self.visit(node.value)
 
 
-def safe_eval(expr: str, context: dict[str, Any] | None = None) -> Any:
+# ---------------------------------------------------------------------------
+# Compiled evaluation
+# ---------------------------------------------------------------------------
+
+Evaluator = Callable[[Mapping[str, Any]], Any]
+
+
+class CompiledExpression:
+    """
+    A validated, reusable form of an expression.
+
+    Call it with a context mapping to evaluate. Disallowed constructs are
+    listed in ``errors`` and raise the same exception as ``SafeEvalVisitor``
+    when (and only when) evaluation reaches them.
+    """
+
+    __slots__ = ("expr", "names", "errors", "_evaluate")
+
+    def __init__(self, expr: str, evaluate: Evaluator, names: frozenset[str], errors: list[str]):
+        self.expr = expr
+        self.names = names  # Context variables the expression reads
+        self.errors = errors
+        self._evaluate = evaluate
+
+    def __call__(self, context: Mapping[str, Any] | None = None) -> Any:
+        return self._evaluate(context if context is not None else {})
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.expr!r})"
+
+
+def _raiser(exc_type: type[Exception], message: str) -> Evaluator:
+    def evaluate(ctx: Mapping[str, Any]) -> Any:
+        raise exc_type(message)
+
+    return evaluate
+
+
+class _Compiler:
+    """Turns an AST into closures mirroring SafeEvalVisitor node by node."""
+
+    def __init__(self):
+        self.names: set[str] = set()
+        self.errors: list[str] = []
+
+    def reject(self, exc_type: type[Exception], message: str) -> Evaluator:
+        self.errors.append(message)
+        return _raiser(exc_type, message)
+
+    def compile(self, node: ast.AST) -> Evaluator:
+        method = getattr(self, "compile_" + node.__class__.__name__, None)
+        if method is None:
+            return self.reject(ValueError, f"Use of {node.__class__.__name__} is not allowed")
+        return method(node)
+
+    def compile_Expression(self, node: ast.Expression) -> Evaluator:
+        return self.compile(node.body)
+
+    def compile_Constant(self, node: ast.Constant) -> Evaluator:
+        value = node.value
+        return lambda ctx: value
+
+    # --- Data Structures ---
+    def compile_List(self, node: ast.List) -> Evaluator:
+        elts = [self.compile(elt) for elt in node.elts]
+        return lambda ctx: [f(ctx) for f in elts]
+
+    def compile_Tuple(self, node: ast.Tuple) -> Evaluator:
+        elts = [self.compile(elt) for elt in node.elts]
+        return lambda ctx: tuple(f(ctx) for f in elts)
+
+    def compile_Dict(self, node: ast.Dict) -> Evaluator:
+        pairs = [
+            (self.compile(k), self.compile(v))
+            for k, v in zip(node.keys, node.values, strict=False)
+            if k is not None
+        ]
+        return lambda ctx: {k(ctx): v(ctx) for k, v in pairs}
+
+    # --- Operations ---
+    def compile_BinOp(self, node: ast.BinOp) -> Evaluator:
+        op_func = SAFE_OPERATORS.get(type(node.op))
+        left, right = self.compile(node.left), self.compile(node.right)
+        if op_func is None:
+            return self.reject(ValueError, f"Operator {type(node.op).__name__} is not allowed")
+        return lambda ctx: op_func(left(ctx), right(ctx))
+
+    def compile_UnaryOp(self, node: ast.UnaryOp) -> Evaluator:
+        op_func = SAFE_OPERATORS.get(type(node.op))
+        operand = self.compile(node.operand)
+        if op_func is None:
+            return self.reject(ValueError, f"Operator {type(node.op).__name__} is not allowed")
+        return lambda ctx: op_func(operand(ctx))
+
+    def compile_Compare(self, node: ast.Compare) -> Evaluator:
+        left = self.compile(node.left)
+        steps = []
+        for op, comparator in zip(node.ops, node.comparators, strict=False):
+            op_func = SAFE_OPERATORS.get(type(op))
+            right = self.compile(comparator)
+            if op_func is None:
+                right = self.reject(ValueError, f"Operator {type(op).__name__} is not allowed")
+                op_func = operator.eq  # never reached: right raises first
+            steps.append((op_func, right))
+
+        if len(steps) == 1:
+            op_func, right = steps[0]
+            return lambda ctx: bool(op_func(left(ctx), right(ctx)))
+
+        def evaluate(ctx: Mapping[str, Any]) -> bool:
+            lhs = left(ctx)
+            for op_func, right in steps:
+                rhs = right(ctx)
+                if not op_func(lhs, rhs):
+                    return False
+                lhs = rhs  # Chain comparisons
+            return True
+
+        return evaluate
+
+    def compile_BoolOp(self, node: ast.BoolOp) -> Evaluator:
+        # Like SafeEvalVisitor, every operand is evaluated (no short-circuit)
+        values = [self.compile(v) for v in node.values]
+        if isinstance(node.op, ast.And):
+            combine = all
+        elif isinstance(node.op, ast.Or):
+            combine = any
+        else:
+            return self.reject(
+                ValueError, f"Boolean operator {type(node.op).__name__} is not allowed"
+            )
+
+        def evaluate(ctx: Mapping[str, Any]) -> bool:
+            results = [f(ctx) for f in values]
+            return combine(results)
+
+        return evaluate
+
+    def compile_IfExp(self, node: ast.IfExp) -> Evaluator:
+        test, body, orelse = (
+            self.compile(node.test),
+            self.compile(node.body),
+            self.compile(node.orelse),
+        )
+        return lambda ctx: body(ctx) if test(ctx) else orelse(ctx)
+
+    # --- Variables and Attributes ---
+    def compile_Name(self, node: ast.Name) -> Evaluator:
+        if not isinstance(node.ctx, ast.Load):
+            return self.reject(ValueError, "Only reading variables is allowed")
+        name = node.id
+        if name in SAFE_FUNCTIONS:
+            # Builtins shadow context variables of the same name
+            func = SAFE_FUNCTIONS[name]
+            return lambda ctx: func
+        self.names.add(name)
+
+        def evaluate(ctx: Mapping[str, Any]) -> Any:
+            if name in ctx:
+                return ctx[name]
+            raise NameError(f"Name '{name}' is not defined")
+
+        return evaluate
+
+    def compile_Subscript(self, node: ast.Subscript) -> Evaluator:
+        value, index = self.compile(node.value), self.compile(node.slice)
+        return lambda ctx: value(ctx)[index(ctx)]
+
+    def compile_Attribute(self, node: ast.Attribute) -> Evaluator:
+        attr = node.attr
+        if attr.startswith("_"):
+            return self.reject(ValueError, f"Access to private attribute '{attr}' is not allowed")
+        value = self.compile(node.value)
+
+        def evaluate(ctx: Mapping[str, Any]) -> Any:
+            val = value(ctx)
+            try:
+                return getattr(val, attr)
+            except AttributeError:
+                pass
+            raise AttributeError(f"Object has no attribute '{attr}'")
+
+        return evaluate
+
+    def compile_Call(self, node: ast.Call) -> Evaluator:
+        func = self.compile(node.func)
+        is_safe = (isinstance(node.func, ast.Name) and node.func.id in SAFE_FUNCTIONS) or (
+            isinstance(node.func, ast.Attribute) and node.func.attr in SAFE_METHODS
+        )
+        args = [self.compile(arg) for arg in node.args]
+        keywords = [(kw.arg, self.compile(kw.value)) for kw in node.keywords]
+
+        def evaluate(ctx: Mapping[str, Any]) -> Any:
+            f = func(ctx)
+            if not is_safe and f not in SAFE_FUNCTIONS.values():
+                raise ValueError("Call to function/method is not allowed")
+            return f(*[a(ctx) for a in args], **{k: v(ctx) for k, v in keywords})
+
+        return evaluate
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(expr: str) -> CompiledExpression:
+    """
+    Parse and compile an expression once; results are cached per string.
+
+    Raises:
+        SyntaxError: If the expression is invalid Python.
+    """
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError as e:
+        raise SyntaxError(f"Invalid syntax in expression: {e}") from e
+
+    compiler = _Compiler()
+    evaluate = compiler.compile(tree)
+    return CompiledExpression(expr, evaluate, frozenset(compiler.names), compiler.errors)
+
+
+def validate_expression(expr: str) -> list[str]:
+    """Return problems that would make *expr* fail whenever it is evaluated."""
+    try:
+        return list(compile_expression(expr).errors)
+    except SyntaxError as e:
+        return [str(e)]
+
+
+def safe_eval(expr: str, context: Mapping[str, Any] | None = None) -> Any:
     """
     Safely evaluate a python expression string.
 
     Args:
         expr: The expression string to evaluate.
-        context: Dictionary of variables available in the expression.
+        context: Mapping of variables available in the expression.
 
     Returns:
         The result of the evaluation.
@@ -236,6 +470,11 @@ def safe_eval(expr: str, context: dict[str, Any] | None = None) -> Any:
         ValueError: If unsafe operations or syntax are detected.
         SyntaxError: If the expression is invalid Python.
     """
+    return compile_expression(expr)(context)
+
+
+def safe_eval_uncompiled(expr: str, context: dict[str, Any] | None = None) -> Any:
+    """Evaluate with SafeEvalVisitor, re-parsing every call (reference implementation)."""
     if context is None:
         context = {}
 
@@ -0,0 +1,332 @@
+"""
+Tool-result spillover - write large tool results to files with structured previews.
+
+When a tool result is too large for the conversation, EventLoopNode writes
+it to the spillover directory and keeps only a preview in context. For JSON
+results the preview is structural rather than a character prefix: the
+top-level keys with their sizes, a schema sketch of the records, and as many
+leading records as fit the token budget.
+
+JSON results are written pretty-printed (so line-based tools keep working)
+together with a sidecar record index, ``.<filename>.idx``, holding the byte
+span of every element of the main record array. ``load_data`` uses it to page
+by record (``offset_records``/``limit_records``) instead of by byte.
+
+Sidecar format (JSON)::
+
+    {"version": 1, "path": "$" | "$.<key>", "records": N,
+     "size": <uncompressed bytes>, "spans": [[start, end], ...]}
+
+With ``compress=True`` the file is gzip-compressed (``<filename>.gz``);
+spans refer to the uncompressed content.
+
+Everything here is blocking; EventLoopNode runs it in a worker thread.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+INDEX_VERSION = 1
+MIN_INDEXED_RECORDS = 2  # Smaller arrays are not worth paging through
+
+_NOT_PARSED = object()
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token), as used for conversation budgets."""
+    return (len(text) + 3) // 4
+
+
+def index_path(path: Path) -> Path:
+    """Sidecar record index for the spill file at *path*."""
+    return path.with_name(f".{path.name}.idx")
+
+
+# ---------------------------------------------------------------------------
+# Structure
+# ---------------------------------------------------------------------------
+
+
+def parse_json(content: str) -> Any:
+    """Parse *content* as a JSON object or array, or return ``_NOT_PARSED``."""
+    if not content.lstrip().startswith(("{", "[")):
+        return _NOT_PARSED
+    try:
+        return json.loads(content)
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return _NOT_PARSED
+
+
+def primary_array(parsed: Any) -> tuple[str | None, list | None]:
+    """
+    Find the main record array of a JSON value.
+
+    Returns:
+        ("$", value) for a top-level array, (key, value[key]) for the
+        longest array directly under a top-level object, else (None, None)
+    """
+    if isinstance(parsed, list):
+        return ("$", parsed) if parsed else (None, None)
+    if isinstance(parsed, dict):
+        arrays = [(k, v) for k, v in parsed.items() if isinstance(v, list) and v]
+        if arrays:
+            return max(arrays, key=lambda kv: len(kv[1]))
+    return None, None
+
+
+def _type_name(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, list):
+        return f"list[{len(value)}]"
+    return "object"
+
+
+def sketch(value: Any, depth: int = 0, max_depth: int = 2, max_fields: int = 20) -> str:
+    """Schema sketch of *value*, e.g. ``{id: int, tags: list[3] of str}``.
+
+    Objects nested *max_depth* levels down collapse to ``{N keys}`` and at
+    most *max_fields* fields are listed per object.
+    """
+    if isinstance(value, dict):
+        if depth >= max_depth:
+            return f"{{{len(value)} keys}}"
+        fields = [
+            f"{k}: {sketch(v, depth + 1, max_depth, max_fields)}"
+            for k, v in list(value.items())[:max_fields]
+        ]
+        if len(value) > max_fields:
+            fields.append(f"... {len(value) - max_fields} more")
+        return "{" + ", ".join(fields) + "}"
+    if isinstance(value, list) and value:
+        return f"list[{len(value)}] of {sketch(value[0], depth + 1, max_depth, max_fields)}"
+    return _type_name(value)
+
+
+# Coarser sketches tried in turn until the schema line fits its budget
+_SKETCH_LEVELS = ((2, 20), (1, 20), (1, 8), (0, 0))
+
+
+def _describe(value: Any) -> str:
+    if isinstance(value, str):
+        return f"str, {len(value)} chars"
+    if isinstance(value, dict):
+        return f"object, {len(value)} keys"
+    if isinstance(value, list):
+        return f"array, {len(value)} items"
+    return _type_name(value)
+
+
+def _clip(text: str, token_budget: int, count_tokens: Callable[[str], int]) -> str:
+    """Cut *text* to about *token_budget* tokens, marking the cut with an ellipsis."""
+    if count_tokens(text) <= token_budget:
+        return text
+    return text[: max(token_budget * 4 - 1, 0)] + "…"
+
+
+def build_preview(
+    content: str,
+    token_budget: int,
+    count_tokens: Callable[[str], int] = estimate_tokens,
+    parsed: Any = _NOT_PARSED,
+) -> str:
+    """
+    Summarize *content* in about *token_budget* tokens.
+
+    JSON objects and arrays get a structural summary followed by whole
+    leading records; anything else gets a prefix of the text. The summary
+    (key list and schema sketch) is held to half the budget so wide or
+    deeply nested results still leave room for records.
+    """
+    if parsed is _NOT_PARSED:
+        parsed = parse_json(content)
+    if not isinstance(parsed, dict | list):
+        chars = max(token_budget * 4, 1)
+        return content[:chars] + ("…" if len(content) > chars else "")
+
+    header_budget = token_budget // 2
+    lines = []
+    if isinstance(parsed, dict):
+        keys = [f"{k} ({_describe(v)})" for k, v in list(parsed.items())[:30]]
+        if len(parsed) > 30:
+            keys.append(f"... {len(parsed) - 30} more")
+        lines.append("Top-level keys: " + ", ".join(keys))
+
+    key, records = primary_array(parsed)
+    if records is None:
+        # Object without arrays: show it compactly, cut to the budget
+        lines.append(json.dumps(parsed, ensure_ascii=False, default=str))
+        text = "\n".join(lines)
+        chars = max(token_budget * 4, 1)
+        return text[:chars] + ("…" if len(text) > chars else "")
+
+    # The key list may take half of the header's share, the schema the rest
+    lines = [_clip(line, header_budget // 2, count_tokens) for line in lines]
+    where = "Top-level array" if key == "$" else f"'{key}'"
+    schema_budget = header_budget - sum(count_tokens(line) for line in lines)
+    for max_depth, max_fields in _SKETCH_LEVELS:
+        schema = (
+            f"{where}: {len(records)} records, each {sketch(records[0], 0, max_depth, max_fields)}"
+        )
+        if count_tokens(schema) <= schema_budget:
+            break
+    lines.append(_clip(schema, schema_budget, count_tokens))
+    lines.append("First records:")
+    header = "\n".join(lines)
+    longest_footer = f"({len(records)} of {len(records)} records shown)"
+    used = count_tokens(header) + count_tokens(longest_footer) + 2
+
+    shown = []
+    for record in records:
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        cost = count_tokens(line) + 1
+        if used + cost > token_budget:
+            if not shown:
+                # Not even one record fits: show the start of the first one
+                shown.append(_clip(line, token_budget - used, count_tokens))
+            break
+        shown.append(line)
+        used += cost
+
+    footer = f"({len(shown)} of {len(records)} records shown)"
+    return "\n".join([header, *shown, footer])
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+
+def _dump(value: Any, depth: int) -> str:
+    return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n" + "  " * depth)
+
+
+def render_indexed(parsed: Any, key: str) -> tuple[str, list[tuple[int, int]]]:
+    """
+    Pretty-print *parsed* and record the byte span of each primary record.
+
+    The text is identical to ``json.dumps(parsed, indent=2, ensure_ascii=False)``.
+    """
+    parts: list[str] = []
+    spans: list[tuple[int, int]] = []
+    pos = 0
+
+    def emit(text: str) -> None:
+        nonlocal pos
+        parts.append(text)
+        pos += len(text.encode("utf-8"))
+
+    def emit_records(items: list, depth: int) -> None:
+        pad = "\n" + "  " * (depth + 1)
+        emit("[")
+        for i, item in enumerate(items):
+            emit(("," if i else "") + pad)
+            start = pos
+            emit(_dump(item, depth + 1))
+            spans.append((start, pos))
+        emit("\n" + "  " * depth + "]")
+
+    if key == "$":
+        emit_records(parsed, 0)
+    else:
+        emit("{")
+        for i, (k, v) in enumerate(parsed.items()):
+            emit(("," if i else "") + "\n  " + json.dumps(k, ensure_ascii=False) + ": ")
+            if k == key:
+                emit_records(v, 1)
+            else:
+                emit(_dump(v, 1))
+        emit("\n}")
+    return "".join(parts), spans
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+@dataclass
+class SpillResult:
+    """A tool result written to the spillover directory."""
+
+    filename: str
+    preview: str
+    records: int | None = None  # Records indexed for load_data paging
+    record_path: str | None = None  # "$" or "$.<key>"
+
+
+def spill_tool_result(
+    spill_dir: str | Path,
+    filename: str,
+    content: str,
+    preview_tokens: int,
+    compress: bool = False,
+) -> SpillResult:
+    """
+    Write *content* to ``spill_dir/filename`` and build its preview.
+
+    Args:
+        spill_dir: Directory for spilled results (created if missing)
+        filename: File name; ``.gz`` is appended when compressing
+        content: Full tool result
+        preview_tokens: Token budget for the preview
+        compress: Gzip the file
+
+    Returns:
+        SpillResult with the final file name and preview
+    """
+    directory = Path(spill_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    if compress:
+        filename += ".gz"
+    path = directory / filename
+
+    parsed = parse_json(content)
+    key, records = primary_array(parsed)
+    spans: list[tuple[int, int]] | None = None
+    if records is not None and len(records) >= MIN_INDEXED_RECORDS:
+        text, spans = render_indexed(parsed, key)
+    elif parsed is not _NOT_PARSED:
+        # Pretty-print so load_data's byte pages and line tools stay readable
+        text = json.dumps(parsed, indent=2, ensure_ascii=False)
+    else:
+        text = content
+
+    data = text.encode("utf-8")
+    _write_atomic(path, gzip.compress(data, compresslevel=6) if compress else data)
+
+    sidecar = index_path(path)
+    result = SpillResult(
+        filename=filename,
+        preview=build_preview(content, preview_tokens, parsed=parsed),
+    )
+    if spans is not None:
+        result.records = len(spans)
+        result.record_path = "$" if key == "$" else f"$.{key}"
+        index = {
+            "version": INDEX_VERSION,
+            "path": result.record_path,
+            "records": len(spans),
+            "size": len(data),
+            "spans": spans,
+        }
+        _write_atomic(sidecar, json.dumps(index, separators=(",", ":")).encode("utf-8"))
+    else:
+        sidecar.unlink(missing_ok=True)  # Stale index from an earlier result
+    return result
@@ -8,9 +8,11 @@
 """
 
 import asyncio
+import inspect
 import json
 import logging
 import time
+from collections import OrderedDict
 from collections.abc import AsyncIterator, Callable
 from datetime import datetime
 from pathlib import Path
@@ -96,6 +98,60 @@ def _estimate_tokens(model: str, messages: list[dict]) -> tuple[int, str]:
     return total_chars // 4, "estimate"
 
 
+# ---------------------------------------------------------------------------
+# Prompt caching
+# ---------------------------------------------------------------------------
+
+_EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Providers that cache long prompt prefixes server-side without any markup.
+_AUTOMATIC_CACHE_PROVIDERS = frozenset({"openai", "azure", "deepseek", "gemini"})
+
+# Converted tool lists kept per provider (one entry per distinct tool set).
+_TOOL_SCHEMA_CACHE_SIZE = 32
+
+
+def _detect_prompt_cache_mode(model: str) -> str | None:
+    """Classify how *model*'s provider does prompt caching.
+
+    Returns ``"anthropic"`` when explicit ``cache_control`` breakpoints are
+    honoured (Anthropic, and Claude served through Bedrock/Vertex/OpenRouter),
+    ``"automatic"`` when the provider caches prefixes on its own (OpenAI,
+    Azure, DeepSeek, Gemini), or ``None`` when no caching is known.
+    """
+    provider = ""
+    if litellm is not None:
+        try:
+            _, provider, _, _ = litellm.get_llm_provider(model)
+        except Exception:
+            provider = ""
+    if provider == "anthropic" or "claude" in model.lower():
+        return "anthropic"
+    if provider in _AUTOMATIC_CACHE_PROVIDERS:
+        return "automatic"
+    return None
+
+
+def _cache_usage(usage: Any) -> tuple[int, int]:
+    """Extract ``(cache_read, cache_creation)`` token counts from a usage object.
+
+    Anthropic reports ``cache_read_input_tokens`` / ``cache_creation_input_tokens``;
+    OpenAI-style providers report ``prompt_tokens_details.cached_tokens``.
+    """
+
+    def _int(value: Any) -> int:
+        return value if isinstance(value, int) else 0
+
+    if not usage:
+        return 0, 0
+    read = _int(getattr(usage, "cache_read_input_tokens", None))
+    if not read:
+        details = getattr(usage, "prompt_tokens_details", None)
+        read = _int(getattr(details, "cached_tokens", None)) if details else 0
+    creation = _int(getattr(usage, "cache_creation_input_tokens", None))
+    return read, creation
+
+
 def _dump_failed_request(
     model: str,
     kwargs: dict[str, Any],
@@ -215,6 +271,32 @@ def _is_stream_transient_error(exc: BaseException) -> bool:
     return isinstance(exc, transient_types)
 
 
+def _resolve_tool_result(result: Any) -> ToolResult:
+    """Resolve a tool executor's result for the sync tool loop.
+
+    Executors such as ToolRegistry's return a coroutine for async tools.
+    Without a running loop in this thread it is run to completion;
+    otherwise it can't be awaited from sync code.
+
+    Raises:
+        RuntimeError: If *result* is awaitable but can't be awaited here
+    """
+    if not inspect.isawaitable(result):
+        return result
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        if asyncio.iscoroutine(result):
+            return asyncio.run(result)
+    else:
+        if asyncio.iscoroutine(result):
+            result.close()  # Never awaited; avoid the "never awaited" warning
+    raise RuntimeError(
+        "tool_executor returned an awaitable that complete_with_tools() cannot await "
+        "here; use acomplete_with_tools() instead"
+    )
+
+
 class LiteLLMProvider(LLMProvider):
     """
     LiteLLM-based LLM provider for multi-provider support.
@@ -257,6 +339,7 @@ def __init__(
         model: str = "gpt-4o-mini",
         api_key: str | None = None,
         api_base: str | None = None,
+        prompt_caching: bool = True,
         **kwargs: Any,
     ):
         """
@@ -269,12 +352,20 @@ def __init__(
                      look for the appropriate env var (OPENAI_API_KEY,
                      ANTHROPIC_API_KEY, etc.)
             api_base: Custom API base URL (for proxies or local deployments)
+            prompt_caching: Mark stable prompt prefixes (system prompt, tool
+                block, first history message, latest message) as cacheable
+                for providers that need explicit ``cache_control``
+                breakpoints. Providers with automatic caching need no markup.
             **kwargs: Additional arguments passed to litellm.completion()
         """
         self.model = model
         self.api_key = api_key
         self.api_base = api_base
         self.extra_kwargs = kwargs
+        self.prompt_cache_mode = _detect_prompt_cache_mode(model) if prompt_caching else None
+        self._tool_schema_cache: OrderedDict[
+            tuple[int, ...], tuple[tuple[Tool, ...], list[dict[str, Any]]]
+        ] = OrderedDict()
 
         if litellm is None:
             raise ImportError(
@@ -408,7 +499,7 @@ def complete(
         # Build kwargs
         kwargs: dict[str, Any] = {
             "model": self.model,
-            "messages": full_messages,
+            "messages": self._apply_cache_breakpoints(full_messages),
             "max_tokens": max_tokens,
             **self.extra_kwargs,
         }
@@ -420,7 +511,7 @@ def complete(
 
         # Add tools if provided
         if tools:
-            kwargs["tools"] = [self._tool_to_openai_format(t) for t in tools]
+            kwargs["tools"] = self._convert_tools(tools)
 
         # Add response_format for structured output
         # LiteLLM passes this through to the underlying provider
@@ -442,6 +533,7 @@ def complete(
         usage = response.usage
         input_tokens = usage.prompt_tokens if usage else 0
         output_tokens = usage.completion_tokens if usage else 0
+        cache_read, cache_creation = _cache_usage(usage)
 
         return LLMResponse(
             content=content,
@@ -450,6 +542,8 @@ def complete(
             output_tokens=output_tokens,
             stop_reason=response.choices[0].finish_reason or "",
             raw_response=response,
+            cache_read_tokens=cache_read,
+            cache_creation_tokens=cache_creation,
         )
 
     def complete_with_tools(
@@ -470,15 +564,17 @@ def complete_with_tools(
 
         total_input_tokens = 0
         total_output_tokens = 0
+        total_cache_read = 0
+        total_cache_creation = 0
 
         # Convert tools to OpenAI format
-        openai_tools = [self._tool_to_openai_format(t) for t in tools]
+        openai_tools = self._convert_tools(tools)
 
         for _ in range(max_iterations):
             # Build kwargs
             kwargs: dict[str, Any] = {
                 "model": self.model,
-                "messages": current_messages,
+                "messages": self._apply_cache_breakpoints(current_messages),
                 "max_tokens": max_tokens,
                 "tools": openai_tools,
                 **self.extra_kwargs,
@@ -496,6 +592,9 @@ def complete_with_tools(
             if usage:
                 total_input_tokens += usage.prompt_tokens
                 total_output_tokens += usage.completion_tokens
+                cache_read, cache_creation = _cache_usage(usage)
+                total_cache_read += cache_read
+                total_cache_creation += cache_creation
 
             choice = response.choices[0]
             message = choice.message
@@ -509,6 +608,8 @@ def complete_with_tools(
                     output_tokens=total_output_tokens,
                     stop_reason=choice.finish_reason or "stop",
                     raw_response=response,
+                    cache_read_tokens=total_cache_read,
+                    cache_creation_tokens=total_cache_creation,
                 )
 
             # Process tool calls.
@@ -552,7 +653,7 @@ def complete_with_tools(
                     input=args,
                 )
 
-                result = tool_executor(tool_use)
+                result = _resolve_tool_result(tool_executor(tool_use))
 
                 # Add tool result message
                 current_messages.append(
@@ -571,6 +672,8 @@ def complete_with_tools(
             output_tokens=total_output_tokens,
             stop_reason="max_iterations",
             raw_response=None,
+            cache_read_tokens=total_cache_read,
+            cache_creation_tokens=total_cache_creation,
         )
 
     # ------------------------------------------------------------------
@@ -695,7 +798,7 @@ async def acomplete(
 
         kwargs: dict[str, Any] = {
             "model": self.model,
-            "messages": full_messages,
+            "messages": self._apply_cache_breakpoints(full_messages),
             "max_tokens": max_tokens,
             **self.extra_kwargs,
         }
@@ -705,7 +808,7 @@ async def acomplete(
         if self.api_base:
             kwargs["api_base"] = self.api_base
         if tools:
-            kwargs["tools"] = [self._tool_to_openai_format(t) for t in tools]
+            kwargs["tools"] = self._convert_tools(tools)
         if response_format:
             kwargs["response_format"] = response_format
 
@@ -715,6 +818,7 @@ async def acomplete(
         usage = response.usage
         input_tokens = usage.prompt_tokens if usage else 0
         output_tokens = usage.completion_tokens if usage else 0
+        cache_read, cache_creation = _cache_usage(usage)
 
         return LLMResponse(
             content=content,
@@ -723,6 +827,8 @@ async def acomplete(
             output_tokens=output_tokens,
             stop_reason=response.choices[0].finish_reason or "",
             raw_response=response,
+            cache_read_tokens=cache_read,
+            cache_creation_tokens=cache_creation,
         )
 
     async def acomplete_with_tools(
@@ -742,12 +848,14 @@ async def acomplete_with_tools(
 
         total_input_tokens = 0
         total_output_tokens = 0
-        openai_tools = [self._tool_to_openai_format(t) for t in tools]
+        total_cache_read = 0
+        total_cache_creation = 0
+        openai_tools = self._convert_tools(tools)
 
         for _ in range(max_iterations):
             kwargs: dict[str, Any] = {
                 "model": self.model,
-                "messages": current_messages,
+                "messages": self._apply_cache_breakpoints(current_messages),
                 "max_tokens": max_tokens,
                 "tools": openai_tools,
                 **self.extra_kwargs,
@@ -764,6 +872,9 @@ async def acomplete_with_tools(
             if usage:
                 total_input_tokens += usage.prompt_tokens
                 total_output_tokens += usage.completion_tokens
+                cache_read, cache_creation = _cache_usage(usage)
+                total_cache_read += cache_read
+                total_cache_creation += cache_creation
 
             choice = response.choices[0]
             message = choice.message
@@ -776,6 +887,8 @@ async def acomplete_with_tools(
                     output_tokens=total_output_tokens,
                     stop_reason=choice.finish_reason or "stop",
                     raw_response=response,
+                    cache_read_tokens=total_cache_read,
+                    cache_creation_tokens=total_cache_creation,
                 )
 
             current_messages.append(
@@ -816,6 +929,8 @@ async def acomplete_with_tools(
                 )
 
                 result = tool_executor(tool_use)
+                if asyncio.iscoroutine(result) or asyncio.isfuture(result):
+                    result = await result
 
                 current_messages.append(
                     {
@@ -832,8 +947,61 @@ async def acomplete_with_tools(
             output_tokens=total_output_tokens,
             stop_reason="max_iterations",
             raw_response=None,
+            cache_read_tokens=total_cache_read,
+            cache_creation_tokens=total_cache_creation,
         )
 
+    def _convert_tools(self, tools: list[Tool]) -> list[dict[str, Any]]:
+        """Convert *tools* to OpenAI format, memoized per tool set.
+
+        EventLoopNode passes the same ``Tool`` objects on every turn, so the
+        converted schemas (and their cache breakpoint) are reused instead of
+        being rebuilt.  Keyed on object identity; the cached entry keeps the
+        tools alive so ids cannot be recycled.
+        """
+        key = tuple(id(t) for t in tools)
+        entry = self._tool_schema_cache.get(key)
+        if entry is not None and all(a is b for a, b in zip(entry[0], tools, strict=True)):
+            self._tool_schema_cache.move_to_end(key)
+            return list(entry[1])
+
+        converted = [self._tool_to_openai_format(t) for t in tools]
+        if self.prompt_cache_mode == "anthropic" and converted:
+            # One breakpoint after the last tool caches the whole tool block
+            converted[-1] = {**converted[-1], "cache_control": dict(_EPHEMERAL_CACHE_CONTROL)}
+        self._tool_schema_cache[key] = (tuple(tools), converted)
+        if len(self._tool_schema_cache) > _TOOL_SCHEMA_CACHE_SIZE:
+            self._tool_schema_cache.popitem(last=False)
+        return list(converted)
+
+    def _apply_cache_breakpoints(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return *messages* with ``cache_control`` breakpoints for Anthropic.
+
+        Marks the system prompt, the first conversational message (the
+        compacted summary once a conversation has been compacted, otherwise
+        the initial task) and the latest message, so the growing history is
+        read from cache on the next turn.  Together with the tool block this
+        stays within Anthropic's limit of four breakpoints.  Marked messages
+        are copied; the caller's dicts are never mutated.
+        """
+        if self.prompt_cache_mode != "anthropic" or not messages:
+            return messages
+
+        targets: set[int] = {len(messages) - 1}
+        if messages[0].get("role") == "system":
+            targets.add(0)
+        first = next((i for i, m in enumerate(messages) if m.get("role") != "system"), None)
+        if first is not None:
+            targets.add(first)
+
+        marked = list(messages)
+        for i in targets:
+            m = marked[i]
+            content = m.get("content")
+            if isinstance(content, str) and content and "cache_control" not in m:
+                marked[i] = {**m, "cache_control": dict(_EPHEMERAL_CACHE_CONTROL)}
+        return marked
+
     def _tool_to_openai_format(self, tool: Tool) -> dict[str, Any]:
         """Convert Tool to OpenAI function calling format."""
         return {
@@ -881,7 +1049,7 @@ async def stream(
 
         kwargs: dict[str, Any] = {
             "model": self.model,
-            "messages": full_messages,
+            "messages": self._apply_cache_breakpoints(full_messages),
             "max_tokens": max_tokens,
             "stream": True,
             "stream_options": {"include_usage": True},
@@ -892,7 +1060,7 @@ async def stream(
         if self.api_base:
             kwargs["api_base"] = self.api_base
         if tools:
-            kwargs["tools"] = [self._tool_to_openai_format(t) for t in tools]
+            kwargs["tools"] = self._convert_tools(tools)
 
         for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
             # Post-stream events (ToolCall, TextEnd, Finish) are buffered
@@ -903,6 +1071,7 @@ async def stream(
             tool_calls_acc: dict[int, dict[str, str]] = {}
             input_tokens = 0
             output_tokens = 0
+            cache_read = cache_creation = 0
 
             try:
                 response = await litellm.acompletion(**kwargs)  # type: ignore[union-attr]
@@ -958,6 +1127,7 @@ async def stream(
                         if usage:
                             input_tokens = getattr(usage, "prompt_tokens", 0) or 0
                             output_tokens = getattr(usage, "completion_tokens", 0) or 0
+                            cache_read, cache_creation = _cache_usage(usage)
 
                         tail_events.append(
                             FinishEvent(
@@ -965,6 +1135,8 @@ async def stream(
                                 input_tokens=input_tokens,
                                 output_tokens=output_tokens,
                                 model=self.model,
+                                cache_read_tokens=cache_read,
+                                cache_creation_tokens=cache_creation,
                             )
                         )
 
@@ -18,6 +18,9 @@ class LLMResponse:
     output_tokens: int = 0
     stop_reason: str = ""
     raw_response: Any = None
+    # Provider prompt-cache accounting (subsets of input_tokens)
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
 
 
 @dataclass
@@ -45,6 +48,7 @@ class ToolResult:
     tool_use_id: str
     content: str
     is_error: bool = False
+    cache_status: str = ""  # "hit" | "miss" for tools with a cache policy
 
 
 class LLMProvider(ABC):
@@ -72,6 +72,8 @@ class FinishEvent:
     input_tokens: int = 0
     output_tokens: int = 0
     model: str = ""
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
 
 
 @dataclass(frozen=True)
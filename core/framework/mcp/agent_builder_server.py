@@ -3495,6 +3495,22 @@ def _read_session_json(path: Path) -> dict | None:
         return None
 
 
+def _read_checkpoint_json(checkpoint_dir: Path, checkpoint_id: str) -> dict | None:
+    """Read a checkpoint with its full memory (delta checkpoints are replayed)."""
+    from framework.storage.checkpoint_store import read_checkpoint
+
+    checkpoint = read_checkpoint(checkpoint_dir, checkpoint_id)
+    return checkpoint.model_dump() if checkpoint else None
+
+
+def _read_checkpoint_index_json(checkpoint_dir: Path) -> dict | None:
+    """Read a session's checkpoint index (the append-only log or a legacy index.json)."""
+    from framework.storage.checkpoint_store import read_checkpoint_index
+
+    index = read_checkpoint_index(checkpoint_dir)
+    return index.model_dump() if index else None
+
+
 def _scan_agent_sessions(agent_work_dir: Path) -> list[tuple[str, Path]]:
     """Find session directories with state.json, sorted most-recent-first."""
     sessions: list[tuple[str, Path]] = []
@@ -3693,8 +3709,8 @@ def list_agent_checkpoints(
             }
         )
 
-    # Try index.json first
-    index_data = _read_session_json(checkpoint_dir / "index.json")
+    # Try the checkpoint index first
+    index_data = _read_checkpoint_index_json(checkpoint_dir)
     if index_data and "checkpoints" in index_data:
         checkpoints = index_data["checkpoints"]
     else:
@@ -3759,7 +3775,7 @@ def get_agent_checkpoint(
         return json.dumps({"error": f"No checkpoints found for session: {session_id}"})
 
     if not checkpoint_id:
-        index_data = _read_session_json(checkpoint_dir / "index.json")
+        index_data = _read_checkpoint_index_json(checkpoint_dir)
         if index_data and index_data.get("latest_checkpoint_id"):
             checkpoint_id = index_data["latest_checkpoint_id"]
         else:
@@ -3768,8 +3784,7 @@ def get_agent_checkpoint(
                 return json.dumps({"error": f"No checkpoints found for session: {session_id}"})
             checkpoint_id = cp_files[-1].stem
 
-    cp_path = checkpoint_dir / f"{checkpoint_id}.json"
-    data = _read_session_json(cp_path)
+    data = _read_checkpoint_json(checkpoint_dir, checkpoint_id)
     if data is None:
         return json.dumps({"error": f"Checkpoint not found: {checkpoint_id}"})
 
@@ -3792,11 +3807,11 @@ def compare_agent_checkpoints(
     """
     checkpoint_dir = Path(agent_work_dir) / "sessions" / session_id / "checkpoints"
 
-    before = _read_session_json(checkpoint_dir / f"{checkpoint_id_before}.json")
+    before = _read_checkpoint_json(checkpoint_dir, checkpoint_id_before)
     if before is None:
         return json.dumps({"error": f"Checkpoint not found: {checkpoint_id_before}"})
 
-    after = _read_session_json(checkpoint_dir / f"{checkpoint_id_after}.json")
+    after = _read_checkpoint_json(checkpoint_dir, checkpoint_id_after)
     if after is None:
         return json.dumps({"error": f"Checkpoint not found: {checkpoint_id_after}"})
 
@@ -266,6 +266,18 @@ def register_commands(subparsers: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Show only sessions with checkpoints",
     )
+    sessions_list_parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Maximum number of sessions to show (default: 20)",
+    )
+    sessions_list_parser.add_argument(
+        "--offset",
+        type=int,
+        default=0,
+        help="Number of sessions to skip (default: 0)",
+    )
     sessions_list_parser.set_defaults(func=cmd_sessions_list)
 
     # sessions show
@@ -309,6 +321,45 @@ def register_commands(subparsers: argparse._SubParsersAction) -> None:
     )
     sessions_checkpoints_parser.set_defaults(func=cmd_sessions_checkpoints)
 
+    # sessions migrate-conversations
+    sessions_migrate_parser = sessions_subparsers.add_parser(
+        "migrate-conversations",
+        help="Convert conversations to segmented storage",
+        description=(
+            "Convert file-per-part conversation directories (parts/*.json) "
+            "to the segmented append-only log format."
+        ),
+    )
+    sessions_migrate_parser.add_argument(
+        "agent_path",
+        type=str,
+        help="Path to agent folder",
+    )
+    sessions_migrate_parser.add_argument(
+        "--session",
+        type=str,
+        default=None,
+        help="Only migrate this session ID (default: all sessions)",
+    )
+    sessions_migrate_parser.set_defaults(func=cmd_sessions_migrate_conversations)
+
+    # sessions reindex
+    sessions_reindex_parser = sessions_subparsers.add_parser(
+        "reindex",
+        help="Rebuild the session index",
+        description=(
+            "Rebuild the session listing index (session_index.db) from every "
+            "sessions/*/state.json. Use after upgrading an existing store or if "
+            "listings look stale."
+        ),
+    )
+    sessions_reindex_parser.add_argument(
+        "agent_path",
+        type=str,
+        help="Path to agent folder",
+    )
+    sessions_reindex_parser.set_defaults(func=cmd_sessions_reindex)
+
     # pause command
     pause_parser = subparsers.add_parser(
         "pause",
@@ -392,19 +443,17 @@ def _load_resume_state(
         return None
 
     if checkpoint_id:
-        # Checkpoint-based resume: load checkpoint and extract state
-        cp_path = session_dir / "checkpoints" / f"{checkpoint_id}.json"
-        if not cp_path.exists():
-            return None
-        try:
-            cp_data = json.loads(cp_path.read_text())
-        except (json.JSONDecodeError, OSError):
+        # Checkpoint-based resume: load checkpoint (replaying deltas) and extract state
+        from framework.storage.checkpoint_store import read_checkpoint
+
+        checkpoint = read_checkpoint(session_dir / "checkpoints", checkpoint_id)
+        if checkpoint is None:
             return None
         return {
             "resume_session_id": session_id,
-            "memory": cp_data.get("shared_memory", {}),
-            "paused_at": cp_data.get("next_node") or cp_data.get("current_node"),
-            "execution_path": cp_data.get("execution_path", []),
+            "memory": checkpoint.shared_memory,
+            "paused_at": checkpoint.next_node or checkpoint.current_node,
+            "execution_path": checkpoint.execution_path,
             "node_visit_counts": {},
         }
     else:
@@ -1846,13 +1895,32 @@ def _interactive_multi(agents_dir: Path) -> int:
 
 
 def cmd_sessions_list(args: argparse.Namespace) -> int:
-    """List agent sessions."""
-    print("⚠ Sessions list command not yet implemented")
-    print("This will be available once checkpoint infrastructure is complete.")
-    print(f"\nAgent: {args.agent_path}")
-    print(f"Status filter: {args.status}")
-    print(f"Has checkpoints: {args.has_checkpoints}")
-    return 1
+    """List agent sessions, most recently updated first."""
+    from framework.storage.session_store import SessionStore
+
+    store = SessionStore(_agent_storage_path(args.agent_path))
+    if not store.sessions_dir.exists():
+        print(f"No sessions found at {store.sessions_dir}", file=sys.stderr)
+        return 1
+
+    status = None if args.status == "all" else args.status
+    entries = asyncio.run(
+        store.list_session_entries(
+            status=status,
+            limit=args.limit,
+            offset=args.offset,
+            has_checkpoints=args.has_checkpoints,
+        )
+    )
+
+    if not entries:
+        print("No matching sessions.")
+        return 0
+
+    print(f"{'SESSION':<36} {'STATUS':<10} {'UPDATED':<26} GOAL")
+    for e in entries:
+        print(f"{e.session_id:<36} {e.status:<10} {e.updated_at:<26} {e.goal_id}")
+    return 0
 
 
 def cmd_sessions_show(args: argparse.Namespace) -> int:
@@ -1873,6 +1941,42 @@ def cmd_sessions_checkpoints(args: argparse.Namespace) -> int:
     return 1
 
 
+def cmd_sessions_reindex(args: argparse.Namespace) -> int:
+    """Rebuild the session index from state.json files."""
+    from framework.storage.session_store import SessionStore
+
+    store = SessionStore(_agent_storage_path(args.agent_path))
+    if not store.sessions_dir.exists():
+        print(f"No sessions found at {store.sessions_dir}", file=sys.stderr)
+        return 1
+
+    count = asyncio.run(store.rebuild_index())
+    print(f"Indexed {count} session(s) into {store.index.path}")
+    return 0
+
+
+def _agent_storage_path(agent_path: str) -> Path:
+    """Storage root for an agent: ~/.hive/agents/{agent_name}."""
+    return Path.home() / ".hive" / "agents" / Path(agent_path).name
+
+
+def cmd_sessions_migrate_conversations(args: argparse.Namespace) -> int:
+    """Migrate file-per-part conversations to the segmented log format."""
+    from framework.storage.segmented_conversation_store import migrate_conversation_tree
+
+    sessions_dir = _agent_storage_path(args.agent_path) / "sessions"
+    root = sessions_dir / args.session if args.session else sessions_dir
+    if not root.exists():
+        print(f"No sessions found at {root}", file=sys.stderr)
+        return 1
+
+    migrated = migrate_conversation_tree(root)
+    for conv_dir, count in migrated.items():
+        print(f"  {conv_dir}: {count} parts")
+    print(f"Migrated {len(migrated)} conversation(s)")
+    return 0
+
+
 def cmd_pause(args: argparse.Namespace) -> int:
     """Pause a running session."""
     print("⚠ Pause command not yet implemented")
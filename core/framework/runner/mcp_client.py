@@ -2,11 +2,25 @@
 
 This module provides a client for connecting to MCP servers and invoking their tools.
 Supports both STDIO and HTTP transports using the official MCP Python SDK.
+
+All transport I/O runs on one background event loop owned by the client, so
+a single connection serves callers on any thread or event loop:
+
+- ``acall_tool`` / ``alist_tools`` await the background loop without
+  blocking the caller's loop, so many calls can be in flight at once over
+  one MCP session (requests are multiplexed by unique JSON-RPC ids).
+- ``call_tool`` / ``list_tools`` are blocking wrappers for sync callers.
+- HTTP uses a pooled ``httpx.AsyncClient``; STDIO can optionally spread
+  calls over ``pool_size`` server processes for CPU-bound tool servers.
 """
 
 import asyncio
+import concurrent.futures
+import itertools
 import logging
 import os
+import threading
+from collections.abc import Coroutine
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -27,10 +41,14 @@ class MCPServerConfig:
     args: list[str] = field(default_factory=list)
     env: dict[str, str] = field(default_factory=dict)
     cwd: str | None = None
+    # Number of server processes to spread calls over (for CPU-bound servers)
+    pool_size: int = 1
 
     # For HTTP transport
     url: str | None = None
     headers: dict[str, str] = field(default_factory=dict)
+    # Size of the pooled HTTP connection pool
+    max_connections: int = 20
 
     # Optional metadata
     description: str = ""
@@ -44,6 +62,22 @@ class MCPTool:
     description: str
     input_schema: dict[str, Any]
     server_name: str
+    meta: dict[str, Any] = field(default_factory=dict)  # MCP ``_meta`` (e.g. cache policy)
+
+
+class _StdioSession:
+    """One STDIO server process and its MCP session.
+
+    The owning task enters and exits the SDK context managers itself
+    (anyio cancel scopes must be exited by the task that entered them) and
+    parks on ``stop`` in between.
+    """
+
+    def __init__(self) -> None:
+        self.session: Any = None
+        self.in_flight = 0
+        self.stop = asyncio.Event()
+        self.task: asyncio.Task | None = None
 
 
 class MCPClient:
@@ -54,6 +88,10 @@ class MCPClient:
     Manages the connection lifecycle and provides methods to list and invoke tools.
     """
 
+    _CONNECT_TIMEOUT = 10
+    _CLEANUP_TIMEOUT = 10
+    _THREAD_JOIN_TIMEOUT = 12
+
     def __init__(self, config: MCPServerConfig):
         """
         Initialize the MCP client.
@@ -62,98 +100,107 @@ def __init__(self, config: MCPServerConfig):
             config: Server configuration
         """
         self.config = config
-        self._session = None
-        self._read_stream = None
-        self._write_stream = None
-        self._stdio_context = None  # Context manager for stdio_client
-        self._http_client: httpx.Client | None = None
+        self._stdio_sessions: list[_StdioSession] = []
+        self._http_client: httpx.AsyncClient | None = None
         self._tools: dict[str, MCPTool] = {}
         self._connected = False
+        self._connect_lock = threading.Lock()
+        # JSON-RPC ids must be unique per in-flight request on a connection
+        self._request_ids = itertools.count(1)
 
-        # Background event loop for persistent STDIO connection
-        self._loop = None
-        self._loop_thread = None
+        # Background event loop that owns all transport I/O
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
 
-    def _run_async(self, coro):
-        """
-        Run an async coroutine, handling both sync and async contexts.
+    # ------------------------------------------------------------------
+    # Background loop plumbing
+    # ------------------------------------------------------------------
 
-        Args:
-            coro: Coroutine to run
+    def _start_loop(self) -> None:
+        """Start the background I/O loop thread if it isn't running."""
+        if self._loop is not None and self._loop.is_running():
+            return
 
-        Returns:
-            Result of the coroutine
-        """
-        # If we have a persistent loop (for STDIO), use it
-        if self._loop is not None:
-            # Check if loop is running AND not closed
-            if self._loop.is_running() and not self._loop.is_closed():
-                future = asyncio.run_coroutine_threadsafe(coro, self._loop)
-                return future.result()
-            # else: fall through to the standard approach below
-            # This handles the case when STDIO loop exists but is stopped/closed
-
-        # Standard approach: handle both sync and async contexts
-        try:
-            # Try to get the current event loop
-            asyncio.get_running_loop()
-            # If we're here, we're in an async context
-            # Create a new thread to run the coroutine
-            import threading
-
-            result = None
-            exception = None
-
-            def run_in_thread():
-                nonlocal result, exception
-                try:
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        result = new_loop.run_until_complete(coro)
-                    finally:
-                        new_loop.close()
-                except Exception as e:
-                    exception = e
-
-            thread = threading.Thread(target=run_in_thread)
-            thread.start()
-            thread.join()
-
-            if exception:
-                raise exception
-            return result
-        except RuntimeError:
-            # No event loop running, we can use asyncio.run
-            return asyncio.run(coro)
+        loop_started = threading.Event()
+
+        def run_event_loop():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            self._loop = loop
+            loop.call_soon(loop_started.set)
+            loop.run_forever()
+            loop.close()
+
+        self._loop_thread = threading.Thread(
+            target=run_event_loop, name=f"mcp-{self.config.name}", daemon=True
+        )
+        self._loop_thread.start()
+        loop_started.wait(timeout=5)
+        if not loop_started.is_set():
+            raise RuntimeError("Event loop failed to start")
+
+    def _submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        if self._loop is None or not self._loop.is_running():
+            coro.close()
+            raise RuntimeError(f"MCP client '{self.config.name}' is not connected")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _run_sync(self, coro: Coroutine) -> Any:
+        """Run *coro* on the background loop and block for the result."""
+        if threading.current_thread() is self._loop_thread:
+            coro.close()
+            raise RuntimeError("Blocking MCP call made from the client's own I/O loop")
+        return self._submit(coro).result()
+
+    async def _run_async(self, coro: Coroutine) -> Any:
+        """Await *coro* on the background loop without blocking the caller's loop."""
+        if asyncio.get_running_loop() is self._loop:
+            return await coro
+        return await asyncio.wrap_future(self._submit(coro))
+
+    # ------------------------------------------------------------------
+    # Connection lifecycle
+    # ------------------------------------------------------------------
 
     def connect(self) -> None:
         """Connect to the MCP server."""
-        if self._connected:
-            return
+        with self._connect_lock:
+            if self._connected:
+                return
+            if self.config.transport not in ("stdio", "http"):
+                raise ValueError(f"Unsupported transport: {self.config.transport}")
+
+            self._start_loop()
+            try:
+                self._run_sync(self._connect_async())
+            except BaseException:
+                self._shutdown()
+                raise
+            self._connected = True
+
+    async def aconnect(self) -> None:
+        """Connect without blocking the caller's event loop."""
+        if not self._connected:
+            await asyncio.to_thread(self.connect)
 
+    async def _connect_async(self) -> None:
+        """Open transports and discover tools (runs on the background loop)."""
         if self.config.transport == "stdio":
-            self._connect_stdio()
-        elif self.config.transport == "http":
-            self._connect_http()
+            await self._connect_stdio()
         else:
-            raise ValueError(f"Unsupported transport: {self.config.transport}")
+            await self._connect_http()
 
         # Discover tools
-        self._discover_tools()
-        self._connected = True
+        await self._discover_tools()
 
-    def _connect_stdio(self) -> None:
-        """Connect to MCP server via STDIO transport using MCP SDK with persistent connection."""
+    async def _connect_stdio(self) -> None:
+        """Start ``pool_size`` STDIO server processes with persistent sessions."""
         if not self.config.command:
             raise ValueError("command is required for STDIO transport")
 
         try:
-            import threading
-
             from mcp import StdioServerParameters
 
-            # Create server parameters
             # Always inherit parent environment and merge with any custom env vars
             merged_env = {**os.environ, **(self.config.env or {})}
             server_params = StdioServerParameters(
@@ -163,85 +210,81 @@ def _connect_stdio(self) -> None:
                 cwd=self.config.cwd,
             )
 
-            # Store for later use
-            self._server_params = server_params
-
-            # Start background event loop for persistent connection
-            loop_started = threading.Event()
-            connection_ready = threading.Event()
-            connection_error = []
-
-            def run_event_loop():
-                """Run event loop in background thread."""
-                self._loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self._loop)
-                loop_started.set()
-
-                # Initialize persistent connection
-                async def init_connection():
-                    try:
-                        from mcp import ClientSession
-                        from mcp.client.stdio import stdio_client
-
-                        # Create persistent stdio client context.
-                        # Redirect server stderr to devnull to prevent raw
-                        # output from leaking behind the TUI.
-                        devnull = open(os.devnull, "w")  # noqa: SIM115
-                        self._stdio_context = stdio_client(server_params, errlog=devnull)
-                        (
-                            self._read_stream,
-                            self._write_stream,
-                        ) = await self._stdio_context.__aenter__()
-
-                        # Create persistent session
-                        self._session = ClientSession(self._read_stream, self._write_stream)
-                        await self._session.__aenter__()
-
-                        # Initialize session
-                        await self._session.initialize()
-
-                        connection_ready.set()
-                    except Exception as e:
-                        connection_error.append(e)
-                        connection_ready.set()
-
-                # Schedule connection initialization
-                self._loop.create_task(init_connection())
-
-                # Run loop forever
-                self._loop.run_forever()
-
-            self._loop_thread = threading.Thread(target=run_event_loop, daemon=True)
-            self._loop_thread.start()
-
-            # Wait for loop to start
-            loop_started.wait(timeout=5)
-            if not loop_started.is_set():
-                raise RuntimeError("Event loop failed to start")
-
-            # Wait for connection to be ready
-            connection_ready.wait(timeout=10)
-            if connection_error:
-                raise connection_error[0]
-
-            logger.info(f"Connected to MCP server '{self.config.name}' via STDIO (persistent)")
+            pool_size = max(1, self.config.pool_size)
+            opened = await asyncio.gather(
+                *(self._open_stdio_session(server_params) for _ in range(pool_size)),
+                return_exceptions=True,
+            )
+            self._stdio_sessions = [h for h in opened if isinstance(h, _StdioSession)]
+            errors = [e for e in opened if isinstance(e, BaseException)]
+            if errors:
+                # Don't leave the processes that did start running
+                await self._cleanup_async()
+                raise errors[0]
+            logger.info(
+                f"Connected to MCP server '{self.config.name}' via STDIO "
+                f"(persistent, {pool_size} process(es))"
+            )
         except Exception as e:
             raise RuntimeError(f"Failed to connect to MCP server: {e}") from e
 
-    def _connect_http(self) -> None:
-        """Connect to MCP server via HTTP transport."""
+    async def _open_stdio_session(self, server_params: Any) -> _StdioSession:
+        from mcp import ClientSession
+        from mcp.client.stdio import stdio_client
+
+        handle = _StdioSession()
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        async def run_session() -> None:
+            # Redirect server stderr to devnull to prevent raw
+            # output from leaking behind the TUI.
+            devnull = open(os.devnull, "w")  # noqa: SIM115
+            try:
+                async with stdio_client(server_params, errlog=devnull) as (read, write):
+                    async with ClientSession(read, write) as session:
+                        await session.initialize()
+                        if ready.done():  # Connect timed out meanwhile
+                            return
+                        handle.session = session
+                        ready.set_result(handle)
+                        await handle.stop.wait()
+            except Exception as e:
+                if not ready.done():
+                    ready.set_exception(e)
+                else:
+                    logger.warning(f"MCP server '{self.config.name}' session ended: {e}")
+            finally:
+                handle.session = None
+                devnull.close()
+                if not ready.done():
+                    ready.cancel()
+
+        handle.task = asyncio.create_task(run_session())
+        try:
+            return await asyncio.wait_for(ready, timeout=self._CONNECT_TIMEOUT)
+        except BaseException:
+            handle.stop.set()
+            handle.task.cancel()
+            raise
+
+    async def _connect_http(self) -> None:
+        """Connect to MCP server via HTTP transport with a pooled async client."""
         if not self.config.url:
             raise ValueError("url is required for HTTP transport")
 
-        self._http_client = httpx.Client(
+        self._http_client = httpx.AsyncClient(
             base_url=self.config.url,
             headers=self.config.headers,
             timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_connections,
+            ),
         )
 
         # Test connection
         try:
-            response = self._http_client.get("/health")
+            response = await self._http_client.get("/health")
             response.raise_for_status()
             logger.info(
                 f"Connected to MCP server '{self.config.name}' via HTTP at {self.config.url}"
@@ -250,13 +293,10 @@ def _connect_http(self) -> None:
             logger.warning(f"Health check failed for MCP server '{self.config.name}': {e}")
             # Continue anyway, server might not have health endpoint
 
-    def _discover_tools(self) -> None:
+    async def _discover_tools(self) -> None:
         """Discover available tools from the MCP server."""
         try:
-            if self.config.transport == "stdio":
-                tools_list = self._run_async(self._list_tools_stdio_async())
-            else:
-                tools_list = self._list_tools_http()
+            tools_list = await self._list_tools_async()
 
             self._tools = {}
             for tool_data in tools_list:
@@ -265,6 +305,7 @@ def _discover_tools(self) -> None:
                     description=tool_data.get("description", ""),
                     input_schema=tool_data.get("inputSchema", {}),
                     server_name=self.config.name,
+                    meta=tool_data.get("_meta") or {},
                 )
                 self._tools[tool.name] = tool
 
@@ -276,13 +317,50 @@ def _discover_tools(self) -> None:
             logger.error(f"Failed to discover tools from '{self.config.name}': {e}")
             raise
 
+    # ------------------------------------------------------------------
+    # Tool listing
+    # ------------------------------------------------------------------
+
+    def list_tools(self) -> list[MCPTool]:
+        """
+        Get list of available tools.
+
+        Returns:
+            List of MCPTool objects
+        """
+        if not self._connected:
+            self.connect()
+
+        return list(self._tools.values())
+
+    async def alist_tools(self, refresh: bool = False) -> list[MCPTool]:
+        """
+        Get list of available tools without blocking the event loop.
+
+        Args:
+            refresh: Re-query the server instead of returning the cached list
+
+        Returns:
+            List of MCPTool objects
+        """
+        if not self._connected:
+            await self.aconnect()
+        elif refresh:
+            await self._run_async(self._discover_tools())
+
+        return list(self._tools.values())
+
+    async def _list_tools_async(self) -> list[dict]:
+        if self.config.transport == "stdio":
+            return await self._list_tools_stdio_async()
+        return await self._list_tools_http()
+
     async def _list_tools_stdio_async(self) -> list[dict]:
         """List tools via STDIO protocol using persistent session."""
-        if not self._session:
-            raise RuntimeError("STDIO session not initialized")
+        session = self._pick_stdio_session().session
 
         # List tools using persistent session
-        response = await self._session.list_tools()
+        response = await session.list_tools()
 
         # Convert tools to dict format
         tools_list = []
@@ -292,30 +370,16 @@ async def _list_tools_stdio_async(self) -> list[dict]:
                     "name": tool.name,
                     "description": tool.description,
                     "inputSchema": tool.inputSchema,
+                    "_meta": tool.meta,
                 }
             )
 
         return tools_list
 
-    def _list_tools_http(self) -> list[dict]:
+    async def _list_tools_http(self) -> list[dict]:
         """List tools via HTTP protocol."""
-        if not self._http_client:
-            raise RuntimeError("HTTP client not initialized")
-
         try:
-            # Use MCP over HTTP protocol
-            response = self._http_client.post(
-                "/mcp/v1",
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "tools/list",
-                    "params": {},
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-
+            data = await self._http_rpc("tools/list", {})
             if "error" in data:
                 raise RuntimeError(f"MCP error: {data['error']}")
 
@@ -323,21 +387,35 @@ def _list_tools_http(self) -> list[dict]:
         except Exception as e:
             raise RuntimeError(f"Failed to list tools via HTTP: {e}") from e
 
-    def list_tools(self) -> list[MCPTool]:
+    # ------------------------------------------------------------------
+    # Tool calls
+    # ------------------------------------------------------------------
+
+    def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """
-        Get list of available tools.
+        Invoke a tool on the MCP server, blocking until it returns.
+
+        Args:
+            tool_name: Name of the tool to invoke
+            arguments: Tool arguments
 
         Returns:
-            List of MCPTool objects
+            Tool result
         """
         if not self._connected:
             self.connect()
 
-        return list(self._tools.values())
+        if tool_name not in self._tools:
+            raise ValueError(f"Unknown tool: {tool_name}")
 
-    def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        return self._run_sync(self._call_tool_async(tool_name, arguments))
+
+    async def acall_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """
-        Invoke a tool on the MCP server.
+        Invoke a tool on the MCP server without blocking the event loop.
+
+        Concurrent calls share the connection and are multiplexed by
+        request id (or spread over the STDIO process pool).
 
         Args:
             tool_name: Name of the tool to invoke
@@ -347,23 +425,33 @@ def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
             Tool result
         """
         if not self._connected:
-            self.connect()
+            await self.aconnect()
 
         if tool_name not in self._tools:
             raise ValueError(f"Unknown tool: {tool_name}")
 
+        return await self._run_async(self._call_tool_async(tool_name, arguments))
+
+    async def _call_tool_async(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         if self.config.transport == "stdio":
-            return self._run_async(self._call_tool_stdio_async(tool_name, arguments))
-        else:
-            return self._call_tool_http(tool_name, arguments)
+            return await self._call_tool_stdio_async(tool_name, arguments)
+        return await self._call_tool_http(tool_name, arguments)
 
-    async def _call_tool_stdio_async(self, tool_name: str, arguments: dict[str, Any]) -> Any:
-        """Call tool via STDIO protocol using persistent session."""
-        if not self._session:
+    def _pick_stdio_session(self) -> _StdioSession:
+        """Least-loaded live STDIO session."""
+        live = [s for s in self._stdio_sessions if s.session is not None]
+        if not live:
             raise RuntimeError("STDIO session not initialized")
+        return min(live, key=lambda s: s.in_flight)
 
-        # Call tool using persistent session
-        result = await self._session.call_tool(tool_name, arguments=arguments)
+    async def _call_tool_stdio_async(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        """Call tool via STDIO protocol using persistent session."""
+        handle = self._pick_stdio_session()
+        handle.in_flight += 1
+        try:
+            result = await handle.session.call_tool(tool_name, arguments=arguments)
+        finally:
+            handle.in_flight -= 1
 
         # Check for server-side errors (validation failures, tool exceptions, etc.)
         if getattr(result, "isError", False):
@@ -388,27 +476,16 @@ async def _call_tool_stdio_async(self, tool_name: str, arguments: dict[str, Any]
 
         return None
 
-    def _call_tool_http(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+    async def _call_tool_http(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """Call tool via HTTP protocol."""
-        if not self._http_client:
-            raise RuntimeError("HTTP client not initialized")
-
         try:
-            response = self._http_client.post(
-                "/mcp/v1",
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "tools/call",
-                    "params": {
-                        "name": tool_name,
-                        "arguments": arguments,
-                    },
+            data = await self._http_rpc(
+                "tools/call",
+                {
+                    "name": tool_name,
+                    "arguments": arguments,
                 },
             )
-            response.raise_for_status()
-            data = response.json()
-
             if "error" in data:
                 raise RuntimeError(f"Tool execution error: {data['error']}")
 
@@ -416,125 +493,118 @@ def _call_tool_http(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         except Exception as e:
             raise RuntimeError(f"Failed to call tool via HTTP: {e}") from e
 
-    _CLEANUP_TIMEOUT = 10
-    _THREAD_JOIN_TIMEOUT = 12
+    async def _http_rpc(self, method: str, params: dict[str, Any]) -> dict:
+        """POST one JSON-RPC request with a unique id and return the response body."""
+        if not self._http_client:
+            raise RuntimeError("HTTP client not initialized")
 
-    async def _cleanup_stdio_async(self) -> None:
-        """Async cleanup for STDIO session and context managers.
+        request_id = next(self._request_ids)
+        response = await self._http_client.post(
+            "/mcp/v1",
+            json={
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params,
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        if data.get("id", request_id) != request_id:
+            raise RuntimeError(
+                f"Mismatched JSON-RPC response id {data.get('id')!r} (expected {request_id})"
+            )
+        return data
+
+    # ------------------------------------------------------------------
+    # Shutdown
+    # ------------------------------------------------------------------
+
+    async def _cleanup_async(self) -> None:
+        """Close STDIO sessions and the HTTP client (runs on the background loop).
 
-        Cleanup order is critical:
-        - The session must be closed BEFORE the stdio_context because the session
-          depends on the streams provided by stdio_context.
-        - This mirrors the initialization order in _connect_stdio(), where
-          stdio_context is entered first (providing streams), then the session is
-          created with those streams and entered.
-        - Do not change this ordering without carefully considering these dependencies.
+        Each STDIO session task exits its own context managers (session
+        first, then the stdio transport) once its stop event is set.
         """
-        # First: close session (depends on stdio_context streams)
-        try:
-            if self._session:
-                await self._session.__aexit__(None, None, None)
-        except asyncio.CancelledError:
-            logger.warning(
-                "MCP session cleanup was cancelled; proceeding with best-effort shutdown"
-            )
-        except Exception as e:
-            logger.warning(f"Error closing MCP session: {e}")
-        finally:
-            self._session = None
+        sessions, self._stdio_sessions = self._stdio_sessions, []
+        for handle in sessions:
+            handle.stop.set()
+        tasks = [h.task for h in sessions if h.task is not None]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self._CLEANUP_TIMEOUT - 1)
+            for task in pending:
+                logger.warning(f"MCP server '{self.config.name}' session did not close in time")
+                task.cancel()
 
-        # Second: close stdio_context (provides the underlying streams)
-        try:
-            if self._stdio_context:
-                await self._stdio_context.__aexit__(None, None, None)
-        except asyncio.CancelledError:
+        if self._http_client:
+            try:
+                await self._http_client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing MCP HTTP client: {e}")
+            self._http_client = None
+
+    def _shutdown(self) -> None:
+        """Release transports, stop the background loop and join its thread."""
+        loop = self._loop
+        if loop is None:
+            return
+
+        if loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(self._cleanup_async(), loop).result(
+                    timeout=self._CLEANUP_TIMEOUT
+                )
+            except TimeoutError:
+                # Cleanup took too long - may indicate stuck resources or slow MCP server
+                logger.warning(f"Async cleanup timed out after {self._CLEANUP_TIMEOUT} seconds")
+            except RuntimeError as e:
+                # Likely: loop stopped between is_running() and run_coroutine_threadsafe()
+                logger.debug(f"Event loop stopped during async cleanup: {e}")
+            except Exception as e:
+                logger.warning(f"Error during async cleanup: {e}")
+
+            try:
+                loop.call_soon_threadsafe(loop.stop)
+            except RuntimeError:
+                # Loop may have already stopped
+                pass
+        else:
+            # The loop crashed or was stopped externally. The transports were
+            # created in its thread and can't be safely cleaned from here; the
+            # OS reclaims the server processes on exit.
             logger.warning(
-                "STDIO context cleanup was cancelled; proceeding with best-effort shutdown"
+                "Event loop for MCP connection exists but is not running; "
+                "skipping async cleanup. Resources may not be fully released."
             )
-        except Exception as e:
-            logger.warning(f"Error closing STDIO context: {e}")
-        finally:
-            self._stdio_context = None
 
-    def disconnect(self) -> None:
-        """Disconnect from the MCP server."""
-        # Clean up persistent STDIO connection
-        if self._loop is not None:
-            cleanup_attempted = False
-
-            # Properly close session and context managers before stopping loop
-            # Note: There's an inherent race condition between checking is_running()
-            # and calling run_coroutine_threadsafe(). We handle this by catching
-            # any exceptions that may occur if the loop stops between these calls.
-            if self._loop.is_running():
-                try:
-                    cleanup_future = asyncio.run_coroutine_threadsafe(
-                        self._cleanup_stdio_async(), self._loop
-                    )
-                    cleanup_future.result(timeout=self._CLEANUP_TIMEOUT)
-                    cleanup_attempted = True
-                except TimeoutError:
-                    # Cleanup took too long - may indicate stuck resources or slow MCP server
-                    cleanup_attempted = True
-                    logger.warning(f"Async cleanup timed out after {self._CLEANUP_TIMEOUT} seconds")
-                except RuntimeError as e:
-                    # Likely: loop stopped between is_running() check and run_coroutine_threadsafe()
-                    cleanup_attempted = True
-                    logger.debug(f"Event loop stopped during async cleanup: {e}")
-                except Exception as e:
-                    # Cleanup was attempted but failed (e.g., error in _cleanup_stdio_async())
-                    cleanup_attempted = True
-                    logger.warning(f"Error during async cleanup: {e}")
-
-                # Now stop the event loop
-                try:
-                    self._loop.call_soon_threadsafe(self._loop.stop)
-                except RuntimeError:
-                    # Loop may have already stopped
-                    pass
-
-            if not cleanup_attempted:
-                # Fallback: loop exists but is not running (e.g., crashed or stopped externally).
-                # At this point the loop and associated resources are in an undefined state.
-                # The context managers (_session, _stdio_context) were created in the loop's
-                # thread and may not be safely cleanable from here. Just log and proceed
-                # with reference clearing - the OS will reclaim resources on process exit.
+        if (
+            self._loop_thread
+            and self._loop_thread.is_alive()
+            and self._loop_thread is not threading.current_thread()
+        ):
+            self._loop_thread.join(timeout=self._THREAD_JOIN_TIMEOUT)
+            if self._loop_thread.is_alive():
                 logger.warning(
-                    "Event loop for STDIO MCP connection exists but is not running; "
-                    "skipping async cleanup. Resources may not be fully released."
+                    "Event loop thread for MCP connection did not terminate "
+                    f"within {self._THREAD_JOIN_TIMEOUT}s; thread may still be running."
                 )
 
-            # Wait for thread to finish (timeout proportional to cleanup timeout)
-            if self._loop_thread and self._loop_thread.is_alive():
-                self._loop_thread.join(timeout=self._THREAD_JOIN_TIMEOUT)
-                if self._loop_thread.is_alive():
-                    logger.warning(
-                        "Event loop thread for STDIO MCP connection did not terminate "
-                        f"within {self._THREAD_JOIN_TIMEOUT}s; thread may still be running."
-                    )
-
-            # Clear remaining references
-            # Note: _session and _stdio_context may already be None if _cleanup_stdio_async()
-            # succeeded. This redundant assignment is intentional for safety in cases where:
-            # 1. Cleanup timed out or failed
-            # 2. Cleanup was skipped (loop not running)
-            # 3. CancelledError interrupted cleanup
-            # Setting None to None is safe and ensures clean state.
-            self._session = None
-            self._stdio_context = None
-            self._read_stream = None
-            self._write_stream = None
-            self._loop = None
-            self._loop_thread = None
-
-        # Clean up HTTP client
-        if self._http_client:
-            self._http_client.close()
-            self._http_client = None
+        self._stdio_sessions = []
+        self._http_client = None
+        self._loop = None
+        self._loop_thread = None
 
-        self._connected = False
+    def disconnect(self) -> None:
+        """Disconnect from the MCP server."""
+        with self._connect_lock:
+            self._shutdown()
+            self._connected = False
         logger.info(f"Disconnected from MCP server '{self.config.name}'")
 
+    async def adisconnect(self) -> None:
+        """Disconnect without blocking the caller's event loop."""
+        await asyncio.to_thread(self.disconnect)
+
     def __enter__(self):
         """Context manager entry."""
         self.connect()
@@ -543,3 +613,12 @@ def __enter__(self):
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.disconnect()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.aconnect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.adisconnect()
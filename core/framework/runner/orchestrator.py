@@ -1,10 +1,33 @@
-"""Agent Orchestrator - routes requests and relays messages between agents."""
+"""
+Agent Orchestrator - routes requests and relays messages between agents.
+
+Routing a request means asking agents whether they can handle it, and each
+``AgentRunner.can_handle`` is an LLM call. Two things keep that cheap:
+
+- **Pre-filtering**: each agent's description, goal, capabilities and node
+  names form a bag-of-words profile. Requests are scored against these
+  profiles by cosine similarity, and only the best ``max_probe_agents``
+  candidates are probed. Agents without lexical overlap are skipped when
+  another agent has some.
+- **Routing cache**: decisions are cached under the request's normalized
+  intent (its sorted set of content words, ignoring numbers and IDs). Entries
+  expire after ``routing_cache_ttl`` seconds, and only decisions with at
+  least ``routing_cache_min_confidence`` are stored. Registering or removing
+  agents clears the cache.
+
+``get_routing_stats()`` reports cache hits and misses, probes made and
+skipped, and LLM routing calls.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import json
-from dataclasses import dataclass, field
+import math
+import re
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +42,61 @@
 )
 from framework.runner.runner import AgentRunner
 
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9_]*")
+_STOPWORDS = frozenset(
+    {
+        "about", "after", "also", "been", "before", "could", "does", "from", "have",
+        "help", "into", "just", "like", "make", "need", "please", "process", "request",
+        "should", "some", "that", "their", "them", "then", "there", "these", "they",
+        "this", "what", "when", "where", "which", "with", "would", "your",
+    }
+)  # fmt: skip
+
+
+def _tokens(text: str) -> list[str]:
+    """Content words of *text*: lowercase, longer than 3 chars, plural "s" removed."""
+    return [
+        t[:-1] if t.endswith("s") and not t.endswith("ss") else t
+        for t in _TOKEN_RE.findall(text.lower())
+        if len(t) > 3 and t not in _STOPWORDS
+    ]
+
+
+def _request_tokens(request: dict, intent: str | None) -> list[str]:
+    return _tokens(f"{intent or ''} {json.dumps(request, sort_keys=True, default=str)}")
+
+
+def _cosine(a: Counter, b: Counter, b_norm: float) -> float:
+    """Cosine similarity of two term-count vectors (*b_norm* precomputed)."""
+    if not a or not b_norm:
+        return 0.0
+    dot = sum(count * b[term] for term, count in a.items() if term in b)
+    return dot / (math.sqrt(sum(v * v for v in a.values())) * b_norm)
+
+
+@dataclass
+class _AgentProfile:
+    """Bag-of-words profile an agent is pre-filtered by."""
+
+    terms: Counter
+    norm: float
+
+    @classmethod
+    def build(cls, runner: AgentRunner, capabilities: list[str]) -> _AgentProfile:
+        info = runner.info()
+        text = " ".join(
+            [
+                info.name,
+                info.description,
+                info.goal_name,
+                info.goal_description,
+                *capabilities,
+                *(f"{n.get('name', '')} {n.get('description', '')}" for n in info.nodes),
+            ]
+        )
+        terms = Counter(_tokens(text))
+        return cls(terms=terms, norm=math.sqrt(sum(v * v for v in terms.values())))
+
 
 @dataclass
 class RoutingDecision:
@@ -56,6 +134,11 @@ def __init__(
         self,
         llm: LLMProvider | None = None,
         model: str = "claude-haiku-4-5-20251001",
+        routing_cache_ttl: float = 300.0,
+        routing_cache_min_confidence: float = 0.7,
+        routing_cache_size: int = 256,
+        max_probe_agents: int | None = 3,
+        prefilter_min_similarity: float = 0.05,
     ):
         """
         Initialize the orchestrator.
@@ -63,12 +146,44 @@ def __init__(
         Args:
             llm: LLM provider for routing decisions (auto-creates if None)
             model: Model to use for routing
+            routing_cache_ttl: Seconds a cached routing decision stays valid
+                (0 disables the cache)
+            routing_cache_min_confidence: Only decisions at least this
+                confident are cached
+            routing_cache_size: Maximum cached decisions (least recently used
+                are evicted)
+            max_probe_agents: Most agents asked ``can_handle`` per request
+                (None probes every agent that passes the similarity filter)
+            prefilter_min_similarity: Agents scoring below this are skipped
+                when another agent scores above it
         """
         self._agents: dict[str, RegisteredAgent] = {}
         self._llm = llm
         self._model = model
         self._message_log: list[AgentMessage] = []
 
+        self._profiles: dict[str, _AgentProfile] = {}
+        self._routing_cache: OrderedDict[str, tuple[RoutingDecision, float]] = OrderedDict()
+        self._routing_cache_ttl = routing_cache_ttl
+        self._routing_cache_min_confidence = routing_cache_min_confidence
+        self._routing_cache_size = routing_cache_size
+        self._max_probe_agents = max_probe_agents
+        self._prefilter_min_similarity = prefilter_min_similarity
+        self._routing_stats = dict.fromkeys(
+            (
+                "requests",
+                "cache_hits",
+                "cache_misses",
+                "cache_expired",
+                "cache_stores",
+                "low_confidence_not_cached",
+                "capability_probes",
+                "probes_skipped",
+                "llm_route_calls",
+            ),
+            0,
+        )
+
         # Auto-create LLM - LiteLLM auto-detects provider and API key from model name
         if self._llm is None:
             from framework.config import get_api_base, get_api_key, get_llm_extra_kwargs
@@ -107,6 +222,8 @@ def register(
             capabilities=capabilities or [],
             priority=priority,
         )
+        self._profiles[name] = _AgentProfile.build(runner, capabilities or [])
+        self.clear_routing_cache()
 
     def register_runner(
         self,
@@ -133,6 +250,8 @@ def register_runner(
             capabilities=capabilities or [],
             priority=priority,
         )
+        self._profiles[name] = _AgentProfile.build(runner, capabilities or [])
+        self.clear_routing_cache()
 
     def list_agents(self) -> list[dict]:
         """List all registered agents."""
@@ -175,11 +294,15 @@ async def dispatch(
         messages.append(initial_message)
         self._message_log.append(initial_message)
 
-        # Step 1: Check capabilities of all agents
-        capabilities = await self._check_all_capabilities(request)
-
-        # Step 2: Route to best agent(s)
-        routing = await self._route_request(request, intent, capabilities)
+        # Steps 1-2: Reuse a cached decision for the same intent, or check
+        # the capabilities of the most likely agents and route to the best
+        self._routing_stats["requests"] += 1
+        cache_key = " ".join(sorted(set(_request_tokens(request, intent))))
+        routing = self._cached_routing(cache_key)
+        if routing is None:
+            capabilities = await self._check_all_capabilities(request, intent)
+            routing = await self._route_request(request, intent, capabilities)
+            self._cache_routing(cache_key, routing)
 
         if not routing.selected_agents:
             return OrchestratorResult(
@@ -347,21 +470,111 @@ async def broadcast(
 
         return responses
 
+    # === ROUTING CACHE ===
+
+    def _cached_routing(self, key: str) -> RoutingDecision | None:
+        """Return a copy of the live cached decision for *key*, if any."""
+        entry = self._routing_cache.get(key) if key else None
+        if entry is None:
+            self._routing_stats["cache_misses"] += 1
+            return None
+        decision, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._routing_cache[key]
+            self._routing_stats["cache_expired"] += 1
+            self._routing_stats["cache_misses"] += 1
+            return None
+        self._routing_cache.move_to_end(key)
+        self._routing_stats["cache_hits"] += 1
+        # dispatch() edits the agent lists while falling back
+        return replace(
+            decision,
+            selected_agents=list(decision.selected_agents),
+            fallback_agents=list(decision.fallback_agents),
+        )
+
+    def _cache_routing(self, key: str, decision: RoutingDecision) -> None:
+        """Cache *decision* under *key* if it is confident enough."""
+        if not key or self._routing_cache_ttl <= 0 or not decision.selected_agents:
+            return
+        if decision.confidence < self._routing_cache_min_confidence:
+            self._routing_stats["low_confidence_not_cached"] += 1
+            return
+        self._routing_cache[key] = (
+            replace(
+                decision,
+                selected_agents=list(decision.selected_agents),
+                fallback_agents=list(decision.fallback_agents),
+            ),
+            time.monotonic() + self._routing_cache_ttl,
+        )
+        self._routing_cache.move_to_end(key)
+        if len(self._routing_cache) > self._routing_cache_size:
+            self._routing_cache.popitem(last=False)
+        self._routing_stats["cache_stores"] += 1
+
+    def clear_routing_cache(self) -> None:
+        """Drop all cached routing decisions."""
+        self._routing_cache.clear()
+
+    def get_routing_stats(self) -> dict:
+        """Get routing cache and capability-probe statistics."""
+        stats = dict(self._routing_stats)
+        lookups = stats["cache_hits"] + stats["cache_misses"]
+        stats["hit_rate"] = stats["cache_hits"] / lookups if lookups else 0.0
+        stats["cache_size"] = len(self._routing_cache)
+        return stats
+
+    # === CAPABILITY CHECKS ===
+
+    def _probe_candidates(
+        self, request: dict, intent: str | None = None
+    ) -> tuple[list[str], dict[str, float]]:
+        """
+        Pick the agents worth asking ``can_handle`` for this request.
+
+        Returns:
+            (candidate names, similarity per agent)
+        """
+        terms = Counter(_request_tokens(request, intent))
+        scores = {
+            name: _cosine(terms, profile.terms, profile.norm)
+            for name, profile in self._profiles.items()
+            if name in self._agents
+        }
+        ranked = sorted(
+            self._agents, key=lambda n: (-scores.get(n, 0.0), -self._agents[n].priority)
+        )
+        matching = [n for n in ranked if scores.get(n, 0.0) >= self._prefilter_min_similarity]
+        if matching:
+            ranked = matching
+        if self._max_probe_agents is not None:
+            ranked = ranked[: self._max_probe_agents]
+        return ranked, scores
+
     async def _check_all_capabilities(
         self,
         request: dict,
+        intent: str | None = None,
     ) -> dict[str, CapabilityResponse]:
-        """Check all agents' capabilities in parallel."""
-        tasks = []
-        agent_names = []
-
-        for name, agent in self._agents.items():
-            agent_names.append(name)
-            tasks.append(agent.runner.can_handle(request, self._llm))
+        """Check the capabilities of the pre-filtered candidate agents in parallel."""
+        agent_names, scores = self._probe_candidates(request, intent)
+        tasks = [self._agents[name].runner.can_handle(request, self._llm) for name in agent_names]
+        self._routing_stats["capability_probes"] += len(tasks)
+        self._routing_stats["probes_skipped"] += len(self._agents) - len(tasks)
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        capabilities = {}
+        capabilities = {
+            name: CapabilityResponse(
+                agent_name=name,
+                level=CapabilityLevel.CANNOT_HANDLE,
+                confidence=0.0,
+                reasoning=f"Skipped by pre-filter (similarity {scores.get(name, 0.0):.2f})",
+            )
+            for name in self._agents
+            if name not in agent_names
+        }
         for name, result in zip(agent_names, results, strict=False):
             if isinstance(result, Exception):
                 capabilities[name] = CapabilityResponse(
@@ -434,6 +647,7 @@ async def _llm_route(
         capable: list[tuple[str, CapabilityResponse]],
     ) -> RoutingDecision:
         """Use LLM to decide routing when multiple agents are capable."""
+        self._routing_stats["llm_route_calls"] += 1
 
         agents_info = "\n".join(
             f"- {name}: {cap.reasoning} (confidence: {cap.confidence:.2f})" for name, cap in capable
@@ -515,3 +729,5 @@ def cleanup(self) -> None:
         for agent in self._agents.values():
             agent.runner.cleanup()
         self._agents.clear()
+        self._profiles.clear()
+        self.clear_routing_cache()
@@ -408,7 +408,7 @@ def __init__(
         _ensure_credential_key_env()
 
         # Initialize components
-        self._tool_registry = ToolRegistry()
+        self._tool_registry = ToolRegistry(result_cache_dir=self._storage_path / "tool_cache")
         self._llm: LLMProvider | None = None
         self._approval_callback: Callable | None = None
 
@@ -942,7 +942,7 @@ def _setup_agent_runtime(
             )
 
         # Create AgentRuntime with all entry points
-        log_store = RuntimeLogStore(base_path=self._storage_path / "runtime_logs")
+        log_store = RuntimeLogStore(base_path=self._storage_path / "runtime_logs", buffered=True)
 
         # Enable checkpointing by default for resumable sessions
         from framework.graph.checkpoint_config import CheckpointConfig
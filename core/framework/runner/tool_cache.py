@@ -0,0 +1,236 @@
+"""
+Tool result cache - memoize results of deterministic, read-only tools.
+
+Tools opt in with a cache policy: ``@tool(cacheable=True, ttl=600)`` in an
+agent's tools.py, ``ToolRegistry.register(..., cache=ToolCachePolicy(600))``,
+or ``meta={"cache": {"ttl": 600}}`` on an MCP tool. ToolRegistry then serves
+repeated calls with the same arguments from the cache:
+
+- Keys hash the tool name, the canonical JSON of the arguments (sorted keys,
+  including injected context params) and the identity of the credentials
+  the call runs under, so different accounts never share results.
+- Two tiers: an in-process LRU, and JSON files under the agent's storage
+  path (``<storage>/tool_cache/<tool>/<key>.json``) that survive restarts
+  and are shared by the agent's sessions. Expiry uses wall-clock time.
+  ToolRegistry keeps tools with a credential spec out of the disk tier:
+  their credentials may come from the CredentialStore, outside the key.
+- Error results are never cached.
+
+Disk methods block; ToolRegistry calls them from a worker thread when it
+runs inside an event loop.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 300.0
+DEFAULT_MAX_ENTRIES = 512
+
+_ERROR_CONTENT_RE = re.compile(r'\s*\{\s*"error"\s*:')
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+@dataclass(frozen=True)
+class ToolCachePolicy:
+    """How long results of a tool may be reused."""
+
+    ttl: float = DEFAULT_TTL  # Seconds
+
+    @classmethod
+    def from_meta(cls, meta: dict[str, Any] | None) -> ToolCachePolicy | None:
+        """
+        Read a policy from MCP tool metadata.
+
+        Accepts ``{"cache": true}`` or ``{"cache": {"ttl": <seconds>}}``;
+        returns None when the tool is not cacheable.
+        """
+        spec = (meta or {}).get("cache")
+        if spec is True:
+            return cls()
+        if isinstance(spec, dict):
+            try:
+                return cls(ttl=float(spec.get("ttl", DEFAULT_TTL)))
+            except (TypeError, ValueError):
+                logger.warning(f"Ignoring invalid tool cache metadata: {spec!r}")
+        return None
+
+
+def cache_key(tool_name: str, arguments: dict[str, Any], credential_identity: str = "") -> str:
+    """Hash of a tool call: name, canonical arguments and credential identity."""
+    payload = json.dumps(
+        [tool_name, credential_identity, arguments],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_cacheable_content(content: str) -> bool:
+    """False for results that report an error as ``{"error": ...}``."""
+    return _ERROR_CONTENT_RE.match(content) is None
+
+
+class ToolResultCache:
+    """
+    Two-tier store of tool result contents.
+
+    Args:
+        cache_dir: Directory for the on-disk tier (None keeps results in
+            memory only)
+        max_entries: Results kept in the in-process LRU
+    """
+
+    def __init__(self, cache_dir: Path | None = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._dir = Path(cache_dir) if cache_dir is not None else None
+        self._max_entries = max_entries
+        # key -> (expiry timestamp, content)
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._stats = dict.fromkeys(
+            ("memory_hits", "disk_hits", "shared", "misses", "stores", "expired"), 0
+        )
+
+    @property
+    def has_disk(self) -> bool:
+        return self._dir is not None
+
+    def _path(self, tool_name: str, key: str) -> Path:
+        assert self._dir is not None
+        return self._dir / _UNSAFE_NAME_RE.sub("_", tool_name) / f"{key}.json"
+
+    # === LOOKUP ===
+
+    def get_memory(self, key: str) -> str | None:
+        """Content from the in-process tier, or None."""
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, content = entry
+        if time.time() >= expires_at:
+            del self._memory[key]
+            self._stats["expired"] += 1
+            return None
+        self._memory.move_to_end(key)
+        self._stats["memory_hits"] += 1
+        return content
+
+    def get_disk(self, tool_name: str, key: str) -> str | None:
+        """Content from the on-disk tier (promoted to memory), or None. Blocking."""
+        if self._dir is None:
+            return None
+        path = self._path(tool_name, key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            expires_at, content = float(entry["expires_at"]), entry["content"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable tool cache entry {path}: {e}")
+            return None
+        if time.time() >= expires_at:
+            path.unlink(missing_ok=True)
+            self._stats["expired"] += 1
+            return None
+        self._remember(key, content, expires_at)
+        self._stats["disk_hits"] += 1
+        return content
+
+    def get(self, tool_name: str, key: str, disk: bool = True) -> str | None:
+        """Content from memory, then disk; records a miss if neither has it. Blocking."""
+        content = self.get_memory(key)
+        if content is None and disk:
+            content = self.get_disk(tool_name, key)
+        if content is None:
+            self.record_miss()
+        return content
+
+    def record_miss(self) -> None:
+        self._stats["misses"] += 1
+
+    def record_shared(self) -> None:
+        """Count a call answered by an identical call already in flight."""
+        self._stats["shared"] += 1
+
+    # === STORE ===
+
+    def _remember(self, key: str, content: str, expires_at: float) -> None:
+        self._memory[key] = (expires_at, content)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def put(self, key: str, content: str, ttl: float) -> float:
+        """
+        Store content in the in-process tier.
+
+        Returns:
+            The expiry timestamp, for ``write_disk``
+        """
+        expires_at = time.time() + ttl
+        self._remember(key, content, expires_at)
+        self._stats["stores"] += 1
+        return expires_at
+
+    def write_disk(self, tool_name: str, key: str, content: str, expires_at: float) -> None:
+        """Store content in the on-disk tier. Blocking; failures are logged."""
+        if self._dir is None:
+            return
+        path = self._path(tool_name, key)
+        tmp = path.with_name(f".{path.name}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            entry = {"tool": tool_name, "expires_at": expires_at, "content": content}
+            tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Failed to write tool cache entry for '{tool_name}': {e}")
+
+    def set(self, tool_name: str, key: str, content: str, ttl: float, disk: bool = True) -> None:
+        """Store content in memory and, unless *disk* is False, on disk. Blocking."""
+        expires_at = self.put(key, content, ttl)
+        if disk:
+            self.write_disk(tool_name, key, content, expires_at)
+
+    # === MAINTENANCE ===
+
+    def purge_expired(self) -> int:
+        """Delete expired on-disk entries. Blocking. Returns the number removed."""
+        if self._dir is None or not self._dir.exists():
+            return 0
+        now = time.time()
+        removed = 0
+        for path in self._dir.glob("*/*.json"):
+            try:
+                expired = float(json.loads(path.read_text(encoding="utf-8"))["expires_at"]) <= now
+            except (OSError, ValueError, KeyError, TypeError):
+                expired = True
+            if expired:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Drop the in-process tier."""
+        self._memory.clear()
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        stats = dict(self._stats)
+        hits = stats["memory_hits"] + stats["disk_hits"] + stats["shared"]
+        lookups = hits + stats["misses"]
+        stats["hit_rate"] = hits / lookups if lookups else 0.0
+        stats["memory_entries"] = len(self._memory)
+        return stats
@@ -2,16 +2,28 @@
 
 import asyncio
 import contextvars
+import hashlib
 import importlib.util
 import inspect
 import json
 import logging
+import os
+import weakref
 from collections.abc import Callable
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
 from framework.llm.provider import Tool, ToolResult, ToolUse
+from framework.runner.tool_cache import (
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_TTL,
+    ToolCachePolicy,
+    ToolResultCache,
+    cache_key,
+    is_cacheable_content,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,12 +35,57 @@
 )
 
 
+# Default size of the thread pool that runs synchronous tool executors.
+DEFAULT_MAX_SYNC_WORKERS = 16
+
+
 @dataclass
 class RegisteredTool:
-    """A tool with its executor function."""
+    """A tool with its executor function.
+
+    Attributes:
+        tool: Tool definition exposed to the LLM.
+        executor: Function that takes the tool input dict.
+        is_async: True when *executor* returns an awaitable.  Sync executors
+            are run on the registry's thread pool when called from an event
+            loop so they don't block other streams.
+        max_concurrency: Max in-flight calls of this tool (None = unlimited).
+        timeout: Seconds before a call is abandoned with an error result
+            (None = registry default).
+        cache: Result cache policy; None for tools whose results must not
+            be reused.
+        credential_scope: Identifies the credentials source (e.g. the MCP
+            server config) for cache keys.
+        context_params: Context params injected into the call; part of the
+            cache key.
+    """
 
     tool: Tool
     executor: Callable[[dict], Any]
+    is_async: bool = False
+    max_concurrency: int | None = None
+    timeout: float | None = None
+    cache: ToolCachePolicy | None = None
+    credential_scope: str = ""
+    context_params: frozenset[str] = field(default_factory=frozenset)
+
+
+def _wrap_result(tool_use_id: str, result: Any) -> ToolResult:
+    if isinstance(result, ToolResult):
+        return result
+    return ToolResult(
+        tool_use_id=tool_use_id,
+        content=json.dumps(result) if not isinstance(result, str) else result,
+        is_error=False,
+    )
+
+
+def _error_result(tool_use_id: str, exc: BaseException) -> ToolResult:
+    return ToolResult(
+        tool_use_id=tool_use_id,
+        content=json.dumps({"error": str(exc)}),
+        is_error=True,
+    )
 
 
 class ToolRegistry:
@@ -40,6 +97,10 @@ class ToolRegistry:
     2. tools.py in agent folder
     3. MCP servers
     4. Manually registered tools
+
+    Tools with a cache policy have their results memoized (see
+    ``framework.runner.tool_cache``); identical concurrent calls share one
+    execution.
     """
 
     # Framework-internal context keys injected into tool calls.
@@ -47,17 +108,52 @@ class ToolRegistry:
     # and auto-injected at call time for tools that accept them.
     CONTEXT_PARAMS = frozenset({"workspace_id", "agent_id", "session_id", "data_dir"})
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_sync_workers: int = DEFAULT_MAX_SYNC_WORKERS,
+        default_tool_timeout: float | None = None,
+        result_cache_dir: Path | None = None,
+        result_cache_size: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            max_sync_workers: Size of the thread pool shared by all sync tool
+                executors.  Bounds how many blocking tool calls run at once.
+            default_tool_timeout: Timeout in seconds applied to tools that
+                don't declare their own (None = no timeout).
+            result_cache_dir: Directory for cached results of cacheable tools
+                (None keeps them in memory only).
+            result_cache_size: Results of cacheable tools kept in memory.
+        """
         self._tools: dict[str, RegisteredTool] = {}
         self._mcp_clients: list[Any] = []  # List of MCPClient instances
         self._session_context: dict[str, Any] = {}  # Auto-injected context for tools
         self._provider_index: dict[str, set[str]] = {}  # provider -> tool names
+        self._max_sync_workers = max_sync_workers
+        self._default_tool_timeout = default_tool_timeout
+        self._sync_pool: ThreadPoolExecutor | None = None
+        # Per-loop, per-tool semaphores (asyncio primitives bind to one loop)
+        self._tool_semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+        self._result_cache = ToolResultCache(result_cache_dir, result_cache_size)
+        # Per-loop in-flight cacheable calls: cache key -> future of the result
+        self._inflight: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Future]
+        ] = weakref.WeakKeyDictionary()
+        self._credential_env_vars: dict[str, list[str]] | None = None  # tool -> env vars
 
     def register(
         self,
         name: str,
         tool: Tool,
         executor: Callable[[dict], Any],
+        *,
+        is_async: bool | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        cache: ToolCachePolicy | None = None,
+        credential_scope: str = "",
     ) -> None:
         """
         Register a single tool with its executor.
@@ -66,14 +162,46 @@ def register(
             name: Tool name (must match tool.name)
             tool: Tool definition
             executor: Function that takes tool input dict and returns result
+            is_async: Whether *executor* returns an awaitable.  Detected from
+                the function when omitted.
+            max_concurrency: Max in-flight calls of this tool (None = unlimited)
+            timeout: Per-call timeout in seconds (None = registry default)
+            cache: Result cache policy, only for deterministic read-only
+                tools (None = never cache)
+            credential_scope: Identifies where the tool's credentials come
+                from; calls with different scopes never share cached results
         """
-        self._tools[name] = RegisteredTool(tool=tool, executor=executor)
+        if is_async is None:
+            is_async = inspect.iscoroutinefunction(executor)
+        self._tools[name] = RegisteredTool(
+            tool=tool,
+            executor=executor,
+            is_async=is_async,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            cache=cache,
+            credential_scope=credential_scope,
+        )
+
+    def set_tool_limits(
+        self,
+        name: str,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Set concurrency and timeout limits for an already-registered tool."""
+        registered = self._tools[name]
+        registered.max_concurrency = max_concurrency
+        registered.timeout = timeout
 
     def register_function(
         self,
         func: Callable,
         name: str | None = None,
         description: str | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        cache: ToolCachePolicy | None = None,
     ) -> None:
         """
         Register a function as a tool, auto-generating the Tool definition.
@@ -82,6 +210,9 @@ def register_function(
             func: Function to register
             name: Tool name (defaults to function name)
             description: Tool description (defaults to docstring)
+            max_concurrency: Max in-flight calls of this tool (None = unlimited)
+            timeout: Per-call timeout in seconds (None = registry default)
+            cache: Result cache policy (None = never cache)
         """
         tool_name = name or func.__name__
         tool_desc = description or func.__doc__ or f"Execute {tool_name}"
@@ -126,7 +257,15 @@ def register_function(
         def executor(inputs: dict) -> Any:
             return func(**inputs)
 
-        self.register(tool_name, tool, executor)
+        self.register(
+            tool_name,
+            tool,
+            executor,
+            is_async=inspect.iscoroutinefunction(func),
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            cache=cache,
+        )
 
     def discover_from_module(self, module_path: Path) -> int:
         """
@@ -197,7 +336,12 @@ def executor(inputs: dict) -> Any:
 
                         return executor
 
-                    self.register(name, tool, make_executor(name))
+                    self.register(
+                        name,
+                        tool,
+                        make_executor(name),
+                        is_async=inspect.iscoroutinefunction(executor_func),
+                    )
                 else:
                     # Register tool without executor (will use mock)
                     self.register(name, tool, lambda inputs: {"mock": True, "inputs": inputs})
@@ -212,6 +356,13 @@ def executor(inputs: dict) -> Any:
                     obj,
                     name=metadata.get("name", name),
                     description=metadata.get("description"),
+                    max_concurrency=metadata.get("max_concurrency"),
+                    timeout=metadata.get("timeout"),
+                    cache=(
+                        ToolCachePolicy(ttl=metadata.get("ttl") or DEFAULT_TTL)
+                        if metadata.get("cacheable")
+                        else None
+                    ),
                 )
                 count += 1
 
@@ -226,19 +377,16 @@ def get_executor(self) -> Callable[[ToolUse], ToolResult]:
         Get unified tool executor function.
 
         Returns a function that dispatches to the appropriate tool executor.
-        Handles both sync and async tool implementations — async results are
-        wrapped so that ``EventLoopNode._execute_tool`` can await them.
+        Async tool results are wrapped so that ``EventLoopNode._execute_tool``
+        can await them.  When called from a running event loop, sync tools
+        are also returned as awaitables: they run on the registry's bounded
+        thread pool (honouring per-tool concurrency limits and timeouts), so
+        parallel tool calls overlap and the loop keeps serving other
+        streams.  Outside an event loop sync tools run inline as before.
+        Tools with a cache policy are answered from the result cache when
+        possible.
         """
 
-        def _wrap_result(tool_use_id: str, result: Any) -> ToolResult:
-            if isinstance(result, ToolResult):
-                return result
-            return ToolResult(
-                tool_use_id=tool_use_id,
-                content=json.dumps(result) if not isinstance(result, str) else result,
-                is_error=False,
-            )
-
         def executor(tool_use: ToolUse) -> ToolResult:
             if tool_use.name not in self._tools:
                 return ToolResult(
@@ -248,34 +396,238 @@ def executor(tool_use: ToolUse) -> ToolResult:
                 )
 
             registered = self._tools[tool_use.name]
+            if registered.cache is not None:
+                return self._call_cached(registered, tool_use)
+            return self._call_tool(registered, tool_use)
+
+        return executor
+
+    def _call_tool(self, registered: RegisteredTool, tool_use: ToolUse) -> Any:
+        """Call a tool; returns a ToolResult or an awaitable of one."""
+        if not registered.is_async:
             try:
-                result = registered.executor(tool_use.input)
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                return self._call_sync_tool(registered, tool_use)
 
-                # Async tool: wrap the awaitable so the caller can await it
-                if asyncio.iscoroutine(result) or asyncio.isfuture(result):
+        try:
+            result = registered.executor(tool_use.input)
 
-                    async def _await_and_wrap():
-                        try:
-                            r = await result
-                            return _wrap_result(tool_use.id, r)
-                        except Exception as exc:
-                            return ToolResult(
-                                tool_use_id=tool_use.id,
-                                content=json.dumps({"error": str(exc)}),
-                                is_error=True,
-                            )
+            # Async tool: wrap the awaitable so the caller can await it
+            if asyncio.iscoroutine(result) or asyncio.isfuture(result):
 
-                    return _await_and_wrap()
+                async def _await_and_wrap():
+                    try:
+                        r = await self._with_limits(registered, tool_use, lambda: result)
+                        return _wrap_result(tool_use.id, r)
+                    except Exception as exc:
+                        return _error_result(tool_use.id, exc)
 
-                return _wrap_result(tool_use.id, result)
-            except Exception as e:
-                return ToolResult(
-                    tool_use_id=tool_use.id,
-                    content=json.dumps({"error": str(e)}),
-                    is_error=True,
+                return _await_and_wrap()
+
+            return _wrap_result(tool_use.id, result)
+        except Exception as e:
+            return _error_result(tool_use.id, e)
+
+    # ------------------------------------------------------------------
+    # Result cache
+    # ------------------------------------------------------------------
+
+    def _call_cached(self, registered: RegisteredTool, tool_use: ToolUse) -> Any:
+        """Call a cacheable tool through the result cache."""
+        key = self._cache_key(registered, tool_use)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            return self._acall_cached(registered, tool_use, key)
+
+        disk = self._disk_cacheable(tool_use.name)
+        content = self._result_cache.get(tool_use.name, key, disk=disk)
+        if content is not None:
+            return ToolResult(tool_use_id=tool_use.id, content=content, cache_status="hit")
+        result = self._call_tool(registered, tool_use)
+        if not isinstance(result, ToolResult):
+            return result  # Async tool called outside an event loop: not cached
+        if self._should_cache(result):
+            self._result_cache.set(
+                tool_use.name, key, result.content, registered.cache.ttl, disk=disk
+            )
+        return replace(result, cache_status="miss")
+
+    async def _acall_cached(
+        self, registered: RegisteredTool, tool_use: ToolUse, key: str
+    ) -> ToolResult:
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.setdefault(loop, {})
+        pending = inflight.get(key)
+        if pending is not None:
+            # An identical call is running: share its result
+            try:
+                shared = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+            else:
+                self._result_cache.record_shared()
+                return replace(shared, tool_use_id=tool_use.id, cache_status="hit")
+
+        future = loop.create_future()
+        inflight[key] = future
+        try:
+            result = await self._lookup_or_call(registered, tool_use, key)
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                future.cancel()
+            if inflight.get(key) is future:
+                del inflight[key]
+
+    async def _lookup_or_call(
+        self, registered: RegisteredTool, tool_use: ToolUse, key: str
+    ) -> ToolResult:
+        cache = self._result_cache
+        disk = cache.has_disk and self._disk_cacheable(tool_use.name)
+        content = cache.get_memory(key)
+        if content is None and disk:
+            content = await asyncio.to_thread(cache.get_disk, tool_use.name, key)
+        if content is not None:
+            return ToolResult(tool_use_id=tool_use.id, content=content, cache_status="hit")
+        cache.record_miss()
+
+        result = self._call_tool(registered, tool_use)
+        if asyncio.iscoroutine(result) or asyncio.isfuture(result):
+            result = await result
+        if self._should_cache(result):
+            expires_at = cache.put(key, result.content, registered.cache.ttl)
+            if disk:
+                await asyncio.to_thread(
+                    cache.write_disk, tool_use.name, key, result.content, expires_at
                 )
+        return replace(result, cache_status="miss")
 
-        return executor
+    @staticmethod
+    def _should_cache(result: ToolResult) -> bool:
+        return not result.is_error and is_cacheable_content(result.content)
+
+    def _cache_key(self, registered: RegisteredTool, tool_use: ToolUse) -> str:
+        """Cache key from the arguments, injected context and credential identity."""
+        arguments = dict(tool_use.input)
+        if registered.context_params:
+            context = {**self._session_context, **(_execution_context.get() or {})}
+            for param in registered.context_params:
+                if param in context and param not in arguments:
+                    arguments[param] = context[param]
+        return cache_key(tool_use.name, arguments, self._credential_identity(registered, tool_use))
+
+    def _tool_credential_env_vars(self, tool_name: str) -> list[str]:
+        """Env vars of the credential specs that cover *tool_name*."""
+        if self._credential_env_vars is None:
+            self._credential_env_vars = {}
+            try:
+                from aden_tools.credentials import CREDENTIAL_SPECS
+            except ImportError:
+                pass
+            else:
+                for spec in CREDENTIAL_SPECS.values():
+                    for name in spec.tools:
+                        self._credential_env_vars.setdefault(name, []).append(spec.env_var)
+        return self._credential_env_vars.get(tool_name, [])
+
+    def _disk_cacheable(self, tool_name: str) -> bool:
+        """Whether results of *tool_name* may go to the on-disk tier.
+
+        Tools with a credential spec may resolve their credentials from the
+        CredentialStore rather than the environment, which the cache key
+        can't see; a key rotated there must not be answered from results
+        persisted under the old one, so these stay in memory only.
+        """
+        return not self._tool_credential_env_vars(tool_name)
+
+    def _credential_identity(self, registered: RegisteredTool, tool_use: ToolUse) -> str:
+        """Digest of the credential scope and the tool's credential env vars."""
+        env_vars = self._tool_credential_env_vars(tool_use.name)
+        if not registered.credential_scope and not env_vars:
+            return ""
+        material = "\0".join(
+            [registered.credential_scope, *(os.environ.get(var, "") for var in env_vars)]
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+    def get_cache_stats(self) -> dict:
+        """Get tool result cache statistics."""
+        return self._result_cache.get_stats()
+
+    async def _call_sync_tool(self, registered: RegisteredTool, tool_use: ToolUse) -> ToolResult:
+        """Run a sync tool executor on the thread pool and wrap its result."""
+        loop = asyncio.get_running_loop()
+        # Copy contextvars so per-execution context reaches the worker thread
+        ctx = contextvars.copy_context()
+        try:
+            result = await self._with_limits(
+                registered,
+                tool_use,
+                lambda: loop.run_in_executor(
+                    self._get_sync_pool(), ctx.run, registered.executor, tool_use.input
+                ),
+            )
+            # A "sync" executor may still hand back an awaitable
+            if asyncio.iscoroutine(result) or asyncio.isfuture(result):
+                result = await result
+            return _wrap_result(tool_use.id, result)
+        except Exception as e:
+            return _error_result(tool_use.id, e)
+
+    async def _with_limits(
+        self,
+        registered: RegisteredTool,
+        tool_use: ToolUse,
+        start: Callable[[], Any],
+    ) -> Any:
+        """Start and await a tool call under its concurrency limit and timeout.
+
+        *start* returns the awaitable; it is only called once a concurrency
+        slot is held so queued calls don't occupy pool threads.
+        """
+        timeout = registered.timeout or self._default_tool_timeout
+        semaphore = self._get_tool_semaphore(tool_use.name, registered.max_concurrency)
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            awaitable = start()
+            if timeout:
+                try:
+                    return await asyncio.wait_for(awaitable, timeout)
+                except TimeoutError:
+                    # The worker thread (if any) can't be interrupted; it
+                    # finishes in the background and its result is dropped.
+                    raise TimeoutError(
+                        f"Tool '{tool_use.name}' timed out after {timeout:g}s"
+                    ) from None
+            return await awaitable
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def _get_sync_pool(self) -> ThreadPoolExecutor:
+        if self._sync_pool is None:
+            self._sync_pool = ThreadPoolExecutor(
+                max_workers=self._max_sync_workers,
+                thread_name_prefix="hive-tool",
+            )
+        return self._sync_pool
+
+    def _get_tool_semaphore(self, name: str, limit: int | None) -> asyncio.Semaphore | None:
+        if not limit:
+            return None
+        per_loop = self._tool_semaphores.setdefault(asyncio.get_running_loop(), {})
+        if name not in per_loop:
+            per_loop[name] = asyncio.Semaphore(limit)
+        return per_loop[name]
 
     def get_registered_names(self) -> list[str]:
         """Get list of registered tool names."""
@@ -367,6 +719,10 @@ def register_mcp_server(
                 - url: Server URL (for http)
                 - headers: HTTP headers (for http)
                 - description: Server description (optional)
+                - pool_size: STDIO server processes to spread calls over (optional)
+                - max_connections: HTTP connection pool size (optional)
+                - max_concurrency: Max in-flight calls per tool (optional)
+                - timeout: Per-call timeout in seconds (optional)
 
         Returns:
             Number of tools registered from this server
@@ -385,6 +741,8 @@ def register_mcp_server(
                 url=server_config.get("url"),
                 headers=server_config.get("headers", {}),
                 description=server_config.get("description", ""),
+                pool_size=server_config.get("pool_size", 1),
+                max_connections=server_config.get("max_connections", 20),
             )
 
             # Create and connect client
@@ -394,6 +752,22 @@ def register_mcp_server(
             # Store client for cleanup
             self._mcp_clients.append(client)
 
+            # Cached results are keyed on the server's credentials source
+            credential_scope = hashlib.sha256(
+                json.dumps(
+                    [
+                        config.name,
+                        config.command,
+                        config.args,
+                        config.url,
+                        config.env,
+                        config.headers,
+                    ],
+                    sort_keys=True,
+                    default=str,
+                ).encode("utf-8")
+            ).hexdigest()[:16]
+
             # Register each tool
             count = 0
             for mcp_tool in client.list_tools():
@@ -407,26 +781,45 @@ def make_mcp_executor(
                     registry_ref,
                     tool_params: set[str],
                 ):
+                    def merge_inputs(inputs: dict) -> dict:
+                        # Build base context: session < execution (execution wins)
+                        base_context = dict(registry_ref._session_context)
+                        exec_ctx = _execution_context.get()
+                        if exec_ctx:
+                            base_context.update(exec_ctx)
+
+                        # Only inject context params the tool accepts
+                        filtered_context = {
+                            k: v for k, v in base_context.items() if k in tool_params
+                        }
+                        return {**filtered_context, **inputs}
+
+                    def unwrap(result: Any) -> Any:
+                        # MCP tools return content array, extract the result
+                        if isinstance(result, list) and len(result) > 0:
+                            if isinstance(result[0], dict) and "text" in result[0]:
+                                return result[0]["text"]
+                            return result[0]
+                        return result
+
+                    async def acall(merged_inputs: dict) -> Any:
+                        try:
+                            return unwrap(await client_ref.acall_tool(tool_name, merged_inputs))
+                        except Exception as e:
+                            logger.error(f"MCP tool '{tool_name}' execution failed: {e}")
+                            return {"error": str(e)}
+
                     def executor(inputs: dict) -> Any:
+                        merged_inputs = merge_inputs(inputs)
                         try:
-                            # Build base context: session < execution (execution wins)
-                            base_context = dict(registry_ref._session_context)
-                            exec_ctx = _execution_context.get()
-                            if exec_ctx:
-                                base_context.update(exec_ctx)
-
-                            # Only inject context params the tool accepts
-                            filtered_context = {
-                                k: v for k, v in base_context.items() if k in tool_params
-                            }
-                            merged_inputs = {**filtered_context, **inputs}
-                            result = client_ref.call_tool(tool_name, merged_inputs)
-                            # MCP tools return content array, extract the result
-                            if isinstance(result, list) and len(result) > 0:
-                                if isinstance(result[0], dict) and "text" in result[0]:
-                                    return result[0]["text"]
-                                return result[0]
-                            return result
+                            asyncio.get_running_loop()
+                        except RuntimeError:
+                            pass
+                        else:
+                            # Native async call: concurrent calls share the session
+                            return acall(merged_inputs)
+                        try:
+                            return unwrap(client_ref.call_tool(tool_name, merged_inputs))
                         except Exception as e:
                             logger.error(f"MCP tool '{tool_name}' execution failed: {e}")
                             return {"error": str(e)}
@@ -438,6 +831,14 @@ def executor(inputs: dict) -> Any:
                     mcp_tool.name,
                     tool,
                     make_mcp_executor(client, mcp_tool.name, self, tool_params),
+                    is_async=True,
+                    max_concurrency=server_config.get("max_concurrency"),
+                    timeout=server_config.get("timeout"),
+                    cache=ToolCachePolicy.from_meta(mcp_tool.meta),
+                    credential_scope=credential_scope,
+                )
+                self._tools[mcp_tool.name].context_params = frozenset(
+                    tool_params & self.CONTEXT_PARAMS
                 )
                 count += 1
 
@@ -532,13 +933,16 @@ def get_all_provider_tool_names(self) -> list[str]:
         return sorted(name for name in self._tools if name in all_names)
 
     def cleanup(self) -> None:
-        """Clean up all MCP client connections."""
+        """Clean up all MCP client connections and the sync tool thread pool."""
         for client in self._mcp_clients:
             try:
                 client.disconnect()
             except Exception as e:
                 logger.warning(f"Error disconnecting MCP client: {e}")
         self._mcp_clients.clear()
+        if self._sync_pool is not None:
+            self._sync_pool.shutdown(wait=False, cancel_futures=True)
+            self._sync_pool = None
 
     def __del__(self):
         """Destructor to ensure cleanup."""
@@ -548,20 +952,36 @@ def __del__(self):
 def tool(
     description: str | None = None,
     name: str | None = None,
+    max_concurrency: int | None = None,
+    timeout: float | None = None,
+    cacheable: bool = False,
+    ttl: float | None = None,
 ) -> Callable:
     """
     Decorator to mark a function as a tool.
 
+    Set ``cacheable=True`` only for deterministic, read-only tools: repeated
+    calls with the same arguments are then answered from the result cache
+    for ``ttl`` seconds.
+
     Usage:
-        @tool(description="Fetch lead from GTM table")
+        @tool(description="Fetch lead from GTM table", timeout=30)
         def gtm_fetch_lead(lead_id: str) -> dict:
             return {"lead_data": {...}}
+
+        @tool(cacheable=True, ttl=3600)
+        def lookup_country(code: str) -> dict:
+            return COUNTRIES[code]
     """
 
     def decorator(func: Callable) -> Callable:
         func._tool_metadata = {
             "name": name or func.__name__,
             "description": description or func.__doc__,
+            "max_concurrency": max_concurrency,
+            "timeout": timeout,
+            "cacheable": cacheable,
+            "ttl": ttl,
         }
         return func
 
@@ -16,11 +16,12 @@
 
 from framework.graph.checkpoint_config import CheckpointConfig
 from framework.graph.executor import ExecutionResult
-from framework.runtime.event_bus import EventBus
+from framework.runtime.event_bus import DeltaCoalescingConfig, EventBus
 from framework.runtime.execution_stream import EntryPointSpec, ExecutionStream
 from framework.runtime.outcome_aggregator import OutcomeAggregator
 from framework.runtime.shared_state import SharedStateManager
 from framework.storage.concurrent import ConcurrentStorage
+from framework.storage.persistence import PersistencePipeline
 from framework.storage.session_store import SessionStore
 
 if TYPE_CHECKING:
@@ -46,6 +47,12 @@ class AgentRuntimeConfig:
     webhook_port: int = 8080
     webhook_routes: list[dict] = field(default_factory=list)
     # Each dict: {"source_id": str, "path": str, "methods": ["POST"], "secret": str|None}
+    # Merge streaming delta events on the event bus (None = one event per chunk)
+    delta_coalescing: DeltaCoalescingConfig | None = None
+    # Session state / checkpoint writes: threads used, and how long a state.json
+    # write waits for a newer one to replace it (0 = write immediately)
+    persistence_workers: int = 4
+    persistence_window_ms: float = 50.0
 
 
 @dataclass
@@ -168,12 +175,20 @@ def __init__(
             batch_interval=self._config.batch_interval,
         )
 
-        # Initialize SessionStore for unified sessions (always enabled)
-        self._session_store = SessionStore(storage_path_obj)
+        # Initialize SessionStore for unified sessions (always enabled).
+        # One pipeline serves every execution's state.json and checkpoint writes.
+        self._persistence = PersistencePipeline(
+            max_workers=self._config.persistence_workers,
+            window_ms=self._config.persistence_window_ms,
+        )
+        self._session_store = SessionStore(storage_path_obj, persistence=self._persistence)
 
         # Initialize shared components
         self._state_manager = SharedStateManager()
-        self._event_bus = EventBus(max_history=self._config.max_history)
+        self._event_bus = EventBus(
+            max_history=self._config.max_history,
+            delta_coalescing=self._config.delta_coalescing,
+        )
         self._outcome_aggregator = OutcomeAggregator(goal, self._event_bus)
 
         # LLM and tools
@@ -550,10 +565,14 @@ async def stop(self) -> None:
                 await stream.stop()
 
             self._streams.clear()
+            await self._event_bus.flush_deltas()
             self._graphs.clear()
 
-            # Stop storage
+            # Stop storage (queued session writes first)
+            await self._persistence.close()
             await self._storage.stop()
+            if self._runtime_log_store is not None and hasattr(self._runtime_log_store, "close"):
+                await asyncio.to_thread(self._runtime_log_store.close)
 
             self._running = False
             logger.info("AgentRuntime stopped")
@@ -974,7 +993,13 @@ def _get_primary_session_state(
                     )
         return None
 
-    async def inject_input(self, node_id: str, content: str, graph_id: str | None = None) -> bool:
+    async def inject_input(
+        self,
+        node_id: str,
+        content: str,
+        graph_id: str | None = None,
+        execution_id: str | None = None,
+    ) -> bool:
         """Inject user input into a running client-facing node.
 
         Routes input to the EventLoopNode identified by ``node_id``.
@@ -984,6 +1009,8 @@ async def inject_input(self, node_id: str, content: str, graph_id: str | None =
             node_id: The node currently waiting for input
             content: The user's input text
             graph_id: Optional graph to search first (defaults to active graph)
+            execution_id: Optional execution the input belongs to (needed when
+                several executions of the same graph wait on the same node)
 
         Returns:
             True if input was delivered, False if no matching node found
@@ -995,7 +1022,7 @@ async def inject_input(self, node_id: str, content: str, graph_id: str | None =
         target = graph_id or self._active_graph_id
         if target in self._graphs:
             for stream in self._graphs[target].streams.values():
-                if await stream.inject_input(node_id, content):
+                if await stream.inject_input(node_id, content, execution_id):
                     return True
 
         # Then search all other graphs
@@ -1003,7 +1030,7 @@ async def inject_input(self, node_id: str, content: str, graph_id: str | None =
             if gid == target:
                 continue
             for stream in reg.streams.values():
-                if await stream.inject_input(node_id, content):
+                if await stream.inject_input(node_id, content, execution_id):
                     return True
         return False
 
@@ -1106,6 +1133,7 @@ def get_stats(self) -> dict:
             "outcome_aggregator": self._outcome_aggregator.get_stats(),
             "event_bus": self._event_bus.get_stats(),
             "state_manager": self._state_manager.get_stats(),
+            "persistence": self._persistence.get_stats(),
         }
 
     # === PROPERTIES ===
@@ -1120,6 +1148,11 @@ def event_bus(self) -> EventBus:
         """Access the event bus."""
         return self._event_bus
 
+    @property
+    def persistence(self) -> PersistencePipeline:
+        """Access the session-state persistence pipeline."""
+        return self._persistence
+
     @property
     def outcome_aggregator(self) -> OutcomeAggregator:
         """Access the outcome aggregator."""
@@ -1185,7 +1218,7 @@ def create_agent_runtime(
         from framework.runtime.runtime_log_store import RuntimeLogStore
 
         storage_path_obj = Path(storage_path) if isinstance(storage_path, str) else storage_path
-        runtime_log_store = RuntimeLogStore(storage_path_obj / "runtime_logs")
+        runtime_log_store = RuntimeLogStore(storage_path_obj / "runtime_logs", buffered=True)
 
     runtime = AgentRuntime(
         graph=graph,
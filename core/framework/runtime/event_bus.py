@@ -9,6 +9,7 @@
 
 import asyncio
 import logging
+from collections import deque
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -117,6 +118,79 @@ def to_dict(self) -> dict:
 # Type for event handlers
 EventHandler = Callable[[AgentEvent], Awaitable[None]]
 
+# Token-level streaming events.  Published far more often than anything
+# else, so they skip the history ring buffer by default.
+DELTA_EVENT_TYPES = frozenset(
+    {
+        EventType.LLM_TEXT_DELTA,
+        EventType.LLM_REASONING_DELTA,
+        EventType.CLIENT_OUTPUT_DELTA,
+    }
+)
+
+
+@dataclass
+class DeltaCoalescingConfig:
+    """Opt-in merging of consecutive streaming delta events.
+
+    Consecutive deltas of the same type from the same (execution, node)
+    are merged into one event once *window_ms* has passed since the first
+    buffered delta or *max_bytes* of content has accumulated, whichever
+    comes first.  Merged events keep the usual ``content`` (concatenated)
+    and ``snapshot`` (latest) fields, plus ``coalesced_count``, so
+    existing subscribers work unchanged.
+    """
+
+    window_ms: float = 50.0
+    max_bytes: int = 2048
+    event_types: frozenset[EventType] = DELTA_EVENT_TYPES
+
+
+@dataclass
+class _PendingDelta:
+    """Deltas buffered for one (stream, execution) pair."""
+
+    first: AgentEvent
+    parts: list[str]
+    last: AgentEvent
+    size: int
+    count: int = 1
+    timer: asyncio.TimerHandle | None = None
+
+    @classmethod
+    def start(cls, event: AgentEvent) -> "_PendingDelta":
+        content = event.data.get("content", "")
+        return cls(first=event, parts=[content], last=event, size=len(content))
+
+    def accepts(self, event: AgentEvent) -> bool:
+        return (
+            event.type == self.first.type
+            and event.node_id == self.first.node_id
+            and event.graph_id == self.first.graph_id
+        )
+
+    def add(self, event: AgentEvent) -> None:
+        content = event.data.get("content", "")
+        self.parts.append(content)
+        self.size += len(content)
+        self.last = event
+        self.count += 1
+
+    def to_event(self) -> AgentEvent:
+        if self.count == 1:
+            return self.first
+        data = {**self.last.data, "content": "".join(self.parts), "coalesced_count": self.count}
+        return AgentEvent(
+            type=self.first.type,
+            stream_id=self.first.stream_id,
+            node_id=self.first.node_id,
+            execution_id=self.first.execution_id,
+            data=data,
+            timestamp=self.last.timestamp,
+            correlation_id=self.first.correlation_id,
+            graph_id=self.first.graph_id,
+        )
+
 
 @dataclass
 class Subscription:
@@ -129,6 +203,22 @@ class Subscription:
     filter_node: str | None = None  # Only receive events from this node
     filter_execution: str | None = None  # Only receive events from this execution
     filter_graph: str | None = None  # Only receive events from this graph
+    order: int = 0  # Registration order, used to keep dispatch order stable
+
+    @property
+    def index_key(self) -> tuple[str | None, str | None]:
+        """Most selective filter, used to bucket the subscription.
+
+        Execution filters are the most selective (one execution), then
+        stream, then graph.  Unfiltered subscriptions use ``(None, None)``.
+        """
+        if self.filter_execution:
+            return ("execution", self.filter_execution)
+        if self.filter_stream:
+            return ("stream", self.filter_stream)
+        if self.filter_graph:
+            return ("graph", self.filter_graph)
+        return (None, None)
 
 
 class EventBus:
@@ -140,6 +230,14 @@ class EventBus:
     - Type-based subscriptions
     - Stream/execution filtering
     - Event history for debugging
+    - Optional coalescing of streaming deltas (see :class:`DeltaCoalescingConfig`)
+
+    Subscriptions are indexed by event type and by their most selective
+    filter (execution, stream or graph), so ``publish`` only looks at the
+    handful of subscriptions that can possibly match instead of scanning
+    all of them.  History is a bounded ring buffer; delta events
+    (:data:`DELTA_EVENT_TYPES`) are not recorded unless
+    ``record_delta_history`` is set.
 
     Example:
         bus = EventBus()
@@ -166,6 +264,8 @@ def __init__(
         self,
         max_history: int = 1000,
         max_concurrent_handlers: int = 10,
+        record_delta_history: bool = False,
+        delta_coalescing: DeltaCoalescingConfig | None = None,
     ):
         """
         Initialize event bus.
@@ -173,13 +273,24 @@ def __init__(
         Args:
             max_history: Maximum events to keep in history
             max_concurrent_handlers: Maximum concurrent handler executions
+            record_delta_history: Also keep streaming delta events in history
+            delta_coalescing: Merge consecutive delta events (None = off)
         """
         self._subscriptions: dict[str, Subscription] = {}
-        self._event_history: list[AgentEvent] = []
+        # (event_type, filter_kind, filter_value) -> {sub_id: Subscription}
+        self._index: dict[tuple[EventType, str | None, str | None], dict[str, Subscription]] = {}
+        self._event_history: deque[AgentEvent] = deque(maxlen=max_history)
         self._max_history = max_history
+        self._record_delta_history = record_delta_history
+        self._delta_events_published = 0
         self._semaphore = asyncio.Semaphore(max_concurrent_handlers)
         self._subscription_counter = 0
-        self._lock = asyncio.Lock()
+        self._coalescing = delta_coalescing
+        # (stream_id, execution_id) -> buffered deltas
+        self._pending_deltas: dict[tuple[str, str | None], _PendingDelta] = {}
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._deltas_received = 0
+        self._coalesced_events_published = 0
 
     def subscribe(
         self,
@@ -215,9 +326,13 @@ def subscribe(
             filter_node=filter_node,
             filter_execution=filter_execution,
             filter_graph=filter_graph,
+            order=self._subscription_counter,
         )
 
         self._subscriptions[sub_id] = subscription
+        kind, value = subscription.index_key
+        for event_type in subscription.event_types:
+            self._index.setdefault((event_type, kind, value), {})[sub_id] = subscription
         logger.debug(f"Subscription {sub_id} registered for {event_types}")
 
         return sub_id
@@ -232,11 +347,19 @@ def unsubscribe(self, subscription_id: str) -> bool:
         Returns:
             True if subscription was found and removed
         """
-        if subscription_id in self._subscriptions:
-            del self._subscriptions[subscription_id]
-            logger.debug(f"Subscription {subscription_id} removed")
-            return True
-        return False
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            return False
+        kind, value = subscription.index_key
+        for event_type in subscription.event_types:
+            key = (event_type, kind, value)
+            bucket = self._index.get(key)
+            if bucket is not None:
+                bucket.pop(subscription_id, None)
+                if not bucket:
+                    del self._index[key]
+        logger.debug(f"Subscription {subscription_id} removed")
+        return True
 
     async def publish(self, event: AgentEvent) -> None:
         """
@@ -245,23 +368,108 @@ async def publish(self, event: AgentEvent) -> None:
         Args:
             event: Event to publish
         """
-        # Add to history
-        async with self._lock:
+        if self._coalescing is not None:
+            if event.type in self._coalescing.event_types:
+                await self._buffer_delta(event)
+                return
+            if self._pending_deltas:
+                # Deliver buffered text before whatever follows it
+                await self._flush_related_deltas(event)
+
+        await self._dispatch(event)
+
+    async def _dispatch(self, event: AgentEvent) -> None:
+        """Record *event* in history and run matching handlers."""
+        # Add to history.  No lock needed: nothing awaits between the
+        # append and the ring buffer's own eviction.
+        if event.type in DELTA_EVENT_TYPES:
+            self._delta_events_published += 1
+            if self._record_delta_history:
+                self._event_history.append(event)
+        else:
             self._event_history.append(event)
-            if len(self._event_history) > self._max_history:
-                self._event_history = self._event_history[-self._max_history :]
-
-        # Find matching subscriptions
-        matching_handlers: list[EventHandler] = []
 
-        for subscription in self._subscriptions.values():
-            if self._matches(subscription, event):
-                matching_handlers.append(subscription.handler)
+        matching_handlers = [s.handler for s in self._matching_subscriptions(event)]
 
         # Execute handlers concurrently
         if matching_handlers:
             await self._execute_handlers(event, matching_handlers)
 
+    # === DELTA COALESCING ===
+
+    async def _buffer_delta(self, event: AgentEvent) -> None:
+        config = self._coalescing
+        key = (event.stream_id, event.execution_id)
+        self._deltas_received += 1
+
+        pending = self._pending_deltas.get(key)
+        if pending is not None and not pending.accepts(event):
+            await self._flush_pending(key)
+            pending = None
+
+        if pending is None:
+            pending = _PendingDelta.start(event)
+            self._pending_deltas[key] = pending
+            pending.timer = asyncio.get_running_loop().call_later(
+                config.window_ms / 1000, self._schedule_flush, key, pending
+            )
+        else:
+            pending.add(event)
+
+        if pending.size >= config.max_bytes:
+            await self._flush_pending(key)
+
+    def _schedule_flush(self, key: tuple[str, str | None], pending: _PendingDelta) -> None:
+        """Timer callback: flush *pending* if it is still the buffered batch."""
+        if self._pending_deltas.get(key) is not pending:
+            return
+        task = asyncio.get_running_loop().create_task(self._flush_pending(key))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_pending(self, key: tuple[str, str | None]) -> None:
+        pending = self._pending_deltas.pop(key, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+        self._coalesced_events_published += 1
+        await self._dispatch(pending.to_event())
+
+    async def _flush_related_deltas(self, event: AgentEvent) -> None:
+        """Flush deltas from the same stream (and execution, if known)."""
+        for key in list(self._pending_deltas):
+            stream_id, execution_id = key
+            if stream_id != event.stream_id:
+                continue
+            if event.execution_id is None or execution_id == event.execution_id:
+                await self._flush_pending(key)
+
+    async def flush_deltas(self) -> None:
+        """Publish every buffered delta now (e.g. before shutdown)."""
+        for key in list(self._pending_deltas):
+            await self._flush_pending(key)
+
+    def _matching_subscriptions(self, event: AgentEvent) -> list[Subscription]:
+        """Collect subscriptions matching *event* from the index buckets."""
+        index = self._index
+        event_type = event.type
+        candidates: list[Subscription] = []
+        buckets = 0
+        for key in (
+            (event_type, None, None),
+            (event_type, "execution", event.execution_id),
+            (event_type, "stream", event.stream_id),
+            (event_type, "graph", event.graph_id),
+        ):
+            bucket = index.get(key)
+            if bucket:
+                candidates.extend(bucket.values())
+                buckets += 1
+        if buckets > 1:
+            candidates.sort(key=lambda sub: sub.order)
+        return [sub for sub in candidates if self._matches(sub, event)]
+
     def _matches(self, subscription: Subscription, event: AgentEvent) -> bool:
         """Check if a subscription matches an event."""
         # Check event type
@@ -300,6 +508,10 @@ async def run_handler(handler: EventHandler) -> None:
                 except Exception as e:
                     logger.error(f"Handler error for {event.type}: {e}")
 
+        if len(handlers) == 1:
+            await run_handler(handlers[0])
+            return
+
         # Run all handlers concurrently
         await asyncio.gather(*[run_handler(h) for h in handlers], return_exceptions=True)
 
@@ -873,7 +1085,7 @@ def get_history(
         Returns:
             List of matching events (most recent first)
         """
-        events = self._event_history[::-1]  # Reverse for most recent first
+        events = list(reversed(self._event_history))  # Most recent first
 
         # Apply filters
         if event_type:
@@ -895,6 +1107,15 @@ def get_stats(self) -> dict:
             "total_events": len(self._event_history),
             "subscriptions": len(self._subscriptions),
             "events_by_type": type_counts,
+            "delta_events_published": self._delta_events_published,
+            "delta_coalescing": {
+                "enabled": self._coalescing is not None,
+                "deltas_received": self._deltas_received,
+                "events_published": self._coalesced_events_published,
+                "events_saved": self._deltas_received
+                - self._coalesced_events_published
+                - len(self._pending_deltas),
+            },
         }
 
     # === WAITING OPERATIONS ===
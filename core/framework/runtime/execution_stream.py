@@ -183,6 +183,7 @@ def __init__(
         self._runtime_log_store = runtime_log_store
         self._checkpoint_config = checkpoint_config
         self._session_store = session_store
+        self._persistence = session_store.persistence if session_store else None
         self._accounts_prompt = accounts_prompt
 
         # Create stream-scoped runtime
@@ -308,15 +309,25 @@ async def stop(self) -> None:
                 )
             )
 
-    async def inject_input(self, node_id: str, content: str) -> bool:
+    async def inject_input(
+        self, node_id: str, content: str, execution_id: str | None = None
+    ) -> bool:
         """Inject user input into a running client-facing EventLoopNode.
 
         Searches active executors for a node matching ``node_id`` and calls
         its ``inject_event()`` method to unblock ``_await_user_input()``.
+        With ``execution_id`` (from the CLIENT_INPUT_REQUESTED event) only
+        that execution's node is considered, so concurrent executions of
+        the same graph each get their own input.
 
         Returns True if input was delivered, False otherwise.
         """
-        for executor in self._active_executors.values():
+        if execution_id is not None:
+            executor = self._active_executors.get(execution_id)
+            executors = [executor] if executor is not None else []
+        else:
+            executors = list(self._active_executors.values())
+        for executor in executors:
             node = executor.node_registry.get(node_id)
             if node is not None and hasattr(node, "inject_event"):
                 await node.inject_event(content)
@@ -457,13 +468,14 @@ async def _run_execution(self, ctx: ExecutionContext) -> None:
                     runtime_logger=runtime_logger,
                     loop_config=self.graph.loop_config,
                     accounts_prompt=self._accounts_prompt,
+                    persistence=self._persistence,
                 )
                 # Track executor so inject_input() can reach EventLoopNode instances
                 self._active_executors[execution_id] = executor
 
-                # Write initial session state
+                # Write initial session state (queued; later writes supersede it)
                 if not _is_shared_session:
-                    await self._write_session_state(execution_id, ctx)
+                    await self._write_session_state(execution_id, ctx, wait=False)
 
                 # Create modified graph with entry point
                 # We need to override the entry_node to use our entry point
@@ -500,6 +512,8 @@ async def _run_execution(self, ctx: ExecutionContext) -> None:
                 # Write final session state (skip for shared-session executions)
                 if not _is_shared_session:
                     await self._write_session_state(execution_id, ctx, result=result)
+                if result.paused_at:
+                    await self._flush_persistence()
 
                 # Emit completion/failure event
                 if self._scoped_event_bus:
@@ -558,6 +572,8 @@ async def _run_execution(self, ctx: ExecutionContext) -> None:
                         await self._write_session_state(
                             execution_id, ctx, error="Execution cancelled"
                         )
+                # Everything the execution queued must be on disk before resume
+                await self._flush_persistence()
 
                 # Don't re-raise - we've handled it and saved state
 
@@ -598,6 +614,10 @@ async def _run_execution(self, ctx: ExecutionContext) -> None:
                     )
 
             finally:
+                # Queued writes of this session land before completion is signalled
+                if self._persistence is not None and self._session_store is not None:
+                    await self._persistence.wait(self._session_store.get_state_path(execution_id))
+
                 # Clean up state
                 self._state_manager.cleanup_execution(execution_id)
 
@@ -617,6 +637,7 @@ async def _write_session_state(
         ctx: ExecutionContext,
         result: ExecutionResult | None = None,
         error: str | None = None,
+        wait: bool = True,
     ) -> None:
         """
         Write state.json for a session.
@@ -626,6 +647,7 @@ async def _write_session_state(
             ctx: Execution context
             result: Optional execution result (if completed)
             error: Optional error message (if failed)
+            wait: Wait for the write to land (see SessionStore.write_state)
         """
         # Only write if session_store is available
         if not self._session_store:
@@ -704,13 +726,22 @@ async def _write_session_state(
                 state.result.error = error
 
             # Write state.json
-            await self._session_store.write_state(execution_id, state)
+            await self._session_store.write_state(execution_id, state, wait=wait)
             logger.debug(f"Wrote state.json for session {execution_id} (status={status})")
 
         except Exception as e:
             # Log but don't fail the execution
             logger.error(f"Failed to write state.json for {execution_id}: {e}")
 
+    async def _flush_persistence(self) -> None:
+        """Wait for queued session and checkpoint writes (pause/cancel barrier)."""
+        if self._persistence is None:
+            return
+        try:
+            await self._persistence.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush session writes: {e}")
+
     def _create_modified_graph(self) -> "GraphSpec":
         """Create a graph with the entry point overridden.
 
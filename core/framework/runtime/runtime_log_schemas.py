@@ -24,6 +24,8 @@ class ToolCallLog(BaseModel):
     tool_input: dict[str, Any] = Field(default_factory=dict)
     result: str = ""
     is_error: bool = False
+    latency_ms: int = 0  # Wall time of the tool execution (0 for framework tools)
+    cache_status: str = ""  # "hit" | "miss" for tools with a result cache policy
 
 
 class NodeStepLog(BaseModel):
@@ -44,6 +46,8 @@ class NodeStepLog(BaseModel):
     input_tokens: int = 0
     output_tokens: int = 0
     latency_ms: int = 0
+    cache_hits: int = 0  # Tool calls answered from the tool result cache
+    cache_misses: int = 0  # Cacheable tool calls that ran the tool
     # EventLoopNode only:
     verdict: str = ""  # "ACCEPT"|"RETRY"|"ESCALATE"|"CONTINUE"
     verdict_feedback: str = ""
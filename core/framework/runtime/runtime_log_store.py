@@ -10,6 +10,17 @@
 disk as soon as it's logged, not only at end_run(). L1 (summary) is still
 written once at end as a regular JSON file since it aggregates L2.
 
+With ``buffered=True`` the JSONL appends go through a background
+``JsonlBatchWriter`` that keeps handles open per run and writes in batches
+instead of doing an open/write/close on the caller's thread per line. Reads
+of a run's JSONL flush its pending lines first, and ``close_run()`` (called
+by ``RuntimeLogger.end_run()``) / ``close()`` drain the queue.
+
+``record_analytics()`` (also called by ``end_run()``) adds the finished run's
+L1/L2/L3 facts to ``run_analytics.db`` in the storage root, which answers
+aggregate queries without reading the log files (see
+``framework.storage.run_analytics``).
+
 Storage layout (current)::
 
     {base_path}/
@@ -36,6 +47,8 @@
     RunSummaryLog,
     RunToolLogs,
 )
+from framework.runtime.runtime_log_writer import Durability, JsonlBatchWriter
+from framework.storage.run_analytics import RunAnalytics
 
 logger = logging.getLogger(__name__)
 
@@ -43,9 +56,42 @@
 class RuntimeLogStore:
     """Persists runtime logs at three levels. Thread-safe via per-run directories."""
 
-    def __init__(self, base_path: Path) -> None:
+    def __init__(
+        self,
+        base_path: Path,
+        *,
+        buffered: bool = False,
+        flush_interval: float = 0.2,
+        max_batch_lines: int = 128,
+        durability: Durability = "batch",
+        analytics: bool = True,
+    ) -> None:
+        """
+        Args:
+            base_path: Root directory for runtime logs.
+            buffered: Queue JSONL appends on a background writer instead of
+                writing synchronously. Unbuffered stores write each line
+                before returning.
+            flush_interval: Max seconds a buffered line waits before being written.
+            max_batch_lines: Queued lines that trigger an immediate batch write.
+            durability: ``"line"`` (fsync per line), ``"batch"`` (fsync per
+                batch) or ``"none"`` (no fsync). Only used when buffered.
+            analytics: Record finished runs in the storage root's run
+                analytics store.
+        """
         self._base_path = base_path
+        root = base_path.parent if base_path.name == "runtime_logs" else base_path
+        self.analytics: RunAnalytics | None = RunAnalytics(root) if analytics else None
         # Note: _runs_dir is determined per-run_id by _get_run_dir()
+        self._writer: JsonlBatchWriter | None = (
+            JsonlBatchWriter(
+                flush_interval=flush_interval,
+                max_batch_lines=max_batch_lines,
+                durability=durability,
+            )
+            if buffered
+            else None
+        )
 
     def _get_run_dir(self, run_id: str) -> Path:
         """Determine run directory path based on run_id format.
@@ -77,27 +123,66 @@ def ensure_run_dir(self, run_id: str) -> None:
         run_dir.mkdir(parents=True, exist_ok=True)
 
     def append_step(self, run_id: str, step: NodeStepLog) -> None:
-        """Append one JSONL line to tool_logs.jsonl. Sync."""
+        """Append one JSONL line to tool_logs.jsonl. Sync (queued if buffered)."""
         path = self._get_run_dir(run_id) / "tool_logs.jsonl"
-        line = json.dumps(step.model_dump(), ensure_ascii=False) + "\n"
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(line)
+        self._append_line(path, json.dumps(step.model_dump(), ensure_ascii=False) + "\n")
 
     def append_node_detail(self, run_id: str, detail: NodeDetail) -> None:
-        """Append one JSONL line to details.jsonl. Sync."""
+        """Append one JSONL line to details.jsonl. Sync (queued if buffered)."""
         path = self._get_run_dir(run_id) / "details.jsonl"
-        line = json.dumps(detail.model_dump(), ensure_ascii=False) + "\n"
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(line)
+        self._append_line(path, json.dumps(detail.model_dump(), ensure_ascii=False) + "\n")
 
     def read_node_details_sync(self, run_id: str) -> list[NodeDetail]:
         """Read details.jsonl back into a list of NodeDetail. Sync.
 
         Used by end_run() to aggregate L2 into L1. Skips corrupt lines.
         """
+        self.flush()
         path = self._get_run_dir(run_id) / "details.jsonl"
         return _read_jsonl_as_models(path, NodeDetail)
 
+    def _append_line(self, path: Path, line: str) -> None:
+        writer = self._writer
+        if writer is not None:
+            try:
+                writer.append(path, line)
+                return
+            except RuntimeError:
+                pass  # Closed concurrently by close(); write synchronously
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    # -------------------------------------------------------------------
+    # Buffered writer lifecycle
+    # -------------------------------------------------------------------
+
+    @property
+    def buffered(self) -> bool:
+        return self._writer is not None
+
+    def flush(self) -> None:
+        """Block until all queued JSONL lines are written. No-op if unbuffered."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close_run(self, run_id: str) -> None:
+        """Flush and release the open JSONL handles of a finished run."""
+        if self._writer is not None:
+            self._writer.close_files(self._get_run_dir(run_id))
+
+    def close(self) -> None:
+        """Drain the writer and stop its thread. Called on runtime shutdown.
+
+        Further appends fall back to synchronous writes.
+        """
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            writer.close()
+
+    def get_writer_stats(self) -> dict | None:
+        """Buffered writer counters, or None if unbuffered."""
+        return self._writer.get_stats() if self._writer is not None else None
+
     # -------------------------------------------------------------------
     # Summary write (async — called from end_run)
     # -------------------------------------------------------------------
@@ -108,6 +193,20 @@ async def save_summary(self, run_id: str, summary: RunSummaryLog) -> None:
         await asyncio.to_thread(run_dir.mkdir, parents=True, exist_ok=True)
         await self._write_json(run_dir / "summary.json", summary.model_dump())
 
+    def record_analytics(self, run_id: str, summary: RunSummaryLog) -> None:
+        """Add a finished run's facts to the analytics store. Sync; reads L2/L3 back."""
+        if self.analytics is None:
+            return
+        self.flush()
+        run_dir = self._get_run_dir(run_id)
+        details = _read_jsonl_as_models(run_dir / "details.jsonl", NodeDetail)
+        steps = _read_jsonl_as_models(run_dir / "tool_logs.jsonl", NodeStepLog)
+        self.analytics.record_log_run(
+            summary.model_dump(),
+            [d.model_dump() for d in details],
+            [s.model_dump() for s in steps],
+        )
+
     # -------------------------------------------------------------------
     # Read
     # -------------------------------------------------------------------
@@ -122,6 +221,7 @@ async def load_details(self, run_id: str) -> RunDetailsLog | None:
         path = self._get_run_dir(run_id) / "details.jsonl"
 
         def _read() -> RunDetailsLog | None:
+            self.flush()
             if not path.exists():
                 return None
             nodes = _read_jsonl_as_models(path, NodeDetail)
@@ -134,6 +234,7 @@ async def load_tool_logs(self, run_id: str) -> RunToolLogs | None:
         path = self._get_run_dir(run_id) / "tool_logs.jsonl"
 
         def _read() -> RunToolLogs | None:
+            self.flush()
             if not path.exists():
                 return None
             steps = _read_jsonl_as_models(path, NodeStepLog)
@@ -0,0 +1,237 @@
+"""Background batching writer for runtime log JSONL files.
+
+``RuntimeLogger`` appends one L2/L3 line per node completion / step. Doing
+an open/write/close for every line on the event loop thread is a blocking
+syscall storm for tool-heavy nodes. ``JsonlBatchWriter`` moves the I/O to a
+single daemon thread that keeps one append handle open per file and writes
+queued lines in batches.
+
+Durability modes:
+
+- ``"line"``  — flush + fsync after every line (strongest, slowest)
+- ``"batch"`` — flush + fsync once per batch (default)
+- ``"none"``  — flush to the OS once per batch, never fsync
+
+Usage::
+
+    writer = JsonlBatchWriter(flush_interval=0.2, max_batch_lines=128)
+    writer.append(path, json_line)
+    writer.flush()                 # barrier: everything queued is on disk
+    writer.close_files(run_dir)    # release handles for a finished run
+    writer.close()                 # drain and stop the thread
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import IO, Literal
+
+logger = logging.getLogger(__name__)
+
+Durability = Literal["line", "batch", "none"]
+
+_DURABILITY_MODES = ("line", "batch", "none")
+
+# Writers still open at interpreter exit get drained so buffered lines are
+# not lost with the daemon thread.
+_live_writers: weakref.WeakSet[JsonlBatchWriter] = weakref.WeakSet()
+
+
+class JsonlBatchWriter:
+    """Appends lines to files from a background thread, in batches.
+
+    Thread-safe: ``append`` may be called from any thread, including the
+    asyncio loop thread, and only takes a short lock to enqueue.
+
+    Args:
+        flush_interval: Max seconds a queued line waits before being written.
+        max_batch_lines: Queue length that triggers an immediate write.
+        durability: ``"line"``, ``"batch"`` or ``"none"`` (see module docs).
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 0.2,
+        max_batch_lines: int = 128,
+        durability: Durability = "batch",
+    ) -> None:
+        if durability not in _DURABILITY_MODES:
+            raise ValueError(
+                f"Unknown durability mode {durability!r}; expected one of {_DURABILITY_MODES}"
+            )
+        self.flush_interval = flush_interval
+        self.max_batch_lines = max(1, max_batch_lines)
+        self.durability: Durability = durability
+
+        self._cond = threading.Condition()
+        self._pending: list[tuple[Path, str]] = []
+        self._enqueued = 0  # sequence number of the last queued line
+        self._written = 0  # sequence number of the last line handled by the worker
+        self._flush_requested = False
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+        # Handles are only touched by the worker or under _io_lock
+        self._io_lock = threading.Lock()
+        self._handles: dict[Path, IO[str]] = {}
+
+        self._batches_written = 0
+        self._lines_written = 0
+        self._write_errors = 0
+
+        _live_writers.add(self)
+
+    # -------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------
+
+    def append(self, path: Path, line: str) -> None:
+        """Queue ``line`` (including its trailing newline) for ``path``."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("JsonlBatchWriter is closed")
+            self._pending.append((path, line))
+            self._enqueued += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="runtime-log-writer", daemon=True
+                )
+                self._thread.start()
+            if len(self._pending) >= self.max_batch_lines or self.durability == "line":
+                self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every line queued so far has been written.
+
+        Returns False if ``timeout`` expired first.
+        """
+        with self._cond:
+            target = self._enqueued
+            if self._written >= target:
+                return True
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._written >= target, timeout=timeout)
+
+    def close_files(self, prefix: Path | None = None) -> None:
+        """Flush, then close open handles under ``prefix`` (all if None).
+
+        Handles are reopened lazily if more lines arrive for the same file.
+        """
+        self.flush()
+        with self._io_lock:
+            for path in list(self._handles):
+                if prefix is None or path.is_relative_to(prefix):
+                    _close_quietly(self._handles.pop(path))
+
+    def close(self) -> None:
+        """Drain the queue, close all handles and stop the worker thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        with self._io_lock:
+            for handle in self._handles.values():
+                _close_quietly(handle)
+            self._handles.clear()
+        _live_writers.discard(self)
+
+    def get_stats(self) -> dict:
+        """Counters for observability and tests."""
+        with self._cond:
+            pending = len(self._pending)
+        return {
+            "durability": self.durability,
+            "pending_lines": pending,
+            "lines_written": self._lines_written,
+            "batches_written": self._batches_written,
+            "open_files": len(self._handles),
+            "write_errors": self._write_errors,
+        }
+
+    # -------------------------------------------------------------------
+    # Worker
+    # -------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: (
+                        self._closed
+                        or self._flush_requested
+                        or len(self._pending) >= self.max_batch_lines
+                        or (self.durability == "line" and self._pending)
+                    ),
+                    timeout=self.flush_interval,
+                )
+                batch, self._pending = self._pending, []
+                upto = self._enqueued
+                self._flush_requested = False
+                closing = self._closed
+
+            if batch:
+                self._write_batch(batch)
+
+            with self._cond:
+                self._written = upto
+                self._cond.notify_all()
+                if closing and not self._pending:
+                    return
+
+    def _write_batch(self, batch: list[tuple[Path, str]]) -> None:
+        """Write a batch grouped by file. Errors are logged, never raised."""
+        by_path: dict[Path, list[str]] = {}
+        for path, line in batch:
+            by_path.setdefault(path, []).append(line)
+
+        with self._io_lock:
+            for path, lines in by_path.items():
+                try:
+                    handle = self._handles.get(path)
+                    if handle is None:
+                        handle = open(path, "a", encoding="utf-8")  # noqa: SIM115
+                        self._handles[path] = handle
+                    if self.durability == "line":
+                        for line in lines:
+                            handle.write(line)
+                            handle.flush()
+                            os.fsync(handle.fileno())
+                    else:
+                        handle.write("".join(lines))
+                        handle.flush()
+                        if self.durability == "batch":
+                            os.fsync(handle.fileno())
+                    self._lines_written += len(lines)
+                except OSError as e:
+                    self._write_errors += 1
+                    logger.warning("Failed to write %d log line(s) to %s: %s", len(lines), path, e)
+                    stale = self._handles.pop(path, None)
+                    if stale is not None:
+                        _close_quietly(stale)
+            self._batches_written += 1
+
+
+def _close_quietly(handle: IO[str]) -> None:
+    try:
+        handle.close()
+    except OSError as e:
+        logger.warning("Failed to close log file %s: %s", getattr(handle, "name", "?"), e)
+
+
+@atexit.register
+def _drain_live_writers() -> None:
+    for writer in list(_live_writers):
+        try:
+            writer.close()
+        except Exception:
+            logger.exception("Failed to drain runtime log writer at exit")
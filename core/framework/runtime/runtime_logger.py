@@ -1,11 +1,13 @@
 """RuntimeLogger: captures runtime data during graph execution.
 
 Injected into GraphExecutor as an optional parameter. Each log_step() and
-log_node_complete() call writes immediately to disk (JSONL append). Only
+log_node_complete() call appends a JSONL line via the store — immediately,
+or through the store's background batch writer when it is buffered. Only
 the L1 summary is written at end_run() since it aggregates L2 data.
 
 This provides crash resilience — L2 and L3 data survives process death
-without needing end_run() to complete.
+without needing end_run() to complete (up to the flush interval when the
+store is buffered).
 
 Usage::
 
@@ -20,6 +22,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 import uuid
@@ -114,6 +117,8 @@ def log_step(
                     tool_input=tc.get("tool_input", {}),
                     result=tc.get("content", ""),
                     is_error=tc.get("is_error", False),
+                    latency_ms=tc.get("latency_ms", 0),
+                    cache_status=tc.get("cache_status", ""),
                 )
             )
 
@@ -132,6 +137,8 @@ def log_step(
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             latency_ms=latency_ms,
+            cache_hits=sum(1 for c in call_logs if c.cache_status == "hit"),
+            cache_misses=sum(1 for c in call_logs if c.cache_status == "miss"),
             verdict=verdict,
             verdict_feedback=verdict_feedback,
             error=error,
@@ -273,12 +280,15 @@ async def end_run(
     ) -> None:
         """Read L2 from disk, aggregate into L1, write summary.json.
 
-        Called by GraphExecutor when graph finishes. Async, writes 1 file.
+        Called by GraphExecutor when graph finishes. Async, writes 1 file
+        and records the run in the analytics store.
         Catches all exceptions internally -- logging failure must not
         propagate to the caller.
         """
         try:
-            # Read L2 back from disk to aggregate into L1
+            # Drain buffered L2/L3 lines off the loop, then read L2 back
+            # from disk to aggregate into L1
+            await asyncio.to_thread(self._store.flush)
             node_details = self._store.read_node_details_sync(self._run_id)
 
             total_input = sum(nd.input_tokens for nd in node_details)
@@ -313,6 +323,11 @@ async def end_run(
             )
 
             await self._store.save_summary(self._run_id, summary)
+            try:
+                await asyncio.to_thread(self._store.record_analytics, self._run_id, summary)
+            except Exception as e:
+                # Derived data: the log files are intact and a rebuild recovers it
+                logger.warning("Failed to record run analytics for %s: %s", self._run_id, e)
             logger.info(
                 "Runtime logs saved: run_id=%s status=%s nodes=%d",
                 self._run_id,
@@ -324,3 +339,8 @@ async def end_run(
                 "Failed to save runtime logs for run_id=%s (non-fatal)",
                 self._run_id,
             )
+        finally:
+            try:
+                await asyncio.to_thread(self._store.close_run, self._run_id)
+            except Exception:
+                logger.exception("Failed to close runtime log files for run_id=%s", self._run_id)
@@ -5,14 +5,33 @@
 - ISOLATED: Each execution has its own memory copy
 - SHARED: All executions read/write same memory (eventual consistency)
 - SYNCHRONIZED: Shared memory with write locks (strong consistency)
+
+Concurrency model:
+- Every stored value carries the version of the write that produced it, and
+  every state layer (global, per stream, per execution) the version of its
+  latest write. ``read_versioned`` and ``compare_and_set`` use this for
+  optimistic updates.
+- Reads never take locks. ``snapshot()`` returns a read-only merged view of
+  the visible layers; it is cached per execution and rebuilt only when one
+  of those layers has changed since, so repeated ``read_all`` calls do not
+  re-merge the layers.
+- SYNCHRONIZED writes lock only the key being written (``KeyLockRegistry``).
+  Locks exist only while held or awaited, so the registry does not grow with
+  the number of keys ever written. ``StreamMemory.lock`` holds key locks
+  across a read-modify-write; writes from the holding task do not block.
+- The change history is a ring buffer of the last ``max_history`` changes.
 """
 
 import asyncio
 import logging
 import time
+from collections import deque
+from collections.abc import AsyncIterator, Mapping
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +65,96 @@ class StateChange:
     timestamp: float = field(default_factory=time.time)
 
 
+class _Entry(NamedTuple):
+    """A stored value and the version of the write that produced it."""
+
+    value: Any
+    version: int
+
+
+class _Layer:
+    """Key/value entries of one scope instance, with the version of its last write."""
+
+    __slots__ = ("entries", "version")
+
+    def __init__(self) -> None:
+        self.entries: dict[str, _Entry] = {}
+        self.version = 0
+
+
+class _KeyLock:
+    __slots__ = ("lock", "owner", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.owner: asyncio.Task | None = None
+        self.users = 0  # Tasks holding or waiting for the lock
+
+
+class KeyLockRegistry:
+    """
+    Per-key asyncio locks, created on demand and evicted once idle.
+
+    A lock is dropped as soon as no task holds or waits for it, so memory is
+    bounded by the number of keys being written concurrently rather than by
+    every key ever written. Locks are re-entrant per task.
+    """
+
+    def __init__(self) -> None:
+        self._locks: dict[str, _KeyLock] = {}
+        self._created = 0
+        self._evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    @asynccontextmanager
+    async def hold(self, *keys: str) -> AsyncIterator[None]:
+        """
+        Hold the locks for *keys* for the duration of the block.
+
+        Keys are acquired in sorted order so that tasks locking overlapping
+        key sets cannot deadlock. Keys the current task already holds are
+        skipped.
+        """
+        task = asyncio.current_task()
+        claimed: list[tuple[str, _KeyLock]] = []
+        for key in sorted(set(keys)):
+            entry = self._locks.get(key)
+            if entry is None:
+                entry = self._locks[key] = _KeyLock()
+                self._created += 1
+            elif task is not None and entry.owner is task:
+                continue
+            entry.users += 1
+            claimed.append((key, entry))
+
+        acquired: list[_KeyLock] = []
+        try:
+            for _, entry in claimed:
+                await entry.lock.acquire()
+                entry.owner = task
+                acquired.append(entry)
+            yield
+        finally:
+            for entry in reversed(acquired):
+                entry.owner = None
+                entry.lock.release()
+            for key, entry in claimed:
+                entry.users -= 1
+                if entry.users == 0 and self._locks.get(key) is entry:
+                    del self._locks[key]
+                    self._evicted += 1
+
+    def get_stats(self) -> dict:
+        """Get lock registry statistics."""
+        return {
+            "active": len(self._locks),
+            "created": self._created,
+            "evicted": self._evicted,
+        }
+
+
 class SharedStateManager:
     """
     Manages shared state across concurrent executions.
@@ -73,26 +182,40 @@ class SharedStateManager:
         # Read/write through the memory
         await memory.write("customer_id", "cust_456", scope=StateScope.STREAM)
         value = await memory.read("customer_id")
+
+        # Read-modify-write under the key lock
+        async with memory.lock("counter", scope=StateScope.GLOBAL):
+            count = await memory.read("counter") or 0
+            await memory.write("counter", count + 1, scope=StateScope.GLOBAL)
     """
 
-    def __init__(self):
+    def __init__(self, max_history: int = 1000):
+        """
+        Initialize the state manager.
+
+        Args:
+            max_history: Number of recent state changes kept for auditing
+        """
         # State storage at each level
-        self._global_state: dict[str, Any] = {}
-        self._stream_state: dict[str, dict[str, Any]] = {}  # stream_id -> {key: value}
-        self._execution_state: dict[str, dict[str, Any]] = {}  # execution_id -> {key: value}
+        self._global_state = _Layer()
+        self._stream_state: dict[str, _Layer] = {}  # stream_id -> layer
+        self._execution_state: dict[str, _Layer] = {}  # execution_id -> layer
 
-        # Locks for synchronized access
-        self._global_lock = asyncio.Lock()
-        self._stream_locks: dict[str, asyncio.Lock] = {}
-        self._key_locks: dict[str, asyncio.Lock] = {}
+        # Locks for synchronized writes
+        self._locks = KeyLockRegistry()
 
         # Change history for debugging/auditing
-        self._change_history: list[StateChange] = []
-        self._max_history = 1000
+        self._max_history = max_history
+        self._change_history: deque[StateChange] = deque(maxlen=max_history)
 
-        # Version tracking
+        # Version tracking: incremented by every write
         self._version = 0
 
+        # execution_id -> (layer versions, merged read-only view)
+        self._snapshots: dict[str, tuple[tuple, Mapping[str, Any]]] = {}
+        self._snapshot_hits = 0
+        self._snapshot_builds = 0
+
     def create_memory(
         self,
         execution_id: str,
@@ -110,14 +233,8 @@ def create_memory(
         Returns:
             StreamMemory instance for reading/writing state
         """
-        # Initialize execution state
-        if execution_id not in self._execution_state:
-            self._execution_state[execution_id] = {}
-
-        # Initialize stream state
-        if stream_id not in self._stream_state:
-            self._stream_state[stream_id] = {}
-            self._stream_locks[stream_id] = asyncio.Lock()
+        self._execution_state.setdefault(execution_id, _Layer())
+        self._stream_state.setdefault(stream_id, _Layer())
 
         return StreamMemory(
             manager=self,
@@ -134,6 +251,7 @@ def cleanup_execution(self, execution_id: str) -> None:
             execution_id: Execution to clean up
         """
         self._execution_state.pop(execution_id, None)
+        self._snapshots.pop(execution_id, None)
         logger.debug(f"Cleaned up state for execution: {execution_id}")
 
     def cleanup_stream(self, stream_id: str) -> None:
@@ -144,11 +262,28 @@ def cleanup_stream(self, stream_id: str) -> None:
             stream_id: Stream to clean up
         """
         self._stream_state.pop(stream_id, None)
-        self._stream_locks.pop(stream_id, None)
         logger.debug(f"Cleaned up state for stream: {stream_id}")
 
     # === LOW-LEVEL STATE OPERATIONS ===
 
+    def _visible_layers(
+        self, execution_id: str, stream_id: str, isolation: IsolationLevel
+    ) -> list[_Layer | None]:
+        """Layers visible to an execution, in resolution order."""
+        layers = [self._execution_state.get(execution_id)]
+        if isolation != IsolationLevel.ISOLATED:
+            layers.append(self._stream_state.get(stream_id))
+            layers.append(self._global_state)
+        return layers
+
+    def _lookup(
+        self, key: str, execution_id: str, stream_id: str, isolation: IsolationLevel
+    ) -> _Entry | None:
+        for layer in self._visible_layers(execution_id, stream_id, isolation):
+            if layer is not None and key in layer.entries:
+                return layer.entries[key]
+        return None
+
     async def read(
         self,
         key: str,
@@ -164,22 +299,52 @@ async def read(
         2. Stream state (if isolation != ISOLATED)
         3. Global state (if isolation != ISOLATED)
         """
-        # Always check execution-local first
-        if execution_id in self._execution_state:
-            if key in self._execution_state[execution_id]:
-                return self._execution_state[execution_id][key]
+        entry = self._lookup(key, execution_id, stream_id, isolation)
+        return entry.value if entry is not None else None
 
-        # Check stream-level (unless isolated)
-        if isolation != IsolationLevel.ISOLATED:
-            if stream_id in self._stream_state:
-                if key in self._stream_state[stream_id]:
-                    return self._stream_state[stream_id][key]
+    async def read_versioned(
+        self,
+        key: str,
+        execution_id: str,
+        stream_id: str,
+        isolation: IsolationLevel,
+    ) -> tuple[Any, int]:
+        """
+        Read a value together with its version.
+
+        Returns:
+            (value, version); version is 0 for keys never written
+        """
+        entry = self._lookup(key, execution_id, stream_id, isolation)
+        return (entry.value, entry.version) if entry is not None else (None, 0)
 
-            # Check global
-            if key in self._global_state:
-                return self._global_state[key]
+    def _lock_key(self, scope: StateScope, key: str, execution_id: str, stream_id: str) -> str:
+        """Lock registry key for a state key at a scope."""
+        if scope == StateScope.GLOBAL:
+            return f"global:{key}"
+        if scope == StateScope.STREAM:
+            return f"stream:{stream_id}:{key}"
+        return f"exec:{execution_id}:{key}"
 
-        return None
+    def _needs_lock(self, isolation: IsolationLevel, scope: StateScope) -> bool:
+        return isolation == IsolationLevel.SYNCHRONIZED and scope != StateScope.EXECUTION
+
+    def lock(
+        self,
+        keys: list[str],
+        execution_id: str,
+        stream_id: str,
+        scope: StateScope = StateScope.GLOBAL,
+    ) -> AbstractAsyncContextManager[None]:
+        """
+        Hold the write locks for *keys* at *scope* (async context manager).
+
+        SYNCHRONIZED writes to these keys from other tasks wait until the
+        block exits; writes from the holding task go through.
+        """
+        return self._locks.hold(
+            *(self._lock_key(scope, key, execution_id, stream_id) for key in keys)
+        )
 
     async def write(
         self,
@@ -201,91 +366,115 @@ async def write(
             isolation: Isolation level
             scope: Where to write (execution, stream, or global)
         """
-        # Get old value for change tracking
-        old_value = await self.read(key, execution_id, stream_id, isolation)
-
         # ISOLATED can only write to execution scope
         if isolation == IsolationLevel.ISOLATED:
             scope = StateScope.EXECUTION
 
         # SYNCHRONIZED requires locks for stream/global writes
-        if isolation == IsolationLevel.SYNCHRONIZED and scope != StateScope.EXECUTION:
-            await self._write_with_lock(key, value, execution_id, stream_id, scope)
+        if self._needs_lock(isolation, scope):
+            async with self.lock([key], execution_id, stream_id, scope):
+                self._apply(key, value, execution_id, stream_id, isolation, scope)
         else:
-            await self._write_direct(key, value, execution_id, stream_id, scope)
+            self._apply(key, value, execution_id, stream_id, isolation, scope)
 
-        # Record change
-        self._record_change(
-            StateChange(
-                key=key,
-                old_value=old_value,
-                new_value=value,
-                scope=scope,
-                execution_id=execution_id,
-                stream_id=stream_id,
-            )
-        )
-
-    async def _write_direct(
+    async def compare_and_set(
         self,
         key: str,
         value: Any,
+        expected_version: int,
         execution_id: str,
         stream_id: str,
-        scope: StateScope,
-    ) -> None:
-        """Write without locking (for ISOLATED and SHARED)."""
-        if scope == StateScope.EXECUTION:
-            if execution_id not in self._execution_state:
-                self._execution_state[execution_id] = {}
-            self._execution_state[execution_id][key] = value
+        isolation: IsolationLevel,
+        scope: StateScope = StateScope.EXECUTION,
+    ) -> bool:
+        """
+        Write *value* only if the visible version of *key* is still *expected_version*.
 
-        elif scope == StateScope.STREAM:
-            if stream_id not in self._stream_state:
-                self._stream_state[stream_id] = {}
-            self._stream_state[stream_id][key] = value
+        Use with ``read_versioned`` for optimistic updates (0 expects the
+        key to be unset).
 
-        elif scope == StateScope.GLOBAL:
-            self._global_state[key] = value
+        Returns:
+            True if the value was written
+        """
+        if isolation == IsolationLevel.ISOLATED:
+            scope = StateScope.EXECUTION
 
-        self._version += 1
+        async with self.lock([key], execution_id, stream_id, scope):
+            entry = self._lookup(key, execution_id, stream_id, isolation)
+            if (entry.version if entry is not None else 0) != expected_version:
+                return False
+            self._apply(key, value, execution_id, stream_id, isolation, scope)
+            return True
 
-    async def _write_with_lock(
+    def _apply(
         self,
         key: str,
         value: Any,
         execution_id: str,
         stream_id: str,
+        isolation: IsolationLevel,
         scope: StateScope,
     ) -> None:
-        """Write with locking (for SYNCHRONIZED)."""
-        lock = self._get_lock(scope, key, stream_id)
-        async with lock:
-            await self._write_direct(key, value, execution_id, stream_id, scope)
+        """Store a value and record the change (no locking, no awaits)."""
+        old = self._lookup(key, execution_id, stream_id, isolation)
 
-    def _get_lock(self, scope: StateScope, key: str, stream_id: str) -> asyncio.Lock:
-        """Get appropriate lock for scope and key."""
         if scope == StateScope.GLOBAL:
-            lock_key = f"global:{key}"
+            layer = self._global_state
         elif scope == StateScope.STREAM:
-            lock_key = f"stream:{stream_id}:{key}"
+            layer = self._stream_state.setdefault(stream_id, _Layer())
         else:
-            lock_key = f"exec:{key}"
+            layer = self._execution_state.setdefault(execution_id, _Layer())
 
-        if lock_key not in self._key_locks:
-            self._key_locks[lock_key] = asyncio.Lock()
+        self._version += 1
+        layer.entries[key] = _Entry(value, self._version)
+        layer.version = self._version
 
-        return self._key_locks[lock_key]
+        self._change_history.append(
+            StateChange(
+                key=key,
+                old_value=old.value if old is not None else None,
+                new_value=value,
+                scope=scope,
+                execution_id=execution_id,
+                stream_id=stream_id,
+            )
+        )
 
-    def _record_change(self, change: StateChange) -> None:
-        """Record a state change for auditing."""
-        self._change_history.append(change)
+    # === BULK OPERATIONS ===
 
-        # Trim history if too long
-        if len(self._change_history) > self._max_history:
-            self._change_history = self._change_history[-self._max_history :]
+    def snapshot(
+        self,
+        execution_id: str,
+        stream_id: str,
+        isolation: IsolationLevel,
+    ) -> Mapping[str, Any]:
+        """
+        Read-only view of all state visible to an execution.
 
-    # === BULK OPERATIONS ===
+        The view reflects the state at the time of the call and is not
+        affected by later writes. It is reused until a visible layer changes.
+        """
+        layers = self._visible_layers(execution_id, stream_id, isolation)
+        stamp = (
+            stream_id,
+            isolation,
+            *((id(layer), layer.version) if layer is not None else None for layer in layers),
+        )
+        cached = self._snapshots.get(execution_id)
+        if cached is not None and cached[0] == stamp:
+            self._snapshot_hits += 1
+            return cached[1]
+
+        merged: dict[str, Any] = {}
+        # Global first, execution last, so narrower scopes win
+        for layer in reversed(layers):
+            if layer is not None:
+                for key, entry in layer.entries.items():
+                    merged[key] = entry.value
+        view = MappingProxyType(merged)
+        self._snapshots[execution_id] = (stamp, view)
+        self._snapshot_builds += 1
+        return view
 
     async def read_all(
         self,
@@ -298,21 +487,7 @@ async def read_all(
 
         Returns merged state from all visible levels.
         """
-        result = {}
-
-        # Start with global (if visible)
-        if isolation != IsolationLevel.ISOLATED:
-            result.update(self._global_state)
-
-            # Add stream state (overwrites global)
-            if stream_id in self._stream_state:
-                result.update(self._stream_state[stream_id])
-
-        # Add execution state (overwrites all)
-        if execution_id in self._execution_state:
-            result.update(self._execution_state[execution_id])
-
-        return result
+        return dict(self.snapshot(execution_id, stream_id, isolation))
 
     async def write_batch(
         self,
@@ -323,24 +498,40 @@ async def write_batch(
         scope: StateScope = StateScope.EXECUTION,
     ) -> None:
         """Write multiple values atomically."""
-        for key, value in updates.items():
-            await self.write(key, value, execution_id, stream_id, isolation, scope)
+        if isolation == IsolationLevel.ISOLATED:
+            scope = StateScope.EXECUTION
+
+        if self._needs_lock(isolation, scope):
+            async with self.lock(list(updates), execution_id, stream_id, scope):
+                for key, value in updates.items():
+                    self._apply(key, value, execution_id, stream_id, isolation, scope)
+        else:
+            for key, value in updates.items():
+                self._apply(key, value, execution_id, stream_id, isolation, scope)
 
     # === UTILITY ===
 
     def get_stats(self) -> dict:
         """Get state manager statistics."""
         return {
-            "global_keys": len(self._global_state),
+            "global_keys": len(self._global_state.entries),
             "stream_count": len(self._stream_state),
             "execution_count": len(self._execution_state),
             "total_changes": len(self._change_history),
             "version": self._version,
+            "key_locks": self._locks.get_stats(),
+            "snapshots": {
+                "cached": len(self._snapshots),
+                "hits": self._snapshot_hits,
+                "builds": self._snapshot_builds,
+            },
         }
 
     def get_recent_changes(self, limit: int = 10) -> list[StateChange]:
         """Get recent state changes."""
-        return self._change_history[-limit:]
+        if limit <= 0:
+            return []
+        return list(self._change_history)[-limit:]
 
 
 class StreamMemory:
@@ -420,19 +611,55 @@ async def write(
             scope=scope,
         )
 
-    async def read_all(self) -> dict[str, Any]:
-        """Read all visible state."""
-        all_state = await self._manager.read_all(
+    async def read_versioned(self, key: str) -> tuple[Any, int]:
+        """Read a value and its version (0 if never written)."""
+        if self._allowed_read is not None and key not in self._allowed_read:
+            raise PermissionError(f"Not allowed to read key: {key}")
+
+        return await self._manager.read_versioned(
+            key=key,
             execution_id=self._execution_id,
             stream_id=self._stream_id,
             isolation=self._isolation,
         )
 
-        # Filter by permissions if set
+    async def compare_and_set(
+        self,
+        key: str,
+        value: Any,
+        expected_version: int,
+        scope: StateScope = StateScope.EXECUTION,
+    ) -> bool:
+        """Write a value only if its version is still *expected_version*."""
+        if self._allowed_write is not None and key not in self._allowed_write:
+            raise PermissionError(f"Not allowed to write key: {key}")
+
+        return await self._manager.compare_and_set(
+            key=key,
+            value=value,
+            expected_version=expected_version,
+            execution_id=self._execution_id,
+            stream_id=self._stream_id,
+            isolation=self._isolation,
+            scope=scope,
+        )
+
+    def lock(
+        self, *keys: str, scope: StateScope = StateScope.GLOBAL
+    ) -> AbstractAsyncContextManager[None]:
+        """Hold the write locks for *keys* at *scope* (async context manager)."""
+        return self._manager.lock(list(keys), self._execution_id, self._stream_id, scope)
+
+    def snapshot(self) -> Mapping[str, Any]:
+        """Read-only view of all visible state (see SharedStateManager.snapshot)."""
+        view = self._manager.snapshot(self._execution_id, self._stream_id, self._isolation)
         if self._allowed_read is not None:
-            return {k: v for k, v in all_state.items() if k in self._allowed_read}
+            return MappingProxyType({k: v for k, v in view.items() if k in self._allowed_read})
+        return view
 
-        return all_state
+    async def read_all(self) -> dict[str, Any]:
+        """Read all visible state."""
+        return dict(self.snapshot())
 
     # === SYNC API (for backward compatibility with SharedMemory) ===
 
@@ -440,28 +667,13 @@ def read_sync(self, key: str) -> Any:
         """
         Synchronous read (for compatibility with existing code).
 
-        Note: This runs the async operation in a new event loop
-        or uses direct access if no loop is running.
+        Reads never block, so this is the same lookup as ``read``.
         """
-        # Direct access for sync usage
         if self._allowed_read is not None and key not in self._allowed_read:
             raise PermissionError(f"Not allowed to read key: {key}")
 
-        # Check execution state
-        exec_state = self._manager._execution_state.get(self._execution_id, {})
-        if key in exec_state:
-            return exec_state[key]
-
-        # Check stream/global if not isolated
-        if self._isolation != IsolationLevel.ISOLATED:
-            stream_state = self._manager._stream_state.get(self._stream_id, {})
-            if key in stream_state:
-                return stream_state[key]
-
-            if key in self._manager._global_state:
-                return self._manager._global_state[key]
-
-        return None
+        entry = self._manager._lookup(key, self._execution_id, self._stream_id, self._isolation)
+        return entry.value if entry is not None else None
 
     def write_sync(self, key: str, value: Any) -> None:
         """
@@ -472,28 +684,15 @@ def write_sync(self, key: str, value: Any) -> None:
         if self._allowed_write is not None and key not in self._allowed_write:
             raise PermissionError(f"Not allowed to write key: {key}")
 
-        if self._execution_id not in self._manager._execution_state:
-            self._manager._execution_state[self._execution_id] = {}
-
-        self._manager._execution_state[self._execution_id][key] = value
-        self._manager._version += 1
+        self._manager._apply(
+            key,
+            value,
+            self._execution_id,
+            self._stream_id,
+            self._isolation,
+            StateScope.EXECUTION,
+        )
 
     def read_all_sync(self) -> dict[str, Any]:
         """Synchronous read all."""
-        result = {}
-
-        # Global (if visible)
-        if self._isolation != IsolationLevel.ISOLATED:
-            result.update(self._manager._global_state)
-            if self._stream_id in self._manager._stream_state:
-                result.update(self._manager._stream_state[self._stream_id])
-
-        # Execution
-        if self._execution_id in self._manager._execution_state:
-            result.update(self._manager._execution_state[self._execution_id])
-
-        # Filter by permissions
-        if self._allowed_read is not None:
-            result = {k: v for k, v in result.items() if k in self._allowed_read}
-
-        return result
+        return dict(self.snapshot())
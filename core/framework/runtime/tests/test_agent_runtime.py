@@ -21,10 +21,10 @@
 from framework.graph.goal import Constraint, SuccessCriterion
 from framework.graph.node import NodeSpec
 from framework.runtime.agent_runtime import AgentRuntime, create_agent_runtime
-from framework.runtime.event_bus import AgentEvent, EventBus, EventType
+from framework.runtime.event_bus import AgentEvent, DeltaCoalescingConfig, EventBus, EventType
 from framework.runtime.execution_stream import EntryPointSpec
 from framework.runtime.outcome_aggregator import OutcomeAggregator
-from framework.runtime.shared_state import IsolationLevel, SharedStateManager
+from framework.runtime.shared_state import IsolationLevel, SharedStateManager, StateScope
 
 # === Test Fixtures ===
 
@@ -207,6 +207,74 @@ def test_cleanup_execution(self):
 
         assert "exec-1" not in manager._execution_state
 
+    @pytest.mark.asyncio
+    async def test_snapshot_reused_until_visible_layer_changes(self):
+        """Test snapshots are cached, read-only and rebuilt after writes."""
+        manager = SharedStateManager()
+        mem = manager.create_memory("exec-1", "stream-1", IsolationLevel.SHARED)
+        other = manager.create_memory("exec-2", "stream-2", IsolationLevel.SHARED)
+        await mem.write("key", "global", scope=StateScope.GLOBAL)
+        await mem.write("key", "local")
+
+        first = mem.snapshot()
+        await other.write("unrelated", 1, scope=StateScope.STREAM)
+
+        assert mem.snapshot() is first
+        assert first["key"] == "local"
+        with pytest.raises(TypeError):
+            first["key"] = "changed"
+
+        await other.write("shared", 2, scope=StateScope.GLOBAL)
+
+        assert mem.snapshot() is not first
+        assert "shared" not in first
+        assert await mem.read_all() == {"key": "local", "shared": 2}
+
+    @pytest.mark.asyncio
+    async def test_compare_and_set(self):
+        """Test versioned optimistic writes."""
+        manager = SharedStateManager()
+        mem = manager.create_memory("exec-1", "stream-1", IsolationLevel.SHARED)
+
+        assert await mem.compare_and_set("count", 1, expected_version=0, scope="global")
+        value, version = await mem.read_versioned("count")
+        assert (value, version) == (1, manager.get_stats()["version"])
+        await mem.write("count", 5, scope="global")
+
+        assert not await mem.compare_and_set("count", 2, expected_version=version, scope="global")
+        assert await mem.read("count") == 5
+
+    @pytest.mark.asyncio
+    async def test_synchronized_read_modify_write_under_key_lock(self):
+        """Test key locks serialize read-modify-write and are evicted when idle."""
+        manager = SharedStateManager()
+
+        async def increment(i: int) -> None:
+            mem = manager.create_memory(f"exec-{i}", "stream-1", IsolationLevel.SYNCHRONIZED)
+            async with mem.lock("counter", scope=StateScope.GLOBAL):
+                count = await mem.read("counter") or 0
+                await asyncio.sleep(0)
+                await mem.write("counter", count + 1, scope=StateScope.GLOBAL)
+
+        await asyncio.gather(*(increment(i) for i in range(50)))
+
+        assert await manager.read("counter", "x", "y", IsolationLevel.SHARED) == 50
+        assert manager.get_stats()["key_locks"] == {"active": 0, "created": 1, "evicted": 1}
+
+    @pytest.mark.asyncio
+    async def test_change_history_bounded(self):
+        """Test only the most recent changes are kept."""
+        manager = SharedStateManager(max_history=10)
+        mem = manager.create_memory("exec-1", "stream-1", IsolationLevel.ISOLATED)
+
+        await manager.write_batch({f"k{i}": i for i in range(25)}, "exec-1", "s", "isolated")
+        mem.write_sync("last", True)
+
+        changes = manager.get_recent_changes(limit=100)
+        assert len(changes) == 10
+        assert [c.key for c in changes[-2:]] == ["k24", "last"]
+        assert mem.read_sync("k3") == 3
+
 
 # === EventBus Tests ===
 
@@ -329,6 +397,173 @@ async def wait_and_check():
         assert event is not None
         assert event.type == EventType.EXECUTION_COMPLETED
 
+    @pytest.mark.asyncio
+    async def test_indexed_dispatch_matches_all_filters(self):
+        """Execution, stream, graph and unfiltered subscriptions all fire."""
+        bus = EventBus()
+        received: list[str] = []
+
+        def make_handler(label: str):
+            async def handler(event: AgentEvent):
+                received.append(label)
+
+            return handler
+
+        bus.subscribe([EventType.TOOL_CALL_STARTED], make_handler("all"))
+        bus.subscribe(
+            [EventType.TOOL_CALL_STARTED], make_handler("exec"), filter_execution="exec-1"
+        )
+        bus.subscribe(
+            [EventType.TOOL_CALL_STARTED], make_handler("other_exec"), filter_execution="exec-2"
+        )
+        bus.subscribe([EventType.TOOL_CALL_STARTED], make_handler("stream"), filter_stream="api")
+        bus.subscribe([EventType.TOOL_CALL_STARTED], make_handler("graph"), filter_graph="g1")
+        bus.subscribe(
+            [EventType.TOOL_CALL_STARTED],
+            make_handler("exec_wrong_node"),
+            filter_execution="exec-1",
+            filter_node="other",
+        )
+
+        await bus.publish(
+            AgentEvent(
+                type=EventType.TOOL_CALL_STARTED,
+                stream_id="api",
+                node_id="n1",
+                execution_id="exec-1",
+                graph_id="g1",
+            )
+        )
+
+        assert received == ["all", "exec", "stream", "graph"]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_removes_from_index(self):
+        bus = EventBus()
+        received = []
+
+        async def handler(event: AgentEvent):
+            received.append(event)
+
+        sub_id = bus.subscribe(
+            [EventType.EXECUTION_STARTED, EventType.EXECUTION_COMPLETED],
+            handler,
+            filter_execution="exec-1",
+        )
+        bus.unsubscribe(sub_id)
+        await bus.publish(
+            AgentEvent(type=EventType.EXECUTION_STARTED, stream_id="s", execution_id="exec-1")
+        )
+
+        assert received == []
+        assert bus._index == {}
+
+    @pytest.mark.asyncio
+    async def test_history_ring_buffer_skips_deltas(self):
+        bus = EventBus(max_history=3)
+        for i in range(5):
+            await bus.publish(
+                AgentEvent(type=EventType.NODE_LOOP_ITERATION, stream_id="s", data={"i": i})
+            )
+        await bus.emit_llm_text_delta(stream_id="s", node_id="n", content="x", snapshot="x")
+
+        history = bus.get_history()
+        assert [e.data["i"] for e in history] == [4, 3, 2]
+        stats = bus.get_stats()
+        assert stats["total_events"] == 3
+        assert stats["delta_events_published"] == 1
+
+        recording = EventBus(record_delta_history=True)
+        await recording.emit_llm_text_delta(stream_id="s", node_id="n", content="x", snapshot="x")
+        assert recording.get_history()[0].type == EventType.LLM_TEXT_DELTA
+
+
+class TestDeltaCoalescing:
+    """Tests for opt-in delta coalescing on the EventBus."""
+
+    @staticmethod
+    def _collecting_bus(**config) -> tuple[EventBus, list[AgentEvent]]:
+        bus = EventBus(delta_coalescing=DeltaCoalescingConfig(**config))
+        received: list[AgentEvent] = []
+
+        async def handler(event: AgentEvent):
+            received.append(event)
+
+        bus.subscribe([EventType.LLM_TEXT_DELTA, EventType.TOOL_CALL_STARTED], handler)
+        return bus, received
+
+    @staticmethod
+    async def _stream(bus: EventBus, chunks: list[str], execution_id: str = "e1") -> None:
+        snapshot = ""
+        for chunk in chunks:
+            snapshot += chunk
+            await bus.emit_llm_text_delta(
+                stream_id="s",
+                node_id="n",
+                content=chunk,
+                snapshot=snapshot,
+                execution_id=execution_id,
+            )
+
+    @pytest.mark.asyncio
+    async def test_window_merges_deltas(self):
+        bus, received = self._collecting_bus(window_ms=20)
+        await self._stream(bus, ["Hel", "lo ", "world"])
+        assert received == []
+
+        await asyncio.sleep(0.05)
+
+        assert len(received) == 1
+        assert received[0].data["content"] == "Hello world"
+        assert received[0].data["snapshot"] == "Hello world"
+        assert received[0].data["coalesced_count"] == 3
+        stats = bus.get_stats()["delta_coalescing"]
+        assert stats["deltas_received"] == 3
+        assert stats["events_saved"] == 2
+
+    @pytest.mark.asyncio
+    async def test_byte_limit_flushes(self):
+        bus, received = self._collecting_bus(window_ms=10_000, max_bytes=4)
+        await self._stream(bus, ["ab", "cd", "ef"])
+        assert [e.data["content"] for e in received] == ["abcd"]
+        await bus.flush_deltas()
+        assert [e.data["content"] for e in received] == ["abcd", "ef"]
+
+    @pytest.mark.asyncio
+    async def test_other_event_flushes_first(self):
+        bus, received = self._collecting_bus(window_ms=10_000)
+        await self._stream(bus, ["a", "b"])
+        await bus.emit_tool_call_started(
+            stream_id="s", node_id="n", tool_use_id="t1", tool_name="calc", execution_id="e1"
+        )
+        assert [e.type for e in received] == [EventType.LLM_TEXT_DELTA, EventType.TOOL_CALL_STARTED]
+        assert received[0].data["content"] == "ab"
+
+    @pytest.mark.asyncio
+    async def test_executions_buffered_separately(self):
+        bus, received = self._collecting_bus(window_ms=10_000)
+        await self._stream(bus, ["a"], execution_id="e1")
+        await self._stream(bus, ["b"], execution_id="e2")
+        await self._stream(bus, ["c"], execution_id="e1")
+        await bus.flush_deltas()
+        contents = {e.execution_id: e.data["content"] for e in received}
+        assert contents == {"e1": "ac", "e2": "b"}
+        # A single buffered delta is delivered unchanged
+        assert "coalesced_count" not in next(e for e in received if e.execution_id == "e2").data
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        bus = EventBus()
+        received = []
+
+        async def handler(event: AgentEvent):
+            received.append(event)
+
+        bus.subscribe([EventType.LLM_TEXT_DELTA], handler)
+        await self._stream(bus, ["a", "b"])
+        assert len(received) == 2
+        assert bus.get_stats()["delta_coalescing"]["enabled"] is False
+
 
 # === OutcomeAggregator Tests ===
 
@@ -3,6 +3,10 @@
 
 Checkpoints capture the execution state at strategic points (node boundaries,
 iterations) to enable crash recovery and resume-from-failure scenarios.
+
+Most checkpoints are deltas: ``shared_memory`` holds only the keys that
+changed since ``parent_checkpoint_id``. ``CheckpointStore`` reconstructs the
+full memory by replaying the chain back to the nearest full snapshot.
 """
 
 from datetime import datetime
@@ -33,18 +37,35 @@ class Checkpoint(BaseModel):
     execution_path: list[str] = Field(default_factory=list)  # Nodes executed so far
 
     # State snapshots
-    shared_memory: dict[str, Any] = Field(default_factory=dict)  # Full SharedMemory._data
+    shared_memory: dict[str, Any] = Field(default_factory=dict)  # SharedMemory._data (or delta)
     accumulated_outputs: dict[str, Any] = Field(default_factory=dict)  # Outputs accumulated so far
 
     # Execution metrics (for resuming quality tracking)
     metrics_snapshot: dict[str, Any] = Field(default_factory=dict)
 
+    # Delta encoding
+    parent_checkpoint_id: str | None = None  # Checkpoint this delta applies on top of
+    is_delta: bool = False  # True if shared_memory only holds keys changed since the parent
+    deleted_keys: list[str] = Field(default_factory=list)  # Keys removed since the parent
+
     # Metadata
     is_clean: bool = True  # True if no failures/retries before this checkpoint
     description: str = ""  # Human-readable checkpoint description
 
     model_config = {"extra": "allow"}
 
+    def apply_to(self, memory: dict[str, Any]) -> dict[str, Any]:
+        """
+        Return the full memory at this checkpoint given the parent's full memory.
+
+        Full snapshots ignore *memory* and return a copy of their own state.
+        """
+        if not self.is_delta:
+            return dict(self.shared_memory)
+        merged = {k: v for k, v in memory.items() if k not in self.deleted_keys}
+        merged.update(self.shared_memory)
+        return merged
+
     @classmethod
     def create(
         cls,
@@ -77,7 +98,9 @@ def create(
         Returns:
             New Checkpoint instance
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Microseconds keep IDs unique when a node is revisited within a second,
+        # which matters because delta checkpoints reference their parent by ID.
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         checkpoint_id = f"cp_{checkpoint_type}_{current_node}_{timestamp}"
 
         if not description:
@@ -114,6 +137,8 @@ class CheckpointSummary(BaseModel):
     next_node: str | None = None
     is_clean: bool = True
     description: str = ""
+    parent_checkpoint_id: str | None = None
+    is_delta: bool = False
 
     model_config = {"extra": "allow"}
 
@@ -128,6 +153,8 @@ def from_checkpoint(cls, checkpoint: Checkpoint) -> "CheckpointSummary":
             next_node=checkpoint.next_node,
             is_clean=checkpoint.is_clean,
             description=checkpoint.description,
+            parent_checkpoint_id=checkpoint.parent_checkpoint_id,
+            is_delta=checkpoint.is_delta,
         )
 
 
@@ -1,6 +1,12 @@
 """Storage backends for runtime data."""
 
 from framework.storage.backend import FileStorage
-from framework.storage.conversation_store import FileConversationStore
+from framework.storage.conversation_store import FileConversationStore, open_conversation_store
+from framework.storage.segmented_conversation_store import SegmentedConversationStore
 
-__all__ = ["FileStorage", "FileConversationStore"]
+__all__ = [
+    "FileStorage",
+    "FileConversationStore",
+    "SegmentedConversationStore",
+    "open_conversation_store",
+]
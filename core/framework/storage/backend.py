@@ -9,11 +9,15 @@
 """
 
 import json
+import logging
 from pathlib import Path
 
 from framework.schemas.run import Run, RunStatus, RunSummary
+from framework.storage.run_analytics import RunAnalytics
 from framework.utils.io import atomic_write
 
+logger = logging.getLogger(__name__)
+
 
 class FileStorage:
     """
@@ -35,10 +39,12 @@ class FileStorage:
           {status}.json
         by_node/
           {node_id}.json
+      run_analytics.db # Decision facts of saved runs (see RunAnalytics)
     """
 
     def __init__(self, base_path: str | Path):
         self.base_path = Path(base_path)
+        self.analytics = RunAnalytics(self.base_path)
         self._ensure_dirs()
 
     def _ensure_dirs(self) -> None:
@@ -90,7 +96,8 @@ def _validate_key(self, key: str) -> None:
     def save_run(self, run: Run) -> None:
         """Save a run to storage.
 
-        DEPRECATED: This method is now a no-op.
+        DEPRECATED: The run JSON is no longer written; only the run's decision
+        facts are recorded in the analytics store, for BuilderQuery aggregates.
         New sessions use unified storage at sessions/{session_id}/state.json.
         Tests should not rely on FileStorage - use unified session storage instead.
         """
@@ -99,11 +106,15 @@ def save_run(self, run: Run) -> None:
         warnings.warn(
             "FileStorage.save_run() is deprecated. "
             "New sessions use unified storage at sessions/{session_id}/state.json. "
-            "This write has been skipped.",
+            "The run JSON write has been skipped.",
             DeprecationWarning,
             stacklevel=2,
         )
-        # No-op: do not write to deprecated locations
+        # Do not write to deprecated locations
+        try:
+            self.analytics.record_run(run)
+        except Exception as e:
+            logger.warning(f"Failed to record run analytics for {run.id}: {e}")
 
     def load_run(self, run_id: str) -> Run | None:
         """Load a run from storage."""
@@ -145,6 +156,7 @@ def delete_run(self, run_id: str) -> bool:
         run_path.unlink()
         if summary_path.exists():
             summary_path.unlink()
+        self.analytics.remove_run(run_id)
 
         return True
 
@@ -3,18 +3,188 @@
 
 Handles saving, loading, listing, and pruning of execution checkpoints
 for session resumability.
+
+Checkpoints are delta-encoded: each one stores only the memory keys that
+changed since the previous checkpoint, with a full snapshot every
+``full_snapshot_every`` checkpoints. Loading replays the chain back to the
+nearest full snapshot. The index is an append-only JSON Lines log, so adding
+a checkpoint never rewrites it; ``prune_checkpoints`` compacts both.
 """
 
 import asyncio
+import json
 import logging
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
+
+from pydantic_core import from_json, to_json
 
 from framework.schemas.checkpoint import Checkpoint, CheckpointIndex, CheckpointSummary
+from framework.storage.persistence import PersistencePipeline
 from framework.utils.io import atomic_write
 
 logger = logging.getLogger(__name__)
 
+INDEX_FILENAME = "index.jsonl"
+LEGACY_INDEX_FILENAME = "index.json"  # Rewritten-on-every-save index of older sessions
+
+DEFAULT_FULL_SNAPSHOT_EVERY = 10
+
+
+# ---------------------------------------------------------------------------
+# Synchronous readers (also used by the CLI and the agent builder MCP server)
+# ---------------------------------------------------------------------------
+
+
+def read_checkpoint_index(checkpoints_dir: Path) -> CheckpointIndex | None:
+    """
+    Load a checkpoints directory's index by replaying its log.
+
+    Args:
+        checkpoints_dir: A session's ``checkpoints/`` directory
+
+    Returns:
+        CheckpointIndex, or None if the directory has no index
+    """
+    checkpoints_dir = Path(checkpoints_dir)
+    index: CheckpointIndex | None = None
+
+    legacy_path = checkpoints_dir / LEGACY_INDEX_FILENAME
+    if legacy_path.exists():
+        try:
+            index = CheckpointIndex.model_validate_json(legacy_path.read_text())
+        except Exception as e:
+            logger.error(f"Failed to load checkpoint index: {e}")
+
+    log_path = checkpoints_dir / INDEX_FILENAME
+    if not log_path.exists():
+        return index
+
+    # Replay the log; dicts keep insertion order, so updates stay in place
+    session_id = index.session_id if index else ""
+    entries = {cp.checkpoint_id: cp for cp in index.checkpoints} if index else {}
+    latest_id = index.latest_checkpoint_id if index else None
+    for line in log_path.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # A torn final line from a crash mid-append
+            logger.warning(f"Skipping malformed checkpoint index line in {log_path}")
+            continue
+
+        op = record.get("op")
+        if op == "add":
+            summary = CheckpointSummary.model_validate(record["checkpoint"])
+            session_id = session_id or record.get("session_id", "")
+            entries[summary.checkpoint_id] = summary
+            latest_id = summary.checkpoint_id
+        elif op == "update":
+            summary = CheckpointSummary.model_validate(record["checkpoint"])
+            if summary.checkpoint_id in entries:
+                entries[summary.checkpoint_id] = summary
+        elif op == "remove":
+            entries.pop(record["checkpoint_id"], None)
+
+    if latest_id not in entries:
+        latest_id = next(reversed(entries), None)
+    return CheckpointIndex(
+        session_id=session_id,
+        checkpoints=list(entries.values()),
+        latest_checkpoint_id=latest_id,
+        total_checkpoints=len(entries),
+    )
+
+
+def _read_checkpoint_file(checkpoints_dir: Path, checkpoint_id: str) -> Checkpoint | None:
+    checkpoint_path = checkpoints_dir / f"{checkpoint_id}.json"
+
+    if not checkpoint_path.exists():
+        logger.warning(f"Checkpoint file not found: {checkpoint_path}")
+        return None
+
+    try:
+        return Checkpoint.model_validate_json(checkpoint_path.read_text())
+    except Exception as e:
+        logger.error(f"Failed to load checkpoint {checkpoint_id}: {e}")
+        return None
+
+
+def read_checkpoint(
+    checkpoints_dir: Path,
+    checkpoint_id: str,
+    materialize: bool = True,
+) -> Checkpoint | None:
+    """
+    Load a checkpoint file, reconstructing full memory for delta checkpoints.
+
+    Args:
+        checkpoints_dir: A session's ``checkpoints/`` directory
+        checkpoint_id: Checkpoint ID to load
+        materialize: Replay the delta chain so ``shared_memory`` holds the
+            full memory (default). If False, return the stored delta as-is.
+
+    Returns:
+        Checkpoint object, or None if it (or a checkpoint in its chain) is missing
+    """
+    checkpoints_dir = Path(checkpoints_dir)
+    checkpoint = _read_checkpoint_file(checkpoints_dir, checkpoint_id)
+    if checkpoint is None or not materialize or not checkpoint.is_delta:
+        return checkpoint
+
+    # Walk back to the nearest full snapshot, then replay forward
+    chain = [checkpoint]
+    seen = {checkpoint.checkpoint_id}
+    while chain[-1].is_delta:
+        parent_id = chain[-1].parent_checkpoint_id
+        if parent_id is None or parent_id in seen:
+            logger.error(f"Broken delta chain for checkpoint {checkpoint_id} at {parent_id}")
+            return None
+        parent = _read_checkpoint_file(checkpoints_dir, parent_id)
+        if parent is None:
+            logger.error(f"Missing parent {parent_id} of delta checkpoint {checkpoint_id}")
+            return None
+        seen.add(parent_id)
+        chain.append(parent)
+
+    memory: dict[str, Any] = {}
+    for cp in reversed(chain):
+        memory = cp.apply_to(memory)
+
+    return checkpoint.model_copy(
+        update={"shared_memory": memory, "is_delta": False, "deleted_keys": []}
+    )
+
+
+def _fold(parent: Checkpoint, child: Checkpoint) -> Checkpoint:
+    """Rewrite *child* so it no longer depends on *parent*."""
+    if not child.is_delta:
+        return child
+    if not parent.is_delta:
+        return child.model_copy(
+            update={
+                "shared_memory": child.apply_to(parent.shared_memory),
+                "is_delta": False,
+                "parent_checkpoint_id": None,
+                "deleted_keys": [],
+            }
+        )
+    # Both deltas: merge into one delta against the grandparent
+    memory = {k: v for k, v in parent.shared_memory.items() if k not in child.deleted_keys}
+    memory.update(child.shared_memory)
+    deleted = [k for k in parent.deleted_keys if k not in child.shared_memory]
+    deleted += [k for k in child.deleted_keys if k not in deleted]
+    return child.model_copy(
+        update={
+            "shared_memory": memory,
+            "parent_checkpoint_id": parent.parent_checkpoint_id,
+            "deleted_keys": deleted,
+        }
+    )
+
 
 class CheckpointStore:
     """
@@ -25,81 +195,132 @@ class CheckpointStore:
 
     Directory structure:
         checkpoints/
-            index.json              # Checkpoint manifest
+            index.jsonl             # Append-only checkpoint log
             cp_{type}_{node}_{timestamp}.json  # Individual checkpoints
     """
 
-    def __init__(self, base_path: Path):
+    def __init__(
+        self,
+        base_path: Path,
+        full_snapshot_every: int = DEFAULT_FULL_SNAPSHOT_EVERY,
+        persistence: PersistencePipeline | None = None,
+    ):
         """
         Initialize checkpoint store.
 
         Args:
             base_path: Session directory (e.g., ~/.hive/agents/agent_name/sessions/session_ID/)
+            full_snapshot_every: Store full memory every N checkpoints and
+                only changed keys in between. 1 disables delta checkpoints.
+            persistence: Optional pipeline whose threads run the file I/O
         """
         self.base_path = Path(base_path)
+        self.persistence = persistence
         self.checkpoints_dir = self.base_path / "checkpoints"
-        self.index_path = self.checkpoints_dir / "index.json"
+        self.index_path = self.checkpoints_dir / INDEX_FILENAME
+        self.full_snapshot_every = full_snapshot_every
         self._index_lock = asyncio.Lock()
 
+        # Delta chain state: the last checkpoint saved by this store
+        self._head_id: str | None = None
+        # Serialized value per key; compared by value, since nodes may mutate
+        # a value read from SharedMemory in place and write it back
+        self._head_memory: dict[str, bytes] | None = None
+        self._deltas_since_full = 0
+
     async def save_checkpoint(self, checkpoint: Checkpoint) -> None:
         """
         Atomically save checkpoint and update index.
 
-        Uses temp file + rename for crash safety. Updates index
-        after checkpoint is persisted.
+        Uses temp file + rename for crash safety. Appends to the index
+        after checkpoint is persisted. Unless a full snapshot is due, only
+        memory keys whose serialized value changed since the previous
+        checkpoint are stored. The stored values are a snapshot taken at
+        call time, so later in-place mutations don't leak into it.
 
         Args:
-            checkpoint: Checkpoint to save
+            checkpoint: Checkpoint to save (with full ``shared_memory``)
 
         Raises:
             OSError: If file write fails
         """
+        # Encode before the first await so concurrent saves chain in call order
+        stored = self._encode(checkpoint)
 
         def _write():
             # Ensure directory exists
             self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
 
             # Write checkpoint file atomically
-            checkpoint_path = self.checkpoints_dir / f"{checkpoint.checkpoint_id}.json"
+            checkpoint_path = self.checkpoints_dir / f"{stored.checkpoint_id}.json"
             with atomic_write(checkpoint_path) as f:
-                f.write(checkpoint.model_dump_json(indent=2))
+                f.write(stored.model_dump_json(indent=2))
 
-            logger.debug(f"Saved checkpoint {checkpoint.checkpoint_id}")
+            logger.debug(f"Saved checkpoint {stored.checkpoint_id}")
 
         # Write checkpoint file (blocking I/O in thread)
-        await asyncio.to_thread(_write)
+        try:
+            await self._run_io(_write)
+        except BaseException:
+            # Start the next chain from a full snapshot
+            self._reset_chain()
+            raise
 
         # Update index (with lock to prevent concurrent modifications)
         async with self._index_lock:
-            await self._update_index_add(checkpoint)
+            await self._update_index_add(stored)
+
+    def _encode(self, checkpoint: Checkpoint) -> Checkpoint:
+        """Return *checkpoint* as a delta against the previous one when possible."""
+        memory = {
+            k: to_json(v, serialize_unknown=True) for k, v in checkpoint.shared_memory.items()
+        }
+        parent_id, parent_memory = self._head_id, self._head_memory
+        self._head_id, self._head_memory = checkpoint.checkpoint_id, memory
+
+        if (
+            checkpoint.is_delta
+            or parent_memory is None
+            or self._deltas_since_full + 1 >= self.full_snapshot_every
+        ):
+            self._deltas_since_full = 0
+            if checkpoint.is_delta:
+                return checkpoint
+            snapshot = {k: from_json(v) for k, v in memory.items()}
+            return checkpoint.model_copy(update={"shared_memory": snapshot})
+
+        self._deltas_since_full += 1
+        changed = {k: from_json(v) for k, v in memory.items() if parent_memory.get(k) != v}
+        deleted = [k for k in parent_memory if k not in memory]
+        return checkpoint.model_copy(
+            update={
+                "shared_memory": changed,
+                "is_delta": True,
+                "parent_checkpoint_id": parent_id,
+                "deleted_keys": deleted,
+            }
+        )
+
+    def _reset_chain(self) -> None:
+        self._head_id = None
+        self._head_memory = None
+        self._deltas_since_full = 0
 
     async def load_checkpoint(
         self,
         checkpoint_id: str | None = None,
+        materialize: bool = True,
     ) -> Checkpoint | None:
         """
         Load checkpoint by ID or latest.
 
         Args:
             checkpoint_id: Checkpoint ID to load, or None for latest
+            materialize: Reconstruct full memory for delta checkpoints (default)
 
         Returns:
             Checkpoint object, or None if not found
         """
-
-        def _read(checkpoint_id: str) -> Checkpoint | None:
-            checkpoint_path = self.checkpoints_dir / f"{checkpoint_id}.json"
-
-            if not checkpoint_path.exists():
-                logger.warning(f"Checkpoint file not found: {checkpoint_path}")
-                return None
-
-            try:
-                return Checkpoint.model_validate_json(checkpoint_path.read_text())
-            except Exception as e:
-                logger.error(f"Failed to load checkpoint {checkpoint_id}: {e}")
-                return None
-
         # Load index to get checkpoint ID if not provided
         if checkpoint_id is None:
             index = await self.load_index()
@@ -108,7 +329,7 @@ def _read(checkpoint_id: str) -> Checkpoint | None:
                 return None
             checkpoint_id = index.latest_checkpoint_id
 
-        return await asyncio.to_thread(_read, checkpoint_id)
+        return await self._run_io(read_checkpoint, self.checkpoints_dir, checkpoint_id, materialize)
 
     async def load_index(self) -> CheckpointIndex | None:
         """
@@ -117,18 +338,7 @@ async def load_index(self) -> CheckpointIndex | None:
         Returns:
             CheckpointIndex or None if not found
         """
-
-        def _read() -> CheckpointIndex | None:
-            if not self.index_path.exists():
-                return None
-
-            try:
-                return CheckpointIndex.model_validate_json(self.index_path.read_text())
-            except Exception as e:
-                logger.error(f"Failed to load checkpoint index: {e}")
-                return None
-
-        return await asyncio.to_thread(_read)
+        return await self._run_io(read_checkpoint_index, self.checkpoints_dir)
 
     async def list_checkpoints(
         self,
@@ -164,38 +374,62 @@ async def delete_checkpoint(self, checkpoint_id: str) -> bool:
         """
         Delete a specific checkpoint.
 
+        Delta checkpoints that build on it are folded first so they stay
+        restorable.
+
         Args:
             checkpoint_id: Checkpoint ID to delete
 
         Returns:
             True if deleted, False if not found
         """
-
-        def _delete(checkpoint_id: str) -> bool:
-            checkpoint_path = self.checkpoints_dir / f"{checkpoint_id}.json"
-
-            if not checkpoint_path.exists():
-                logger.warning(f"Checkpoint file not found: {checkpoint_path}")
-                return False
-
-            try:
-                checkpoint_path.unlink()
-                logger.info(f"Deleted checkpoint {checkpoint_id}")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to delete checkpoint {checkpoint_id}: {e}")
-                return False
-
-        # Delete checkpoint file
-        deleted = await asyncio.to_thread(_delete, checkpoint_id)
-
-        if deleted:
-            # Update index (with lock)
-            async with self._index_lock:
-                await self._update_index_remove(checkpoint_id)
+        async with self._index_lock:
+            index = await self.load_index()
+            children = [
+                cp.checkpoint_id
+                for cp in (index.checkpoints if index else [])
+                if cp.parent_checkpoint_id == checkpoint_id
+            ]
+            deleted, rebased = await self._run_io(self._delete, checkpoint_id, children)
+
+            if deleted:
+                if checkpoint_id == self._head_id:
+                    self._reset_chain()
+                records = [{"op": "update", "checkpoint": s.model_dump()} for s in rebased]
+                records.append({"op": "remove", "checkpoint_id": checkpoint_id})
+                await self._run_io(self._append_index, records)
 
         return deleted
 
+    def _delete(
+        self, checkpoint_id: str, children: list[str]
+    ) -> tuple[bool, list[CheckpointSummary]]:
+        """Fold *children* onto the checkpoint's parent, then delete its file."""
+        checkpoint_path = self.checkpoints_dir / f"{checkpoint_id}.json"
+
+        if not checkpoint_path.exists():
+            logger.warning(f"Checkpoint file not found: {checkpoint_path}")
+            return False, []
+
+        rebased: list[CheckpointSummary] = []
+        if children:
+            parent = _read_checkpoint_file(self.checkpoints_dir, checkpoint_id)
+            for child_id in children:
+                child = _read_checkpoint_file(self.checkpoints_dir, child_id)
+                if parent is None or child is None:
+                    continue
+                folded = _fold(parent, child)
+                self._write_checkpoint(folded)
+                rebased.append(CheckpointSummary.from_checkpoint(folded))
+
+        try:
+            checkpoint_path.unlink()
+            logger.info(f"Deleted checkpoint {checkpoint_id}")
+            return True, rebased
+        except Exception as e:
+            logger.error(f"Failed to delete checkpoint {checkpoint_id}: {e}")
+            return False, rebased
+
     async def prune_checkpoints(
         self,
         max_age_days: int = 7,
@@ -203,37 +437,75 @@ async def prune_checkpoints(
         """
         Prune checkpoints older than max_age_days.
 
+        Surviving delta checkpoints whose chain runs through a pruned
+        checkpoint are rewritten as full snapshots, and the index log is
+        compacted to the surviving entries.
+
         Args:
             max_age_days: Maximum age in days (default 7)
 
         Returns:
             Number of checkpoints deleted
         """
-        index = await self.load_index()
-        if not index or not index.checkpoints:
-            return 0
-
         # Calculate cutoff datetime
         cutoff = datetime.now() - timedelta(days=max_age_days)
 
-        # Find old checkpoints
-        old_checkpoints = []
-        for cp in index.checkpoints:
-            try:
-                created = datetime.fromisoformat(cp.created_at)
-                if created < cutoff:
-                    old_checkpoints.append(cp.checkpoint_id)
-            except Exception as e:
-                logger.warning(f"Failed to parse timestamp for {cp.checkpoint_id}: {e}")
+        async with self._index_lock:
+            index = await self.load_index()
+            if not index or not index.checkpoints:
+                return 0
+
+            # Find old checkpoints
+            old_checkpoints = set()
+            for cp in index.checkpoints:
+                try:
+                    created = datetime.fromisoformat(cp.created_at)
+                    if created < cutoff:
+                        old_checkpoints.add(cp.checkpoint_id)
+                except Exception as e:
+                    logger.warning(f"Failed to parse timestamp for {cp.checkpoint_id}: {e}")
+
+            if not old_checkpoints:
+                return 0
+
+            if self._head_id in old_checkpoints:
+                self._reset_chain()
+
+            deleted_count = await self._run_io(self._prune, index, old_checkpoints)
+
+        if deleted_count > 0:
+            logger.info(f"Pruned {deleted_count} checkpoints older than {max_age_days} days")
+
+        return deleted_count
+
+    def _prune(self, index: CheckpointIndex, old_checkpoints: set[str]) -> int:
+        """Rebase survivors, delete *old_checkpoints* and compact the index log."""
+        survivors = [cp for cp in index.checkpoints if cp.checkpoint_id not in old_checkpoints]
+
+        # Chain compaction: cut every surviving chain loose from pruned parents
+        for i, summary in enumerate(survivors):
+            if summary.is_delta and summary.parent_checkpoint_id in old_checkpoints:
+                full = read_checkpoint(self.checkpoints_dir, summary.checkpoint_id)
+                if full is None:
+                    continue
+                full = full.model_copy(update={"parent_checkpoint_id": None})
+                self._write_checkpoint(full)
+                survivors[i] = CheckpointSummary.from_checkpoint(full)
 
-        # Delete old checkpoints
         deleted_count = 0
         for checkpoint_id in old_checkpoints:
-            if await self.delete_checkpoint(checkpoint_id):
+            try:
+                (self.checkpoints_dir / f"{checkpoint_id}.json").unlink()
                 deleted_count += 1
+            except FileNotFoundError:
+                logger.warning(f"Checkpoint file not found: {checkpoint_id}")
+            except Exception as e:
+                logger.error(f"Failed to delete checkpoint {checkpoint_id}: {e}")
 
-        if deleted_count > 0:
-            logger.info(f"Pruned {deleted_count} checkpoints older than {max_age_days} days")
+        with atomic_write(self.index_path) as f:
+            for summary in survivors:
+                f.write(json.dumps(self._index_record(index.session_id, summary)) + "\n")
+        (self.checkpoints_dir / LEGACY_INDEX_FILENAME).unlink(missing_ok=True)
 
         return deleted_count
 
@@ -252,74 +524,42 @@ def _check(checkpoint_id: str) -> bool:
             checkpoint_path = self.checkpoints_dir / f"{checkpoint_id}.json"
             return checkpoint_path.exists()
 
-        return await asyncio.to_thread(_check, checkpoint_id)
-
-    async def _update_index_add(self, checkpoint: Checkpoint) -> None:
-        """
-        Update index after adding a checkpoint.
-
-        Should be called with _index_lock held.
-
-        Args:
-            checkpoint: Checkpoint that was added
-        """
-
-        def _write(index: CheckpointIndex):
-            # Ensure directory exists
-            self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
-
-            # Write index atomically
-            with atomic_write(self.index_path) as f:
-                f.write(index.model_dump_json(indent=2))
+        return await self._run_io(_check, checkpoint_id)
 
-        # Load or create index
-        index = await self.load_index()
-        if not index:
-            index = CheckpointIndex(
-                session_id=checkpoint.session_id,
-                checkpoints=[],
-            )
+    async def _run_io(self, fn, *args):
+        """Run blocking I/O on the pipeline's threads, or the default pool without one."""
+        if self.persistence is None:
+            return await asyncio.to_thread(fn, *args)
+        return await self.persistence.run(fn, *args)
 
-        # Add checkpoint to index
-        index.add_checkpoint(checkpoint)
+    def _write_checkpoint(self, checkpoint: Checkpoint) -> None:
+        checkpoint_path = self.checkpoints_dir / f"{checkpoint.checkpoint_id}.json"
+        with atomic_write(checkpoint_path) as f:
+            f.write(checkpoint.model_dump_json(indent=2))
 
-        # Write updated index
-        await asyncio.to_thread(_write, index)
+    @staticmethod
+    def _index_record(session_id: str, summary: CheckpointSummary) -> dict[str, Any]:
+        return {"op": "add", "session_id": session_id, "checkpoint": summary.model_dump()}
 
-        logger.debug(f"Updated index with checkpoint {checkpoint.checkpoint_id}")
+    def _append_index(self, records: list[dict[str, Any]]) -> None:
+        """Append records to the index log (one line each)."""
+        self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(r) + "\n" for r in records))
+            f.flush()
+            os.fsync(f.fileno())
 
-    async def _update_index_remove(self, checkpoint_id: str) -> None:
+    async def _update_index_add(self, checkpoint: Checkpoint) -> None:
         """
-        Update index after removing a checkpoint.
+        Append a checkpoint to the index log.
 
         Should be called with _index_lock held.
 
         Args:
-            checkpoint_id: Checkpoint ID that was removed
+            checkpoint: Checkpoint that was added
         """
+        summary = CheckpointSummary.from_checkpoint(checkpoint)
+        record = self._index_record(checkpoint.session_id, summary)
+        await self._run_io(self._append_index, [record])
 
-        def _write(index: CheckpointIndex):
-            with atomic_write(self.index_path) as f:
-                f.write(index.model_dump_json(indent=2))
-
-        # Load index
-        index = await self.load_index()
-        if not index:
-            return
-
-        # Remove checkpoint from index
-        index.checkpoints = [cp for cp in index.checkpoints if cp.checkpoint_id != checkpoint_id]
-
-        # Update totals
-        index.total_checkpoints = len(index.checkpoints)
-
-        # Update latest_checkpoint_id if we removed the latest
-        if index.latest_checkpoint_id == checkpoint_id:
-            index.latest_checkpoint_id = (
-                index.checkpoints[-1].checkpoint_id if index.checkpoints else None
-            )
-
-        # Write updated index
-        await asyncio.to_thread(_write, index)
-
-        logger.debug(f"Removed checkpoint {checkpoint_id} from index")
+        logger.debug(f"Updated index with checkpoint {checkpoint.checkpoint_id}")
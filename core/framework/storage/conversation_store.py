@@ -23,6 +23,8 @@
 from pathlib import Path
 from typing import Any
 
+from framework.storage.segmented_conversation_store import SegmentedConversationStore
+
 
 class FileConversationStore:
     """File-per-part ConversationStore.
@@ -112,3 +114,25 @@ def _destroy() -> None:
                 shutil.rmtree(self._base)
 
         await self._run(_destroy)
+
+
+def open_conversation_store(
+    base_path: str | Path,
+    backend: str | None = None,
+) -> FileConversationStore | SegmentedConversationStore:
+    """Open the ConversationStore for *base_path*.
+
+    Existing directories keep the layout they were written with
+    (``segments/`` -> segmented, ``parts/`` -> file-per-part).  New
+    directories use *backend*: ``"segmented"`` or ``"file"`` (default).
+    """
+    base = Path(base_path)
+    if (base / "segments").is_dir():
+        return SegmentedConversationStore(base)
+    if (base / "parts").is_dir():
+        return FileConversationStore(base)
+    if backend == "segmented":
+        return SegmentedConversationStore(base)
+    if backend not in (None, "file"):
+        raise ValueError(f"Unknown conversation store backend: {backend!r}")
+    return FileConversationStore(base)
@@ -0,0 +1,267 @@
+"""
+Persistence Pipeline - Coalesced, bounded background writes for session files.
+
+Every execution rewrites its ``state.json`` several times per node (initial
+state, live progress, final state) and saves checkpoint files. Sending each
+of those to ``asyncio.to_thread`` saturates the default thread pool under
+many concurrent executions. One pipeline per runtime instead:
+
+- Coalesces writes to the same file: a write queued within ``window_ms`` of
+  another replaces it (last write wins), so only the newest content is
+  serialized and written.
+- Serializes writes per file, so a slow rewrite can never land after a newer one.
+- Runs all file I/O on a fixed-size thread pool (``max_workers``).
+- Exposes queue depth and write latency via ``get_stats()`` and a
+  ``flush()`` barrier used on pause and shutdown.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _PendingWrite:
+    """A queued write, plus the futures of the writes it superseded."""
+
+    fn: Callable[[], Any]
+    patch: str | None
+    submitted_at: float
+    futures: list[asyncio.Future] = field(default_factory=list)
+
+
+@dataclass
+class _FileQueue:
+    """Writes waiting for one file; at most one batch runs at a time."""
+
+    pending: list[_PendingWrite] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+    running: list[_PendingWrite] = field(default_factory=list)
+
+
+class PersistencePipeline:
+    """
+    Background writer shared by a runtime's session and checkpoint stores.
+
+    Example:
+        pipeline = PersistencePipeline(max_workers=4, window_ms=50)
+
+        # Fire-and-forget: coalesced with other writes to the same file
+        pipeline.submit(state_path, lambda: state_path.write_text(data))
+
+        # Awaited, bounded I/O with no coalescing
+        await pipeline.run(checkpoint_path.write_text, data)
+
+        await pipeline.flush()  # everything submitted so far is on disk
+        await pipeline.close()
+    """
+
+    def __init__(self, max_workers: int = 4, window_ms: float = 50.0):
+        """
+        Initialize persistence pipeline.
+
+        Args:
+            max_workers: Threads used for file I/O
+            window_ms: How long a write waits for a newer write to the same file
+        """
+        self._max_workers = max_workers
+        self._window = window_ms / 1000
+        self._executor: ThreadPoolExecutor | None = None
+        self._files: dict[str, _FileQueue] = {}
+        self._runs: set[asyncio.Future] = set()  # Uncoalesced run() calls in flight
+        self._tasks: set[asyncio.Task] = set()
+
+        # Metrics
+        self._submitted = 0
+        self._coalesced = 0
+        self._completed = 0
+        self._failed = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._flushes = 0
+        self._last_flush_ms = 0.0
+
+    # --- Writing ---
+
+    def submit(
+        self,
+        path: str | Path,
+        fn: Callable[[], Any],
+        patch: str | None = None,
+        urgent: bool = False,
+    ) -> asyncio.Future:
+        """
+        Queue a write of *path*. Must be called from the event loop thread.
+
+        Args:
+            path: File being written; writes to the same path are coalesced
+            fn: Blocking function performing the write (runs in a worker thread)
+            patch: None if *fn* rewrites the whole file, which replaces every
+                queued write of *path*. Writes that read-modify-write part of
+                the file pass a name and only replace a queued write with the
+                same name that is last in line.
+            urgent: Start writing now instead of waiting out the window
+
+        Returns:
+            Future resolved once this write (or one that replaced it) is on disk.
+            Failures are logged, so the future may be ignored.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        future.add_done_callback(_consume_exception)
+        self._submitted += 1
+
+        key = str(path)
+        queue = self._files.setdefault(key, _FileQueue())
+        write = _PendingWrite(fn=fn, patch=patch, submitted_at=time.perf_counter())
+        write.futures.append(future)
+
+        if patch is None:
+            superseded = queue.pending
+            queue.pending = []
+        elif queue.pending and queue.pending[-1].patch == patch:
+            superseded = [queue.pending.pop()]
+        else:
+            superseded = []
+        for old in superseded:
+            write.futures.extend(old.futures)
+            write.submitted_at = min(write.submitted_at, old.submitted_at)
+        self._coalesced += len(superseded)
+        queue.pending.append(write)
+
+        if not queue.running:
+            if urgent or self._window <= 0:
+                self._dispatch(key)
+            elif queue.timer is None:
+                queue.timer = loop.call_later(self._window, self._dispatch, key)
+        return future
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run blocking I/O on the pipeline's threads (no coalescing)."""
+        future = asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+        self._runs.add(future)
+        try:
+            return await future
+        finally:
+            self._runs.discard(future)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="hive-persist"
+            )
+        return self._executor
+
+    def _dispatch(self, key: str) -> None:
+        queue = self._files.get(key)
+        if queue is None:
+            return
+        if queue.timer is not None:
+            queue.timer.cancel()
+            queue.timer = None
+        if queue.running or not queue.pending:
+            return
+        queue.running, queue.pending = queue.pending, []
+        task = asyncio.get_running_loop().create_task(self._write(key, queue))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _write(self, key: str, queue: _FileQueue) -> None:
+        loop = asyncio.get_running_loop()
+        for write in queue.running:
+            try:
+                await loop.run_in_executor(self._get_executor(), write.fn)
+            except Exception as e:
+                self._failed += 1
+                logger.warning(f"Background write of {key} failed: {e}")
+                for future in write.futures:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            latency = time.perf_counter() - write.submitted_at
+            self._completed += 1
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+            for future in write.futures:
+                if not future.done():
+                    future.set_result(None)
+
+        queue.running = []
+        if queue.pending:
+            # Writes queued meanwhile already waited at least one write's duration
+            self._dispatch(key)
+        else:
+            del self._files[key]
+
+    # --- Barriers ---
+
+    async def wait(self, path: str | Path) -> None:
+        """Wait until every write queued for *path* is on disk."""
+        key = str(path)
+        queue = self._files.get(key)
+        if queue is None:
+            return
+        futures = [f for w in queue.running + queue.pending for f in w.futures]
+        self._dispatch(key)
+        await asyncio.gather(*futures, return_exceptions=True)
+
+    async def flush(self) -> None:
+        """Wait until everything submitted so far is on disk, skipping the window."""
+        start = time.perf_counter()
+        futures = list(self._runs)
+        for key, queue in list(self._files.items()):
+            futures.extend(f for w in queue.running + queue.pending for f in w.futures)
+            self._dispatch(key)
+        if futures:
+            await asyncio.gather(*futures, return_exceptions=True)
+        self._flushes += 1
+        self._last_flush_ms = (time.perf_counter() - start) * 1000
+
+    async def close(self) -> None:
+        """Flush and release the worker threads. The pipeline can be reused afterwards."""
+        await self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    # --- Stats ---
+
+    @property
+    def queue_depth(self) -> int:
+        """Writes queued or in progress."""
+        in_files = sum(len(q.pending) + len(q.running) for q in self._files.values())
+        return in_files + len(self._runs)
+
+    def get_stats(self) -> dict:
+        """Get pipeline statistics."""
+        return {
+            "queue_depth": self.queue_depth,
+            "files_pending": len(self._files),
+            "submitted": self._submitted,
+            "coalesced": self._coalesced,
+            "completed": self._completed,
+            "failed": self._failed,
+            "avg_write_latency_ms": (
+                self._latency_total / self._completed * 1000 if self._completed else 0.0
+            ),
+            "max_write_latency_ms": self._latency_max * 1000,
+            "flushes": self._flushes,
+            "last_flush_ms": self._last_flush_ms,
+            "max_workers": self._max_workers,
+        }
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    # Failures are already logged; don't warn about unretrieved exceptions
+    if not future.cancelled():
+        future.exception()
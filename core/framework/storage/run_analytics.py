@@ -0,0 +1,660 @@
+"""
+Run Analytics - SQLite fact tables for aggregate queries over past runs.
+
+Questions like "which node fails most", "p95 latency per tool" or "tokens
+spent per goal" used to mean loading every run file (``BuilderQuery``) or
+parsing every summary.json/details.jsonl/tool_logs.jsonl (the runtime logs
+tool). This store keeps one row per fact so they are single indexed queries:
+
+- Runtime logs (``RuntimeLogger.end_run``): ``runs`` (L1 summary),
+  ``node_runs`` (L2 node completions), ``node_steps`` (L3 steps) and
+  ``tool_calls`` (one row per tool call within a step).
+- Decision runs (``FileStorage.save_run``): ``decision_runs`` and
+  ``decisions``, the facts ``BuilderQuery`` aggregates.
+
+Each run's rows are replaced as a whole when it is recorded again (e.g. when
+a resumed session ends), so recording is idempotent.
+
+The store is derived data: it is rebuilt automatically when missing or from
+an older schema, and ``rebuild()`` re-derives it from the log files and
+legacy ``runs/*.json``. Decision facts recorded since ``FileStorage`` stopped
+writing run files exist only here; ``rebuild()`` carries them over from the
+existing file when its schema is current.
+
+The file layout is an interface: the runtime logs MCP tool reads it directly
+with ``sqlite3``.
+
+Layout::
+
+    {base_path}/
+      run_analytics.db     # this store
+      run_analytics.db.lock  # flock()ed by rebuilds (exclusive) and writes (shared)
+      sessions/session_*/logs/{summary.json,details.jsonl,tool_logs.jsonl}
+      runtime_logs/runs/{run_id}/...   # deprecated log location
+      runs/{run_id}.json               # deprecated decision runs
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any
+
+from framework.schemas.run import Run
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_FILENAME = "run_analytics.db"
+
+# Bump when the table layout changes; older files are rebuilt.
+_SCHEMA_VERSION = 1
+
+# One lock per store file, shared by every RunAnalytics on it (a runtime has
+# one for its logs and one in FileStorage); a rebuild swaps the file, so it
+# must not race another instance's first-use rebuild or writes. Across
+# processes the same is done with flock() on a sidecar lock file.
+_REBUILD_LOCKS: dict[Path, threading.Lock] = {}
+_REBUILD_LOCKS_GUARD = threading.Lock()
+
+
+def _rebuild_lock(path: Path) -> threading.Lock:
+    with _REBUILD_LOCKS_GUARD:
+        return _REBUILD_LOCKS.setdefault(path.resolve(), threading.Lock())
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id          TEXT PRIMARY KEY,
+    agent_id        TEXT NOT NULL,
+    goal_id         TEXT NOT NULL,
+    status          TEXT NOT NULL,
+    started_at      TEXT NOT NULL,
+    duration_ms     INTEGER NOT NULL,
+    input_tokens    INTEGER NOT NULL,
+    output_tokens   INTEGER NOT NULL,
+    needs_attention INTEGER NOT NULL,
+    summary         TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs (started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_goal ON runs (goal_id);
+
+CREATE TABLE IF NOT EXISTS node_runs (
+    run_id        TEXT NOT NULL,
+    node_id       TEXT NOT NULL,
+    node_type     TEXT NOT NULL,
+    attempt       INTEGER NOT NULL,
+    success       INTEGER NOT NULL,
+    exit_status   TEXT NOT NULL,
+    total_steps   INTEGER NOT NULL,
+    input_tokens  INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    latency_ms    INTEGER NOT NULL,
+    error         TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_node_runs_run ON node_runs (run_id);
+CREATE INDEX IF NOT EXISTS idx_node_runs_node ON node_runs (node_id);
+
+CREATE TABLE IF NOT EXISTS node_steps (
+    run_id        TEXT NOT NULL,
+    node_id       TEXT NOT NULL,
+    step_index    INTEGER NOT NULL,
+    verdict       TEXT NOT NULL,
+    input_tokens  INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    latency_ms    INTEGER NOT NULL,
+    is_partial    INTEGER NOT NULL,
+    error         TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_node_steps_run ON node_steps (run_id);
+
+CREATE TABLE IF NOT EXISTS tool_calls (
+    run_id     TEXT NOT NULL,
+    node_id    TEXT NOT NULL,
+    step_index INTEGER NOT NULL,
+    tool_name  TEXT NOT NULL,
+    is_error   INTEGER NOT NULL,
+    latency_ms INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tool_calls_run ON tool_calls (run_id);
+CREATE INDEX IF NOT EXISTS idx_tool_calls_tool ON tool_calls (tool_name, latency_ms);
+
+CREATE TABLE IF NOT EXISTS decision_runs (
+    run_id       TEXT PRIMARY KEY,
+    goal_id      TEXT NOT NULL,
+    status       TEXT NOT NULL,
+    started_at   TEXT NOT NULL,
+    duration_ms  INTEGER NOT NULL,
+    total_tokens INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_decision_runs_goal ON decision_runs (goal_id);
+
+CREATE TABLE IF NOT EXISTS decisions (
+    run_id        TEXT NOT NULL,
+    goal_id       TEXT NOT NULL,
+    seq           INTEGER NOT NULL,
+    node_id       TEXT NOT NULL,
+    decision_type TEXT NOT NULL,
+    outcome       INTEGER,  -- NULL: no outcome recorded, else 1/0 for success
+    error         TEXT,
+    latency_ms    INTEGER NOT NULL,
+    tokens_used   INTEGER NOT NULL,
+    intent_key    TEXT NOT NULL,  -- intent[:50], for grouping similar decisions
+    choice        TEXT            -- description of the chosen option
+);
+CREATE INDEX IF NOT EXISTS idx_decisions_run ON decisions (run_id);
+CREATE INDEX IF NOT EXISTS idx_decisions_goal ON decisions (goal_id);
+CREATE INDEX IF NOT EXISTS idx_decisions_node ON decisions (node_id);
+"""
+
+_LOG_TABLES = ("node_runs", "node_steps", "tool_calls", "runs")
+_DECISION_TABLES = ("decisions", "decision_runs")
+
+# Nearest-rank percentile: the row at rank ceil(n * p / 100) of each group
+_PERCENTILE_SQL = """
+WITH ranked AS (
+    SELECT {key} AS key, {value} AS value,
+           ROW_NUMBER() OVER (PARTITION BY {key} ORDER BY {value}) AS rank,
+           COUNT(*) OVER (PARTITION BY {key}) AS n
+    FROM {source}
+)
+SELECT key, value FROM ranked WHERE rank = (n * ? + 99) / 100
+"""
+
+
+class RunAnalytics:
+    """
+    SQLite fact store for run aggregates.
+
+    Uses short-lived connections, so it is safe to call from worker threads
+    (``asyncio.to_thread``). Rebuilds hold an exclusive ``flock`` on
+    ``run_analytics.db.lock`` and writes a shared one, so processes sharing
+    a store never write into a file another process's rebuild is replacing.
+    Without ``fcntl`` (Windows) only threads of one process are coordinated.
+    """
+
+    def __init__(self, base_path: str | Path):
+        """
+        Args:
+            base_path: Storage root (the directory containing ``sessions/``)
+        """
+        self.base_path = Path(base_path)
+        self.path = self.base_path / ANALYTICS_FILENAME
+        self._ready = False
+        self._lock = _rebuild_lock(self.path)
+
+    @contextmanager
+    def _connect(self, write: bool = False) -> Iterator[sqlite3.Connection]:
+        self.ensure()
+        with self._file_lock(exclusive=False) if write else nullcontext():
+            conn = sqlite3.connect(self.path, timeout=10)
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        """Hold a cross-process lock on the store: exclusive to swap it, shared to write."""
+        if fcntl is None:
+            yield
+            return
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_name(f"{self.path.name}.lock"), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def ensure(self) -> None:
+        """Create the store on first use, rebuilding it from the files on disk."""
+        if self._ready:
+            return
+        with self._lock, self._file_lock(exclusive=True):
+            if self._ready:
+                return
+            if self.path.exists() and _read_schema_version(self.path) == _SCHEMA_VERSION:
+                self._ready = True
+                return
+            self._rebuild()
+
+    # === WRITE ===
+
+    def record_log_run(
+        self,
+        summary: dict[str, Any],
+        details: list[dict[str, Any]],
+        steps: list[dict[str, Any]],
+    ) -> None:
+        """
+        Replace the facts of one runtime-logged run.
+
+        Args:
+            summary: L1 summary (summary.json contents)
+            details: L2 node details (details.jsonl lines)
+            steps: L3 steps (tool_logs.jsonl lines)
+        """
+        with self._connect(write=True) as conn:
+            _insert_log_run(conn, summary, details, steps)
+
+    def record_run(self, run: Run) -> None:
+        """Replace the decision facts of one run."""
+        with self._connect(write=True) as conn:
+            _insert_decision_run(conn, run)
+
+    def remove_run(self, run_id: str) -> None:
+        """Drop the decision facts of ``run_id`` if present."""
+        with self._connect(write=True) as conn:
+            for table in _DECISION_TABLES:
+                conn.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+
+    def rebuild(self) -> int:
+        """
+        Re-derive the store from runtime logs and legacy run files.
+
+        Builds into a temp file and swaps it in, so concurrent readers see
+        either the old or the new store.
+
+        Returns:
+            Number of runs recorded
+        """
+        with self._lock, self._file_lock(exclusive=True):
+            return self._rebuild()
+
+    def _rebuild(self) -> int:
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.unlink(missing_ok=True)
+
+        conn = sqlite3.connect(tmp_path, timeout=10)
+        try:
+            with conn:
+                conn.executescript(_SCHEMA)
+                self._carry_over_decisions(conn)
+                for log_dir in self._iter_log_dirs():
+                    try:
+                        summary = json.loads((log_dir / "summary.json").read_text("utf-8"))
+                        details = _read_jsonl(log_dir / "details.jsonl")
+                        steps = _read_jsonl(log_dir / "tool_logs.jsonl")
+                        _insert_log_run(conn, summary, details, steps)
+                    except Exception as e:
+                        logger.warning(f"Skipping unreadable run logs in {log_dir}: {e}")
+                for run_path in sorted((self.base_path / "runs").glob("*.json")):
+                    try:
+                        _insert_decision_run(conn, Run.model_validate_json(run_path.read_text()))
+                    except Exception as e:
+                        logger.warning(f"Skipping unreadable {run_path} while indexing: {e}")
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+                count = conn.execute(
+                    "SELECT (SELECT COUNT(*) FROM runs) + (SELECT COUNT(*) FROM decision_runs)"
+                ).fetchone()[0]
+        finally:
+            conn.close()
+        tmp_path.replace(self.path)
+        self._ready = True
+        logger.info(f"Rebuilt run analytics at {self.path} ({count} runs)")
+        return count
+
+    def _carry_over_decisions(self, conn: sqlite3.Connection) -> None:
+        """Copy decision facts from the current file; they have no other copy."""
+        if not self.path.exists() or _read_schema_version(self.path) != _SCHEMA_VERSION:
+            return
+        conn.execute("ATTACH DATABASE ? AS previous", (str(self.path),))
+        try:
+            for table in _DECISION_TABLES:
+                conn.execute(f"INSERT INTO {table} SELECT * FROM previous.{table}")
+        finally:
+            conn.commit()
+            conn.execute("DETACH DATABASE previous")
+
+    def _iter_log_dirs(self) -> Iterator[Path]:
+        for parent, pattern in (
+            (self.base_path / "sessions", "session_*/logs"),
+            (self.base_path / "runtime_logs" / "runs", "*"),
+        ):
+            if parent.is_dir():
+                for log_dir in sorted(parent.glob(pattern)):
+                    if (log_dir / "summary.json").is_file():
+                        yield log_dir
+
+    # === READ: RUNTIME LOGS ===
+
+    def node_stats(self, goal_id: str | None = None) -> list[dict[str, Any]]:
+        """
+        Failure rate, latency and tokens per node, worst failure rate first.
+
+        Args:
+            goal_id: Only count runs for this goal
+
+        Returns:
+            One dict per node
+        """
+        where, params = _goal_filter(goal_id, "node_runs")
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT node_id, COUNT(*), SUM(success = 0), AVG(latency_ms), "
+                f"SUM(input_tokens), SUM(output_tokens) FROM node_runs{where} "
+                f"GROUP BY node_id",
+                params,
+            ).fetchall()
+            p95 = _percentiles(conn, "node_id", "latency_ms", "node_runs", where, params)
+        stats = [
+            {
+                "node_id": node_id,
+                "executions": executions,
+                "failures": failures,
+                "failure_rate": failures / executions,
+                "avg_latency_ms": avg_latency,
+                "p95_latency_ms": p95.get(node_id, 0),
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+            }
+            for node_id, executions, failures, avg_latency, input_tokens, output_tokens in rows
+        ]
+        stats.sort(key=lambda s: (-s["failure_rate"], -s["executions"], s["node_id"]))
+        return stats
+
+    def tool_stats(self, goal_id: str | None = None) -> list[dict[str, Any]]:
+        """
+        Call count, error rate and latency per tool, slowest p95 first.
+
+        Args:
+            goal_id: Only count runs for this goal
+
+        Returns:
+            One dict per tool
+        """
+        where, params = _goal_filter(goal_id, "tool_calls")
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT tool_name, COUNT(*), SUM(is_error), AVG(latency_ms) "
+                f"FROM tool_calls{where} GROUP BY tool_name",
+                params,
+            ).fetchall()
+            p95 = _percentiles(conn, "tool_name", "latency_ms", "tool_calls", where, params)
+        stats = [
+            {
+                "tool_name": tool_name,
+                "calls": calls,
+                "errors": errors,
+                "error_rate": errors / calls,
+                "avg_latency_ms": avg_latency,
+                "p95_latency_ms": p95.get(tool_name, 0),
+            }
+            for tool_name, calls, errors, avg_latency in rows
+        ]
+        stats.sort(key=lambda s: (-s["p95_latency_ms"], s["tool_name"]))
+        return stats
+
+    def goal_stats(self) -> list[dict[str, Any]]:
+        """Run count, failure rate and token usage per goal, most tokens first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT goal_id, COUNT(*), SUM(status = 'failure'), "
+                "SUM(input_tokens), SUM(output_tokens), AVG(duration_ms) "
+                "FROM runs GROUP BY goal_id"
+            ).fetchall()
+        stats = [
+            {
+                "goal_id": goal_id,
+                "runs": runs,
+                "failures": failures,
+                "failure_rate": failures / runs,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "avg_tokens_per_run": (input_tokens + output_tokens) / runs,
+                "avg_duration_ms": avg_duration,
+            }
+            for goal_id, runs, failures, input_tokens, output_tokens, avg_duration in rows
+        ]
+        stats.sort(key=lambda s: (-(s["input_tokens"] + s["output_tokens"]), s["goal_id"]))
+        return stats
+
+    # === READ: DECISIONS ===
+
+    def goal_outcomes(self, goal_id: str) -> tuple[int, int]:
+        """Return (runs, completed runs) recorded for a goal."""
+        with self._connect() as conn:
+            total, completed = conn.execute(
+                "SELECT COUNT(*), SUM(status = 'completed') FROM decision_runs WHERE goal_id = ?",
+                (goal_id,),
+            ).fetchone()
+        return total, completed or 0
+
+    def decision_failures(self, goal_id: str, limit: int = 5) -> list[tuple[str, int]]:
+        """Most frequent errors of failed decisions, as (error, count)."""
+        with self._connect() as conn:
+            return [
+                tuple(row)
+                for row in conn.execute(
+                    "SELECT COALESCE(NULLIF(error, ''), 'Unknown error') AS e, COUNT(*) "
+                    "FROM decisions WHERE goal_id = ? AND outcome = 0 "
+                    "GROUP BY e ORDER BY COUNT(*) DESC, MIN(rowid) LIMIT ?",
+                    (goal_id, limit),
+                )
+            ]
+
+    def decision_failure_rates(self, goal_id: str) -> list[tuple[str, float]]:
+        """Share of unsuccessful decisions per node, as (node_id, rate), highest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT node_id, SUM(outcome IS NOT 1), COUNT(*) FROM decisions "
+                "WHERE goal_id = ? GROUP BY node_id ORDER BY MIN(rowid)",
+                (goal_id,),
+            ).fetchall()
+        rates = [(node_id, failed / total) for node_id, failed, total in rows]
+        rates.sort(key=lambda x: x[1], reverse=True)
+        return rates
+
+    def decision_types(self, goal_id: str | None = None, node_id: str | None = None) -> dict:
+        """Decision count per decision type, in order of first occurrence."""
+        clauses, params = [], []
+        if goal_id is not None:
+            clauses.append("goal_id = ?")
+            params.append(goal_id)
+        if node_id is not None:
+            clauses.append("node_id = ?")
+            params.append(node_id)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT decision_type, COUNT(*) FROM decisions{where} "
+                f"GROUP BY decision_type ORDER BY MIN(rowid)",
+                params,
+            ).fetchall()
+        return dict(rows)
+
+    def decision_choices(self, goal_id: str) -> list[tuple[str, str, int]]:
+        """(intent_key, choice, count) in order of first occurrence."""
+        with self._connect() as conn:
+            return [
+                tuple(row)
+                for row in conn.execute(
+                    "SELECT intent_key, choice, COUNT(*) FROM decisions "
+                    "WHERE goal_id = ? AND choice IS NOT NULL "
+                    "GROUP BY intent_key, choice ORDER BY MIN(rowid)",
+                    (goal_id,),
+                )
+            ]
+
+    def node_decisions(self, node_id: str) -> tuple[int, int, int, int]:
+        """Return (decisions, successful, total latency ms, total tokens) for a node."""
+        with self._connect() as conn:
+            total, successful, latency, tokens = conn.execute(
+                "SELECT COUNT(*), SUM(outcome = 1), SUM(latency_ms), SUM(tokens_used) "
+                "FROM decisions WHERE node_id = ?",
+                (node_id,),
+            ).fetchone()
+        return total, successful or 0, latency or 0, tokens or 0
+
+
+def _insert_log_run(
+    conn: sqlite3.Connection,
+    summary: dict[str, Any],
+    details: list[dict[str, Any]],
+    steps: list[dict[str, Any]],
+) -> None:
+    run_id = summary["run_id"]
+    for table in _LOG_TABLES:
+        conn.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+    conn.execute(
+        "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            run_id,
+            summary.get("agent_id", ""),
+            summary.get("goal_id", ""),
+            summary.get("status", ""),
+            summary.get("started_at", ""),
+            summary.get("duration_ms", 0),
+            summary.get("total_input_tokens", 0),
+            summary.get("total_output_tokens", 0),
+            int(bool(summary.get("needs_attention"))),
+            json.dumps(summary, ensure_ascii=False),
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO node_runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                run_id,
+                d.get("node_id", ""),
+                d.get("node_type", ""),
+                d.get("attempt", 1),
+                int(bool(d.get("success", True))),
+                d.get("exit_status", ""),
+                d.get("total_steps", 0),
+                d.get("input_tokens", 0),
+                d.get("output_tokens", 0),
+                d.get("latency_ms", 0),
+                d.get("error"),
+            )
+            for d in details
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO node_steps VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                run_id,
+                s.get("node_id", ""),
+                s.get("step_index", 0),
+                s.get("verdict", ""),
+                s.get("input_tokens", 0),
+                s.get("output_tokens", 0),
+                s.get("latency_ms", 0),
+                int(bool(s.get("is_partial"))),
+                s.get("error", ""),
+            )
+            for s in steps
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO tool_calls VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (
+                run_id,
+                s.get("node_id", ""),
+                s.get("step_index", 0),
+                tc.get("tool_name", ""),
+                int(bool(tc.get("is_error"))),
+                tc.get("latency_ms", 0),
+            )
+            for s in steps
+            for tc in s.get("tool_calls", [])
+        ],
+    )
+
+
+def _insert_decision_run(conn: sqlite3.Connection, run: Run) -> None:
+    for table in _DECISION_TABLES:
+        conn.execute(f"DELETE FROM {table} WHERE run_id = ?", (run.id,))
+    conn.execute(
+        "INSERT INTO decision_runs VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            run.id,
+            run.goal_id,
+            run.status.value,
+            run.started_at.isoformat(),
+            run.duration_ms,
+            run.metrics.total_tokens,
+        ),
+    )
+    rows = []
+    for seq, d in enumerate(run.decisions):
+        outcome = d.outcome
+        chosen = d.chosen_option
+        rows.append(
+            (
+                run.id,
+                run.goal_id,
+                seq,
+                d.node_id,
+                d.decision_type.value,
+                None if outcome is None else int(outcome.success),
+                outcome.error if outcome else None,
+                outcome.latency_ms if outcome else 0,
+                outcome.tokens_used if outcome else 0,
+                d.intent[:50],
+                chosen.description if chosen else None,
+            )
+        )
+    conn.executemany("INSERT INTO decisions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+
+def _goal_filter(goal_id: str | None, table: str) -> tuple[str, tuple[str, ...]]:
+    if goal_id is None:
+        return "", ()
+    return (
+        f" WHERE {table}.run_id IN (SELECT run_id FROM runs WHERE goal_id = ?)",
+        (goal_id,),
+    )
+
+
+def _percentiles(
+    conn: sqlite3.Connection,
+    key: str,
+    value: str,
+    table: str,
+    where: str,
+    params: tuple,
+    percentile: int = 95,
+) -> dict[str, int]:
+    sql = _PERCENTILE_SQL.format(key=key, value=value, source=f"{table}{where}")
+    return dict(conn.execute(sql, (*params, percentile)).fetchall())
+
+
+def _read_jsonl(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    items = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                items.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # Partial line from a crash
+    return items
+
+
+def _read_schema_version(path: Path) -> int:
+    try:
+        conn = sqlite3.connect(path)
+        try:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            conn.close()
+    except sqlite3.DatabaseError:
+        return -1
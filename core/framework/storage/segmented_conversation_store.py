@@ -0,0 +1,527 @@
+"""Segmented append-only ConversationStore implementation.
+
+Parts, cursor updates and compaction tombstones are appended as JSON
+lines to a small number of segment files instead of one file per part.
+Long-lived conversations therefore create a handful of files rather than
+thousands, restores read each segment sequentially, and compaction drops
+whole segments instead of unlinking part files one by one.
+
+Directory layout::
+
+    {base_path}/
+        meta.json
+        segments/
+            00000000.jsonl    # sealed segment
+            00000000.idx      # offset index, written when a segment is sealed
+            00000001.jsonl    # active segment (appends go here)
+
+Each line of a segment is one record:
+
+- ``{"t": "p", "seq": 3, "d": {...}}`` — a part (later writes of the
+  same seq supersede earlier ones)
+- ``{"t": "c", "d": {...}}`` — a cursor update
+- ``{"t": "x", "before": 5}`` — a tombstone from ``delete_parts_before``
+
+Records are replayed in log order on open, so a part written after a
+tombstone (e.g. the compaction summary) stays visible.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SEGMENT_BYTES = 4 * 1024 * 1024
+DEFAULT_FSYNC_EVERY = 32
+
+_SEGMENT_SUFFIX = ".jsonl"
+_INDEX_SUFFIX = ".idx"
+
+
+@dataclass
+class _Segment:
+    """In-memory bookkeeping for one segment file."""
+
+    number: int
+    path: Path
+    size: int = 0
+    # (kind, seq_or_before, offset, length) in log order.  Used to write
+    # the ``.idx`` sidecar so reopening skips parsing record bodies.
+    entries: list[tuple[str, int, int, int]] = field(default_factory=list)
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_suffix(_INDEX_SUFFIX)
+
+
+class SegmentedConversationStore:
+    """Append-only ConversationStore backed by segmented JSONL files.
+
+    Appends are O(1): the active segment stays open and each write is a
+    single ``write`` + ``flush``.  Durability is batched — ``os.fsync`` runs
+    every *fsync_every* appends, and always when a segment is sealed or the
+    store is closed.  Set *fsync_every* to ``1`` for per-write durability or
+    ``0`` to only sync on seal/close.
+
+    Args:
+        base_path: Conversation directory (same location the
+            file-per-part store would use).
+        max_segment_bytes: Seal the active segment and start a new one
+            once it grows past this size.
+        fsync_every: Number of appends between ``fsync`` calls.
+    """
+
+    def __init__(
+        self,
+        base_path: str | Path,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        fsync_every: int = DEFAULT_FSYNC_EVERY,
+    ) -> None:
+        self._base = Path(base_path)
+        self._segments_dir = self._base / "segments"
+        self._max_segment_bytes = max_segment_bytes
+        self._fsync_every = fsync_every
+
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._segments: list[_Segment] = []
+        # seq -> (segment number, offset, length) of the live record
+        self._live: dict[int, tuple[int, int, int]] = {}
+        self._cursor: dict[str, Any] | None = None
+        self._cursor_segment: int | None = None
+        self._active_fh: Any = None
+        self._unsynced = 0
+
+    # --- loading -------------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded and self._is_stale():
+            # Another instance wrote to this directory: the cached offsets and
+            # live map no longer describe the files, so rebuild them from disk.
+            self._release_active()
+            self._loaded = False
+        if self._loaded:
+            return
+        self._segments = []
+        self._live = {}
+        self._cursor = None
+        self._cursor_segment = None
+        last_cursor: tuple[int, int, int] | None = None
+
+        paths: list[Path] = []
+        if self._segments_dir.exists():
+            paths = sorted(self._segments_dir.glob(f"*{_SEGMENT_SUFFIX}"))
+        for i, path in enumerate(paths):
+            try:
+                number = int(path.stem)
+            except ValueError:
+                continue
+            seg = _Segment(number=number, path=path)
+            is_last = i == len(paths) - 1
+            entries = self._load_index(seg)
+            if entries is None:
+                entries = self._scan_segment(seg, repair_tail=is_last)
+                if not is_last:
+                    self._write_index(seg, entries)
+            seg.entries = entries
+            for kind, key, offset, length in entries:
+                if kind == "p":
+                    self._live[key] = (number, offset, length)
+                elif kind == "x":
+                    self._drop_live_before(key)
+                elif kind == "c":
+                    last_cursor = (number, offset, length)
+            self._segments.append(seg)
+
+        if last_cursor is not None:
+            record = self._read_records({last_cursor[0]: [(last_cursor[1], last_cursor[2])]})
+            if record:
+                self._cursor = record[0].get("d")
+                self._cursor_segment = last_cursor[0]
+
+        # Only the active (last) segment keeps its entry list in memory.
+        for seg in self._segments[:-1]:
+            seg.entries = []
+        self._loaded = True
+
+    def _is_stale(self) -> bool:
+        """Whether the segment files changed since this instance last wrote.
+
+        Every append grows the active segment and every roll creates the
+        next one, so one ``stat`` of the tail tells us if someone else wrote.
+        """
+        if not self._segments:
+            return self._segments_dir.exists() and any(
+                self._segments_dir.glob(f"*{_SEGMENT_SUFFIX}")
+            )
+        seg = self._segments[-1]
+        try:
+            size = seg.path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        return size != seg.size or self._segment_path(seg.number + 1).exists()
+
+    def _load_index(self, seg: _Segment) -> list[tuple[str, int, int, int]] | None:
+        """Load a sealed segment's sidecar index; None if missing or stale."""
+        try:
+            with open(seg.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+            seg.size = seg.path.stat().st_size
+        except (OSError, json.JSONDecodeError, ValueError):
+            return None
+        if data.get("size") != seg.size:
+            return None
+        return [tuple(e) for e in data.get("entries", [])]
+
+    def _write_index(self, seg: _Segment, entries: list[tuple[str, int, int, int]]) -> None:
+        tmp = seg.index_path.with_suffix(".idx.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"size": seg.size, "entries": entries}, f, separators=(",", ":"))
+        os.replace(tmp, seg.index_path)
+
+    def _scan_segment(self, seg: _Segment, repair_tail: bool) -> list[tuple[str, int, int, int]]:
+        """Parse every record of a segment, skipping corrupt lines.
+
+        When *repair_tail* is set, a trailing partial line (crash mid-append)
+        is truncated so subsequent appends start on a clean line boundary.
+        """
+        with open(seg.path, "rb") as f:
+            raw = f.read()
+        if repair_tail and raw and not raw.endswith(b"\n"):
+            keep = raw.rfind(b"\n") + 1
+            logger.warning("Truncating torn tail of %s (%d bytes)", seg.path, len(raw) - keep)
+            with open(seg.path, "r+b") as f:
+                f.truncate(keep)
+            raw = raw[:keep]
+        seg.size = len(raw)
+
+        entries: list[tuple[str, int, int, int]] = []
+        offset = 0
+        for line in raw.split(b"\n")[:-1]:
+            length = len(line) + 1
+            try:
+                record = json.loads(line)
+                kind = record["t"]
+                if kind == "p":
+                    entries.append(("p", int(record["seq"]), offset, length))
+                elif kind == "x":
+                    entries.append(("x", int(record["before"]), offset, length))
+                elif kind == "c":
+                    entries.append(("c", 0, offset, length))
+            except (json.JSONDecodeError, ValueError, KeyError, TypeError):
+                logger.warning("Skipping corrupt record in %s at offset %d", seg.path, offset)
+            offset += length
+        return entries
+
+    def _drop_live_before(self, seq: int) -> None:
+        for key in [k for k in self._live if k < seq]:
+            del self._live[key]
+
+    # --- reading -------------------------------------------------------------
+
+    def _read_records(self, wanted: dict[int, list[tuple[int, int]]]) -> list[dict[str, Any]]:
+        """Read records grouped by segment number, one open per segment."""
+        paths = {seg.number: seg.path for seg in self._segments}
+        records: list[dict[str, Any]] = []
+        for number, spans in wanted.items():
+            spans.sort()
+            with open(paths[number], "rb") as f:
+                for offset, length in spans:
+                    f.seek(offset)
+                    try:
+                        records.append(json.loads(f.read(length)))
+                    except (json.JSONDecodeError, ValueError):
+                        continue
+        return records
+
+    def _read_seq_range(self, start: int, end: int | None) -> list[dict[str, Any]]:
+        with self._lock:
+            self._ensure_loaded()
+            wanted: dict[int, list[tuple[int, int]]] = {}
+            for seq, (number, offset, length) in self._live.items():
+                if seq >= start and (end is None or seq < end):
+                    wanted.setdefault(number, []).append((offset, length))
+            records = self._read_records(wanted)
+        records.sort(key=lambda r: r["seq"])
+        return [r["d"] for r in records]
+
+    # --- appending -----------------------------------------------------------
+
+    def _open_active(self) -> _Segment:
+        if not self._segments:
+            self._segments_dir.mkdir(parents=True, exist_ok=True)
+            self._segments.append(_Segment(number=0, path=self._segment_path(0)))
+        seg = self._segments[-1]
+        if self._active_fh is None:
+            self._segments_dir.mkdir(parents=True, exist_ok=True)
+            self._active_fh = open(seg.path, "ab")
+        return seg
+
+    def _segment_path(self, number: int) -> Path:
+        return self._segments_dir / f"{number:08d}{_SEGMENT_SUFFIX}"
+
+    def _append(self, kind: str, key: int, record: dict[str, Any]) -> tuple[int, int, int]:
+        seg = self._open_active()
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        offset = seg.size
+        self._active_fh.write(line)
+        self._active_fh.flush()
+        seg.size += len(line)
+        seg.entries.append((kind, key, offset, len(line)))
+        self._unsynced += 1
+        if self._fsync_every and self._unsynced >= self._fsync_every:
+            self._sync()
+        location = (seg.number, offset, len(line))
+        if seg.size >= self._max_segment_bytes:
+            self._seal_active()
+        return location
+
+    def _sync(self) -> None:
+        if self._active_fh is not None and self._unsynced:
+            self._active_fh.flush()
+            os.fsync(self._active_fh.fileno())
+        self._unsynced = 0
+
+    def _seal_active(self) -> None:
+        """Sync and index the active segment, then start a new one."""
+        seg = self._segments[-1]
+        self._sync()
+        self._active_fh.close()
+        self._active_fh = None
+        self._write_index(seg, seg.entries)
+        seg.entries = []
+        number = seg.number + 1
+        self._segments.append(_Segment(number=number, path=self._segment_path(number)))
+
+    def _write_part_sync(self, seq: int, data: dict[str, Any]) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            self._live[seq] = self._append("p", seq, {"t": "p", "seq": seq, "d": data})
+
+    def _write_cursor_sync(self, data: dict[str, Any]) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            location = self._append("c", 0, {"t": "c", "d": data})
+            self._cursor = dict(data)
+            self._cursor_segment = location[0]
+
+    def _delete_before_sync(self, seq: int) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            if not self._segments:
+                return
+            self._append("x", seq, {"t": "x", "before": seq})
+            self._drop_live_before(seq)
+            self._drop_dead_segments()
+
+    def _drop_dead_segments(self) -> None:
+        """Delete the oldest sealed segments that hold no live parts.
+
+        Segments are only dropped as a prefix of the log: a tombstone in a
+        dropped segment can then only have affected records in segments that
+        are dropped too, so replaying the remaining log stays correct.
+        """
+        referenced = {number for number, _, _ in self._live.values()}
+        dead: list[_Segment] = []
+        for seg in self._segments[:-1]:
+            if seg.number in referenced:
+                break
+            dead.append(seg)
+        if not dead:
+            return
+        dead_numbers = {seg.number for seg in dead}
+        if self._cursor is not None and self._cursor_segment in dead_numbers:
+            # Re-home the latest cursor before its segment disappears.
+            self._cursor_segment = self._append("c", 0, {"t": "c", "d": self._cursor})[0]
+        # Make the tombstone durable before deleting what it replaces.
+        self._sync()
+        for seg in dead:
+            seg.path.unlink(missing_ok=True)
+            seg.index_path.unlink(missing_ok=True)
+        self._segments = [s for s in self._segments if s.number not in dead_numbers]
+
+    def _release_active(self) -> None:
+        if self._active_fh is not None:
+            self._sync()
+            self._active_fh.close()
+            self._active_fh = None
+
+    def _close_sync(self) -> None:
+        with self._lock:
+            if self._active_fh is None:
+                return
+            self._release_active()
+            seg = self._segments[-1]
+            # Persist the active segment's index too; it is ignored on reopen
+            # if more records were appended afterwards (size mismatch).
+            self._write_index(seg, seg.entries)
+
+    # --- meta helpers --------------------------------------------------------
+
+    def _write_json(self, path: Path, data: dict) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    def _read_json(self, path: Path) -> dict | None:
+        if not path.exists():
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, ValueError):
+            return None
+
+    def _read_cursor_sync(self) -> dict[str, Any] | None:
+        with self._lock:
+            self._ensure_loaded()
+            return dict(self._cursor) if self._cursor is not None else None
+
+    # --- async wrapper -------------------------------------------------------
+
+    async def _run(self, fn, *args):
+        return await asyncio.to_thread(fn, *args)
+
+    # --- ConversationStore interface -----------------------------------------
+
+    async def write_part(self, seq: int, data: dict[str, Any]) -> None:
+        await self._run(self._write_part_sync, seq, data)
+
+    async def read_parts(self) -> list[dict[str, Any]]:
+        return await self._run(self._read_seq_range, 0, None)
+
+    async def read_parts_range(self, start: int, end: int | None = None) -> list[dict[str, Any]]:
+        """Read live parts with ``start <= seq < end`` (``end=None`` = to the tail)."""
+        return await self._run(self._read_seq_range, start, end)
+
+    async def write_meta(self, data: dict[str, Any]) -> None:
+        await self._run(self._write_json, self._base / "meta.json", data)
+
+    async def read_meta(self) -> dict[str, Any] | None:
+        return await self._run(self._read_json, self._base / "meta.json")
+
+    async def write_cursor(self, data: dict[str, Any]) -> None:
+        await self._run(self._write_cursor_sync, data)
+
+    async def read_cursor(self) -> dict[str, Any] | None:
+        return await self._run(self._read_cursor_sync)
+
+    async def delete_parts_before(self, seq: int) -> None:
+        await self._run(self._delete_before_sync, seq)
+
+    async def close(self) -> None:
+        """Flush, fsync and close the active segment."""
+        await self._run(self._close_sync)
+
+    async def destroy(self) -> None:
+        """Delete the entire base directory and all persisted data."""
+
+        def _destroy() -> None:
+            self._close_sync()
+            with self._lock:
+                if self._base.exists():
+                    shutil.rmtree(self._base)
+                self._loaded = False
+                self._segments = []
+                self._live = {}
+                self._cursor = None
+
+        await self._run(_destroy)
+
+
+# ---------------------------------------------------------------------------
+# Migration from the file-per-part layout
+# ---------------------------------------------------------------------------
+
+
+def migrate_file_conversation_store(
+    base_path: str | Path,
+    max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+) -> int:
+    """Convert a file-per-part conversation directory to segments in place.
+
+    Parts and the cursor are written to a staging directory first and
+    moved to ``segments/`` only once complete, so an interrupted
+    migration leaves the original ``parts/`` directory untouched.
+    If any part or the cursor cannot be read, the migration is abandoned
+    and the directory keeps its file-per-part layout, so nothing is lost.
+    ``meta.json`` is shared by both layouts and is left as-is.
+
+    Returns:
+        Number of parts migrated (0 if there was nothing to migrate, the
+        directory already uses segments, or a file could not be read).
+    """
+    base = Path(base_path)
+    parts_dir = base / "parts"
+    segments_dir = base / "segments"
+    if not parts_dir.is_dir() or segments_dir.exists():
+        return 0
+
+    staging = base / ".segments-migration"
+    if staging.exists():
+        shutil.rmtree(staging)
+
+    store = SegmentedConversationStore(staging, max_segment_bytes, fsync_every=0)
+
+    def abandon(unreadable: Path) -> int:
+        logger.warning("Unreadable %s; leaving %s unmigrated", unreadable, base)
+        store._close_sync()
+        shutil.rmtree(staging, ignore_errors=True)
+        return 0
+
+    count = 0
+    for path in sorted(parts_dir.glob("*.json")):
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            seq = int(path.stem)
+        except (json.JSONDecodeError, ValueError, OSError):
+            return abandon(path)
+        store._write_part_sync(seq, data)
+        count += 1
+
+    cursor_path = base / "cursor.json"
+    cursor = None
+    if cursor_path.exists():
+        try:
+            with open(cursor_path, encoding="utf-8") as f:
+                cursor = json.load(f)
+        except (json.JSONDecodeError, ValueError, OSError):
+            return abandon(cursor_path)
+    if cursor is not None:
+        store._write_cursor_sync(cursor)
+    store._close_sync()
+
+    if (staging / "segments").exists():
+        os.replace(staging / "segments", segments_dir)
+    shutil.rmtree(staging)
+    shutil.rmtree(parts_dir)
+    cursor_path.unlink(missing_ok=True)
+    return count
+
+
+def migrate_conversation_tree(root: str | Path) -> dict[str, int]:
+    """Migrate every file-per-part conversation directory under *root*.
+
+    Returns:
+        Mapping of migrated conversation directory -> parts migrated.
+    """
+    migrated: dict[str, int] = {}
+    for parts_dir in sorted(Path(root).rglob("parts")):
+        if not parts_dir.is_dir() or not (parts_dir.parent / "meta.json").exists():
+            continue
+        count = migrate_file_conversation_store(parts_dir.parent)
+        if count:
+            migrated[str(parts_dir.parent)] = count
+    return migrated
@@ -0,0 +1,240 @@
+"""
+Session Index - SQLite secondary index over sessions/*/state.json.
+
+``SessionStore.list_sessions`` used to parse every state.json under
+``sessions/`` to answer "the N most recent sessions with status X". The
+index keeps one row per session (status, goal_id, entry_point, timestamps)
+so listings are a single indexed query; only the requested page of
+state.json files is ever read.
+
+The index is derived data: ``SessionStore.write_state`` / ``delete_session``
+keep it current, it is rebuilt automatically when missing or from an older
+schema, and ``rebuild()`` (``hive sessions reindex``) re-derives it from the
+state files for stores written before the index existed.
+
+Layout::
+
+    {base_path}/
+      session_index.db     # this index
+      sessions/
+        session_*/state.json
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from framework.schemas.session_state import SessionState
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "session_index.db"
+
+# Bump when the table layout changes; older files are rebuilt from state.json.
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id  TEXT PRIMARY KEY,
+    status      TEXT NOT NULL,
+    goal_id     TEXT NOT NULL,
+    entry_point TEXT NOT NULL,
+    started_at  TEXT NOT NULL,
+    updated_at  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions (updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions (status, updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_goal ON sessions (goal_id, updated_at DESC);
+"""
+
+
+@dataclass(frozen=True)
+class SessionIndexEntry:
+    """One indexed session, without the full state payload."""
+
+    session_id: str
+    status: str
+    goal_id: str
+    entry_point: str
+    started_at: str
+    updated_at: str
+
+
+class SessionIndex:
+    """
+    Persistent secondary index of sessions keyed on status, goal and recency.
+
+    All methods are synchronous and open a short-lived connection, so they
+    are safe to call from ``asyncio.to_thread`` workers and from several
+    processes sharing one store.
+    """
+
+    def __init__(self, base_path: Path):
+        """
+        Initialize the index.
+
+        Args:
+            base_path: Store root (the directory containing ``sessions/``)
+        """
+        self.base_path = Path(base_path)
+        self.path = self.base_path / INDEX_FILENAME
+        self.sessions_dir = self.base_path / "sessions"
+        self._ready = False
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.ensure()
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def ensure(self) -> None:
+        """Create the index on first use, rebuilding it from state.json files."""
+        if self._ready:
+            return
+        with self._lock:
+            if self._ready:
+                return
+            if self.path.exists() and _read_schema_version(self.path) == _SCHEMA_VERSION:
+                self._ready = True
+                return
+        self.rebuild()
+
+    # === WRITE ===
+
+    def upsert(self, session_id: str, state: SessionState) -> None:
+        """Insert or refresh the row for a session's latest state."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?)",
+                _row(session_id, state),
+            )
+
+    def remove(self, session_id: str) -> None:
+        """Drop the row for ``session_id`` if present."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def rebuild(self) -> int:
+        """
+        Re-derive the index from every sessions/*/state.json.
+
+        Builds into a temp file and swaps it in, so concurrent readers see
+        either the old or the new index.
+
+        Returns:
+            Number of sessions indexed
+        """
+        with self._lock:
+            return self._rebuild()
+
+    def _rebuild(self) -> int:
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.unlink(missing_ok=True)
+
+        rows = []
+        if self.sessions_dir.exists():
+            for session_dir in self.sessions_dir.iterdir():
+                state_path = session_dir / "state.json"
+                if not session_dir.is_dir() or not state_path.exists():
+                    continue
+                try:
+                    state = SessionState.model_validate_json(state_path.read_text())
+                    rows.append(_row(session_dir.name, state))
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable {state_path} while indexing: {e}")
+
+        conn = sqlite3.connect(tmp_path)
+        try:
+            with conn:
+                conn.executescript(_SCHEMA)
+                conn.executemany("INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?)", rows)
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        finally:
+            conn.close()
+        tmp_path.replace(self.path)
+        self._ready = True
+        logger.info(f"Rebuilt session index at {self.path} ({len(rows)} sessions)")
+        return len(rows)
+
+    # === READ ===
+
+    def query(
+        self,
+        status: str | None = None,
+        goal_id: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[SessionIndexEntry]:
+        """
+        Return indexed sessions, most recently updated first.
+
+        Args:
+            status: Optional status filter
+            goal_id: Optional goal ID filter
+            limit: Page size
+            offset: Number of matching sessions to skip
+
+        Returns:
+            List of SessionIndexEntry
+        """
+        where, params = _filters(status, goal_id)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT session_id, status, goal_id, entry_point, started_at, updated_at "
+                f"FROM sessions{where} ORDER BY updated_at DESC, session_id DESC "
+                f"LIMIT ? OFFSET ?",
+                (*params, limit, offset),
+            ).fetchall()
+        return [SessionIndexEntry(*row) for row in rows]
+
+    def count(self, status: str | None = None, goal_id: str | None = None) -> int:
+        """Count indexed sessions matching the filters."""
+        where, params = _filters(status, goal_id)
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM sessions{where}", params).fetchone()[0]
+
+
+def _row(session_id: str, state: SessionState) -> tuple[str, str, str, str, str, str]:
+    return (
+        session_id,
+        str(state.status),
+        state.goal_id,
+        state.entry_point,
+        state.timestamps.started_at,
+        state.timestamps.updated_at,
+    )
+
+
+def _filters(status: str | None, goal_id: str | None) -> tuple[str, tuple[str, ...]]:
+    clauses = []
+    params: list[str] = []
+    if status:
+        clauses.append("status = ?")
+        params.append(str(status))
+    if goal_id:
+        clauses.append("goal_id = ?")
+        params.append(goal_id)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, tuple(params)
+
+
+def _read_schema_version(path: Path) -> int:
+    try:
+        conn = sqlite3.connect(path)
+        try:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            conn.close()
+    except sqlite3.DatabaseError:
+        return -1
@@ -7,11 +7,14 @@
 
 import asyncio
 import logging
+import sqlite3
 import uuid
 from datetime import datetime
 from pathlib import Path
 
 from framework.schemas.session_state import SessionState
+from framework.storage.persistence import PersistencePipeline
+from framework.storage.session_index import SessionIndex, SessionIndexEntry
 from framework.utils.io import atomic_write
 
 logger = logging.getLogger(__name__)
@@ -30,17 +33,27 @@ class SessionStore:
             ├── summary.json
             ├── details.jsonl
             └── tool_logs.jsonl
+
+    Listings are served from a SQLite secondary index ({base_path}/session_index.db,
+    see SessionIndex) that write_state() and delete_session() keep current.
+
+    With a PersistencePipeline, writes run on the pipeline's threads and
+    repeated writes of the same state.json are coalesced; reads wait for
+    queued writes first, so callers always see their own writes.
     """
 
-    def __init__(self, base_path: Path):
+    def __init__(self, base_path: Path, persistence: PersistencePipeline | None = None):
         """
         Initialize session store.
 
         Args:
             base_path: Base path for storage (e.g., ~/.hive/agents/deep_research_agent)
+            persistence: Optional pipeline for coalesced background writes
         """
         self.base_path = Path(base_path)
         self.sessions_dir = self.base_path / "sessions"
+        self.index = SessionIndex(self.base_path)
+        self.persistence = persistence
 
     def generate_session_id(self) -> str:
         """
@@ -77,7 +90,7 @@ def get_state_path(self, session_id: str) -> Path:
         """
         return self.get_session_path(session_id) / "state.json"
 
-    async def write_state(self, session_id: str, state: SessionState) -> None:
+    async def write_state(self, session_id: str, state: SessionState, wait: bool = True) -> None:
         """
         Atomically write state.json for a session.
 
@@ -85,17 +98,28 @@ async def write_state(self, session_id: str, state: SessionState) -> None:
 
         Args:
             session_id: Session ID
-            state: SessionState to write
+            state: SessionState to write (not modified afterwards by the caller)
+            wait: Return only once the file is written. With a persistence
+                pipeline, wait=False queues the write and returns at once;
+                a newer write of the same session may replace it.
         """
+        state_path = self.get_state_path(session_id)
 
         def _write():
-            state_path = self.get_state_path(session_id)
             state_path.parent.mkdir(parents=True, exist_ok=True)
 
             with atomic_write(state_path) as f:
                 f.write(state.model_dump_json(indent=2))
 
-        await asyncio.to_thread(_write)
+            self._update_index(lambda: self.index.upsert(session_id, state))
+
+        if self.persistence is None:
+            await asyncio.to_thread(_write)
+        else:
+            future = self.persistence.submit(state_path, _write, urgent=wait)
+            if not wait:
+                return
+            await future
         logger.debug(f"Wrote state.json for session {session_id}")
 
     async def read_state(self, session_id: str) -> SessionState | None:
@@ -116,61 +140,194 @@ def _read():
 
             return SessionState.model_validate_json(state_path.read_text())
 
-        return await asyncio.to_thread(_read)
+        await self._settle(session_id)
+        return await self._run_io(_read)
 
     async def list_sessions(
         self,
         status: str | None = None,
         goal_id: str | None = None,
         limit: int = 100,
+        offset: int = 0,
     ) -> list[SessionState]:
         """
         List sessions, optionally filtered by status or goal.
 
+        Most recently updated first. Only the state.json files of the
+        returned page are read.
+
         Args:
             status: Optional status filter (e.g., "paused", "completed")
             goal_id: Optional goal ID filter
             limit: Maximum number of sessions to return
+            offset: Number of matching sessions to skip (for pagination)
 
         Returns:
             List of SessionState objects
         """
 
-        def _scan():
-            sessions = []
+        def _list():
+            try:
+                return self._list_from_index(status, goal_id, limit, offset)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Session index unavailable, scanning state files: {e}")
+                return self._scan_states(status, goal_id)[offset : offset + limit]
 
-            if not self.sessions_dir.exists():
-                return sessions
+        await self._settle()
+        return await self._run_io(_list)
 
-            for session_dir in self.sessions_dir.iterdir():
-                if not session_dir.is_dir():
-                    continue
+    async def list_session_entries(
+        self,
+        status: str | None = None,
+        goal_id: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        has_checkpoints: bool = False,
+    ) -> list[SessionIndexEntry]:
+        """
+        List index entries (id, status, goal, timestamps) without reading state.json.
 
-                state_path = session_dir / "state.json"
-                if not state_path.exists():
-                    continue
+        Args:
+            status: Optional status filter
+            goal_id: Optional goal ID filter
+            limit: Maximum number of entries to return
+            offset: Number of matching entries to skip
+            has_checkpoints: Only list sessions with at least one checkpoint;
+                ``limit`` and ``offset`` count matching sessions only
+
+        Returns:
+            List of SessionIndexEntry, most recently updated first
+        """
+        await self._settle()
+        if has_checkpoints:
+            return await self._run_io(
+                self._entries_with_checkpoints, status, goal_id, limit, offset
+            )
+        return await self._run_io(self.index.query, status, goal_id, limit, offset)
+
+    async def count_sessions(self, status: str | None = None, goal_id: str | None = None) -> int:
+        """Count sessions matching the filters, from the index."""
+        await self._settle()
+        return await self._run_io(self.index.count, status, goal_id)
+
+    async def rebuild_index(self) -> int:
+        """
+        Rebuild the session index from state.json files.
 
+        Returns:
+            Number of sessions indexed
+        """
+        await self._settle()
+        return await self._run_io(self.index.rebuild)
+
+    def _list_from_index(
+        self,
+        status: str | None,
+        goal_id: str | None,
+        limit: int,
+        offset: int,
+    ) -> list[SessionState]:
+        sessions: list[SessionState] = []
+        while len(sessions) < limit:
+            entries = self.index.query(status, goal_id, limit - len(sessions), offset)
+            if not entries:
+                break
+            for entry in entries:
+                state_path = self.get_state_path(entry.session_id)
                 try:
-                    state = SessionState.model_validate_json(state_path.read_text())
+                    sessions.append(SessionState.model_validate_json(state_path.read_text()))
+                    offset += 1
+                except FileNotFoundError:
+                    # Deleted behind the index's back; drop the stale row
+                    self.index.remove(entry.session_id)
+                except Exception as e:
+                    logger.warning(f"Failed to load {state_path}: {e}")
+                    offset += 1
+        return sessions
 
-                    # Apply filters
-                    if status and state.status != status:
-                        continue
+    def _entries_with_checkpoints(
+        self,
+        status: str | None,
+        goal_id: str | None,
+        limit: int,
+        offset: int,
+    ) -> list[SessionIndexEntry]:
+        # Checkpoints aren't indexed, so filter index pages before paging the result
+        entries: list[SessionIndexEntry] = []
+        scanned = 0
+        while len(entries) < limit:
+            page = self.index.query(status, goal_id, max(limit, 100), scanned)
+            if not page:
+                break
+            scanned += len(page)
+            for entry in page:
+                checkpoints_dir = self.get_session_path(entry.session_id) / "checkpoints"
+                if not any(checkpoints_dir.glob("cp_*.json")):
+                    continue
+                if offset:
+                    offset -= 1
+                    continue
+                entries.append(entry)
+                if len(entries) == limit:
+                    break
+        return entries
 
-                    if goal_id and state.goal_id != goal_id:
-                        continue
+    def _scan_states(self, status: str | None, goal_id: str | None) -> list[SessionState]:
+        """Parse every state.json. Fallback for when the index can't be used."""
+        sessions = []
 
-                    sessions.append(state)
+        if not self.sessions_dir.exists():
+            return sessions
 
-                except Exception as e:
-                    logger.warning(f"Failed to load {state_path}: {e}")
+        for session_dir in self.sessions_dir.iterdir():
+            if not session_dir.is_dir():
+                continue
+
+            state_path = session_dir / "state.json"
+            if not state_path.exists():
+                continue
+
+            try:
+                state = SessionState.model_validate_json(state_path.read_text())
+
+                # Apply filters
+                if status and state.status != status:
                     continue
 
-            # Sort by updated_at descending (most recent first)
-            sessions.sort(key=lambda s: s.timestamps.updated_at, reverse=True)
-            return sessions[:limit]
+                if goal_id and state.goal_id != goal_id:
+                    continue
 
-        return await asyncio.to_thread(_scan)
+                sessions.append(state)
+
+            except Exception as e:
+                logger.warning(f"Failed to load {state_path}: {e}")
+                continue
+
+        # Sort by updated_at descending (most recent first)
+        sessions.sort(key=lambda s: s.timestamps.updated_at, reverse=True)
+        return sessions
+
+    async def _settle(self, session_id: str | None = None) -> None:
+        """Wait for queued writes of one session (or all sessions) to land."""
+        if self.persistence is None:
+            return
+        if session_id is None:
+            await self.persistence.flush()
+        else:
+            await self.persistence.wait(self.get_state_path(session_id))
+
+    async def _run_io(self, fn, *args):
+        """Run blocking I/O on the pipeline's threads, or the default pool without one."""
+        if self.persistence is None:
+            return await asyncio.to_thread(fn, *args)
+        return await self.persistence.run(fn, *args)
+
+    def _update_index(self, update) -> None:
+        """Apply an index update; the index is derived data, so failures only warn."""
+        try:
+            update()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Failed to update session index (run `hive sessions reindex`): {e}")
 
     async def delete_session(self, session_id: str) -> bool:
         """
@@ -188,13 +345,16 @@ def _delete():
 
             session_path = self.get_session_path(session_id)
             if not session_path.exists():
+                self._update_index(lambda: self.index.remove(session_id))
                 return False
 
             shutil.rmtree(session_path)
+            self._update_index(lambda: self.index.remove(session_id))
             logger.info(f"Deleted session {session_id}")
             return True
 
-        return await asyncio.to_thread(_delete)
+        await self._settle(session_id)  # A queued write would recreate the session
+        return await self._run_io(_delete)
 
     async def session_exists(self, session_id: str) -> bool:
         """
@@ -210,4 +370,5 @@ async def session_exists(self, session_id: str) -> bool:
         def _check():
             return self.get_state_path(session_id).exists()
 
-        return await asyncio.to_thread(_check)
+        await self._settle(session_id)
+        return await self._run_io(_check)
@@ -513,25 +513,27 @@ async def _list_sessions(self, storage_path: Path) -> None:
             self._write_history("  Sessions will appear here after running the agent")
             return
 
-        session_dirs = sorted(
-            [d for d in sessions_dir.iterdir() if d.is_dir()],
-            key=lambda d: d.name,
-            reverse=True,  # Most recent first
-        )
+        # Most recently updated first, served from the session index
+        from framework.storage.session_store import SessionStore
+
+        session_store = SessionStore(storage_path)
+        total = await session_store.count_sessions()
+        entries = await session_store.list_session_entries(limit=10)  # Show last 10 sessions
 
-        if not session_dirs:
+        if not entries:
             self._write_history("[dim]No sessions found.[/dim]")
             return
 
-        self._write_history(f"[dim]Found {len(session_dirs)} session(s)[/dim]\n")
+        self._write_history(f"[dim]Found {total} session(s)[/dim]\n")
 
         # Reset the session index for numeric lookups
         self._session_index = []
 
         import json
 
-        for session_dir in session_dirs[:10]:  # Show last 10 sessions
-            session_id = session_dir.name
+        for entry in entries:
+            session_id = entry.session_id
+            session_dir = sessions_dir / session_id
             state_file = session_dir / "state.json"
 
             if not state_file.exists():
@@ -0,0 +1,184 @@
+"""Tests for delta-encoded checkpoints and the append-only checkpoint index."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from framework.graph.node import SharedMemory
+from framework.schemas.checkpoint import Checkpoint, CheckpointIndex
+from framework.storage.checkpoint_store import CheckpointStore
+
+
+def _checkpoint(i: int, memory: dict, node: str = "node") -> Checkpoint:
+    cp = Checkpoint.create(
+        checkpoint_type="node_complete",
+        session_id="session_1",
+        current_node=node,
+        execution_path=[node] * i,
+        shared_memory=memory,
+    )
+    return cp.model_copy(update={"checkpoint_id": f"cp_{i:03d}"})
+
+
+async def _save_run(store: CheckpointStore, steps: int) -> list[dict]:
+    """Save one checkpoint per step, rewriting one key each time like a node would."""
+    document = "x" * 10_000  # large value written once
+    memory = {"document": document, "counter": 0}
+    snapshots = []
+    for i in range(steps):
+        memory = dict(memory)
+        memory["counter"] = i
+        memory[f"step_{i}"] = f"result {i}"
+        if i == 3:
+            del memory["step_1"]
+        await store.save_checkpoint(_checkpoint(i, memory))
+        snapshots.append(memory)
+    return snapshots
+
+
+def _raw(store: CheckpointStore, checkpoint_id: str) -> dict:
+    return json.loads((store.checkpoints_dir / f"{checkpoint_id}.json").read_text())
+
+
+class TestDeltaCheckpoints:
+    @pytest.mark.asyncio
+    async def test_only_changed_keys_stored(self, tmp_path):
+        store = CheckpointStore(tmp_path, full_snapshot_every=4)
+        await _save_run(store, 6)
+
+        first, second, fourth = _raw(store, "cp_000"), _raw(store, "cp_001"), _raw(store, "cp_004")
+        assert not first["is_delta"] and "document" in first["shared_memory"]
+        assert second["is_delta"] and second["parent_checkpoint_id"] == "cp_000"
+        assert set(second["shared_memory"]) == {"counter", "step_1"}
+        assert _raw(store, "cp_003")["deleted_keys"] == ["step_1"]
+        # Periodic full snapshot bounds the chain length
+        assert not fourth["is_delta"] and "document" in fourth["shared_memory"]
+
+    @pytest.mark.asyncio
+    async def test_load_replays_chain(self, tmp_path):
+        store = CheckpointStore(tmp_path, full_snapshot_every=4)
+        snapshots = await _save_run(store, 7)
+
+        for i, expected in enumerate(snapshots):
+            loaded = await store.load_checkpoint(f"cp_{i:03d}")
+            assert loaded.shared_memory == expected
+            assert not loaded.is_delta
+
+        latest = await store.load_checkpoint()
+        assert latest.checkpoint_id == "cp_006"
+        raw = await store.load_checkpoint("cp_006", materialize=False)
+        assert raw.is_delta and "document" not in raw.shared_memory
+
+    @pytest.mark.asyncio
+    async def test_value_mutated_in_place_is_stored(self, tmp_path):
+        # SharedMemory.read returns live objects: read -> mutate -> write
+        # keeps the same object, which must still count as a change.
+        store = CheckpointStore(tmp_path, full_snapshot_every=10)
+        memory = SharedMemory()
+        memory.write("items", [1])
+        await store.save_checkpoint(_checkpoint(0, memory.read_all()))
+
+        items = memory.read("items")
+        items.append(2)
+        memory.write("items", items)
+        await store.save_checkpoint(_checkpoint(1, memory.read_all()))
+        items.append(3)  # Mutations after a save must not leak into it
+
+        assert _raw(store, "cp_001")["shared_memory"] == {"items": [1, 2]}
+        assert (await store.load_checkpoint("cp_000")).shared_memory == {"items": [1]}
+        assert (await store.load_checkpoint("cp_001")).shared_memory == {"items": [1, 2]}
+
+    @pytest.mark.asyncio
+    async def test_full_snapshot_every_one_disables_deltas(self, tmp_path):
+        store = CheckpointStore(tmp_path, full_snapshot_every=1)
+        await _save_run(store, 3)
+        assert not any(_raw(store, f"cp_{i:03d}")["is_delta"] for i in range(3))
+
+
+class TestCheckpointIndex:
+    @pytest.mark.asyncio
+    async def test_index_is_append_only_log(self, tmp_path):
+        store = CheckpointStore(tmp_path)
+        await _save_run(store, 5)
+
+        lines = store.index_path.read_text().splitlines()
+        assert len(lines) == 5
+        assert all(json.loads(line)["op"] == "add" for line in lines)
+
+        index = await store.load_index()
+        assert [cp.checkpoint_id for cp in index.checkpoints] == [f"cp_{i:03d}" for i in range(5)]
+        assert index.latest_checkpoint_id == "cp_004"
+        assert index.session_id == "session_1"
+
+    @pytest.mark.asyncio
+    async def test_torn_trailing_line_ignored(self, tmp_path):
+        store = CheckpointStore(tmp_path)
+        await _save_run(store, 2)
+        with open(store.index_path, "a") as f:
+            f.write('{"op": "add", "checkpo')
+
+        index = await store.load_index()
+        assert index.total_checkpoints == 2
+
+    @pytest.mark.asyncio
+    async def test_reads_legacy_index(self, tmp_path):
+        store = CheckpointStore(tmp_path, full_snapshot_every=1)
+        checkpoint = _checkpoint(0, {"a": 1})
+        store.checkpoints_dir.mkdir(parents=True)
+        store._write_checkpoint(checkpoint)
+        legacy = CheckpointIndex(session_id="session_1")
+        legacy.add_checkpoint(checkpoint)
+        (store.checkpoints_dir / "index.json").write_text(legacy.model_dump_json())
+
+        await store.save_checkpoint(_checkpoint(1, {"a": 2}))
+
+        index = await store.load_index()
+        assert [cp.checkpoint_id for cp in index.checkpoints] == ["cp_000", "cp_001"]
+        assert (await store.load_checkpoint("cp_000")).shared_memory == {"a": 1}
+
+
+class TestChainMaintenance:
+    @pytest.mark.asyncio
+    async def test_delete_folds_children(self, tmp_path):
+        store = CheckpointStore(tmp_path, full_snapshot_every=10)
+        snapshots = await _save_run(store, 5)
+
+        assert await store.delete_checkpoint("cp_000")
+        assert await store.delete_checkpoint("cp_002")
+
+        assert _raw(store, "cp_001")["is_delta"] is False
+        assert _raw(store, "cp_003")["parent_checkpoint_id"] == "cp_001"
+        for i in (1, 3, 4):
+            assert (await store.load_checkpoint(f"cp_{i:03d}")).shared_memory == snapshots[i]
+
+        index = await store.load_index()
+        assert [cp.checkpoint_id for cp in index.checkpoints] == ["cp_001", "cp_003", "cp_004"]
+
+    @pytest.mark.asyncio
+    async def test_prune_compacts_chains_and_index(self, tmp_path):
+        store = CheckpointStore(tmp_path, full_snapshot_every=10)
+        old = (datetime.now() - timedelta(days=30)).isoformat()
+        memory = {"document": "x" * 1000, "counter": 0}
+        snapshots = []
+        for i in range(6):
+            memory = {**memory, "counter": i}
+            cp = _checkpoint(i, memory)
+            if i < 3:
+                cp = cp.model_copy(update={"created_at": old})
+            await store.save_checkpoint(cp)
+            snapshots.append(memory)
+
+        assert await store.prune_checkpoints(max_age_days=7) == 3
+
+        assert not (store.checkpoints_dir / "cp_000.json").exists()
+        assert _raw(store, "cp_003")["is_delta"] is False
+        for i in (3, 4, 5):
+            assert (await store.load_checkpoint(f"cp_{i:03d}")).shared_memory == snapshots[i]
+        assert len(store.index_path.read_text().splitlines()) == 3
+
+        # The store keeps chaining after a prune
+        await store.save_checkpoint(_checkpoint(6, {**memory, "counter": 6}))
+        assert (await store.load_checkpoint("cp_006")).shared_memory["counter"] == 6
@@ -10,8 +10,12 @@
 - Memory conflict strategies
 - Per-branch retry
 - Single-edge paths unaffected
+- Bounded concurrency and priority launch order
+- Branch-local memory overlays and merge policies
+- Per-branch stats in ExecutionResult
 """
 
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
@@ -48,6 +52,18 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
         return NodeResult(success=False, error="branch failed")
 
 
+class SlowFailNode(FailNode):
+    """Fails after a delay, so sibling branches are already running."""
+
+    def __init__(self, delay: float = 0.02):
+        super().__init__()
+        self.delay = delay
+
+    async def execute(self, ctx: NodeContext) -> NodeResult:
+        await asyncio.sleep(self.delay)
+        return await super().execute(ctx)
+
+
 class FlakyNode(NodeProtocol):
     """Fails N times, then succeeds."""
 
@@ -77,6 +93,26 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
         )
 
 
+class SlowNode(NodeProtocol):
+    """Sleeps, tracking peak concurrency and start order, then writes its output."""
+
+    def __init__(self, label: str, tracker: dict, output: dict | None = None, delay: float = 0.02):
+        self.label = label
+        self.tracker = tracker
+        self.delay = delay
+        self._output = output or {f"{label}_done": True}
+        self.seen: dict = {}
+
+    async def execute(self, ctx: NodeContext) -> NodeResult:
+        self.tracker.setdefault("started", []).append(self.label)
+        self.tracker["active"] = self.tracker.get("active", 0) + 1
+        self.tracker["peak"] = max(self.tracker.get("peak", 0), self.tracker["active"])
+        await asyncio.sleep(self.delay)
+        self.seen = ctx.memory.read_all()
+        self.tracker["active"] -= 1
+        return NodeResult(success=True, output=self._output, tokens_used=3, latency_ms=7)
+
+
 # --- Fixtures ---
 
 
@@ -492,3 +528,184 @@ async def test_parallel_disabled_uses_sequential(runtime, goal):
     # Only one branch should have executed (sequential follows first edge)
     executed_count = sum([b1_impl.executed, b2_impl.executed])
     assert executed_count == 1
+
+
+# === 12. Bounded concurrency ===
+
+
+def _branches(count: int, node_type: str = "event_loop", extra_keys=()) -> list[NodeSpec]:
+    return [
+        NodeSpec(
+            id=f"b{i}",
+            name=f"B{i}",
+            description="branch",
+            node_type=node_type,
+            output_keys=[f"b{i}_done", *extra_keys],
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight_bounds_concurrency(runtime, goal):
+    """No more than max_in_flight branches should run at once."""
+    tracker: dict = {}
+    graph = _make_fanout_graph(_branches(6))
+
+    config = ParallelExecutionConfig(max_in_flight=2)
+    executor = GraphExecutor(runtime=runtime, parallel_config=config)
+    executor.register_node("source", SuccessNode({"data": "x"}))
+    for i in range(6):
+        executor.register_node(f"b{i}", SlowNode(f"b{i}", tracker))
+
+    result = await executor.execute(graph, goal, {})
+
+    assert result.success
+    assert len(tracker["started"]) == 6
+    assert tracker["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_priority_order_controls_launch_order(runtime, goal):
+    """Branches listed in priority_order launch first, in that order."""
+    tracker: dict = {}
+    graph = _make_fanout_graph(_branches(4))
+
+    config = ParallelExecutionConfig(max_in_flight=1, priority_order=["b3", "b1"])
+    executor = GraphExecutor(runtime=runtime, parallel_config=config)
+    executor.register_node("source", SuccessNode({"data": "x"}))
+    for i in range(4):
+        executor.register_node(f"b{i}", SlowNode(f"b{i}", tracker, delay=0))
+
+    await executor.execute(graph, goal, {})
+
+    assert tracker["started"] == ["b3", "b1", "b0", "b2"]
+
+
+@pytest.mark.asyncio
+async def test_fail_all_stops_launching_after_first_failure(runtime, goal):
+    """Under fail_all no worker launches another branch once one has failed."""
+    tracker: dict = {}
+    branches = _branches(4)
+    branches[0] = branches[0].model_copy(update={"max_retries": 1})
+    graph = _make_fanout_graph(branches)
+
+    config = ParallelExecutionConfig(max_in_flight=2, on_branch_failure="fail_all")
+    executor = GraphExecutor(runtime=runtime, parallel_config=config)
+    executor.register_node("source", SuccessNode({"data": "x"}))
+    executor.register_node("b0", SlowFailNode())
+    for i in range(1, 4):
+        executor.register_node(f"b{i}", SlowNode(f"b{i}", tracker, delay=0.1))
+
+    result = await executor.execute(graph, goal, {})
+
+    assert not result.success
+    # b1 was already running alongside b0; b2 and b3 never start
+    assert tracker["started"] == ["b1"]
+
+
+# === 13. Branch memory isolation and merge policies ===
+
+
+def _merge_graph(count: int, shared: bool = False) -> GraphSpec:
+    """Diamond graph; with *shared*, branches are non-event_loop nodes writing a common key."""
+    merge = NodeSpec(
+        id="merge",
+        name="Merge",
+        description="fan-in",
+        node_type="event_loop",
+        input_keys=["shared"] + [f"b{i}_done" for i in range(count)],
+        output_keys=["merged"],
+    )
+    branches = (
+        _branches(count, node_type="function", extra_keys=["shared"])
+        if shared
+        else _branches(count)
+    )
+    return _make_fanout_graph(branches, fan_in_node=merge)
+
+
+@pytest.mark.asyncio
+async def test_branch_writes_isolated_until_fan_in(runtime, goal):
+    """Branches don't see each other's writes; the fan-in node sees all of them."""
+    tracker: dict = {}
+    graph = _merge_graph(2)
+
+    executor = GraphExecutor(runtime=runtime)
+    executor.register_node("source", SuccessNode({"data": "x"}))
+    fast = SlowNode("b0", tracker, delay=0)
+    slow = SlowNode("b1", tracker, delay=0.05)
+    merge_impl = SlowNode("merge", tracker, output={"merged": True}, delay=0)
+    executor.register_node("b0", fast)
+    executor.register_node("b1", slow)
+    executor.register_node("merge", merge_impl)
+
+    result = await executor.execute(graph, goal, {})
+
+    assert result.success
+    assert "b0_done" not in slow.seen
+    assert merge_impl.seen["b0_done"] and merge_impl.seen["b1_done"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("strategy", "expected"),
+    [("last_wins", "slow"), ("first_wins", "fast"), ("priority", "slow")],
+)
+async def test_memory_conflict_strategies(runtime, goal, strategy, expected):
+    """Conflicting branch writes are resolved by memory_conflict_strategy."""
+    graph = _merge_graph(2, shared=True)
+
+    config = ParallelExecutionConfig(memory_conflict_strategy=strategy, priority_order=["b1", "b0"])
+    executor = GraphExecutor(runtime=runtime, parallel_config=config)
+    executor.register_node("source", SuccessNode({"data": "x"}))
+    executor.register_node("b0", SlowNode("b0", {}, {"shared": "fast"}, delay=0))
+    executor.register_node("b1", SlowNode("b1", {}, {"shared": "slow"}, delay=0.05))
+    merge_impl = SlowNode("merge", {}, output={"merged": True}, delay=0)
+    executor.register_node("merge", merge_impl)
+
+    result = await executor.execute(graph, goal, {})
+
+    assert result.success
+    assert merge_impl.seen["shared"] == expected
+
+
+@pytest.mark.asyncio
+async def test_memory_conflict_error_strategy(runtime, goal):
+    """The "error" strategy fails the run on conflicting branch writes."""
+    graph = _merge_graph(2, shared=True)
+
+    config = ParallelExecutionConfig(memory_conflict_strategy="error")
+    executor = GraphExecutor(runtime=runtime, parallel_config=config)
+    executor.register_node("source", SuccessNode({"data": "x"}))
+    executor.register_node("b0", SlowNode("b0", {}, {"shared": "a"}, delay=0))
+    executor.register_node("b1", SlowNode("b1", {}, {"shared": "b"}, delay=0))
+    executor.register_node("merge", SuccessNode({"merged": True}))
+
+    result = await executor.execute(graph, goal, {})
+
+    assert not result.success
+    assert "memory conflict" in result.error.lower()
+
+
+# === 14. Per-branch stats ===
+
+
+@pytest.mark.asyncio
+async def test_branch_stats_in_execution_result(runtime, goal):
+    """ExecutionResult.branch_stats reports tokens, latency and queueing per branch."""
+    graph = _make_fanout_graph(_branches(3))
+
+    config = ParallelExecutionConfig(max_in_flight=1)
+    executor = GraphExecutor(runtime=runtime, parallel_config=config)
+    executor.register_node("source", SuccessNode({"data": "x"}))
+    for i in range(3):
+        executor.register_node(f"b{i}", SlowNode(f"b{i}", {}))
+
+    result = await executor.execute(graph, goal, {})
+
+    stats = result.branch_stats
+    assert set(stats) == {"source_to_b0", "source_to_b1", "source_to_b2"}
+    assert all(s["tokens_used"] == 3 and s["status"] == "completed" for s in stats.values())
+    assert all(s["wall_ms"] >= 15 for s in stats.values())
+    assert max(s["queued_ms"] for s in stats.values()) >= 30
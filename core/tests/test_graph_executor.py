@@ -241,3 +241,59 @@ async def test_executor_no_events_without_event_bus():
     result = await executor.execute(graph=graph, goal=goal)
 
     assert result.success is True
+
+
+# ---- Fake node that persists WIP outputs, then crashes ----
+class CrashingAccumulatorNode:
+    def __init__(self, store):
+        self.store = store
+
+    def validate_input(self, ctx):
+        return []
+
+    async def execute(self, ctx):
+        await self.store.write_cursor({"next_seq": 1, "outputs": {"draft": "half done"}})
+        raise RuntimeError("crashed mid-node")
+
+
+@pytest.mark.asyncio
+async def test_executor_failure_flushes_wip_outputs_from_segmented_store(tmp_path):
+    from framework.storage.segmented_conversation_store import SegmentedConversationStore
+
+    graph = GraphSpec(
+        id="graph-wip",
+        goal_id="g-wip",
+        nodes=[
+            NodeSpec(
+                id="n1",
+                name="node1",
+                description="crashing node",
+                node_type="event_loop",
+                input_keys=[],
+                output_keys=["draft"],
+                max_retries=0,
+            )
+        ],
+        edges=[],
+        entry_node="n1",
+    )
+    # Segmented layout: the cursor lives in segments/, there is no cursor.json
+    store = SegmentedConversationStore(tmp_path / "conversations" / "n1")
+    executor = GraphExecutor(
+        runtime=DummyRuntime(),
+        node_registry={"n1": CrashingAccumulatorNode(store)},
+        storage_path=tmp_path,
+    )
+
+    goal = Goal(id="g-wip", name="wip-test", description="wip flush")
+    result = await executor.execute(graph=graph, goal=goal)
+    await store.close()
+
+    assert result.success is False
+    assert not (tmp_path / "conversations" / "n1" / "cursor.json").exists()
+    assert result.session_state["memory"]["draft"] == "half done"
+    # The flush read through the executor's store for n1, which is closed again
+    flushed = executor._conversation_stores["n1"]
+    assert flushed._active_fh is None
+    # Node construction and continuous-mode switches get that same instance
+    assert executor._open_conversation_store("n1") is flushed
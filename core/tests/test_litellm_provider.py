@@ -215,6 +215,47 @@ def tool_executor(tool_use: ToolUse) -> ToolResult:
         assert result.output_tokens == 25  # 15 + 10
         assert mock_completion.call_count == 2
 
+    @patch("litellm.completion")
+    def test_complete_with_tools_runs_async_tool_executor(self, mock_completion):
+        """A coroutine returned by the tool executor is run, not used as the result."""
+        tool_call_response = MagicMock()
+        tool_call_response.choices = [MagicMock()]
+        tool_call_response.choices[0].message.content = None
+        tool_call_response.choices[0].message.tool_calls = [MagicMock()]
+        tool_call_response.choices[0].message.tool_calls[0].id = "call_123"
+        tool_call_response.choices[0].message.tool_calls[0].function.name = "get_weather"
+        tool_call_response.choices[0].message.tool_calls[0].function.arguments = "{}"
+        tool_call_response.choices[0].finish_reason = "tool_calls"
+        tool_call_response.model = "gpt-4o-mini"
+        tool_call_response.usage.prompt_tokens = 10
+        tool_call_response.usage.completion_tokens = 5
+
+        final_response = MagicMock()
+        final_response.choices = [MagicMock()]
+        final_response.choices[0].message.content = "Sunny."
+        final_response.choices[0].message.tool_calls = None
+        final_response.choices[0].finish_reason = "stop"
+        final_response.model = "gpt-4o-mini"
+        final_response.usage.prompt_tokens = 5
+        final_response.usage.completion_tokens = 5
+
+        mock_completion.side_effect = [tool_call_response, final_response]
+        provider = LiteLLMProvider(model="gpt-4o-mini", api_key="test-key")
+
+        async def tool_executor(tool_use: ToolUse) -> ToolResult:
+            return ToolResult(tool_use_id=tool_use.id, content="Sunny, 22C")
+
+        result = provider.complete_with_tools(
+            messages=[{"role": "user", "content": "Weather?"}],
+            system="",
+            tools=[Tool(name="get_weather", description="Get the weather", parameters={})],
+            tool_executor=tool_executor,
+        )
+
+        assert result.content == "Sunny."
+        tool_message = mock_completion.call_args_list[1][1]["messages"][-1]
+        assert tool_message["content"] == "Sunny, 22C"
+
     @patch("litellm.completion")
     def test_complete_with_tools_invalid_json_arguments_are_handled(self, mock_completion):
         """Test that invalid JSON tool arguments do not execute the tool."""
@@ -297,6 +338,103 @@ def test_tool_to_openai_format(self):
         assert result["function"]["parameters"]["required"] == ["query"]
 
 
+def _mock_response(content: str = "ok", usage: MagicMock | None = None) -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    response.choices[0].finish_reason = "stop"
+    response.model = "claude-3-haiku-20240307"
+    response.usage = usage or MagicMock(prompt_tokens=100, completion_tokens=5)
+    return response
+
+
+SEARCH_TOOLS = [
+    Tool(name="search", description="Search", parameters={"properties": {}}),
+    Tool(name="fetch", description="Fetch", parameters={"properties": {}}),
+]
+
+
+class TestPromptCaching:
+    """Test prompt-cache breakpoints, tool schema memoization and cache usage."""
+
+    def test_cache_mode_detection(self):
+        assert LiteLLMProvider(model="claude-3-haiku-20240307").prompt_cache_mode == "anthropic"
+        assert LiteLLMProvider(model="gpt-4o-mini").prompt_cache_mode == "automatic"
+        assert LiteLLMProvider(model="ollama/llama3").prompt_cache_mode is None
+        disabled = LiteLLMProvider(model="claude-3-haiku-20240307", prompt_caching=False)
+        assert disabled.prompt_cache_mode is None
+
+    @patch("litellm.completion")
+    def test_anthropic_breakpoints(self, mock_completion):
+        mock_completion.return_value = _mock_response()
+        provider = LiteLLMProvider(model="claude-3-haiku-20240307", api_key="test-key")
+        history = [
+            {"role": "user", "content": "summary of earlier turns"},
+            {"role": "assistant", "content": "ok"},
+            {"role": "user", "content": "next"},
+        ]
+
+        provider.complete(messages=history, system="You are helpful.", tools=SEARCH_TOOLS)
+
+        call_kwargs = mock_completion.call_args[1]
+        marked = [i for i, m in enumerate(call_kwargs["messages"]) if "cache_control" in m]
+        assert marked == [0, 1, 3]  # system, first history message, latest message
+        assert call_kwargs["messages"][0]["content"] == "You are helpful."
+        assert "cache_control" in call_kwargs["tools"][-1]
+        assert "cache_control" not in call_kwargs["tools"][0]
+        # Caller's dicts are untouched
+        assert all("cache_control" not in m for m in history)
+
+    @patch("litellm.completion")
+    def test_no_breakpoints_for_automatic_providers(self, mock_completion):
+        mock_completion.return_value = _mock_response()
+        provider = LiteLLMProvider(model="gpt-4o-mini", api_key="test-key")
+
+        provider.complete(
+            messages=[{"role": "user", "content": "hi"}], system="sys", tools=SEARCH_TOOLS
+        )
+
+        call_kwargs = mock_completion.call_args[1]
+        assert all("cache_control" not in m for m in call_kwargs["messages"])
+        assert all("cache_control" not in t for t in call_kwargs["tools"])
+
+    def test_tool_schemas_memoized_per_tool_set(self):
+        provider = LiteLLMProvider(model="gpt-4o-mini", api_key="test-key")
+        with patch.object(
+            provider, "_tool_to_openai_format", wraps=provider._tool_to_openai_format
+        ) as convert:
+            first = provider._convert_tools(SEARCH_TOOLS)
+            second = provider._convert_tools(SEARCH_TOOLS)
+            assert convert.call_count == 2
+            assert first == second
+
+            provider._convert_tools(SEARCH_TOOLS[:1])
+            assert convert.call_count == 3
+
+    @patch("litellm.completion")
+    def test_cache_usage_reported(self, mock_completion):
+        anthropic_usage = MagicMock(
+            prompt_tokens=100,
+            completion_tokens=5,
+            cache_read_input_tokens=80,
+            cache_creation_input_tokens=15,
+        )
+        mock_completion.return_value = _mock_response(usage=anthropic_usage)
+        provider = LiteLLMProvider(model="claude-3-haiku-20240307", api_key="test-key")
+
+        result = provider.complete(messages=[{"role": "user", "content": "hi"}])
+        assert (result.cache_read_tokens, result.cache_creation_tokens) == (80, 15)
+
+        openai_usage = MagicMock(prompt_tokens=100, completion_tokens=5)
+        openai_usage.cache_read_input_tokens = None
+        openai_usage.cache_creation_input_tokens = None
+        openai_usage.prompt_tokens_details.cached_tokens = 64
+        mock_completion.return_value = _mock_response(usage=openai_usage)
+
+        result = provider.complete(messages=[{"role": "user", "content": "hi"}])
+        assert (result.cache_read_tokens, result.cache_creation_tokens) == (64, 0)
+
+
 class TestAnthropicProviderBackwardCompatibility:
     """Test AnthropicProvider backward compatibility with LiteLLM backend."""
 
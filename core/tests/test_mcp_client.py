@@ -0,0 +1,176 @@
+"""Tests for MCPClient's async API, STDIO process pool and HTTP request ids."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import textwrap
+import time
+from functools import partial
+
+import httpx
+import pytest
+
+from framework.llm.provider import ToolUse
+from framework.runner import mcp_client as mcp_client_module
+from framework.runner.mcp_client import MCPClient, MCPServerConfig
+from framework.runner.tool_registry import ToolRegistry
+
+pytest.importorskip("mcp.server.fastmcp")
+
+SERVER_SOURCE = textwrap.dedent(
+    """
+    import asyncio
+    import os
+
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("test")
+
+
+    @mcp.tool()
+    async def slow_echo(text: str, delay: float = 0.0) -> str:
+        await asyncio.sleep(delay)
+        return text
+
+
+    @mcp.tool()
+    def pid() -> str:
+        return str(os.getpid())
+
+
+    if __name__ == "__main__":
+        mcp.run("stdio")
+    """
+)
+
+
+@pytest.fixture
+def stdio_config(tmp_path):
+    script = tmp_path / "server.py"
+    script.write_text(SERVER_SOURCE)
+
+    def make(**kwargs) -> MCPServerConfig:
+        return MCPServerConfig(
+            name="test", transport="stdio", command=sys.executable, args=[str(script)], **kwargs
+        )
+
+    return make
+
+
+class TestStdioClient:
+    def test_sync_api(self, stdio_config):
+        with MCPClient(stdio_config()) as client:
+            assert {t.name for t in client.list_tools()} == {"slow_echo", "pid"}
+            assert client.call_tool("slow_echo", {"text": "hi"}) == "hi"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_async_calls_share_session(self, stdio_config):
+        async with MCPClient(stdio_config()) as client:
+            assert {t.name for t in await client.alist_tools()} == {"slow_echo", "pid"}
+
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(client.acall_tool("slow_echo", {"text": str(i), "delay": 0.5}) for i in range(8))
+            )
+            elapsed = time.perf_counter() - start
+
+        assert results == [str(i) for i in range(8)]
+        assert elapsed < 2.0  # overlapped, not 8 x 0.5s
+
+    @pytest.mark.asyncio
+    async def test_process_pool_spreads_calls(self, stdio_config):
+        async with MCPClient(stdio_config(pool_size=2)) as client:
+            pids = await asyncio.gather(*(client.acall_tool("pid", {}) for _ in range(6)))
+        assert len(set(pids)) == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self, stdio_config):
+        async with MCPClient(stdio_config()) as client:
+            with pytest.raises(ValueError):
+                await client.acall_tool("missing", {})
+
+
+class TestHttpClient:
+    @pytest.mark.asyncio
+    async def test_unique_request_ids(self, monkeypatch):
+        seen_ids: list[int] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/health":
+                return httpx.Response(200)
+            body = json.loads(request.content)
+            seen_ids.append(body["id"])
+            if body["method"] == "tools/list":
+                result = {"tools": [{"name": "echo", "inputSchema": {}}]}
+            else:
+                await asyncio.sleep(0.05)
+                text = body["params"]["arguments"]["text"]
+                result = {"content": [{"type": "text", "text": text}]}
+            return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": result})
+
+        monkeypatch.setattr(
+            mcp_client_module.httpx,
+            "AsyncClient",
+            partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+        )
+        config = MCPServerConfig(name="remote", transport="http", url="http://mcp.test")
+        async with MCPClient(config) as client:
+            results = await asyncio.gather(
+                *(client.acall_tool("echo", {"text": str(i)}) for i in range(5))
+            )
+
+        assert [r[0]["text"] for r in results] == [str(i) for i in range(5)]
+        assert len(seen_ids) == len(set(seen_ids)) == 6
+
+
+class TestRegistryWiring:
+    @pytest.mark.asyncio
+    async def test_mcp_tools_registered_as_async_executors(self, stdio_config):
+        config = stdio_config()
+        registry = ToolRegistry()
+        try:
+            count = await asyncio.to_thread(
+                registry.register_mcp_server,
+                {
+                    "name": config.name,
+                    "transport": "stdio",
+                    "command": config.command,
+                    "args": config.args,
+                },
+            )
+            assert count == 2
+
+            executor = registry.get_executor()
+            pending = [
+                executor(ToolUse(id=f"c{i}", name="slow_echo", input={"text": "x", "delay": 0.5}))
+                for i in range(4)
+            ]
+            assert all(asyncio.iscoroutine(p) for p in pending)
+
+            start = time.perf_counter()
+            results = await asyncio.gather(*pending)
+            assert time.perf_counter() - start < 1.5
+            assert [r.content for r in results] == ["x"] * 4
+        finally:
+            await asyncio.to_thread(registry.cleanup)
+
+    def test_sync_executor_outside_event_loop(self, stdio_config):
+        config = stdio_config()
+        registry = ToolRegistry()
+        try:
+            registry.register_mcp_server(
+                {
+                    "name": config.name,
+                    "transport": "stdio",
+                    "command": config.command,
+                    "args": config.args,
+                }
+            )
+            result = registry.get_executor()(
+                ToolUse(id="c1", name="slow_echo", input={"text": "sync"})
+            )
+            assert result.content == "sync"
+        finally:
+            registry.cleanup()
@@ -365,6 +365,97 @@ async def test_export_summary_output_keys(self):
         assert "output_keys" not in conv2.export_summary()
 
 
+# ===================================================================
+# Incremental token accounting and cached LLM messages
+# ===================================================================
+
+
+def _full_rebuild(conv: NodeConversation) -> list[dict[str, Any]]:
+    msgs = [m.to_llm_dict() for m in conv.messages]
+    return NodeConversation._repair_orphaned_tool_calls(msgs)
+
+
+class TestIncrementalAccounting:
+    @pytest.mark.asyncio
+    async def test_totals_track_add_prune_compact_clear(self):
+        conv = NodeConversation()
+        for i in range(6):
+            await conv.add_user_message(f"question {i}")
+            await conv.add_assistant_message("", tool_calls=[{"id": f"c{i}", "type": "function"}])
+            await conv.add_tool_result(f"c{i}", "r" * 4000)
+            expected = sum(len(m.content) for m in conv.messages) // 4
+            assert conv.estimate_tokens() == expected
+            assert conv.to_llm_messages() == _full_rebuild(conv)
+
+        assert await conv.prune_old_tool_results(protect_tokens=1000, min_prune_tokens=100) > 0
+        assert conv.estimate_tokens() == sum(len(m.content) for m in conv.messages) // 4
+        assert conv.to_llm_messages() == _full_rebuild(conv)
+
+        await conv.compact("summary", keep_recent=3)
+        assert conv.estimate_tokens() == sum(len(m.content) for m in conv.messages) // 4
+        assert conv.turn_count == sum(1 for m in conv.messages if m.role == "user")
+        assert conv.to_llm_messages() == _full_rebuild(conv)
+
+        await conv.clear()
+        assert conv.estimate_tokens() == 0
+        assert conv.turn_count == 0
+        assert conv.to_llm_messages() == []
+
+    @pytest.mark.asyncio
+    async def test_token_counter_memoized_per_message(self):
+        calls: list[str] = []
+
+        def counter(text: str) -> int:
+            calls.append(text)
+            return len(text.split())
+
+        conv = NodeConversation(token_counter=counter)
+        await conv.add_user_message("one two three")
+        await conv.add_assistant_message("four five")
+        for _ in range(10):
+            assert conv.estimate_tokens() == 5
+            conv.needs_compaction()
+        assert len(calls) == 2
+
+        await conv.compact("six", keep_recent=1)
+        assert conv.estimate_tokens() == 3  # "six" + "four five"
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_orphans_repaired_in_sealed_and_trailing_blocks(self):
+        conv = NodeConversation()
+        await conv.add_user_message("go")
+        await conv.add_assistant_message("", tool_calls=[{"id": "a"}, {"id": "b"}])
+        await conv.add_tool_result("a", "ok")
+        await conv.add_user_message("interrupted")  # seals block with "b" orphaned
+        await conv.add_assistant_message("", tool_calls=[{"id": "c"}])
+
+        msgs = conv.to_llm_messages()
+        # Patches are placed directly after their assistant message
+        assert [m.get("tool_call_id") for m in msgs if m["role"] == "tool"] == ["b", "a", "c"]
+        assert msgs == _full_rebuild(conv)
+        assert msgs[-1]["content"] == "ERROR: Tool execution was interrupted."
+
+        # The trailing patch disappears once the real result arrives
+        await conv.add_tool_result("c", "done")
+        msgs = conv.to_llm_messages()
+        assert msgs[-1] == {"role": "tool", "tool_call_id": "c", "content": "done"}
+        assert msgs == _full_rebuild(conv)
+
+    @pytest.mark.asyncio
+    async def test_restore_recomputes_totals(self):
+        store = MockConversationStore()
+        conv = NodeConversation(store=store)
+        await conv.add_user_message("a" * 400)
+        await conv.add_assistant_message("b" * 40)
+
+        restored = await NodeConversation.restore(store)
+        assert restored is not None
+        assert restored.estimate_tokens() == 110
+        assert restored.turn_count == 1
+        assert restored.to_llm_messages() == conv.to_llm_messages()
+
+
 # ===================================================================
 # Output-key extraction
 # ===================================================================
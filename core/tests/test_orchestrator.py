@@ -5,11 +5,21 @@
     pytest tests/test_orchestrator.py -v
 """
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import pytest
+
 from framework.llm.litellm import LiteLLMProvider
 from framework.llm.provider import LLMProvider
+from framework.runner import orchestrator as orchestrator_module
 from framework.runner.orchestrator import AgentOrchestrator
+from framework.runner.protocol import (
+    AgentMessage,
+    CapabilityLevel,
+    CapabilityResponse,
+    MessageType,
+)
 
 # Patch config helpers so tests don't depend on local ~/.hive/configuration.json
 _CONFIG_PATCHES = {
@@ -103,3 +113,119 @@ def test_llm_implements_llm_provider_interface(self):
         assert isinstance(orchestrator._llm, LLMProvider)
         assert hasattr(orchestrator._llm, "complete")
         assert hasattr(orchestrator._llm, "complete_with_tools")
+
+
+class FakeRunner:
+    """Runner stand-in that counts capability probes."""
+
+    def __init__(self, name: str, description: str, level=CapabilityLevel.CAN_HANDLE, conf=0.9):
+        self.name = name
+        self.description = description
+        self.level = level
+        self.confidence = conf
+        self.probes = 0
+
+    def info(self):
+        return SimpleNamespace(
+            name=self.name,
+            description=self.description,
+            goal_name="",
+            goal_description="",
+            nodes=[],
+        )
+
+    async def can_handle(self, request, llm=None):
+        self.probes += 1
+        return CapabilityResponse(self.name, self.level, self.confidence, "fake")
+
+    async def receive_message(self, message):
+        return AgentMessage(
+            type=MessageType.RESPONSE, from_agent=self.name, content={"handled": self.name}
+        )
+
+    def cleanup(self):
+        pass
+
+
+def _orchestrator(**kwargs) -> tuple[AgentOrchestrator, dict[str, FakeRunner]]:
+    orchestrator = AgentOrchestrator(llm=Mock(spec=LLMProvider), **kwargs)
+    runners = {
+        "billing": FakeRunner("billing", "Resolve billing disputes, refunds and invoices"),
+        "shipping": FakeRunner("shipping", "Track shipments and delivery delays"),
+        "sales": FakeRunner("sales", "Outbound sales prospecting and lead research"),
+    }
+    for i in range(7):
+        runners[f"other{i}"] = FakeRunner(f"other{i}", f"Unrelated workflow number {i}")
+    for name, runner in runners.items():
+        orchestrator.register_runner(name, runner)
+    return orchestrator, runners
+
+
+class TestRoutingCache:
+    """Test routing pre-filtering and the routing decision cache."""
+
+    @pytest.mark.asyncio
+    async def test_prefilter_probes_only_matching_agents(self):
+        orchestrator, runners = _orchestrator()
+
+        result = await orchestrator.dispatch({"customer_id": "123"}, intent="refund an invoice")
+
+        assert result.handled_by == ["billing"]
+        assert runners["billing"].probes == 1
+        assert sum(r.probes for r in runners.values()) == 1
+        assert orchestrator.get_routing_stats()["probes_skipped"] == 9
+
+    @pytest.mark.asyncio
+    async def test_same_intent_served_from_cache(self):
+        orchestrator, runners = _orchestrator()
+
+        await orchestrator.dispatch({"customer_id": "123"}, intent="Refund an invoice")
+        result = await orchestrator.dispatch({"customer_id": "456"}, intent="invoice refund!")
+
+        assert result.handled_by == ["billing"]
+        assert runners["billing"].probes == 1
+        stats = orchestrator.get_routing_stats()
+        assert stats["cache_hits"] == 1 and stats["cache_misses"] == 1
+        assert stats["hit_rate"] == 0.5 and stats["cache_size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_entries_expire(self, monkeypatch):
+        orchestrator, runners = _orchestrator(routing_cache_ttl=10)
+        now = [1000.0]
+        monkeypatch.setattr(orchestrator_module.time, "monotonic", lambda: now[0])
+
+        await orchestrator.dispatch({}, intent="track delivery delays")
+        now[0] += 11
+        await orchestrator.dispatch({}, intent="track delivery delays")
+
+        assert runners["shipping"].probes == 2
+        assert orchestrator.get_routing_stats()["cache_expired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_low_confidence_decisions_not_cached(self):
+        orchestrator, runners = _orchestrator(routing_cache_min_confidence=0.95)
+
+        await orchestrator.dispatch({}, intent="lead research")
+        await orchestrator.dispatch({}, intent="lead research")
+
+        assert runners["sales"].probes == 2
+        assert orchestrator.get_routing_stats()["low_confidence_not_cached"] == 2
+
+    @pytest.mark.asyncio
+    async def test_register_clears_cache(self):
+        orchestrator, runners = _orchestrator()
+        await orchestrator.dispatch({}, intent="refund an invoice")
+
+        orchestrator.register_runner("refunds", FakeRunner("refunds", "Refund processing"))
+
+        assert orchestrator.get_routing_stats()["cache_size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_no_overlap_probes_top_priority_agents(self):
+        orchestrator, runners = _orchestrator(max_probe_agents=2)
+        orchestrator.register_runner("vip", FakeRunner("vip", "Concierge"), priority=5)
+
+        await orchestrator.dispatch({}, intent="xyzzy plugh")
+
+        assert runners["billing"].probes + runners["shipping"].probes == 1
+        assert orchestrator.get_routing_stats()["capability_probes"] == 2
@@ -0,0 +1,159 @@
+"""Tests for the coalescing persistence pipeline and its SessionStore integration."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from framework.schemas.session_state import SessionState, SessionStatus, SessionTimestamps
+from framework.storage.persistence import PersistencePipeline
+from framework.storage.session_store import SessionStore
+
+
+def _recorder(log: list, name: str, delay: float = 0.0):
+    def fn():
+        if delay:
+            time.sleep(delay)
+        log.append(name)
+
+    return fn
+
+
+def _state(session_id: str, status: SessionStatus) -> SessionState:
+    now = "2026-01-01T00:00:00"
+    return SessionState(
+        session_id=session_id,
+        goal_id="g1",
+        status=status,
+        timestamps=SessionTimestamps(started_at=now, updated_at=now),
+    )
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio
+    async def test_last_write_wins(self):
+        pipeline = PersistencePipeline(window_ms=20)
+        log: list[str] = []
+
+        futures = [pipeline.submit("state.json", _recorder(log, f"w{i}")) for i in range(3)]
+        await asyncio.gather(*futures)
+
+        assert log == ["w2"]
+        stats = pipeline.get_stats()
+        assert stats["submitted"] == 3
+        assert stats["coalesced"] == 2
+        assert stats["completed"] == 1
+        assert stats["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_patches_only_replace_same_patch(self):
+        pipeline = PersistencePipeline(window_ms=20)
+        log: list[str] = []
+
+        pipeline.submit("state.json", _recorder(log, "initial"))
+        pipeline.submit("state.json", _recorder(log, "progress1"), patch="progress")
+        pipeline.submit("state.json", _recorder(log, "progress2"), patch="progress")
+        pipeline.submit("other.json", _recorder(log, "other"))
+        await pipeline.flush()
+
+        assert sorted(log) == ["initial", "other", "progress2"]
+        assert log.index("initial") < log.index("progress2")
+
+        # A full rewrite supersedes queued patches
+        log.clear()
+        pipeline.submit("state.json", _recorder(log, "progress3"), patch="progress")
+        pipeline.submit("state.json", _recorder(log, "final"))
+        await pipeline.flush()
+        assert log == ["final"]
+
+    @pytest.mark.asyncio
+    async def test_writes_to_one_file_never_overlap(self):
+        pipeline = PersistencePipeline(window_ms=0)
+        log: list[str] = []
+
+        first = pipeline.submit("state.json", _recorder(log, "slow", delay=0.05))
+        await asyncio.sleep(0.01)  # "slow" is now running
+        second = pipeline.submit("state.json", _recorder(log, "newer"))
+        await asyncio.gather(first, second)
+
+        assert log == ["slow", "newer"]
+
+
+class TestBounds:
+    @pytest.mark.asyncio
+    async def test_thread_usage_bounded(self):
+        pipeline = PersistencePipeline(max_workers=2, window_ms=0)
+        lock = threading.Lock()
+        active = peak = 0
+
+        def write():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+
+        futures = [pipeline.submit(f"session_{i}/state.json", write) for i in range(10)]
+        await asyncio.gather(*futures, pipeline.run(write))
+
+        assert peak <= 2
+        await pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_skips_window(self):
+        pipeline = PersistencePipeline(window_ms=10_000)
+        log: list[str] = []
+
+        pipeline.submit("state.json", _recorder(log, "queued"))
+        assert pipeline.queue_depth == 1
+
+        start = time.perf_counter()
+        await pipeline.flush()
+
+        assert log == ["queued"]
+        assert time.perf_counter() - start < 5
+        assert pipeline.get_stats()["flushes"] == 1
+        assert pipeline.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_write_reported(self):
+        pipeline = PersistencePipeline(window_ms=0)
+
+        def fail():
+            raise OSError("disk full")
+
+        future = pipeline.submit("state.json", fail)
+        with pytest.raises(OSError, match="disk full"):
+            await future
+        assert pipeline.get_stats()["failed"] == 1
+
+
+class TestSessionStoreWithPipeline:
+    @pytest.mark.asyncio
+    async def test_reads_see_queued_writes(self, tmp_path):
+        store = SessionStore(tmp_path, persistence=PersistencePipeline(window_ms=10_000))
+
+        await store.write_state("s1", _state("s1", SessionStatus.ACTIVE), wait=False)
+        await store.write_state("s1", _state("s1", SessionStatus.COMPLETED), wait=False)
+        assert not store.get_state_path("s1").exists()
+
+        state = await store.read_state("s1")
+        assert state.status == SessionStatus.COMPLETED
+        assert await store.count_sessions(status="completed") == 1
+        assert store.persistence.get_stats()["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_waits_for_queued_write(self, tmp_path):
+        store = SessionStore(tmp_path, persistence=PersistencePipeline(window_ms=10_000))
+
+        await store.write_state("s1", _state("s1", SessionStatus.ACTIVE), wait=False)
+        assert await store.delete_session("s1")
+        await store.persistence.flush()
+
+        assert not store.get_session_path("s1").exists()
+        assert await store.read_state("s1") is None
@@ -0,0 +1,185 @@
+"""Tests for the run analytics store and the aggregates served from it."""
+
+from __future__ import annotations
+
+import multiprocessing
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from framework.builder.query import BuilderQuery
+from framework.runtime.runtime_log_store import RuntimeLogStore
+from framework.runtime.runtime_logger import RuntimeLogger
+from framework.schemas.decision import Decision, Option, Outcome
+from framework.schemas.run import Run, RunStatus
+from framework.storage.backend import FileStorage
+from framework.storage.run_analytics import RunAnalytics, fcntl
+
+
+def _decision(node_id: str, success: bool | None, error: str | None = None, **kw) -> Decision:
+    outcome = None
+    if success is not None:
+        outcome = Outcome(
+            success=success, error=error, latency_ms=kw.get("latency", 10), tokens_used=5
+        )
+    return Decision(
+        id=f"d_{node_id}_{kw.get('n', 0)}",
+        node_id=node_id,
+        intent=kw.get("intent", "Find contacts"),
+        options=[Option(id="a", description="Search", action_type="tool_call")],
+        chosen_option_id="a",
+        outcome=outcome,
+    )
+
+
+def _run(run_id: str, status: RunStatus, decisions: list[Decision], goal_id="g1") -> Run:
+    return Run(id=run_id, goal_id=goal_id, status=status, decisions=decisions)
+
+
+def _record_and_rebuild(base_path: Path, worker: int) -> None:
+    """Process worker: interleave writes with rebuilds that swap the store file."""
+    analytics = RunAnalytics(base_path)
+    for i in range(8):
+        analytics.record_run(_run(f"w{worker}_r{i}", RunStatus.COMPLETED, [_decision("a", True)]))
+        if i % 3 == 0:
+            analytics.rebuild()
+
+
+def _save(storage: FileStorage, run: Run) -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        storage.save_run(run)
+
+
+async def _log_run(store: RuntimeLogStore, session_id: str, goal_id: str, failed: bool) -> None:
+    rt_logger = RuntimeLogger(store=store, agent_id="agent")
+    rt_logger.start_run(goal_id, session_id=session_id)
+    for i in range(10):
+        rt_logger.log_step(
+            node_id="search",
+            node_type="event_loop",
+            step_index=i,
+            tool_calls=[
+                {"tool_name": "web_search", "latency_ms": (i + 1) * 100},
+                {"tool_name": "set_output", "latency_ms": 0, "is_error": i == 0},
+            ],
+            input_tokens=100,
+            output_tokens=10,
+        )
+    rt_logger.log_node_complete("search", "Search", "event_loop", success=True, latency_ms=50)
+    rt_logger.log_node_complete("write", "Write", "event_loop", success=not failed, latency_ms=20)
+    await rt_logger.end_run("failure" if failed else "success", duration_ms=100)
+
+
+class TestBuilderAggregates:
+    def test_find_patterns_from_legacy_run_files(self, tmp_path: Path):
+        runs_dir = tmp_path / "runs"
+        runs_dir.mkdir()
+        runs = [
+            _run("r1", RunStatus.COMPLETED, [_decision("a", True), _decision("b", True)]),
+            _run("r2", RunStatus.FAILED, [_decision("a", True), _decision("b", False, "Timeout")]),
+            _run("r3", RunStatus.FAILED, [_decision("b", False, "Timeout"), _decision("c", None)]),
+            _run("r4", RunStatus.COMPLETED, [_decision("b", False, "")], goal_id="other"),
+        ]
+        for run in runs:
+            (runs_dir / f"{run.id}.json").write_text(run.model_dump_json())
+
+        patterns = BuilderQuery(tmp_path).find_patterns("g1")
+
+        assert patterns.run_count == 3
+        assert patterns.success_rate == pytest.approx(1 / 3)
+        assert patterns.common_failures == [("Timeout", 2)]
+        assert patterns.problematic_nodes == [("c", 1.0), ("b", 2 / 3)]
+        assert patterns.decision_patterns == {
+            "decision_type_distribution": {"custom": 6},
+            "common_choices": {
+                "Find contacts": {"choice": "Search", "count": 6, "alternatives": 0}
+            },
+        }
+        assert BuilderQuery(tmp_path).find_patterns("missing") is None
+
+    def test_saved_runs_recorded_and_replaced(self, tmp_path: Path):
+        storage = FileStorage(tmp_path)
+        _save(storage, _run("r1", RunStatus.RUNNING, [_decision("a", True, latency=30)]))
+        _save(
+            storage,
+            _run("r1", RunStatus.FAILED, [_decision("a", True, latency=30), _decision("a", False)]),
+        )
+
+        query = BuilderQuery(tmp_path)
+        assert query.get_node_performance("a") == {
+            "node_id": "a",
+            "total_decisions": 2,
+            "success_rate": 0.5,
+            "avg_latency_ms": 20.0,
+            "total_tokens": 10,
+            "decision_type_distribution": {"custom": 2},
+        }
+        suggestions = query.suggest_improvements("g1")
+        assert {s["type"] for s in suggestions} == {"node_improvement", "architecture"}
+
+    def test_instances_sharing_a_store_do_not_lose_facts(self, tmp_path: Path):
+        # A runtime opens the store twice (runtime logs and FileStorage); both
+        # may hit first use at once, and only one may build the file.
+        runs = [_run(f"r{i}", RunStatus.COMPLETED, [_decision("a", True)]) for i in range(16)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda run: RunAnalytics(tmp_path).record_run(run), runs))
+
+        assert BuilderQuery(tmp_path).find_patterns("g1").run_count == 16
+
+    @pytest.mark.skipif(fcntl is None, reason="cross-process locking needs fcntl")
+    def test_processes_rebuilding_a_store_do_not_lose_facts(self, tmp_path: Path):
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=4, mp_context=context) as pool:
+            list(pool.map(_record_and_rebuild, [tmp_path] * 4, range(4)))
+
+        assert BuilderQuery(tmp_path).find_patterns("g1").run_count == 32
+
+    def test_rebuild_keeps_saved_decision_facts(self, tmp_path: Path):
+        storage = FileStorage(tmp_path)
+        _save(storage, _run("r1", RunStatus.COMPLETED, [_decision("a", True)]))
+
+        RunAnalytics(tmp_path).rebuild()
+
+        assert BuilderQuery(tmp_path).find_patterns("g1").run_count == 1
+
+
+class TestRuntimeLogAggregates:
+    @pytest.mark.asyncio
+    async def test_end_run_feeds_node_tool_and_goal_stats(self, tmp_path: Path):
+        store = RuntimeLogStore(tmp_path / "runtime_logs")
+        await _log_run(store, "session_1", "goal-a", failed=False)
+        await _log_run(store, "session_2", "goal-a", failed=True)
+        await _log_run(store, "session_3", "goal-b", failed=True)
+
+        analytics = RunAnalytics(tmp_path)
+        nodes = {n["node_id"]: n for n in analytics.node_stats()}
+        assert nodes["write"]["executions"] == 3
+        assert nodes["write"]["failure_rate"] == pytest.approx(2 / 3)
+        assert nodes["search"]["failures"] == 0
+
+        tools = analytics.tool_stats()
+        assert tools[0]["tool_name"] == "web_search"
+        assert tools[0]["calls"] == 30
+        assert tools[0]["p95_latency_ms"] == 1000
+        assert tools[0]["avg_latency_ms"] == pytest.approx(550)
+        assert tools[1]["error_rate"] == pytest.approx(0.1)
+
+        goals = analytics.goal_stats()
+        assert [g["goal_id"] for g in goals] == ["goal-a", "goal-b"]
+        assert goals[0]["runs"] == 2 and goals[0]["failure_rate"] == 0.5
+        assert goals[0]["input_tokens"] == 0  # Node details carried no token counts
+        assert analytics.node_stats(goal_id="goal-b")[0]["executions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rebuild_from_log_files(self, tmp_path: Path):
+        store = RuntimeLogStore(tmp_path / "runtime_logs")
+        await _log_run(store, "session_1", "goal-a", failed=False)
+        (tmp_path / "run_analytics.db").unlink()
+
+        analytics = RunAnalytics(tmp_path)
+
+        assert analytics.goal_stats()[0]["runs"] == 1
+        assert analytics.tool_stats()[0]["calls"] == 10
@@ -0,0 +1,39 @@
+"""Smoke tests for the runtime benchmark harness (benchmarks/runtime_throughput.py).
+
+Runs every scenario for a handful of executions so the scripted provider,
+the scenario graphs and the metrics stay in step with the runtime.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.runtime_throughput import compare, run_scenario
+from benchmarks.scenarios import SCENARIOS
+
+# LLM calls per execution implied by each scenario's scripts
+EXPECTED_TURNS = {"linear": 8, "fanout": 13, "feedback": 17, "hitl": 9}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+async def test_scenario_runs_to_completion(name: str, tmp_path: Path):
+    metrics = await run_scenario(SCENARIOS[name](), tmp_path, executions=3, concurrency=3)
+
+    assert metrics["failures"] == 0
+    assert metrics["llm_calls_per_execution"] == EXPECTED_TURNS[name]
+    assert metrics["events_per_execution"] > 0
+    assert metrics["file_writes_per_execution"] > 0
+    assert metrics["files_per_execution"] > 0
+    assert metrics["turn_p99_ms"] >= metrics["turn_p50_ms"] > 0
+
+
+def test_compare_flags_regressions_only():
+    baseline = {"linear": {"events_per_execution": 50, "executions_per_sec": 100}}
+    ok = {"linear": {"failures": 0, "events_per_execution": 55, "executions_per_sec": 90}}
+    worse = {"linear": {"failures": 1, "events_per_execution": 70, "executions_per_sec": 50}}
+
+    assert compare(ok, baseline, tolerance=0.2) == []
+    problems = compare(worse, baseline, tolerance=0.2)
+    assert len(problems) == 3
+    assert any("executions failed" in p for p in problems)
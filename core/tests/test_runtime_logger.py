@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 
@@ -331,6 +332,28 @@ async def test_log_step_writes_to_disk_immediately(self, tmp_path: Path):
         assert data["node_id"] == "node-1"
         assert data["input_tokens"] == 100
 
+    @pytest.mark.asyncio
+    async def test_log_step_counts_tool_cache_hits(self, tmp_path: Path):
+        store = RuntimeLogStore(tmp_path / "logs")
+        rl = RuntimeLogger(store=store, agent_id="test-agent")
+        run_id = rl.start_run("goal-1")
+
+        rl.log_step(
+            node_id="node-1",
+            node_type="event_loop",
+            step_index=0,
+            tool_calls=[
+                {"tool_name": "maps_geocode", "cache_status": "hit"},
+                {"tool_name": "maps_geocode", "cache_status": "miss"},
+                {"tool_name": "web_search"},
+            ],
+        )
+
+        jsonl_path = tmp_path / "logs" / "runs" / run_id / "tool_logs.jsonl"
+        data = json.loads(jsonl_path.read_text().strip())
+        assert (data["cache_hits"], data["cache_misses"]) == (1, 1)
+        assert [c["cache_status"] for c in data["tool_calls"]] == ["hit", "miss", ""]
+
     @pytest.mark.asyncio
     async def test_log_node_complete_writes_to_disk_immediately(self, tmp_path: Path):
         store = RuntimeLogStore(tmp_path / "logs")
@@ -1049,3 +1072,88 @@ async def test_guard_failure_exit_status(self, tmp_path: Path):
         node = loaded.nodes[0]
         assert node.exit_status == "guard_failure"
         assert node.success is False
+
+
+# ---------------------------------------------------------------------------
+# Buffered writer tests
+# ---------------------------------------------------------------------------
+
+
+class TestBufferedRuntimeLogStore:
+    def _log_steps(self, rt_logger: RuntimeLogger, count: int) -> None:
+        for i in range(count):
+            rt_logger.log_step(node_id="node-1", node_type="event_loop", step_index=i)
+
+    @pytest.mark.asyncio
+    async def test_lines_batched_until_interval(self, tmp_path: Path):
+        store = RuntimeLogStore(tmp_path / "logs", buffered=True, flush_interval=60)
+        rt_logger = RuntimeLogger(store=store, agent_id="test-agent")
+        run_id = rt_logger.start_run("goal-1")
+        self._log_steps(rt_logger, 3)
+
+        jsonl_path = tmp_path / "logs" / "runs" / run_id / "tool_logs.jsonl"
+        assert not jsonl_path.exists()
+
+        # Reads flush pending lines first
+        tool_logs = await store.load_tool_logs(run_id)
+        assert [s.step_index for s in tool_logs.steps] == [0, 1, 2]
+        assert store.get_writer_stats()["batches_written"] == 1
+        store.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_size_triggers_write(self, tmp_path: Path):
+        store = RuntimeLogStore(
+            tmp_path / "logs", buffered=True, flush_interval=60, max_batch_lines=2
+        )
+        rt_logger = RuntimeLogger(store=store, agent_id="test-agent")
+        run_id = rt_logger.start_run("goal-1")
+        self._log_steps(rt_logger, 2)
+
+        jsonl_path = tmp_path / "logs" / "runs" / run_id / "tool_logs.jsonl"
+        for _ in range(200):
+            if jsonl_path.exists() and jsonl_path.read_text().count("\n") == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert jsonl_path.read_text().count("\n") == 2
+        store.close()
+
+    @pytest.mark.asyncio
+    async def test_end_run_flushes_and_releases_handles(self, tmp_path: Path):
+        store = RuntimeLogStore(tmp_path / "logs", buffered=True, flush_interval=60)
+        rt_logger = RuntimeLogger(store=store, agent_id="test-agent")
+        run_id = rt_logger.start_run("goal-1")
+        self._log_steps(rt_logger, 2)
+        rt_logger.log_node_complete(
+            node_id="node-1", node_name="Search", node_type="event_loop", success=True
+        )
+
+        await rt_logger.end_run("success", duration_ms=10)
+
+        summary = await store.load_summary(run_id)
+        assert summary.total_nodes_executed == 1
+        run_dir = tmp_path / "logs" / "runs" / run_id
+        assert (run_dir / "tool_logs.jsonl").read_text().count("\n") == 2
+        assert store.get_writer_stats()["open_files"] == 0
+        store.close()
+
+    @pytest.mark.asyncio
+    async def test_close_drains_queue(self, tmp_path: Path):
+        store = RuntimeLogStore(
+            tmp_path / "logs", buffered=True, flush_interval=60, durability="line"
+        )
+        rt_logger = RuntimeLogger(store=store, agent_id="test-agent")
+        run_id = rt_logger.start_run("goal-1")
+        self._log_steps(rt_logger, 5)
+        store.close()
+
+        jsonl_path = tmp_path / "logs" / "runs" / run_id / "tool_logs.jsonl"
+        assert jsonl_path.read_text().count("\n") == 5
+        assert not store.buffered
+
+        # Appends after close fall back to synchronous writes
+        self._log_steps(rt_logger, 1)
+        assert jsonl_path.read_text().count("\n") == 6
+
+    def test_unknown_durability_rejected(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            RuntimeLogStore(tmp_path / "logs", buffered=True, durability="sometimes")
@@ -0,0 +1,125 @@
+"""Tests for compiled safe_eval expressions and edge-condition validation."""
+
+import pytest
+
+from framework.graph.edge import EdgeCondition, EdgeSpec, GraphSpec
+from framework.graph.node import NodeSpec
+from framework.graph.safe_eval import (
+    compile_expression,
+    safe_eval,
+    safe_eval_uncompiled as _visit,
+    validate_expression,
+)
+
+CONTEXT = {
+    "output": {"result": "ok", "score": 0.8, "items": [1, 2, 3]},
+    "score": 7,
+    "name": "Hive",
+    "flag": "True",
+    "needs_more_research": True,
+    "len": "shadowed",  # builtins win over context names
+}
+
+EXPRESSIONS = [
+    "score > 5",
+    "1 < score < 10",
+    "1 < score > 10",
+    "score == 7 and name == 'Hive'",
+    "score > 100 or not needs_more_research",
+    "needs_more_research == True",
+    "str(flag).lower() == 'true'",
+    "output.get('result') == 'ok'",
+    "output['items'][1] + score * 2 - 1",
+    "len(output['items']) >= 3",
+    "max([1, score, 3]) if score else min(1, 2)",
+    "{'a': score, 'b': [name, (1, 2)]}",
+    "name.upper().split('I')",
+    "round(output['score'] * 10) in [8, 9]",
+    "-score ** 2 // 3 % 5",
+    "score is not None",
+    "all([score, name]) and any([0, ''])",
+    "list(output.keys())",
+    "int('3') + float('1.5') + abs(-1)",
+]
+
+
+class TestCompiledMatchesVisitor:
+    @pytest.mark.parametrize("expr", EXPRESSIONS)
+    def test_same_result(self, expr):
+        assert compile_expression(expr)(CONTEXT) == _visit(expr, CONTEXT)
+
+    @pytest.mark.parametrize(
+        ("expr", "error", "message"),
+        [
+            ("undefined_var > 1", NameError, "Name 'undefined_var' is not defined"),
+            ("name.__class__", ValueError, "private attribute '__class__'"),
+            ("name.nope", AttributeError, "Object has no attribute 'nope'"),
+            ("name.zfill(5)", ValueError, "Call to function/method is not allowed"),
+            ("__import__('os')", NameError, "Name '__import__' is not defined"),
+            ("[x for x in output]", ValueError, "Use of ListComp is not allowed"),
+            ("lambda: 1", ValueError, "Use of Lambda is not allowed"),
+            ("score @ score", ValueError, "Operator MatMult is not allowed"),
+            ("output['missing']", KeyError, "missing"),
+        ],
+    )
+    def test_same_errors(self, expr, error, message):
+        with pytest.raises(error, match=message):
+            _visit(expr, CONTEXT)
+        with pytest.raises(error, match=message):
+            compile_expression(expr)(CONTEXT)
+
+    def test_disallowed_branch_not_taken_still_evaluates(self):
+        """Rejections fire at evaluation time, exactly where the visitor raises."""
+        expr = "score if score > 0 else name.zfill(3)"
+        assert compile_expression(expr)(CONTEXT) == _visit(expr, CONTEXT) == 7
+        assert compile_expression(expr).errors == []
+
+    def test_syntax_error(self):
+        with pytest.raises(SyntaxError, match="Invalid syntax in expression"):
+            safe_eval("score >")
+
+
+class TestCompileCache:
+    def test_compiled_once_per_string(self):
+        assert compile_expression("score > 1") is compile_expression("score > 1")
+
+    def test_names_lists_context_variables(self):
+        compiled = compile_expression("len(output['items']) > score and str(x).lower()")
+        assert compiled.names == frozenset({"output", "score", "x"})
+
+    def test_validate_expression(self):
+        assert validate_expression("score > 1") == []
+        assert validate_expression("[x for x in y]") == ["Use of ListComp is not allowed"]
+        assert "Invalid syntax" in validate_expression("score >")[0]
+
+
+class TestGraphValidation:
+    def _graph(self, expr: str) -> GraphSpec:
+        return GraphSpec(
+            id="g",
+            goal_id="goal",
+            entry_node="a",
+            terminal_nodes=["b"],
+            nodes=[
+                NodeSpec(id="a", name="A", description="a"),
+                NodeSpec(id="b", name="B", description="b"),
+            ],
+            edges=[
+                EdgeSpec(
+                    id="a_to_b",
+                    source="a",
+                    target="b",
+                    condition=EdgeCondition.CONDITIONAL,
+                    condition_expr=expr,
+                )
+            ],
+        )
+
+    def test_valid_condition(self):
+        errors = self._graph("needs_more_research == True").validate()
+        assert not any("invalid condition" in e for e in errors)
+
+    @pytest.mark.parametrize("expr", ["score >", "output.__dict__", "[x for x in y]"])
+    def test_invalid_condition_reported(self, expr):
+        errors = self._graph(expr).validate()
+        assert any(e.startswith("Edge 'a_to_b' has invalid condition") for e in errors)
@@ -0,0 +1,229 @@
+"""Tests for SegmentedConversationStore and file-per-part migration."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from framework.graph.conversation import ConversationStore, NodeConversation
+from framework.storage.conversation_store import FileConversationStore, open_conversation_store
+from framework.storage.segmented_conversation_store import (
+    SegmentedConversationStore,
+    migrate_conversation_tree,
+    migrate_file_conversation_store,
+)
+
+
+def _segment_files(base):
+    return sorted((base / "segments").glob("*.jsonl"))
+
+
+class TestSegmentedConversationStore:
+    @pytest.mark.asyncio
+    async def test_satisfies_protocol(self, tmp_path):
+        assert isinstance(SegmentedConversationStore(tmp_path / "conv"), ConversationStore)
+
+    @pytest.mark.asyncio
+    async def test_meta_and_cursor_crud(self, tmp_path):
+        store = SegmentedConversationStore(tmp_path / "conv")
+        assert await store.read_meta() is None
+        assert await store.read_cursor() is None
+        await store.write_meta({"system_prompt": "hi"})
+        await store.write_cursor({"next_seq": 5})
+        assert await store.read_meta() == {"system_prompt": "hi"}
+        assert await store.read_cursor() == {"next_seq": 5}
+
+    @pytest.mark.asyncio
+    async def test_parts_ordered_and_last_write_wins(self, tmp_path):
+        store = SegmentedConversationStore(tmp_path / "conv")
+        await store.write_part(2, {"seq": 2, "v": "b"})
+        await store.write_part(0, {"seq": 0, "v": "a"})
+        await store.write_part(2, {"seq": 2, "v": "c"})
+        parts = await store.read_parts()
+        assert [(p["seq"], p["v"]) for p in parts] == [(0, "a"), (2, "c")]
+
+    @pytest.mark.asyncio
+    async def test_read_parts_range(self, tmp_path):
+        store = SegmentedConversationStore(tmp_path / "conv", max_segment_bytes=64)
+        for i in range(10):
+            await store.write_part(i, {"seq": i})
+        parts = await store.read_parts_range(3, 6)
+        assert [p["seq"] for p in parts] == [3, 4, 5]
+        tail = await store.read_parts_range(8)
+        assert [p["seq"] for p in tail] == [8, 9]
+
+    @pytest.mark.asyncio
+    async def test_reopen_replays_log(self, tmp_path):
+        base = tmp_path / "conv"
+        store = SegmentedConversationStore(base, max_segment_bytes=64)
+        for i in range(6):
+            await store.write_part(i, {"seq": i})
+        await store.write_cursor({"next_seq": 6})
+        await store.close()
+
+        reopened = SegmentedConversationStore(base)
+        assert [p["seq"] for p in await reopened.read_parts()] == list(range(6))
+        assert await reopened.read_cursor() == {"next_seq": 6}
+        # Sealed segments get an offset index sidecar
+        assert list((base / "segments").glob("*.idx"))
+
+    @pytest.mark.asyncio
+    async def test_part_written_after_tombstone_survives_reopen(self, tmp_path):
+        """Compaction deletes before N, then writes the summary at N-1."""
+        base = tmp_path / "conv"
+        store = SegmentedConversationStore(base)
+        for i in range(5):
+            await store.write_part(i, {"seq": i})
+        await store.delete_parts_before(4)
+        await store.write_part(3, {"seq": 3, "summary": True})
+        await store.close()
+
+        parts = await SegmentedConversationStore(base).read_parts()
+        assert [p["seq"] for p in parts] == [3, 4]
+        assert parts[0]["summary"] is True
+
+    @pytest.mark.asyncio
+    async def test_delete_drops_whole_segments(self, tmp_path):
+        base = tmp_path / "conv"
+        store = SegmentedConversationStore(base, max_segment_bytes=64)
+        await store.write_cursor({"next_seq": 0})
+        for i in range(20):
+            await store.write_part(i, {"seq": i, "pad": "x" * 20})
+        before = len(_segment_files(base))
+        await store.delete_parts_before(18)
+        assert len(_segment_files(base)) < before
+        assert [p["seq"] for p in await store.read_parts()] == [18, 19]
+        await store.close()
+
+        reopened = SegmentedConversationStore(base)
+        assert [p["seq"] for p in await reopened.read_parts()] == [18, 19]
+        assert await reopened.read_cursor() == {"next_seq": 0}
+
+    @pytest.mark.asyncio
+    async def test_torn_tail_is_repaired(self, tmp_path):
+        base = tmp_path / "conv"
+        store = SegmentedConversationStore(base)
+        await store.write_part(0, {"seq": 0})
+        await store.write_part(1, {"seq": 1})
+        await store.close()
+        (base / "segments" / "00000000.idx").unlink()
+        with open(_segment_files(base)[-1], "ab") as f:
+            f.write(b'{"t":"p","seq":2,"d":{"se')
+
+        reopened = SegmentedConversationStore(base)
+        assert [p["seq"] for p in await reopened.read_parts()] == [0, 1]
+        await reopened.write_part(2, {"seq": 2})
+        assert [p["seq"] for p in await reopened.read_parts()] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_two_instances_on_one_directory(self, tmp_path):
+        base = tmp_path / "conv"
+        a = SegmentedConversationStore(base, max_segment_bytes=300)
+        b = SegmentedConversationStore(base, max_segment_bytes=300)
+        for i in range(10):
+            writer = a if i % 2 == 0 else b
+            await writer.write_part(i, {"seq": i, "pad": "x" * 40})
+            await (b if writer is a else a).write_cursor({"next_seq": i + 1})
+        await a.delete_parts_before(8)
+
+        assert [p["seq"] for p in await b.read_parts()] == [8, 9]
+        assert await b.read_cursor() == {"next_seq": 10}
+        await a.close()
+        await b.close()
+
+        fresh = SegmentedConversationStore(base)
+        assert [p["seq"] for p in await fresh.read_parts()] == [8, 9]
+        assert await fresh.read_cursor() == {"next_seq": 10}
+        stems = {p.stem for p in _segment_files(base)}
+        assert {p.stem for p in (base / "segments").glob("*.idx")} <= stems
+
+    @pytest.mark.asyncio
+    async def test_node_conversation_round_trip_with_compaction(self, tmp_path):
+        base = tmp_path / "conv"
+        conv = NodeConversation(system_prompt="sys", store=SegmentedConversationStore(base))
+        for i in range(6):
+            await conv.add_user_message(f"u{i}")
+        await conv.compact("summary", keep_recent=2)
+        await conv.add_assistant_message("after")
+
+        restored = await NodeConversation.restore(SegmentedConversationStore(base))
+        assert restored is not None
+        assert restored.system_prompt == "sys"
+        assert [m.content for m in restored.messages] == ["summary", "u4", "u5", "after"]
+        assert restored.next_seq == conv.next_seq
+
+    @pytest.mark.asyncio
+    async def test_destroy(self, tmp_path):
+        base = tmp_path / "conv"
+        store = SegmentedConversationStore(base)
+        await store.write_part(0, {"seq": 0})
+        await store.destroy()
+        assert not base.exists()
+
+
+class TestMigration:
+    @pytest.mark.asyncio
+    async def test_migrate_file_store(self, tmp_path):
+        base = tmp_path / "conv"
+        conv = NodeConversation(system_prompt="sys", store=FileConversationStore(base))
+        for i in range(4):
+            await conv.add_user_message(f"u{i}")
+
+        assert migrate_file_conversation_store(base) == 4
+        assert not (base / "parts").exists()
+        assert not (base / "cursor.json").exists()
+        assert json.loads((base / "meta.json").read_text())["system_prompt"] == "sys"
+
+        store = open_conversation_store(base)
+        assert isinstance(store, SegmentedConversationStore)
+        restored = await NodeConversation.restore(store)
+        assert [m.content for m in restored.messages] == ["u0", "u1", "u2", "u3"]
+        assert restored.next_seq == 4
+
+        # Already migrated: no-op
+        assert migrate_file_conversation_store(base) == 0
+
+    @pytest.mark.asyncio
+    async def test_unreadable_part_aborts_migration(self, tmp_path):
+        base = tmp_path / "conv"
+        conv = NodeConversation(system_prompt="sys", store=FileConversationStore(base))
+        for i in range(4):
+            await conv.add_user_message(f"u{i}")
+        broken = base / "parts" / "0000000001.json"
+        broken.write_text("{broken", encoding="utf-8")
+
+        assert migrate_file_conversation_store(base) == 0
+        assert broken.read_text(encoding="utf-8") == "{broken"
+        assert len(list((base / "parts").glob("*.json"))) == 4
+        assert (base / "cursor.json").exists()
+        assert not (base / "segments").exists()
+        assert not (base / ".segments-migration").exists()
+        assert isinstance(open_conversation_store(base), FileConversationStore)
+
+    @pytest.mark.asyncio
+    async def test_migrate_tree(self, tmp_path):
+        for node in ("a", "b"):
+            store = FileConversationStore(tmp_path / "session_1" / "conversations" / node)
+            await store.write_meta({"system_prompt": node})
+            await store.write_part(0, {"seq": 0, "role": "user", "content": node})
+
+        migrated = migrate_conversation_tree(tmp_path)
+        assert sorted(migrated.values()) == [1, 1]
+        assert not list(tmp_path.rglob("parts"))
+
+
+class TestOpenConversationStore:
+    def test_new_directory_uses_requested_backend(self, tmp_path):
+        assert isinstance(open_conversation_store(tmp_path / "a"), FileConversationStore)
+        assert isinstance(
+            open_conversation_store(tmp_path / "b", "segmented"), SegmentedConversationStore
+        )
+        with pytest.raises(ValueError):
+            open_conversation_store(tmp_path / "c", "sqlite")
+
+    @pytest.mark.asyncio
+    async def test_existing_layout_wins(self, tmp_path):
+        base = tmp_path / "conv"
+        await FileConversationStore(base).write_part(0, {"seq": 0})
+        assert isinstance(open_conversation_store(base, "segmented"), FileConversationStore)
@@ -0,0 +1,134 @@
+"""Tests for SessionStore listings served from the SQLite session index."""
+
+from __future__ import annotations
+
+import shutil
+from unittest.mock import MagicMock
+
+import pytest
+
+from framework.graph.executor import GraphExecutor
+from framework.graph.node import SharedMemory
+from framework.schemas.session_state import SessionState, SessionStatus, SessionTimestamps
+from framework.storage.session_index import INDEX_FILENAME
+from framework.storage.session_store import SessionStore
+
+
+def _state(session_id: str, status: SessionStatus, updated_at: str, goal_id: str = "g1"):
+    return SessionState(
+        session_id=session_id,
+        goal_id=goal_id,
+        status=status,
+        timestamps=SessionTimestamps(started_at=updated_at, updated_at=updated_at),
+    )
+
+
+async def _populate(store: SessionStore, count: int = 6) -> None:
+    for i in range(count):
+        status = SessionStatus.COMPLETED if i % 2 else SessionStatus.PAUSED
+        goal = "g1" if i < 3 else "g2"
+        await store.write_state(
+            f"session_{i}", _state(f"session_{i}", status, f"2026-01-0{i + 1}T00:00:00", goal)
+        )
+
+
+class TestSessionStoreIndex:
+    @pytest.mark.asyncio
+    async def test_list_most_recent_first_with_filters(self, tmp_path):
+        store = SessionStore(tmp_path)
+        await _populate(store)
+
+        ids = [s.session_id for s in await store.list_sessions()]
+        assert ids == [f"session_{i}" for i in range(5, -1, -1)]
+
+        paused = await store.list_sessions(status="paused")
+        assert [s.session_id for s in paused] == ["session_4", "session_2", "session_0"]
+
+        g2_completed = await store.list_sessions(status="completed", goal_id="g2")
+        assert [s.session_id for s in g2_completed] == ["session_5", "session_3"]
+        assert await store.count_sessions(goal_id="g1") == 3
+
+    @pytest.mark.asyncio
+    async def test_pagination(self, tmp_path):
+        store = SessionStore(tmp_path)
+        await _populate(store)
+
+        page1 = await store.list_session_entries(limit=4)
+        page2 = await store.list_session_entries(limit=4, offset=4)
+        assert [e.session_id for e in page1 + page2] == [f"session_{i}" for i in range(5, -1, -1)]
+        assert [s.session_id for s in await store.list_sessions(limit=2, offset=1)] == [
+            "session_4",
+            "session_3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rewrite_updates_row(self, tmp_path):
+        store = SessionStore(tmp_path)
+        await _populate(store, 2)
+        await store.write_state(
+            "session_0", _state("session_0", SessionStatus.FAILED, "2026-02-01T00:00:00")
+        )
+
+        entries = await store.list_session_entries()
+        assert entries[0].session_id == "session_0"
+        assert entries[0].status == "failed"
+        assert len(entries) == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_row(self, tmp_path):
+        store = SessionStore(tmp_path)
+        await _populate(store, 3)
+        assert await store.delete_session("session_1") is True
+        assert [e.session_id for e in await store.list_session_entries()] == [
+            "session_2",
+            "session_0",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stale_row_for_externally_deleted_session_is_dropped(self, tmp_path):
+        store = SessionStore(tmp_path)
+        await _populate(store, 3)
+        shutil.rmtree(store.get_session_path("session_2"))
+
+        ids = [s.session_id for s in await store.list_sessions(limit=2)]
+        assert ids == ["session_1", "session_0"]
+        assert await store.count_sessions() == 2
+
+    @pytest.mark.asyncio
+    async def test_existing_store_indexed_on_first_use_and_rebuild(self, tmp_path):
+        store = SessionStore(tmp_path)
+        await _populate(store, 3)
+        (tmp_path / INDEX_FILENAME).unlink()
+        (store.get_session_path("session_9")).mkdir()
+        (store.get_state_path("session_9")).write_text("{broken")
+
+        fresh = SessionStore(tmp_path)
+        assert await fresh.count_sessions() == 3
+        assert await fresh.rebuild_index() == 3
+
+    @pytest.mark.asyncio
+    async def test_has_checkpoints_filters_before_paging(self, tmp_path):
+        store = SessionStore(tmp_path)
+        await _populate(store)
+        for i in (0, 2, 5):
+            checkpoints_dir = store.get_session_path(f"session_{i}") / "checkpoints"
+            checkpoints_dir.mkdir()
+            (checkpoints_dir / "cp_000.json").write_text("{}")
+
+        page1 = await store.list_session_entries(limit=2, has_checkpoints=True)
+        page2 = await store.list_session_entries(limit=2, offset=2, has_checkpoints=True)
+        assert [e.session_id for e in page1] == ["session_5", "session_2"]
+        assert [e.session_id for e in page2] == ["session_0"]
+
+    @pytest.mark.asyncio
+    async def test_executor_progress_refreshes_index(self, tmp_path):
+        store = SessionStore(tmp_path)
+        await _populate(store, 2)
+        executor = GraphExecutor(
+            runtime=MagicMock(), storage_path=store.get_session_path("session_0")
+        )
+
+        executor._write_progress("n1", ["n1"], SharedMemory(), {"n1": 1})
+
+        entries = await store.list_session_entries()
+        assert [e.session_id for e in entries] == ["session_0", "session_1"]
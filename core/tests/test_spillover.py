@@ -0,0 +1,141 @@
+"""Tests for tool-result spillover: structured previews, record index and compression."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+
+from framework.graph.event_loop_node import EventLoopNode, LoopConfig
+from framework.graph.spillover import (
+    build_preview,
+    index_path,
+    render_indexed,
+    spill_tool_result,
+)
+from framework.llm.provider import ToolResult
+
+
+def _records(n: int) -> list[dict]:
+    return [{"id": i, "name": f"user {i}", "tags": ["a", "ü"], "score": i / 3} for i in range(n)]
+
+
+class TestPreview:
+    def test_object_preview_lists_keys_schema_and_records(self):
+        content = json.dumps({"total": 500, "next": None, "items": _records(500)})
+
+        preview = build_preview(content, token_budget=300)
+
+        assert "Top-level keys: total (int), next (null), items (array, 500 items)" in preview
+        assert "'items': 500 records, each {id: int, name: str, tags: list[2] of str" in preview
+        shown = [line for line in preview.splitlines() if line.startswith('{"id"')]
+        assert 1 <= len(shown) < 500
+        assert json.loads(shown[0]) == _records(1)[0]
+        assert f"({len(shown)} of 500 records shown)" in preview
+        assert len(preview) <= 300 * 4 + 100
+
+    def test_budget_controls_record_count(self):
+        content = json.dumps(_records(200))
+
+        small = build_preview(content, token_budget=100)
+        large = build_preview(content, token_budget=1000)
+
+        assert small.count('{"id"') < large.count('{"id"')
+
+    def test_wide_nested_records_stay_within_budget(self):
+        def nested(level: int) -> dict:
+            if level == 0:
+                return {f"leaf_{i}": i for i in range(20)}
+            return {f"field_{level}_{i}": nested(level - 1) for i in range(20)}
+
+        record = {f"col_{i}": nested(1) for i in range(20)}
+        content = json.dumps({f"key_{i}": i for i in range(40)} | {"rows": [record] * 5})
+        budget = 675  # max_tool_result_chars=3000 leaves a 2700-char preview
+
+        preview = build_preview(content, token_budget=budget)
+
+        assert len(preview) <= budget * 4
+        assert "Top-level keys: key_0 (int)" in preview
+        assert "'rows': 5 records, each {" in preview
+        assert "(1 of 5 records shown)" in preview
+
+    def test_plain_text_preview_is_prefix(self):
+        content = "line\n" * 1000
+
+        preview = build_preview(content, token_budget=50)
+
+        assert preview == content[:200] + "…"
+
+
+class TestRecordIndex:
+    @pytest.mark.parametrize(
+        "value, key",
+        [
+            (_records(5), "$"),
+            ({"meta": {"page": 1}, "items": _records(3), "other": [1]}, "items"),
+        ],
+    )
+    def test_render_matches_json_dumps(self, value, key):
+        text, spans = render_indexed(value, key)
+
+        assert text == json.dumps(value, indent=2, ensure_ascii=False)
+        records = value if key == "$" else value[key]
+        data = text.encode("utf-8")
+        assert [json.loads(data[s:e]) for s, e in spans] == records
+
+    def test_spill_writes_file_and_index(self, tmp_path):
+        content = json.dumps({"items": _records(50)})
+
+        spill = spill_tool_result(tmp_path, "tool_x.txt", content, preview_tokens=200)
+
+        path = tmp_path / "tool_x.txt"
+        assert json.loads(path.read_text()) == json.loads(content)
+        index = json.loads(index_path(path).read_text())
+        assert index["path"] == "$.items" and index["records"] == 50
+        assert spill.records == 50 and spill.record_path == "$.items"
+
+    def test_compressed_spill(self, tmp_path):
+        content = json.dumps(_records(100))
+
+        spill = spill_tool_result(tmp_path, "tool_x.txt", content, 200, compress=True)
+
+        path = tmp_path / spill.filename
+        assert spill.filename == "tool_x.txt.gz"
+        data = gzip.decompress(path.read_bytes())
+        index = json.loads(index_path(path).read_text())
+        start, end = index["spans"][42]
+        assert json.loads(data[start:end]) == _records(100)[42]
+        assert path.stat().st_size < len(data)
+
+    def test_non_json_has_no_index(self, tmp_path):
+        spill = spill_tool_result(tmp_path, "tool_x.txt", "plain " * 1000, 100)
+
+        assert spill.records is None
+        assert not index_path(tmp_path / "tool_x.txt").exists()
+
+
+class TestEventLoopSpill:
+    @pytest.mark.asyncio
+    async def test_large_result_spilled_with_structured_preview(self, tmp_path):
+        node = EventLoopNode(
+            config=LoopConfig(max_tool_result_chars=2000, spillover_dir=str(tmp_path))
+        )
+        content = json.dumps({"results": _records(300)})
+        result = ToolResult(tool_use_id="call_1", content=content, is_error=False)
+
+        truncated = await node._truncate_tool_result(result, "search")
+
+        assert "saved to 'tool_search_call_1.txt'" in truncated.content
+        assert "offset_records=0" in truncated.content and "300 records" in truncated.content
+        assert "'results': 300 records" in truncated.content
+        assert len(truncated.content) < 2000
+        assert (tmp_path / ".tool_search_call_1.txt.idx").exists()
+
+    @pytest.mark.asyncio
+    async def test_small_result_unchanged(self, tmp_path):
+        node = EventLoopNode(config=LoopConfig(spillover_dir=str(tmp_path)))
+        result = ToolResult(tool_use_id="call_1", content='{"ok": true}', is_error=False)
+
+        assert await node._truncate_tool_result(result, "search") is result
+        assert list(tmp_path.iterdir()) == []
@@ -241,6 +241,8 @@ def test_finish_asdict(self):
             "input_tokens": 10,
             "output_tokens": 20,
             "model": "gpt-4",
+            "cache_read_tokens": 0,
+            "cache_creation_tokens": 0,
         }
 
     @pytest.mark.parametrize("cls", ALL_EVENT_CLASSES, ids=lambda c: c.__name__)
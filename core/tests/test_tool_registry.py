@@ -6,10 +6,18 @@
 could cause a json.JSONDecodeError and crash execution.
 """
 
+import asyncio
+import json
 import textwrap
+import threading
+import time
 from pathlib import Path
 
-from framework.runner.tool_registry import ToolRegistry
+import pytest
+
+from framework.llm.provider import Tool, ToolResult, ToolUse
+from framework.runner.tool_cache import ToolCachePolicy
+from framework.runner.tool_registry import ToolRegistry, _execution_context
 
 
 def _write_tool_module(tmp_path: Path, content: str) -> Path:
@@ -91,3 +99,254 @@ def tool_executor(tool_use: ToolUse) -> ToolResult:
     result = registered.executor({})
     assert isinstance(result, dict)
     assert result == {}
+
+
+# ---------------------------------------------------------------------------
+# Sync tool offloading
+# ---------------------------------------------------------------------------
+
+
+def _make_tool(name: str) -> Tool:
+    return Tool(name=name, description=name, parameters={"type": "object", "properties": {}})
+
+
+def test_register_detects_async_executors():
+    registry = ToolRegistry()
+
+    async def async_exec(inputs: dict) -> dict:
+        return {}
+
+    registry.register("a", _make_tool("a"), async_exec)
+    registry.register("s", _make_tool("s"), lambda inputs: {})
+    assert registry._tools["a"].is_async is True  # noqa: SLF001
+    assert registry._tools["s"].is_async is False  # noqa: SLF001
+
+
+def test_sync_tool_runs_inline_outside_event_loop():
+    registry = ToolRegistry()
+    registry.register("s", _make_tool("s"), lambda inputs: {"ok": True})
+    result = registry.get_executor()(ToolUse(id="1", name="s", input={}))
+    assert isinstance(result, ToolResult)
+    assert json.loads(result.content) == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_parallel_sync_tools_overlap():
+    registry = ToolRegistry(max_sync_workers=4)
+    registry.register("slow", _make_tool("slow"), lambda inputs: time.sleep(0.2) or "done")
+    executor = registry.get_executor()
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(executor(ToolUse(id=str(i), name="slow", input={})) for i in range(4))
+    )
+    elapsed = time.perf_counter() - start
+
+    assert [r.content for r in results] == ["done"] * 4
+    assert elapsed < 0.6
+    registry.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_sync_tool_does_not_block_event_loop():
+    registry = ToolRegistry()
+    registry.register("slow", _make_tool("slow"), lambda inputs: time.sleep(0.2) or "done")
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.02)
+            ticks += 1
+
+    await asyncio.gather(registry.get_executor()(ToolUse(id="1", name="slow", input={})), ticker())
+    assert ticks == 5
+    registry.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_per_tool_concurrency_limit():
+    registry = ToolRegistry(max_sync_workers=8)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def limited(inputs: dict) -> str:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return "ok"
+
+    registry.register("limited", _make_tool("limited"), limited, max_concurrency=2)
+    executor = registry.get_executor()
+    await asyncio.gather(
+        *(executor(ToolUse(id=str(i), name="limited", input={})) for i in range(6))
+    )
+    assert peak == 2
+    registry.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_tool_timeout_returns_error():
+    registry = ToolRegistry()
+    registry.register("hang", _make_tool("hang"), lambda inputs: time.sleep(0.5), timeout=0.05)
+    result = await registry.get_executor()(ToolUse(id="1", name="hang", input={}))
+    assert result.is_error
+    assert "timed out" in json.loads(result.content)["error"]
+    registry.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_execution_context_reaches_worker_thread():
+    registry = ToolRegistry()
+    registry.register("ctx", _make_tool("ctx"), lambda inputs: _execution_context.get() or {})
+    token = ToolRegistry.set_execution_context(session_id="s-1")
+    try:
+        result = await registry.get_executor()(ToolUse(id="1", name="ctx", input={}))
+    finally:
+        ToolRegistry.reset_execution_context(token)
+    assert json.loads(result.content) == {"session_id": "s-1"}
+    registry.cleanup()
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+
+def _counting_registry(tmp_path: Path | None = None, **register_kwargs):
+    registry = ToolRegistry(result_cache_dir=tmp_path)
+    calls = []
+
+    def lookup(inputs: dict) -> dict:
+        calls.append(inputs)
+        time.sleep(0.05)
+        if inputs.get("fail"):
+            return {"error": "not found"}
+        return {"answer": inputs.get("q")}
+
+    registry.register(
+        "lookup", _make_tool("lookup"), lookup, cache=ToolCachePolicy(ttl=60), **register_kwargs
+    )
+    return registry, calls
+
+
+def test_cacheable_tool_served_from_memory_outside_loop():
+    registry, calls = _counting_registry()
+    executor = registry.get_executor()
+
+    first = executor(ToolUse(id="1", name="lookup", input={"q": "a", "n": 1}))
+    second = executor(ToolUse(id="2", name="lookup", input={"n": 1, "q": "a"}))
+
+    assert len(calls) == 1
+    assert (first.cache_status, second.cache_status) == ("miss", "hit")
+    assert second.tool_use_id == "2" and second.content == first.content
+    assert registry.get_cache_stats()["memory_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_execution(tmp_path):
+    registry, calls = _counting_registry(tmp_path)
+    executor = registry.get_executor()
+
+    results = await asyncio.gather(
+        *(executor(ToolUse(id=str(i), name="lookup", input={"q": "a"})) for i in range(5))
+    )
+
+    assert len(calls) == 1
+    assert sorted(r.cache_status for r in results) == ["hit"] * 4 + ["miss"]
+    assert registry.get_cache_stats()["shared"] == 4
+    registry.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_new_registry(tmp_path):
+    registry, calls = _counting_registry(tmp_path)
+    await registry.get_executor()(ToolUse(id="1", name="lookup", input={"q": "a"}))
+
+    fresh, fresh_calls = _counting_registry(tmp_path)
+    result = await fresh.get_executor()(ToolUse(id="2", name="lookup", input={"q": "a"}))
+
+    assert fresh_calls == []
+    assert result.cache_status == "hit" and json.loads(result.content) == {"answer": "a"}
+    assert fresh.get_cache_stats()["disk_hits"] == 1
+    registry.cleanup()
+    fresh.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_errors_and_credential_scopes_not_shared(tmp_path):
+    registry, calls = _counting_registry(tmp_path, credential_scope="account-1")
+    executor = registry.get_executor()
+    await executor(ToolUse(id="1", name="lookup", input={"fail": True}))
+    await executor(ToolUse(id="2", name="lookup", input={"fail": True}))
+    await executor(ToolUse(id="3", name="lookup", input={"q": "a"}))
+
+    other, other_calls = _counting_registry(tmp_path, credential_scope="account-2")
+    await other.get_executor()(ToolUse(id="4", name="lookup", input={"q": "a"}))
+
+    assert len(calls) == 3
+    assert len(other_calls) == 1
+    registry.cleanup()
+    other.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_credentialed_tools_stay_out_of_disk_tier(tmp_path):
+    """news_search's key may come from the CredentialStore, which the key can't see."""
+    registries = []
+    for _ in range(2):
+        registry = ToolRegistry(result_cache_dir=tmp_path)
+        registry.register(
+            "news_search",
+            _make_tool("news_search"),
+            lambda inputs: {"articles": [inputs["q"]]},
+            cache=ToolCachePolicy(ttl=60),
+        )
+        registries.append(registry)
+
+    executor = registries[0].get_executor()
+    await executor(ToolUse(id="1", name="news_search", input={"q": "a"}))
+    repeat = await executor(ToolUse(id="2", name="news_search", input={"q": "a"}))
+    fresh = await registries[1].get_executor()(
+        ToolUse(id="3", name="news_search", input={"q": "a"})
+    )
+
+    assert repeat.cache_status == "hit"
+    assert fresh.cache_status == "miss"
+    assert not (tmp_path / "news_search").exists()
+    for registry in registries:
+        registry.cleanup()
+
+
+def test_tool_decorator_cache_policy(tmp_path):
+    module_path = _write_tool_module(
+        tmp_path,
+        """
+        from framework.runner.tool_registry import tool
+
+        @tool(cacheable=True, ttl=90)
+        def geocode(address: str) -> dict:
+            return {"address": address}
+
+        @tool()
+        def send_email(to: str) -> dict:
+            return {"sent": to}
+        """,
+    )
+    registry = ToolRegistry()
+    registry.discover_from_module(module_path)
+
+    assert registry._tools["geocode"].cache == ToolCachePolicy(ttl=90)  # noqa: SLF001
+    assert registry._tools["send_email"].cache is None  # noqa: SLF001
+
+
+def test_cache_policy_from_mcp_meta():
+    assert ToolCachePolicy.from_meta({"cache": {"ttl": 30}}) == ToolCachePolicy(ttl=30)
+    assert ToolCachePolicy.from_meta({"cache": True}) == ToolCachePolicy()
+    assert ToolCachePolicy.from_meta({"_fastmcp": {"tags": []}}) is None
+    assert ToolCachePolicy.from_meta(None) is None
@@ -14,8 +14,17 @@
     # Run with STDIO transport (for local testing)
     python mcp_server.py --stdio
 
+    # Only expose the tools an agent needs (glob patterns, comma-separated)
+    python mcp_server.py --stdio --tools "web_search,web_scrape,github_*"
+
+Tool modules are imported lazily: schemas come from the bundled tool
+manifest and each module is loaded on its first call. Pass --eager to
+import and register everything at startup instead.
+
 Environment Variables:
     MCP_PORT              - Server port (default: 4001)
+    MCP_TOOLS             - Default for --tools
+    MCP_EAGER_TOOLS       - Set to 1 for --eager
     ANTHROPIC_API_KEY     - Required at startup for testing/LLM nodes
     BRAVE_SEARCH_API_KEY  - Required for web_search tool (validated at agent load time)
 
@@ -48,6 +57,42 @@ def setup_logger():
 
 setup_logger()
 
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Aden Tools MCP Server", allow_abbrev=False)
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=int(os.getenv("MCP_PORT", "4001")),
+        help="HTTP server port (default: 4001)",
+    )
+    parser.add_argument(
+        "--host",
+        default="0.0.0.0",
+        help="HTTP server host (default: 0.0.0.0)",
+    )
+    parser.add_argument(
+        "--stdio",
+        action="store_true",
+        help="Use STDIO transport instead of HTTP",
+    )
+    parser.add_argument(
+        "--tools",
+        default=os.getenv("MCP_TOOLS", ""),
+        help="Comma-separated tool names or glob patterns to expose (default: all)",
+    )
+    parser.add_argument(
+        "--eager",
+        action="store_true",
+        default=os.getenv("MCP_EAGER_TOOLS", "") == "1",
+        help="Import every tool module at startup instead of on first call",
+    )
+    return parser
+
+
+# Parsed up front: tool registration below happens at import time.
+_args, _ = build_parser().parse_known_args()
+
 # Suppress FastMCP banner in STDIO mode
 if "--stdio" in sys.argv:
     # Monkey-patch rich Console to redirect to stderr
@@ -67,6 +112,7 @@ def _patched_console_init(self, *args, **kwargs):
 
 from aden_tools.credentials import CredentialError, CredentialStoreAdapter  # noqa: E402
 from aden_tools.tools import register_all_tools  # noqa: E402
+from aden_tools.utils.shutdown import shutdown_lifespan  # noqa: E402
 
 credentials = CredentialStoreAdapter.default()
 
@@ -78,10 +124,12 @@ def _patched_console_init(self, *args, **kwargs):
     # Non-fatal - tools will validate their own credentials when called
     logger.warning(str(e))
 
-mcp = FastMCP("tools")
+# Closes tool resources bound to the event loop (e.g. web_scrape's browser)
+mcp = FastMCP("tools", lifespan=shutdown_lifespan)
 
-# Register all tools with the MCP server, passing credential store
-tools = register_all_tools(mcp, credentials=credentials)
+# Register tools with the MCP server, passing credential store
+_include = [p.strip() for p in _args.tools.split(",") if p.strip()] or None
+tools = register_all_tools(mcp, credentials=credentials, include=_include, lazy=not _args.eager)
 # Only print to stdout in HTTP mode (STDIO mode requires clean stdout for JSON-RPC)
 if "--stdio" not in sys.argv:
     logger.info(f"Registered {len(tools)} tools: {tools}")
@@ -101,24 +149,7 @@ async def index(request: Request) -> PlainTextResponse:
 
 def main() -> None:
     """Entry point for the MCP server."""
-    parser = argparse.ArgumentParser(description="Aden Tools MCP Server")
-    parser.add_argument(
-        "--port",
-        type=int,
-        default=int(os.getenv("MCP_PORT", "4001")),
-        help="HTTP server port (default: 4001)",
-    )
-    parser.add_argument(
-        "--host",
-        default="0.0.0.0",
-        help="HTTP server host (default: 0.0.0.0)",
-    )
-    parser.add_argument(
-        "--stdio",
-        action="store_true",
-        help="Use STDIO transport instead of HTTP",
-    )
-    args = parser.parse_args()
+    args = build_parser().parse_args()
 
     if args.stdio:
         # STDIO mode: only JSON-RPC messages go to stdout
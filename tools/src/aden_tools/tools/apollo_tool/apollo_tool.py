@@ -21,6 +21,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -99,7 +101,7 @@ def enrich_person(
         if domain:
             body["domain"] = domain
 
-        response = httpx.post(
+        response = http_client.post(
             f"{APOLLO_API_BASE}/people/match",
             headers=self._headers,
             params=body if not email and not linkedin_url else None,
@@ -149,7 +151,7 @@ def enrich_company(self, domain: str) -> dict[str, Any]:
             "domain": domain,
         }
 
-        response = httpx.post(
+        response = http_client.post(
             f"{APOLLO_API_BASE}/organizations/enrich",
             headers=self._headers,
             json=body,
@@ -224,7 +226,7 @@ def search_people(
         if technologies:
             body["currently_using_any_of_technology_uids"] = technologies
 
-        response = httpx.post(
+        response = http_client.post(
             f"{APOLLO_API_BASE}/mixed_people/search",
             headers=self._headers,
             json=body,
@@ -292,7 +294,7 @@ def search_companies(
         if technologies:
             body["currently_using_any_of_technology_uids"] = technologies
 
-        response = httpx.post(
+        response = http_client.post(
             f"{APOLLO_API_BASE}/mixed_companies/search",
             headers=self._headers,
             json=body,
@@ -22,7 +22,7 @@
 def register_tools(mcp: FastMCP) -> None:
     """Register arXiv tools with the MCP server."""
 
-    @mcp.tool()
+    @mcp.tool(meta={"cache": {"ttl": 3600}})
     def search_papers(
         query: str = "",
         id_list: list[str] | None = None,
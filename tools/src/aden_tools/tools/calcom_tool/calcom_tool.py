@@ -17,6 +17,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -81,7 +83,7 @@ def list_bookings(
         if end_date:
             params["beforeEnd"] = end_date
 
-        response = httpx.get(
+        response = http_client.get(
             f"{CALCOM_API_BASE}/bookings",
             headers=self._headers,
             params=self._get_params(params),
@@ -91,7 +93,7 @@ def list_bookings(
 
     def get_booking(self, booking_id: int) -> dict[str, Any]:
         """Get a single booking by ID."""
-        response = httpx.get(
+        response = http_client.get(
             f"{CALCOM_API_BASE}/bookings/{booking_id}",
             headers=self._headers,
             params=self._get_params(),
@@ -128,7 +130,7 @@ def create_booking(
         if guests:
             data["responses"]["guests"] = guests
 
-        response = httpx.post(
+        response = http_client.post(
             f"{CALCOM_API_BASE}/bookings",
             headers=self._headers,
             params=self._get_params(),
@@ -147,7 +149,7 @@ def cancel_booking(
         if cancel_reason:
             data["cancellationReason"] = cancel_reason
 
-        response = httpx.request(
+        response = http_client.request(
             "DELETE",
             f"{CALCOM_API_BASE}/bookings/{booking_id}",
             headers=self._headers,
@@ -172,7 +174,7 @@ def get_availability(
             "timeZone": timezone,
         }
 
-        response = httpx.get(
+        response = http_client.get(
             f"{CALCOM_API_BASE}/slots",
             headers=self._headers,
             params=self._get_params(params),
@@ -182,7 +184,7 @@ def get_availability(
 
     def list_schedules(self) -> dict[str, Any]:
         """List all schedules for the authenticated user."""
-        response = httpx.get(
+        response = http_client.get(
             f"{CALCOM_API_BASE}/schedules",
             headers=self._headers,
             params=self._get_params(),
@@ -206,7 +208,7 @@ def update_schedule(
         if availability:
             data["availability"] = availability
 
-        response = httpx.patch(
+        response = http_client.patch(
             f"{CALCOM_API_BASE}/schedules/{schedule_id}",
             headers=self._headers,
             params=self._get_params(),
@@ -217,7 +219,7 @@ def update_schedule(
 
     def list_event_types(self) -> dict[str, Any]:
         """List all event types."""
-        response = httpx.get(
+        response = http_client.get(
             f"{CALCOM_API_BASE}/event-types",
             headers=self._headers,
             params=self._get_params(),
@@ -227,7 +229,7 @@ def list_event_types(self) -> dict[str, Any]:
 
     def get_event_type(self, event_type_id: int) -> dict[str, Any]:
         """Get a single event type by ID."""
-        response = httpx.get(
+        response = http_client.get(
             f"{CALCOM_API_BASE}/event-types/{event_type_id}",
             headers=self._headers,
             params=self._get_params(),
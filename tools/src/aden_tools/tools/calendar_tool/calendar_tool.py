@@ -25,6 +25,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from framework.credentials.oauth2 import TokenLifecycleManager
 
@@ -228,7 +230,7 @@ def calendar_list_events(
             params["q"] = query
 
         try:
-            response = httpx.get(
+            response = http_client.get(
                 f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}/events",
                 headers=_get_headers(account),
                 params=params,
@@ -301,7 +303,7 @@ def calendar_get_event(
             return {"error": "event_id is required"}
 
         try:
-            response = httpx.get(
+            response = http_client.get(
                 f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}/events/{_encode_id(event_id)}",
                 headers=_get_headers(account),
                 timeout=30.0,
@@ -418,7 +420,7 @@ def calendar_create_event(
             params["conferenceDataVersion"] = 1
 
         try:
-            response = httpx.post(
+            response = http_client.post(
                 f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}/events",
                 headers=_get_headers(account),
                 json=event_body,
@@ -505,7 +507,7 @@ def calendar_update_event(
         if remove_attendees is not None:
             # Fetch current event to get attendee list
             try:
-                get_response = httpx.get(
+                get_response = http_client.get(
                     f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}/events/{_encode_id(event_id)}",
                     headers=_get_headers(account),
                     timeout=30.0,
@@ -572,7 +574,7 @@ def calendar_update_event(
             params["conferenceDataVersion"] = 1
 
         try:
-            response = httpx.patch(
+            response = http_client.patch(
                 f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}/events/{_encode_id(event_id)}",
                 headers=_get_headers(account),
                 json=patch_body,
@@ -621,7 +623,7 @@ def calendar_delete_event(
         params = {"sendUpdates": "all" if send_notifications else "none"}
 
         try:
-            response = httpx.delete(
+            response = http_client.delete(
                 f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}/events/{_encode_id(event_id)}",
                 headers=_get_headers(account),
                 params=params,
@@ -667,7 +669,7 @@ def calendar_list_calendars(
             return {"error": "max_results must be between 1 and 250"}
 
         try:
-            response = httpx.get(
+            response = http_client.get(
                 f"{CALENDAR_API_BASE}/users/me/calendarList",
                 headers=_get_headers(account),
                 params={"maxResults": max_results},
@@ -730,7 +732,7 @@ def calendar_get_calendar(
             return {"error": "calendar_id is required"}
 
         try:
-            response = httpx.get(
+            response = http_client.get(
                 f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}",
                 headers=_get_headers(account),
                 timeout=30.0,
@@ -789,7 +791,7 @@ def calendar_check_availability(
         }
 
         try:
-            response = httpx.post(
+            response = http_client.post(
                 f"{CALENDAR_API_BASE}/freeBusy",
                 headers=_get_headers(account),
                 json=request_body,
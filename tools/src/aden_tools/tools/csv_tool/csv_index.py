@@ -0,0 +1,205 @@
+"""
+Row index for CSV files - seek to a row instead of re-parsing the file.
+
+The index records the byte offset of every ``INDEX_STRIDE``-th data row plus
+the row counts, so ``csv_read(offset=1_000_000)`` seeks close to the row and
+parses at most ``INDEX_STRIDE`` rows, and row counts need no scan at all.
+
+Indexes are kept in memory and, for files of at least ``INDEX_MIN_BYTES``,
+persisted next to the file as ``.<name>.idx``. An index is only used while
+the file's size and mtime match the ones it was built from; appends made
+through ``extend_index`` only scan the new bytes.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+
+INDEX_VERSION = 1
+INDEX_STRIDE = 1000
+INDEX_MIN_BYTES = 1 << 20  # Smaller files are indexed in memory only
+MAX_CACHED_INDEXES = 64
+
+
+@dataclass
+class CsvIndex:
+    """Row offsets and counts for one version of a CSV file."""
+
+    size: int
+    mtime_ns: int
+    columns: list[str] | None  # None if the file is empty or has no header
+    rows: int = 0  # Data rows, as csv.DictReader yields them (blank lines skipped)
+    nonblank_rows: int = 0  # Data rows with at least one non-empty field
+    header_nonblank: bool = False
+    offsets: list[int] = field(default_factory=list)  # Byte offset of row i * stride
+    stride: int = INDEX_STRIDE
+    version: int = INDEX_VERSION
+
+    @property
+    def total_rows(self) -> int:
+        """Row count reported by csv_read (non-blank lines minus the header)."""
+        return self.nonblank_rows + (1 if self.header_nonblank else 0) - 1
+
+    def matches(self, stat: os.stat_result) -> bool:
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+
+class _Lines:
+    """Binary line iterator for csv.reader that tracks the byte position."""
+
+    def __init__(self, f: io.BufferedReader, pos: int):
+        self._f = f
+        self.pos = pos
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        line = self._f.readline()
+        if not line:
+            raise StopIteration
+        self.pos += len(line)
+        return line.decode("utf-8")
+
+
+def _scan(f: io.BufferedReader, index: CsvIndex, pos: int) -> None:
+    """Parse rows from byte *pos* onwards, adding them to *index*."""
+    lines = _Lines(f, pos)
+    reader = csv.reader(lines)
+    while True:
+        start = lines.pos
+        try:
+            row = next(reader)
+        except StopIteration:
+            break
+        if not row:
+            continue  # csv.DictReader skips blank lines
+        if index.columns is None:
+            index.columns = row
+            index.header_nonblank = any(row)
+            continue
+        if index.rows % index.stride == 0:
+            index.offsets.append(start)
+        index.rows += 1
+        if any(row):
+            index.nonblank_rows += 1
+
+
+def _sidecar_path(path: str) -> str:
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.idx")
+
+
+def build_index(path: str, stride: int = INDEX_STRIDE) -> CsvIndex:
+    """Scan *path* once and return its index."""
+    stat = os.stat(path)
+    index = CsvIndex(size=stat.st_size, mtime_ns=stat.st_mtime_ns, columns=None, stride=stride)
+    with open(path, "rb") as f:
+        _scan(f, index, 0)
+    return index
+
+
+def _load_sidecar(path: str, stat: os.stat_result) -> CsvIndex | None:
+    try:
+        with open(_sidecar_path(path), encoding="utf-8") as f:
+            index = CsvIndex(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+    if index.version != INDEX_VERSION or not index.matches(stat):
+        return None
+    return index
+
+
+def _save_sidecar(path: str, index: CsvIndex) -> None:
+    if index.size < INDEX_MIN_BYTES:
+        return
+    sidecar = _sidecar_path(path)
+    tmp = sidecar + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(index), f, separators=(",", ":"))
+        os.replace(tmp, sidecar)
+    except OSError:
+        pass  # The index is only an optimization; read-only directories still work
+
+
+_cache: OrderedDict[str, CsvIndex] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _remember(path: str, index: CsvIndex) -> None:
+    with _cache_lock:
+        _cache[path] = index
+        _cache.move_to_end(path)
+        while len(_cache) > MAX_CACHED_INDEXES:
+            _cache.popitem(last=False)
+
+
+def get_index(path: str) -> CsvIndex:
+    """Return an up-to-date index for *path*, building it if needed."""
+    stat = os.stat(path)
+    with _cache_lock:
+        index = _cache.get(path)
+    if index is not None and index.matches(stat):
+        return index
+
+    index = _load_sidecar(path, stat)
+    if index is None:
+        index = build_index(path)
+        _save_sidecar(path, index)
+    _remember(path, index)
+    return index
+
+
+def extend_index(path: str, index: CsvIndex) -> CsvIndex:
+    """Return the index of *path* after rows were appended to the file *index* describes."""
+    stat = os.stat(path)
+    with open(path, "rb") as f:
+        if index.columns is None or stat.st_size < index.size:
+            return get_index(path)
+        if index.size:
+            # A last line without a newline merges with the appended data
+            f.seek(index.size - 1)
+            if f.read(1) != b"\n":
+                return get_index(path)
+        extended = CsvIndex(**{**asdict(index), "offsets": list(index.offsets)})
+        _scan(f, extended, index.size)
+    extended.size, extended.mtime_ns = stat.st_size, stat.st_mtime_ns
+    _save_sidecar(path, extended)
+    _remember(path, extended)
+    return extended
+
+
+def read_rows(
+    path: str,
+    index: CsvIndex,
+    offset: int = 0,
+    limit: int | None = None,
+    columns: list[str] | None = None,
+) -> list[dict]:
+    """
+    Read data rows ``offset`` to ``offset + limit`` as dicts, seeking via *index*.
+
+    Rows match what csv.DictReader yields; *columns* restricts the keys.
+    """
+    block = offset // index.stride
+    if index.columns is None or block >= len(index.offsets) or limit == 0:
+        return []
+
+    with open(path, "rb") as raw:
+        raw.seek(index.offsets[block])
+        text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+        reader = csv.DictReader(text, fieldnames=index.columns)
+        stop = None if limit is None else offset - block * index.stride + limit
+        rows = list(islice(reader, offset - block * index.stride, stop))
+
+    if columns is not None:
+        rows = [{c: row.get(c) for c in columns} for row in rows]
+    return rows
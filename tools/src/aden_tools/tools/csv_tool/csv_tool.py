@@ -6,6 +6,51 @@
 from fastmcp import FastMCP
 
 from ..file_system_toolkits.security import get_secure_path
+from .csv_index import extend_index, get_index, read_rows
+
+DUCKDB_MISSING = (
+    "DuckDB not installed. Install with: uv pip install duckdb  or  uv pip install tools[sql]"
+)
+
+# Keywords rejected anywhere in user-supplied SQL
+DISALLOWED_SQL = [
+    "INSERT",
+    "UPDATE",
+    "DELETE",
+    "DROP",
+    "CREATE",
+    "ALTER",
+    "TRUNCATE",
+    "EXEC",
+    "EXECUTE",
+]
+
+
+def _check_sql(sql: str) -> str | None:
+    """Return an error message if *sql* contains a disallowed keyword."""
+    sql_upper = sql.upper()
+    for keyword in DISALLOWED_SQL:
+        if keyword in sql_upper:
+            return f"'{keyword}' is not allowed in queries"
+    return None
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _connect_csv(secure_path: str):
+    """Open an in-memory DuckDB connection with the CSV available as view 'data'.
+
+    A view (rather than a table) lets DuckDB stream the file and push filters,
+    projections and limits into the scan, so large files are never loaded whole.
+    """
+    import duckdb
+
+    con = duckdb.connect(":memory:")
+    source = secure_path.replace("'", "''")
+    con.execute(f"CREATE VIEW data AS SELECT * FROM read_csv_auto('{source}')")
+    return con
 
 
 def register_tools(mcp: FastMCP) -> None:
@@ -19,10 +64,15 @@ def csv_read(
         session_id: str,
         limit: int | None = None,
         offset: int = 0,
+        columns: list[str] | None = None,
+        where: str | None = None,
     ) -> dict:
         """
         Read a CSV file and return its contents.
 
+        Offsets are served from a row index, so paging through large files does
+        not re-read them from the start.
+
         Args:
             path: Path to the CSV file (relative to session sandbox)
             workspace_id: Workspace identifier
@@ -30,6 +80,10 @@ def csv_read(
             session_id: Session identifier
             limit: Maximum number of rows to return (None = all rows)
             offset: Number of rows to skip from the beginning
+            columns: Only return these columns (None = all columns)
+            where: Optional SQL filter, e.g. "price > 100 AND status = 'open'".
+                   Runs through DuckDB like csv_sql, so values come back typed
+                   and offset/limit/total_rows apply to the matching rows.
 
         Returns:
             dict with success status, data, and metadata
@@ -45,37 +99,29 @@ def csv_read(
             if not path.lower().endswith(".csv"):
                 return {"error": "File must have .csv extension"}
 
-            # Read CSV
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-
-                if reader.fieldnames is None:
-                    return {"error": "CSV file is empty or has no headers"}
+            index = get_index(secure_path)
+            if index.columns is None:
+                return {"error": "CSV file is empty or has no headers"}
 
-                columns = list(reader.fieldnames)
+            if columns is not None:
+                unknown = [c for c in columns if c not in index.columns]
+                if unknown:
+                    return {"error": f"Unknown columns: {unknown}. Available: {index.columns}"}
 
-                # Apply offset and limit
-                rows = []
-                for i, row in enumerate(reader):
-                    if i < offset:
-                        continue
-                    if limit is not None and len(rows) >= limit:
-                        break
-                    rows.append(row)
+            if where is not None and where.strip():
+                return _read_where(path, secure_path, index.columns, columns, where, limit, offset)
 
-            # Get total row count (re-read for accurate count)
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.reader(f)
-                total_rows = sum(1 for row in reader if any(row)) - 1
+            rows = read_rows(secure_path, index, offset, limit, columns)
+            result_columns = columns if columns is not None else list(index.columns)
 
             return {
                 "success": True,
                 "path": path,
-                "columns": columns,
-                "column_count": len(columns),
+                "columns": result_columns,
+                "column_count": len(result_columns),
                 "rows": rows,
                 "row_count": len(rows),
-                "total_rows": total_rows,
+                "total_rows": index.total_rows,
                 "offset": offset,
                 "limit": limit,
             }
@@ -87,6 +133,55 @@ def csv_read(
         except Exception as e:
             return {"error": f"Failed to read CSV: {str(e)}"}
 
+    def _read_where(
+        path: str,
+        secure_path: str,
+        all_columns: list[str],
+        columns: list[str] | None,
+        where: str,
+        limit: int | None,
+        offset: int,
+    ) -> dict:
+        """csv_read with a filter, evaluated by DuckDB."""
+        try:
+            import duckdb  # noqa: F401
+        except ImportError:
+            return {"error": DUCKDB_MISSING}
+
+        error = _check_sql(where)
+        if error is None and ";" in where:
+            error = "';' is not allowed in queries"
+        if error:
+            return {"error": error}
+
+        result_columns = columns if columns is not None else list(all_columns)
+        select = ", ".join(_quote_identifier(c) for c in result_columns)
+        page = f" LIMIT {int(limit)}" if limit is not None else ""
+        page += f" OFFSET {int(offset)}" if offset else ""
+
+        con = _connect_csv(secure_path)
+        try:
+            total_rows = con.execute(f"SELECT COUNT(*) FROM data WHERE {where}").fetchone()[0]
+            result = con.execute(f"SELECT {select} FROM data WHERE {where}{page}")
+            rows = [dict(zip(result_columns, row, strict=False)) for row in result.fetchall()]
+        except Exception as e:
+            return {"error": f"Filter failed: {str(e)}"}
+        finally:
+            con.close()
+
+        return {
+            "success": True,
+            "path": path,
+            "columns": result_columns,
+            "column_count": len(result_columns),
+            "rows": rows,
+            "row_count": len(rows),
+            "total_rows": total_rows,
+            "offset": offset,
+            "limit": limit,
+            "where": where,
+        }
+
     @mcp.tool()
     def csv_write(
         path: str,
@@ -177,12 +272,11 @@ def csv_append(
             if not rows:
                 return {"error": "rows cannot be empty"}
 
-            # Read existing columns
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-                if reader.fieldnames is None:
-                    return {"error": "CSV file is empty or has no headers"}
-                columns = list(reader.fieldnames)
+            # Existing columns and row count come from the row index
+            index = get_index(secure_path)
+            if index.columns is None:
+                return {"error": "CSV file is empty or has no headers"}
+            columns = list(index.columns)
 
             # Append rows
             with open(secure_path, "a", encoding="utf-8", newline="") as f:
@@ -192,10 +286,8 @@ def csv_append(
                     filtered_row = {k: v for k, v in row.items() if k in columns}
                     writer.writerow(filtered_row)
 
-            # Get new total row count
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.reader(f)
-                total_rows = sum(1 for row in reader if any(row)) - 1  # Subtract header
+            # Index only the appended bytes for the new total row count
+            total_rows = extend_index(secure_path, index).total_rows
 
             return {
                 "success": True,
@@ -242,17 +334,13 @@ def csv_info(
             # Get file size
             file_size = os.path.getsize(secure_path)
 
-            # Read headers and count rows
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-
-                if reader.fieldnames is None:
-                    return {"error": "CSV file is empty or has no headers"}
+            # Headers and row count come from the row index
+            index = get_index(secure_path)
+            if index.columns is None:
+                return {"error": "CSV file is empty or has no headers"}
 
-                columns = list(reader.fieldnames)
-
-                # Count rows
-                total_rows = sum(1 for _ in reader)
+            columns = list(index.columns)
+            total_rows = index.rows
 
             return {
                 "success": True,
@@ -309,14 +397,9 @@ def csv_sql(
             query="SELECT * FROM data WHERE LOWER(name) LIKE '%phone%'"
         """
         try:
-            import duckdb
+            import duckdb  # noqa: F401
         except ImportError:
-            return {
-                "error": (
-                    "DuckDB not installed. Install with: "
-                    "uv pip install duckdb  or  uv pip install tools[sql]"
-                )
-            }
+            return {"error": DUCKDB_MISSING}
 
         try:
             secure_path = get_secure_path(path, workspace_id, agent_id, session_id)
@@ -336,27 +419,13 @@ def csv_sql(
                 return {"error": "Only SELECT queries are allowed for security reasons"}
 
             # Disallowed keywords for security
-            disallowed = [
-                "INSERT",
-                "UPDATE",
-                "DELETE",
-                "DROP",
-                "CREATE",
-                "ALTER",
-                "TRUNCATE",
-                "EXEC",
-                "EXECUTE",
-            ]
-            for keyword in disallowed:
-                if keyword in query_upper:
-                    return {"error": f"'{keyword}' is not allowed in queries"}
-
-            # Execute query using in-memory DuckDB
-            con = duckdb.connect(":memory:")
-            try:
-                # Load CSV as 'data' table
-                con.execute(f"CREATE TABLE data AS SELECT * FROM read_csv_auto('{secure_path}')")
+            error = _check_sql(query)
+            if error:
+                return {"error": error}
 
+            # Execute query using in-memory DuckDB over a view of the file
+            con = _connect_csv(secure_path)
+            try:
                 # Execute user query
                 result = con.execute(query)
                 columns = [desc[0] for desc in result.description]
@@ -16,6 +16,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -49,7 +51,7 @@ def _request_with_retry(
         """Make HTTP request with retry on 429 rate limit."""
         request_kwargs = {"headers": self._headers, "timeout": 30.0, **kwargs}
         for attempt in range(MAX_RETRIES + 1):
-            response = httpx.request(method, url, **request_kwargs)
+            response = http_client.request(method, url, **request_kwargs)
             if response.status_code == 429 and attempt < MAX_RETRIES:
                 try:
                     data = response.json()
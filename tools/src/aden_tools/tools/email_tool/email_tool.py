@@ -15,6 +15,8 @@
 import resend
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -85,7 +87,7 @@ def _send_via_gmail(
 
         raw = base64.urlsafe_b64encode(msg.as_bytes()).decode("ascii")
 
-        response = httpx.post(
+        response = http_client.post(
             "https://gmail.googleapis.com/gmail/v1/users/me/messages/send",
             headers={
                 "Authorization": f"Bearer {access_token}",
@@ -241,7 +243,7 @@ def send_email(
 
     def _fetch_original_message(access_token: str, message_id: str) -> dict:
         """Fetch the original message to extract threading info."""
-        response = httpx.get(
+        response = http_client.get(
             f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}",
             headers={
                 "Authorization": f"Bearer {access_token}",
@@ -363,7 +365,7 @@ def gmail_reply_email(
             raw = base64.urlsafe_b64encode(msg.as_bytes()).decode("ascii")
 
         try:
-            response = httpx.post(
+            response = http_client.post(
                 "https://gmail.googleapis.com/gmail/v1/users/me/messages/send",
                 headers={
                     "Authorization": f"Bearer {credential}",
@@ -19,6 +19,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -55,7 +57,7 @@ def _make_request(
         """
         max_retries = 3
         for attempt in range(max_retries + 1):
-            response = httpx.post(
+            response = http_client.post(
                 f"{EXA_API_BASE}{endpoint}",
                 json=payload,
                 headers={
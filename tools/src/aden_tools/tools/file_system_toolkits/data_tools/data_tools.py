@@ -6,17 +6,101 @@
 Used in conjunction with the spillover system: when a tool result is too
 large, the framework writes it to a file and the agent can load it back
 with load_data().
+
+Spilled JSON results come with a sidecar record index, ``.<filename>.idx``
+(written by the framework's spillover), listing the byte span of each
+record of the main array. load_data(offset_records=...) uses it to page by
+record. Spilled files may be gzip-compressed (``.gz``); load_data reads them
+transparently, with offsets referring to the uncompressed content.
 """
 
 from __future__ import annotations
 
+import gzip
+import json
 from pathlib import Path
+from typing import BinaryIO
 
 from mcp.server.fastmcp import FastMCP
 
 from aden_tools.credentials.browser import open_browser
 
 
+def _open_data(path: Path) -> BinaryIO:
+    """Open a data file for binary reading, decompressing ``.gz`` files."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def _data_size(path: Path) -> int:
+    """Size of the (uncompressed) content of a data file."""
+    if path.suffix != ".gz":
+        return path.stat().st_size
+    with open(path, "rb") as f:
+        f.seek(-4, 2)  # gzip trailer: uncompressed size mod 2**32
+        return int.from_bytes(f.read(4), "little")
+
+
+def _load_index(path: Path) -> dict | None:
+    try:
+        index = json.loads(path.with_name(f".{path.name}.idx").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return index if index.get("version") == 1 else None
+
+
+def _load_records(
+    path: Path, filename: str, offset_records: int, limit_records: int, limit_bytes: int
+) -> dict:
+    """Read up to ``limit_records`` records from ``offset_records`` via the index.
+
+    Stops early so the records read span at most ``limit_bytes``.
+    """
+    if offset_records < 0:
+        return {"error": "offset_records must be non-negative"}
+    index = _load_index(path)
+    if index is None:
+        return {
+            "error": f"No record index for {filename}. "
+            "Page through it with offset_bytes and limit_bytes instead."
+        }
+    spans = index["spans"]
+    total = len(spans)
+    selected = spans[offset_records : offset_records + max(limit_records, 0)]
+    if selected:
+        start = selected[0][0]
+        fitting = [span for span in selected if span[1] - start <= limit_bytes]
+        if not fitting:
+            first_start, first_end = selected[0]
+            return {
+                "error": f"Record {offset_records} is {first_end - first_start} bytes, "
+                f"over limit_bytes={limit_bytes}. Raise limit_bytes or read it with "
+                f"offset_bytes={first_start}."
+            }
+        selected = fitting
+    next_offset = offset_records + len(selected)
+
+    content = "[]"
+    if selected:
+        start, end = selected[0][0], selected[-1][1]
+        with _open_data(path) as f:
+            f.seek(start)
+            content = "[" + f.read(end - start).decode("utf-8") + "]"
+
+    return {
+        "success": True,
+        "filename": filename,
+        "content": content,
+        "record_path": index["path"],
+        "offset_records": offset_records,
+        "records_read": len(selected),
+        "next_offset_records": min(next_offset, total),
+        "total_records": total,
+        "has_more": next_offset < total,
+    }
+
+
 def register_tools(mcp: FastMCP) -> None:
     """Register data management tools with the MCP server."""
 
@@ -70,6 +154,8 @@ def load_data(
         data_dir: str,
         offset_bytes: int = 0,
         limit_bytes: int = 10000,
+        offset_records: int | None = None,
+        limit_records: int = 20,
     ) -> dict:
         """
         Purpose
@@ -87,12 +173,19 @@ def load_data(
             Uses byte offsets for O(1) seeking (works with huge files)
             Automatically trims to valid UTF-8 character boundaries
             Returns exactly limit_bytes or less (rounded to safe boundary)
+            Spilled JSON results can be paged by record with offset_records
+            (content is then a JSON array of whole records)
+            .gz files are decompressed transparently
 
         Args:
             filename: The filename to load (as shown in spillover messages or save_data results).
             data_dir: Absolute path to the data directory.
             offset_bytes: Byte offset to start reading from. Default 0.
             limit_bytes: Max number of bytes to return. Default 10000 (10KB).
+                With offset_records, fewer records are returned to stay under it.
+            offset_records: Index of the first record to return. Pages by record
+                instead of by byte (spilled JSON results only). Default None.
+            limit_records: Max number of records to return. Default 20.
 
         Returns:
             Dict with content, pagination info, and metadata
@@ -101,6 +194,7 @@ def load_data(
             load_data('emails.jsonl', '/data')                           # first 10KB
             load_data('emails.jsonl', '/data', offset_bytes=10000)       # next 10KB
             load_data('large.txt', '/data', limit_bytes=50000)           # first 50KB
+            load_data('tool_x.txt', '/data', offset_records=20)          # records 20-39
         """
         if not filename or ".." in filename or "/" in filename or "\\" in filename:
             return {"error": "Invalid filename"}
@@ -114,7 +208,12 @@ def load_data(
             if not path.exists():
                 return {"error": f"File not found: {filename}"}
 
-            file_size = path.stat().st_size
+            if offset_records is not None:
+                return _load_records(
+                    path, filename, int(offset_records), int(limit_records), limit_bytes
+                )
+
+            file_size = _data_size(path)
 
             # Handle edge case: offset beyond file size
             if offset_bytes >= file_size:
@@ -129,8 +228,8 @@ def load_data(
                     "has_more": False,
                 }
 
-            with open(path, "rb") as f:
-                # O(1) seek to byte offset
+            with _open_data(path) as f:
+                # O(1) seek to byte offset (sequential for .gz files)
                 f.seek(offset_bytes)
 
                 # Read exactly limit_bytes
@@ -253,7 +352,8 @@ def list_data_files(data_dir: str) -> dict:
 
             files = []
             for f in sorted(dir_path.iterdir()):
-                if f.is_file():
+                # Dotfiles are record indexes and partial writes
+                if f.is_file() and not f.name.startswith("."):
                     files.append(
                         {
                             "filename": f.name,
@@ -4,6 +4,7 @@
 from mcp.server.fastmcp import FastMCP
 
 from ..security import WORKSPACES_DIR, get_secure_path
+from .search_engine import inherited_rules, iter_files, search
 
 
 def register_tools(mcp: FastMCP) -> None:
@@ -17,12 +18,17 @@ def grep_search(
         agent_id: str,
         session_id: str,
         recursive: bool = False,
+        max_results: int = 1000,
+        offset: int = 0,
+        respect_gitignore: bool = True,
     ) -> dict:
         """
         Search for a pattern in a file or directory within the session sandbox.
 
         Use this when you need to find specific content or patterns in files using regex.
-        Set recursive=True to search through all subdirectories.
+        Set recursive=True to search through all subdirectories. Binary files, .git
+        and paths matched by .gitignore are skipped. Results are paginated: if
+        "truncated" is true, call again with offset=next_offset for more.
 
         Args:
             path: The path to search in (file or directory, relative to session root)
@@ -31,6 +37,9 @@ def grep_search(
             agent_id: The ID of the agent
             session_id: The ID of the current session
             recursive: Whether to search recursively in directories (default: False)
+            max_results: Maximum matches to return; the search stops once found (default: 1000)
+            offset: Number of matches to skip, for fetching the next page (default: 0)
+            respect_gitignore: Skip files matched by .gitignore rules (default: True)
 
         Returns:
             Dict with search results and match details, or error dict
@@ -41,53 +50,43 @@ def grep_search(
             regex = re.compile(pattern)
         except re.error as e:
             return {"error": f"Invalid regex pattern: {e.msg}"}
+        if max_results < 1:
+            return {"error": "max_results must be at least 1"}
+        if offset < 0:
+            return {"error": "offset must be non-negative"}
 
         try:
             secure_path = get_secure_path(path, workspace_id, agent_id, session_id)
             # Use session dir root for relative path calculations
             session_root = os.path.join(WORKSPACES_DIR, workspace_id, agent_id, session_id)
 
-            matches = []
-
             if os.path.isfile(secure_path):
-                files = [secure_path]
-            elif recursive:
-                files = []
-                for root, _, filenames in os.walk(secure_path):
-                    for filename in filenames:
-                        files.append(os.path.join(root, filename))
+                files = iter([secure_path])
+            elif os.path.isdir(secure_path):
+                rules = inherited_rules(secure_path, session_root) if respect_gitignore else []
+                files = iter_files(secure_path, recursive, rules, respect_gitignore)
             else:
-                files = [
-                    os.path.join(secure_path, f)
-                    for f in os.listdir(secure_path)
-                    if os.path.isfile(os.path.join(secure_path, f))
-                ]
+                raise FileNotFoundError(secure_path)
 
-            for file_path in files:
-                # Calculate relative path for display
-                display_path = os.path.relpath(file_path, session_root)
-                try:
-                    with open(file_path, encoding="utf-8") as f:
-                        for i, line in enumerate(f, 1):
-                            if regex.search(line):
-                                matches.append(
-                                    {
-                                        "file": display_path,
-                                        "line_number": i,
-                                        "line_content": line.strip(),
-                                    }
-                                )
-                except (UnicodeDecodeError, PermissionError):
-                    # Skips files that cannot be decoded or lack permissions
-                    continue
+            result = search(
+                files,
+                regex,
+                display_path=lambda p: os.path.relpath(p, session_root),
+                offset=offset,
+                max_results=max_results,
+            )
 
             return {
                 "success": True,
                 "pattern": pattern,
                 "path": path,
                 "recursive": recursive,
-                "matches": matches,
-                "total_matches": len(matches),
+                "matches": result.matches,
+                "total_matches": len(result.matches),
+                "files_searched": result.files_searched,
+                "files_skipped": result.files_skipped,
+                "truncated": result.truncated,
+                "next_offset": offset + len(result.matches) if result.truncated else None,
             }
 
         # 2. Specific Exception Handling (Issue #55 Requirements)
@@ -0,0 +1,396 @@
+"""
+Search engine behind grep_search.
+
+- Files are listed in sorted order, skipping ``.git`` and anything matched
+  by ``.gitignore`` files (from the session root down), and searched by a
+  thread pool so file I/O overlaps.
+- Binary files (a NUL byte in the first 8 KiB) are skipped.
+- Patterns without regex metacharacters are matched with a plain substring
+  search over the raw bytes; files of ``MMAP_MIN_BYTES`` or more are
+  memory-mapped instead of read.
+- Results come back in file order and the search stops as soon as enough
+  matches for the requested page have been found.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+BINARY_SNIFF_BYTES = 8192
+MMAP_MIN_BYTES = 1 << 20
+PREFILTER_MAX_BYTES = 64 << 20  # Larger files are searched line by line without loading them
+MAX_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+_LONE_CR = re.compile(rb"\r(?!\n)")
+
+
+# ---------------------------------------------------------------------------
+# .gitignore rules
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """One .gitignore line, matched against paths relative to ``base``."""
+
+    base: str
+    regex: re.Pattern
+    negated: bool
+    dir_only: bool
+    prefix: str = ""  # base with a trailing separator
+
+    def __post_init__(self):
+        object.__setattr__(self, "prefix", os.path.join(self.base, ""))
+
+    def matches(self, path: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if not path.startswith(self.prefix):
+            return False
+        rel = path[len(self.prefix) :]
+        if os.sep != "/":
+            rel = rel.replace(os.sep, "/")
+        return self.regex.match(rel) is not None
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore glob to a regex body."""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+def parse_gitignore(base: str, text: str) -> list[IgnoreRule]:
+    """Parse the contents of ``base/.gitignore``."""
+    rules = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        # A slash anywhere but the end anchors the pattern to the .gitignore's directory
+        anchored = "/" in line
+        body = _translate(line.lstrip("/"))
+        regex = re.compile(("^" if anchored else "^(?:.*/)?") + body + "$", re.DOTALL)
+        rules.append(IgnoreRule(base=base, regex=regex, negated=negated, dir_only=dir_only))
+    return rules
+
+
+def load_gitignore(directory: str) -> list[IgnoreRule]:
+    try:
+        with open(os.path.join(directory, ".gitignore"), encoding="utf-8") as f:
+            return parse_gitignore(directory, f.read())
+    except (OSError, UnicodeDecodeError):
+        return []
+
+
+def is_ignored(rules: list[IgnoreRule], path: str, is_dir: bool) -> bool:
+    """Later rules (and deeper .gitignore files) override earlier ones."""
+    ignored = False
+    for rule in rules:
+        if rule.negated == ignored and rule.matches(path, is_dir):
+            ignored = not rule.negated
+    return ignored
+
+
+def inherited_rules(directory: str, root: str) -> list[IgnoreRule]:
+    """Rules from .gitignore files in *root* and between it and *directory* (exclusive)."""
+    directory, root = os.path.abspath(directory), os.path.abspath(root)
+    parents = []
+    current = os.path.dirname(directory)
+    while current.startswith(root) and current != directory:
+        parents.append(current)
+        if current == root:
+            break
+        current = os.path.dirname(current)
+    rules: list[IgnoreRule] = []
+    for parent in reversed(parents):
+        rules.extend(load_gitignore(parent))
+    return rules
+
+
+def iter_files(
+    directory: str,
+    recursive: bool,
+    rules: list[IgnoreRule] | None = None,
+    use_gitignore: bool = True,
+) -> Iterator[str]:
+    """Yield files under *directory* in sorted order, skipping ignored paths."""
+    rules = list(rules or [])
+    if use_gitignore:
+        rules += load_gitignore(directory)
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except (PermissionError, FileNotFoundError):
+        return
+
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            is_file = not is_dir and entry.is_file()
+        except OSError:
+            continue
+        if use_gitignore and is_ignored(rules, entry.path, is_dir):
+            continue
+        if is_dir:
+            if recursive and entry.name != ".git":
+                yield from iter_files(entry.path, recursive, rules, use_gitignore)
+        elif is_file:
+            yield entry.path
+
+
+# ---------------------------------------------------------------------------
+# Matching
+# ---------------------------------------------------------------------------
+
+
+def is_literal(pattern: str) -> bool:
+    """True if *pattern* matches itself (no metacharacters, no line breaks)."""
+    return bool(pattern) and not any(c in _REGEX_METACHARACTERS or c in "\r\n" for c in pattern)
+
+
+@dataclass
+class FileResult:
+    """Matches found in one file, as (line number, stripped line) pairs."""
+
+    matches: list[tuple[int, str]] = field(default_factory=list)
+    skipped: bool = False
+
+
+def _count_newlines(data: bytes | mmap.mmap, start: int, end: int) -> int:
+    # mmap has no count(); count slices of bounded size instead
+    total = 0
+    for chunk_start in range(start, end, MMAP_MIN_BYTES):
+        total += data[chunk_start : min(end, chunk_start + MMAP_MIN_BYTES)].count(b"\n")
+    return total
+
+
+def _search_literal(data: bytes | mmap.mmap, needle: bytes, limit: int) -> FileResult:
+    result = FileResult()
+    line_number, counted_to = 1, 0
+    pos = data.find(needle)
+    while pos != -1 and len(result.matches) < limit:
+        line_start = data.rfind(b"\n", 0, pos) + 1
+        line_end = data.find(b"\n", pos)
+        if line_end == -1:
+            line_end = len(data)
+        line_number += _count_newlines(data, counted_to, line_start)
+        counted_to = line_start
+        try:
+            line = data[line_start:line_end].decode("utf-8")
+        except UnicodeDecodeError:
+            return FileResult(skipped=True)
+        result.matches.append((line_number, line.strip()))
+        pos = data.find(needle, line_end + 1)
+    return result
+
+
+def prefilter(regex: re.Pattern) -> re.Pattern | None:
+    """
+    Return a pattern that matches somewhere in a file whenever *regex* matches one of its lines.
+
+    Most files searched contain no match, and one whole-file search is much
+    cheaper than one search per line. Returns None for patterns whose result
+    depends on where the text ends (\\A, \\Z), on text beyond the line
+    (negative lookarounds) or that turn MULTILINE off. Anchored patterns
+    (``^...``) are already fast line by line, so they are left alone too.
+    """
+    if regex.pattern.startswith("^"):
+        return None
+    if any(token in regex.pattern for token in ("\\A", "\\Z", "(?!", "(?<!", "(?-")):
+        return None
+    try:
+        return re.compile(regex.pattern, regex.flags | re.MULTILINE)
+    except re.error:
+        return None
+
+
+def _search_lines(
+    path: str, regex: re.Pattern, limit: int, whole_file: re.Pattern | None = None
+) -> FileResult:
+    result = FileResult()
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f
+            if whole_file is not None and os.fstat(f.fileno()).st_size <= PREFILTER_MAX_BYTES:
+                text = f.read()
+                if not whole_file.search(text):
+                    return result
+                lines = io.StringIO(text)
+            for i, line in enumerate(lines, 1):
+                if regex.search(line):
+                    result.matches.append((i, line.strip()))
+                    if len(result.matches) >= limit:
+                        break
+    except UnicodeDecodeError:
+        return FileResult(skipped=True)
+    return result
+
+
+def search_file(
+    path: str,
+    regex: re.Pattern,
+    literal: bytes | None,
+    limit: int,
+    whole_file: re.Pattern | None = None,
+) -> FileResult:
+    """Search one file; unreadable, binary and non-UTF-8 files are skipped."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(BINARY_SNIFF_BYTES)
+            if b"\0" in head:
+                return FileResult(skipped=True)
+            if literal is None:
+                return _search_lines(path, regex, limit, whole_file)
+
+            size = os.fstat(f.fileno()).st_size
+            if size >= MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return _search_literal_checked(path, data, regex, literal, limit)
+            f.seek(0)
+            return _search_literal_checked(path, f.read(), regex, literal, limit)
+    except OSError:
+        return FileResult(skipped=True)
+
+
+def _search_literal_checked(
+    path: str,
+    data: bytes | mmap.mmap,
+    regex: re.Pattern,
+    literal: bytes,
+    limit: int,
+) -> FileResult:
+    # Lone \r line endings count as line breaks when reading text; let the
+    # line-by-line search handle those rare files so line numbers agree.
+    if _LONE_CR.search(data):
+        return _search_lines(path, regex, limit)
+    return _search_literal(data, literal, limit)
+
+
+@dataclass
+class SearchResult:
+    """One page of matches across files."""
+
+    matches: list[dict]
+    files_searched: int
+    files_skipped: int
+    truncated: bool
+
+
+def search(
+    files: Iterator[str],
+    regex: re.Pattern,
+    display_path,
+    offset: int = 0,
+    max_results: int | None = None,
+    max_workers: int = MAX_WORKERS,
+) -> SearchResult:
+    """
+    Search *files* in parallel, returning matches in file order.
+
+    Args:
+        files: Paths to search, in result order
+        regex: Compiled pattern
+        display_path: Maps a file path to the path shown in results
+        offset: Number of matches to skip (for pagination)
+        max_results: Stop after this many matches (None = all)
+        max_workers: Threads searching files concurrently
+
+    Returns:
+        SearchResult; ``truncated`` is True if more matches may follow
+    """
+    literal = regex.pattern.encode("utf-8") if is_literal(regex.pattern) else None
+    whole_file = prefilter(regex) if literal is None else None
+    wanted = offset + max_results if max_results is not None else float("inf")
+    per_file_limit = int(min(wanted, 2**62))
+
+    collected: list[dict] = []
+    searched = skipped = 0
+    truncated = False
+    pending: deque[tuple[str, Future]] = deque()
+    files = iter(files)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="grep") as pool:
+
+        def submit_next() -> bool:
+            path = next(files, None)
+            if path is None:
+                return False
+            future = pool.submit(search_file, path, regex, literal, per_file_limit, whole_file)
+            pending.append((path, future))
+            return True
+
+        # Keep a bounded window of files in flight; consume them in order
+        while len(pending) < max_workers * 4 and submit_next():
+            pass
+        while pending:
+            path, future = pending.popleft()
+            result = future.result()
+            searched += 1
+            skipped += result.skipped
+            shown = display_path(path)
+            for line_number, content in result.matches:
+                collected.append(
+                    {"file": shown, "line_number": line_number, "line_content": content}
+                )
+            if len(collected) >= wanted:
+                truncated = len(collected) > wanted or bool(pending) or submit_next()
+                break
+            submit_next()
+
+        for _, future in pending:
+            future.cancel()
+
+    end = offset + max_results if max_results is not None else None
+    return SearchResult(
+        matches=collected[offset:end],
+        files_searched=searched,
+        files_skipped=skipped,
+        truncated=truncated,
+    )
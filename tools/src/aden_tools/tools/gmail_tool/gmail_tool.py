@@ -21,6 +21,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -64,7 +66,7 @@ def _gmail_request(
         method: str, path: str, access_token: str, **kwargs: object
     ) -> httpx.Response:
         """Make an authenticated Gmail API request."""
-        return httpx.request(
+        return http_client.request(
             method,
             f"{GMAIL_API_BASE}/{path}",
             headers={
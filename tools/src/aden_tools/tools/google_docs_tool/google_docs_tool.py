@@ -25,6 +25,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -174,7 +176,7 @@ def _b64url_encode(data: bytes) -> str:
         jwt_token = f"{signing_input}.{signature_b64}"
 
         # Exchange JWT for access token
-        response = httpx.post(
+        response = http_client.post(
             token_uri,
             data={
                 "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
@@ -236,7 +238,7 @@ def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
 
     def create_document(self, title: str) -> dict[str, Any]:
         """Create a new blank document with a specified title."""
-        response = httpx.post(
+        response = http_client.post(
             f"{GOOGLE_DOCS_API_BASE}/documents",
             headers=self._headers,
             json={"title": title},
@@ -246,7 +248,7 @@ def create_document(self, title: str) -> dict[str, Any]:
 
     def get_document(self, document_id: str) -> dict[str, Any]:
         """Retrieve the full structural content, metadata, and elements of a document."""
-        response = httpx.get(
+        response = http_client.get(
             f"{GOOGLE_DOCS_API_BASE}/documents/{document_id}",
             headers=self._headers,
             timeout=30.0,
@@ -255,7 +257,7 @@ def get_document(self, document_id: str) -> dict[str, Any]:
 
     def batch_update(self, document_id: str, requests: list[dict[str, Any]]) -> dict[str, Any]:
         """Execute multiple requests in a single atomic operation."""
-        response = httpx.post(
+        response = http_client.post(
             f"{GOOGLE_DOCS_API_BASE}/documents/{document_id}:batchUpdate",
             headers=self._headers,
             json={"requests": requests},
@@ -419,7 +421,7 @@ def add_comment(
         if quoted_text:
             body["quotedFileContent"] = {"value": quoted_text}
 
-        response = httpx.post(
+        response = http_client.post(
             f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/comments",
             headers=self._headers,
             params={"fields": "*"},
@@ -444,7 +446,7 @@ def list_comments(
         if page_token:
             params["pageToken"] = page_token
 
-        response = httpx.get(
+        response = http_client.get(
             f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/comments",
             headers=self._headers,
             params=params,
@@ -458,7 +460,7 @@ def export_document(
         mime_type: str = "application/pdf",
     ) -> dict[str, Any]:
         """Export the document to different formats (PDF, DOCX, TXT)."""
-        response = httpx.get(
+        response = http_client.get(
             f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/export",
             headers=self._headers,
             params={"mimeType": mime_type},
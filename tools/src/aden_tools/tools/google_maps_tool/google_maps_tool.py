@@ -20,6 +20,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -30,6 +32,24 @@
 _PLACE_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
 _PLACE_SEARCH_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
 
+
+def _geocode_succeeded(response: httpx.Response) -> bool:
+    """Whether a 200 geocoding response carries a result rather than an error status.
+
+    Google reports quota and key errors (OVER_QUERY_LIMIT, REQUEST_DENIED,
+    UNKNOWN_ERROR, ...) in the body of a 200, and those must not be cached.
+    """
+    try:
+        return response.json().get("status") in ("OK", "ZERO_RESULTS")
+    except ValueError:
+        return False
+
+
+# Geocodes (forward and reverse) are stable for the length of a run. Only the
+# geocoding endpoint is cached: directions and distances depend on traffic
+# and departure time, and place details change (e.g. opening hours).
+http_client.set_cache_ttl(_GEOCODE_URL, 3600.0, cacheable=_geocode_succeeded)
+
 _MISSING_KEY_ERROR = {
     "error": "Google Maps API key not configured",
     "help": (
@@ -51,7 +71,7 @@ def __init__(self, api_key: str):
     def get(self, url: str, params: dict) -> httpx.Response:
         """Execute a GET request with API key authentication."""
         params["key"] = self._api_key
-        return httpx.get(url, params=params, timeout=_REQUEST_TIMEOUT)
+        return http_client.get(url, params=params, timeout=_REQUEST_TIMEOUT)
 
     def handle_status(self, api_status: str, error_message: str = "") -> dict | None:
         """Check API-level status and return error dict if not OK.
@@ -102,7 +122,7 @@ def _make_client() -> _GoogleMapsClient | None:
 
     # ── Tool 1: Geocoding ──────────────────────────────────────────────
 
-    @mcp.tool()
+    @mcp.tool(meta={"cache": {"ttl": 86400}})
     def maps_geocode(
         address: str,
         components: str = "",
@@ -191,7 +211,7 @@ def maps_geocode(
 
     # ── Tool 2: Reverse Geocoding ──────────────────────────────────────
 
-    @mcp.tool()
+    @mcp.tool(meta={"cache": {"ttl": 86400}})
     def maps_reverse_geocode(
         latitude: float,
         longitude: float,
@@ -16,6 +16,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -68,7 +70,7 @@ def search_objects(
         if properties:
             body["properties"] = properties
 
-        response = httpx.post(
+        response = http_client.post(
             f"{HUBSPOT_API_BASE}/crm/v3/objects/{object_type}/search",
             headers=self._headers,
             json=body,
@@ -87,7 +89,7 @@ def get_object(
         if properties:
             params["properties"] = ",".join(properties)
 
-        response = httpx.get(
+        response = http_client.get(
             f"{HUBSPOT_API_BASE}/crm/v3/objects/{object_type}/{object_id}",
             headers=self._headers,
             params=params,
@@ -101,7 +103,7 @@ def create_object(
         properties: dict[str, str],
     ) -> dict[str, Any]:
         """Create a CRM object."""
-        response = httpx.post(
+        response = http_client.post(
             f"{HUBSPOT_API_BASE}/crm/v3/objects/{object_type}",
             headers=self._headers,
             json={"properties": properties},
@@ -116,7 +118,7 @@ def update_object(
         properties: dict[str, str],
     ) -> dict[str, Any]:
         """Update a CRM object."""
-        response = httpx.patch(
+        response = http_client.patch(
             f"{HUBSPOT_API_BASE}/crm/v3/objects/{object_type}/{object_id}",
             headers=self._headers,
             json={"properties": properties},
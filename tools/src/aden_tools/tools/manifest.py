@@ -0,0 +1,254 @@
+"""
+Tool manifest - tool schemas without importing tool implementations.
+
+``tool_manifest.json`` records, for every tool, the module that registers it
+and the schema FastMCP derived from its signature. ``register_lazy_tools``
+serves those schemas directly and imports a tool's module the first time one
+of its tools is called, so an MCP server answers ``list_tools`` without
+loading Playwright, pandas, DuckDB or the Google clients.
+
+Regenerate the manifest after adding or changing a tool::
+
+    python -m aden_tools.tools.manifest
+
+``tests/tools/test_tool_manifest.py`` fails when it is out of date.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import importlib
+import json
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from fastmcp import FastMCP
+from fastmcp.tools import Tool
+from fastmcp.tools.tool import ToolResult
+from mcp.types import ToolAnnotations
+from pydantic import PrivateAttr
+
+if TYPE_CHECKING:
+    from aden_tools.credentials import CredentialStoreAdapter
+
+MANIFEST_PATH = Path(__file__).with_name("tool_manifest.json")
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ToolModule:
+    """A module under ``aden_tools.tools`` exposing ``register_tools``."""
+
+    module: str
+    credentials: bool = False
+
+
+# Registration order matters: a later module wins if two register the same name.
+TOOL_MODULES: tuple[ToolModule, ...] = (
+    # Tools that don't need credentials
+    ToolModule("example_tool"),
+    ToolModule("web_scrape_tool"),
+    ToolModule("pdf_read_tool"),
+    ToolModule("time_tool"),
+    ToolModule("runtime_logs_tool"),
+    ToolModule("arxiv_tool"),
+    # Tools that need credentials
+    ToolModule("web_search_tool", credentials=True),
+    ToolModule("github_tool", credentials=True),
+    ToolModule("email_tool", credentials=True),
+    ToolModule("gmail_tool", credentials=True),
+    ToolModule("hubspot_tool", credentials=True),
+    ToolModule("apollo_tool", credentials=True),
+    ToolModule("bigquery_tool", credentials=True),
+    ToolModule("calcom_tool", credentials=True),
+    ToolModule("calendar_tool", credentials=True),
+    ToolModule("discord_tool", credentials=True),
+    ToolModule("exa_search_tool", credentials=True),
+    ToolModule("news_tool", credentials=True),
+    ToolModule("razorpay_tool", credentials=True),
+    ToolModule("serpapi_tool", credentials=True),
+    ToolModule("slack_tool", credentials=True),
+    ToolModule("telegram_tool", credentials=True),
+    ToolModule("vision_tool", credentials=True),
+    ToolModule("google_docs_tool", credentials=True),
+    ToolModule("google_maps_tool", credentials=True),
+    ToolModule("account_info_tool", credentials=True),
+    # File system toolkits
+    ToolModule("file_system_toolkits.view_file"),
+    ToolModule("file_system_toolkits.write_to_file"),
+    ToolModule("file_system_toolkits.list_dir"),
+    ToolModule("file_system_toolkits.replace_file_content"),
+    ToolModule("file_system_toolkits.apply_diff"),
+    ToolModule("file_system_toolkits.apply_patch"),
+    ToolModule("file_system_toolkits.grep_search"),
+    ToolModule("file_system_toolkits.execute_command_tool"),
+    ToolModule("file_system_toolkits.data_tools"),
+    ToolModule("csv_tool"),
+    ToolModule("excel_tool"),
+    # Security scanning tools
+    ToolModule("ssl_tls_scanner"),
+    ToolModule("http_headers_scanner"),
+    ToolModule("dns_security_scanner"),
+    ToolModule("port_scanner"),
+    ToolModule("tech_stack_detector"),
+    ToolModule("subdomain_enumerator"),
+    ToolModule("risk_scorer"),
+    ToolModule("stripe_tool", credentials=True),
+    ToolModule("postgres_tool", credentials=True),
+)
+
+_MODULES_BY_NAME = {m.module: m for m in TOOL_MODULES}
+
+
+def register_module(
+    mcp: FastMCP,
+    spec: ToolModule,
+    credentials: CredentialStoreAdapter | None = None,
+) -> None:
+    """Import *spec*'s module and call its ``register_tools`` on *mcp*."""
+    module = importlib.import_module(f"{__package__}.{spec.module}")
+    if spec.credentials:
+        module.register_tools(mcp, credentials=credentials)
+    else:
+        module.register_tools(mcp)
+
+
+def matches(name: str, include: Iterable[str] | None) -> bool:
+    """True when *include* is ``None`` or one of its glob patterns matches *name*."""
+    if include is None:
+        return True
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in include)
+
+
+# ---------------------------------------------------------------------------
+# Manifest generation
+# ---------------------------------------------------------------------------
+
+
+def build_manifest() -> dict[str, Any]:
+    """Import every tool module and capture the schemas FastMCP generates."""
+    entries: dict[str, dict[str, Any]] = {}
+    for spec in TOOL_MODULES:
+        scratch = FastMCP(f"manifest-{spec.module}")
+        register_module(scratch, spec)
+        for name, tool in scratch._tool_manager._tools.items():
+            entries.pop(name, None)  # keep registration order for overrides
+            entries[name] = {
+                "name": name,
+                "module": spec.module,
+                "description": tool.description,
+                "parameters": tool.parameters,
+                "output_schema": tool.output_schema,
+                "annotations": (
+                    tool.annotations.model_dump(exclude_none=True) if tool.annotations else None
+                ),
+                "meta": tool.meta,
+            }
+    return {"version": MANIFEST_VERSION, "tools": list(entries.values())}
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> int:
+    """Regenerate the manifest file. Returns the number of tools."""
+    manifest = build_manifest()
+    path.write_text(json.dumps(manifest, indent=1, ensure_ascii=False) + "\n", encoding="utf-8")
+    return len(manifest["tools"])
+
+
+@lru_cache(maxsize=1)
+def load_manifest() -> dict[str, Any]:
+    """Read the bundled manifest (cached for the life of the process)."""
+    return json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# Lazy registration
+# ---------------------------------------------------------------------------
+
+
+class _ModuleLoader:
+    """Imports one tool module on first use and registers it on a private server."""
+
+    def __init__(self, spec: ToolModule, credentials: CredentialStoreAdapter | None):
+        self._spec = spec
+        self._credentials = credentials
+        self._tools: dict[str, Tool] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._tools is not None
+
+    def get(self, name: str) -> Tool:
+        if self._tools is None:
+            with self._lock:
+                if self._tools is None:
+                    scratch = FastMCP(f"lazy-{self._spec.module}")
+                    register_module(scratch, self._spec, self._credentials)
+                    self._tools = dict(scratch._tool_manager._tools)
+        return self._tools[name]
+
+
+class LazyTool(Tool):
+    """Tool advertised from the manifest; the implementation is imported on first call."""
+
+    _loader: _ModuleLoader = PrivateAttr()
+
+    async def run(self, arguments: dict[str, Any]) -> ToolResult:
+        loader = self._loader
+        if loader.loaded:
+            tool = loader.get(self.name)
+        else:
+            # Importing heavy modules (Playwright, pandas, ...) must not block the loop
+            tool = await asyncio.to_thread(loader.get, self.name)
+        return await tool.run(arguments)
+
+
+def register_lazy_tools(
+    mcp: FastMCP,
+    credentials: CredentialStoreAdapter | None = None,
+    include: Iterable[str] | None = None,
+) -> list[str]:
+    """
+    Register manifest tools on *mcp* without importing their modules.
+
+    Args:
+        mcp: FastMCP server instance
+        credentials: Passed to each module's ``register_tools`` on first use
+        include: Optional tool-name glob patterns; other tools are not exposed
+
+    Returns:
+        List of registered tool names
+    """
+    include = list(include) if include is not None else None
+    loaders: dict[str, _ModuleLoader] = {}
+    registered = []
+    for entry in load_manifest()["tools"]:
+        name = entry["name"]
+        if not matches(name, include):
+            continue
+        module = entry["module"]
+        if module not in loaders:
+            loaders[module] = _ModuleLoader(_MODULES_BY_NAME[module], credentials)
+        annotations = entry.get("annotations")
+        tool = LazyTool(
+            name=name,
+            description=entry.get("description"),
+            parameters=entry["parameters"],
+            output_schema=entry.get("output_schema"),
+            annotations=ToolAnnotations(**annotations) if annotations else None,
+            meta=entry.get("meta"),
+        )
+        tool._loader = loaders[module]
+        mcp.add_tool(tool)
+        registered.append(name)
+    return registered
+
+
+if __name__ == "__main__":
+    count = write_manifest()
+    print(f"Wrote {count} tools to {MANIFEST_PATH}")
@@ -18,6 +18,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -25,6 +27,10 @@
 NEWSDATA_ARCHIVE_URL = "https://newsdata.io/api/1/archive"
 FINLIGHT_URL = "https://api.finlight.me/v2/articles"
 
+# Identical NewsData queries within a few minutes reuse the earlier result.
+http_client.set_cache_ttl(NEWSDATA_URL, 300.0)
+http_client.set_cache_ttl(NEWSDATA_ARCHIVE_URL, 300.0)
+
 
 def register_tools(
     mcp: FastMCP,
@@ -196,7 +202,7 @@ def _search_newsdata(
 
         max_retries = 3
         for attempt in range(max_retries + 1):
-            response = httpx.get(url, params=params, timeout=30.0)
+            response = http_client.get(url, params=params, timeout=30.0)
 
             if response.status_code == 429 and attempt < max_retries:
                 time.sleep(2**attempt)
@@ -248,7 +254,7 @@ def _search_finlight(
 
         max_retries = 3
         for attempt in range(max_retries + 1):
-            response = httpx.post(FINLIGHT_URL, json=json_body, headers=headers, timeout=30.0)
+            response = http_client.post(FINLIGHT_URL, json=json_body, headers=headers, timeout=30.0)
 
             if response.status_code == 429 and attempt < max_retries:
                 time.sleep(2**attempt)
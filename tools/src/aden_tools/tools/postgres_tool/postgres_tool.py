@@ -10,21 +10,38 @@
 - SQL hashing for safe logging (no raw query logs)
 - CredentialStore integration
 - Thread-safe connection pooling
+
+Performance:
+- One connection pool per database URL, kept in an LRU of ``MAX_POOLS``
+  pools, so agents querying several databases don't rebuild pools
+- Connections idle for ``HEALTH_CHECK_AFTER_S`` are pinged before reuse and
+  replaced if broken; the statement timeout is set once per connection
+- ``pg_query`` reads through a server-side cursor. Results larger than
+  ``MAX_ROWS`` are streamed into a CSV file in ``data_dir`` and only a
+  preview and the row count are returned
 """
 
 from __future__ import annotations
 
+import csv
 import hashlib
+import json
 import logging
 import os
 import re
+import threading
 import time
+import uuid
+from collections import OrderedDict
 from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 import psycopg2 as psycopg
 from fastmcp import FastMCP
 from psycopg2 import pool, sql as pg_sql
+from psycopg2.extensions import parse_dsn
 
 from aden_tools.credentials import CREDENTIAL_SPECS
 from aden_tools.credentials.store_adapter import CredentialStoreAdapter
@@ -34,11 +51,15 @@
 
 MIN_POOL_SIZE = 1
 MAX_POOL_SIZE = 10
+MAX_POOLS = 8  # Database URLs with a live pool; the least recently used is closed
+HEALTH_CHECK_AFTER_S = 30.0  # Ping connections idle for longer than this before reuse
+
+STREAM_BATCH_ROWS = 2000  # Rows per FETCH from the server-side cursor
+MAX_SPILL_ROWS = 1_000_000
+PREVIEW_ROWS = 20
 
 
 logger = logging.getLogger(__name__)
-_connection_pool: pool.ThreadedConnectionPool | None = None
-_pool_database_url: str | None = None
 
 
 # ============================================================
@@ -111,28 +132,92 @@ def validate_sql(sql: str) -> str:
 # ============================================================
 
 
-def _get_pool(database_url: str):
-    """
-    Retrieve a connection pool for the given PostgreSQL database URL.
+@dataclass
+class _PoolEntry:
+    """A database URL's pool, plus bookkeeping for eviction and health checks."""
 
-    This function lazily creates a connection pool when the first request is made.
-    Subsequent requests will reuse the existing connection pool.
+    pool: pool.ThreadedConnectionPool
+    in_use: int = 0
+    evicted: bool = False
+    returned_at: dict[int, float] = field(default_factory=dict)  # id(conn) -> time
 
-    Args:
-        database_url: PostgreSQL database URL
 
-    Returns:
-        A connection pool object
+_pools: OrderedDict[str, _PoolEntry] = OrderedDict()
+_pools_lock = threading.Lock()
+
+
+def _create_pool(database_url: str) -> pool.ThreadedConnectionPool:
+    """Create a pool whose connections carry the statement timeout."""
+    options = parse_dsn(database_url).get("options", "")
+    options = f"{options} -c statement_timeout={STATEMENT_TIMEOUT_MS}".strip()
+    return pool.ThreadedConnectionPool(
+        MIN_POOL_SIZE, MAX_POOL_SIZE, dsn=database_url, options=options
+    )
+
+
+def _acquire_pool(database_url: str) -> _PoolEntry:
     """
-    global _connection_pool, _pool_database_url
-    if _connection_pool is None or _pool_database_url != database_url:
-        if _connection_pool is not None:
-            _connection_pool.closeall()
-        _connection_pool = pool.ThreadedConnectionPool(
-            MIN_POOL_SIZE, MAX_POOL_SIZE, dsn=database_url
-        )
-        _pool_database_url = database_url
-    return _connection_pool
+    Return the pool for *database_url*, creating it if needed.
+
+    Pools are kept in an LRU of ``MAX_POOLS`` entries. An evicted pool is
+    closed once the connections checked out from it have been returned.
+    Callers must hand the entry back with ``_release_pool``.
+    """
+    with _pools_lock:
+        entry = _pools.get(database_url)
+        if entry is not None:
+            _pools.move_to_end(database_url)
+            entry.in_use += 1
+            return entry
+
+    created = _PoolEntry(pool=_create_pool(database_url))  # Connects outside the lock
+    evicted = []
+    with _pools_lock:
+        entry = _pools.get(database_url)
+        if entry is None:
+            entry = _pools[database_url] = created
+            created = None
+            while len(_pools) > MAX_POOLS:
+                _, old = _pools.popitem(last=False)
+                old.evicted = True
+                if old.in_use == 0:
+                    evicted.append(old)
+        else:
+            _pools.move_to_end(database_url)
+        entry.in_use += 1
+
+    if created is not None:
+        created.pool.closeall()  # Another thread created the pool first
+    for old in evicted:
+        old.pool.closeall()
+    return entry
+
+
+def _release_pool(entry: _PoolEntry) -> None:
+    with _pools_lock:
+        entry.in_use -= 1
+        close = entry.evicted and entry.in_use == 0
+    if close:
+        entry.pool.closeall()
+
+
+def _checkout(entry: _PoolEntry):
+    """Get a working connection, replacing closed or broken ones."""
+    for _ in range(MAX_POOL_SIZE):
+        conn = entry.pool.getconn()
+        returned_at = entry.returned_at.pop(id(conn), None)
+        if not conn.closed:
+            if returned_at is None or time.monotonic() - returned_at < HEALTH_CHECK_AFTER_S:
+                return conn
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1")
+                conn.rollback()
+                return conn
+            except (psycopg.OperationalError, psycopg.InterfaceError):
+                logger.info("postgres.pool.replacing_broken_connection")
+        entry.pool.putconn(conn, close=True)
+    raise psycopg.OperationalError("No healthy connection available")
 
 
 @contextmanager
@@ -150,25 +235,25 @@ def _get_connection(database_url: str):
     Yields:
         A connection object
     """
-    pool_instance = _get_pool(database_url)
-    conn = pool_instance.getconn()
-
+    entry = _acquire_pool(database_url)
     try:
-        # Ensure clean state
-        if conn.closed:
-            conn = pool_instance.getconn()
-
-        conn.rollback()  # Clear any aborted transaction
-        conn.set_session(readonly=True)
-
-        yield conn
-
-    finally:
+        conn = _checkout(entry)
         try:
-            conn.rollback()  # Always rollback before returning to pool
-        except Exception:
-            pass
-        pool_instance.putconn(conn)
+            conn.rollback()  # Clear any aborted transaction
+            conn.set_session(readonly=True)
+
+            yield conn
+
+        finally:
+            try:
+                conn.rollback()  # Always rollback before returning to pool
+            except Exception:
+                pass
+            if not conn.closed:
+                entry.returned_at[id(conn)] = time.monotonic()
+            entry.pool.putconn(conn, close=bool(conn.closed))
+    finally:
+        _release_pool(entry)
 
 
 # ============================================================
@@ -192,6 +277,48 @@ def _hash_sql(sql: str) -> str:
     return hashlib.sha256(sql.encode("utf-8")).hexdigest()[:12]
 
 
+def _csv_value(value: Any) -> Any:
+    """Format a value returned by psycopg2 for a CSV cell."""
+    if isinstance(value, memoryview | bytes):
+        return "\\x" + bytes(value).hex()
+    if isinstance(value, dict | list):
+        return json.dumps(value, default=str)
+    return value
+
+
+def _spill_rows(cur, columns: list[str], first: list, data_dir: str, sql_hash: str) -> dict:
+    """
+    Write *first* and the rest of *cur*'s rows to a CSV file in *data_dir*.
+
+    Rows are fetched ``STREAM_BATCH_ROWS`` at a time, so memory use does not
+    grow with the result size. At most ``MAX_SPILL_ROWS`` rows are written.
+
+    Returns:
+        dict with the file name, rows written and whether rows were left out
+    """
+    directory = Path(data_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    filename = f"pg_query_{sql_hash}_{uuid.uuid4().hex[:8]}.csv"
+    tmp = directory / f".{filename}.tmp"
+
+    written = 0
+    truncated = False
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        batch = first
+        while batch:
+            batch = batch[: MAX_SPILL_ROWS - written]
+            writer.writerows([_csv_value(v) for v in row] for row in batch)
+            written += len(batch)
+            if written >= MAX_SPILL_ROWS:
+                truncated = bool(cur.fetchmany(1))
+                break
+            batch = cur.fetchmany(STREAM_BATCH_ROWS)
+    os.replace(tmp, directory / filename)
+    return {"file": filename, "row_count": written, "truncated": truncated}
+
+
 def _error_response(message: str) -> dict:
     """
     Return a standardized error response for the Postgres tool.
@@ -268,19 +395,26 @@ def register_tools(
     """
 
     @mcp.tool()
-    def pg_query(sql: str, params: dict | None = None) -> dict:
+    def pg_query(sql: str, params: dict | None = None, data_dir: str = "") -> dict:
         """
         Execute a read-only SELECT query.
 
+        Results of up to max_rows rows are returned inline. Larger results are
+        written to a CSV file in data_dir (readable with load_data or the csv
+        tools); only the first rows and the row count are returned.
+
         Parameters:
             sql (str): SQL SELECT query
             params (dict, optional): Parameterized query values
+            data_dir (str, optional): Directory for large results (set by the framework)
 
         Returns:
             dict:
                 columns (list[str])
-                rows (list[list[Any]])
+                rows (list[list[Any]]): all rows, or a preview if spilled
                 row_count (int)
+                truncated (bool): rows were left out of the result
+                file (str): CSV file holding every row, if spilled
                 duration_ms (int)
                 success (bool)
         """
@@ -294,17 +428,26 @@ def pg_query(sql: str, params: dict | None = None) -> dict:
         try:
             sql = validate_sql(sql)
             params = params or {}
+            spill = None
 
             with _get_connection(database_url) as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        "SET statement_timeout TO %s",
-                        (STATEMENT_TIMEOUT_MS,),
-                    )
+                # Named cursor: rows stay on the server until fetched
+                with conn.cursor(name=f"pg_query_{uuid.uuid4().hex[:12]}") as cur:
+                    cur.itersize = STREAM_BATCH_ROWS
                     cur.execute(sql, params)
-
+                    rows = cur.fetchmany(MAX_ROWS + 1)
                     columns = [d.name for d in cur.description]
-                    rows = cur.fetchmany(MAX_ROWS)
+
+                    if len(rows) > MAX_ROWS and data_dir:
+                        spill = _spill_rows(cur, columns, rows, data_dir, sql_hash)
+
+            truncated = len(rows) > MAX_ROWS
+            if spill is not None:
+                row_count, rows = spill["row_count"], rows[:PREVIEW_ROWS]
+                truncated = spill["truncated"]
+            else:
+                rows = rows[:MAX_ROWS]
+                row_count = len(rows)
 
             duration_ms = int((time.monotonic() - start) * 1000)
 
@@ -312,19 +455,25 @@ def pg_query(sql: str, params: dict | None = None) -> dict:
                 "postgres.query.success",
                 extra={
                     "sql_hash": sql_hash,
-                    "row_count": len(rows),
+                    "row_count": row_count,
+                    "spilled": spill is not None,
                     "duration_ms": duration_ms,
                 },
             )
 
-            return {
+            result = {
                 "columns": columns,
                 "rows": rows,
-                "row_count": len(rows),
+                "row_count": row_count,
                 "max_rows": MAX_ROWS,
+                "truncated": truncated,
                 "duration_ms": duration_ms,
                 "success": True,
             }
+            if spill is not None:
+                result["file"] = spill["file"]
+                result["preview_rows"] = len(rows)
+            return result
 
         except ValueError as e:
             logger.warning(
@@ -354,7 +503,7 @@ def pg_query(sql: str, params: dict | None = None) -> dict:
             )
             return _error_response("Unexpected error while executing query")
 
-    @mcp.tool()
+    @mcp.tool(meta={"cache": {"ttl": 300}})
     def pg_list_schemas() -> dict:
         """
         List all schemas in the PostgreSQL database.
@@ -384,7 +533,7 @@ def pg_list_schemas() -> dict:
         except psycopg.Error:
             return _error_response("Failed to list schemas")
 
-    @mcp.tool()
+    @mcp.tool(meta={"cache": {"ttl": 300}})
     def pg_list_tables(schema: str | None = None) -> dict:
         """
         List all tables in the database.
@@ -423,7 +572,7 @@ def pg_list_tables(schema: str | None = None) -> dict:
         except psycopg.Error:
             return _error_response("Failed to list tables")
 
-    @mcp.tool()
+    @mcp.tool(meta={"cache": {"ttl": 300}})
     def pg_describe_table(schema: str, table: str) -> dict:
         """
         Describe a PostgreSQL table.
@@ -5,16 +5,25 @@
 - query_runtime_log_details: Level 2 per-node results (which node failed?)
 - query_runtime_log_raw:     Level 3 full step data (what exactly happened?)
 
+A fourth, query_runtime_log_stats, answers aggregates across runs (failure
+rate by node, p95 latency by tool, tokens by goal).
+
 Implementation uses pure sync file I/O -- no imports from the core runtime
 logger/store classes. L2 and L3 use JSONL format (one JSON object per line).
 L1 uses standard JSON. The file format is the interface between writer
 (RuntimeLogger -> RuntimeLogStore) and reader (these MCP tools).
+
+The runtime also records every finished run in ``run_analytics.db`` (SQLite,
+see ``framework.storage.run_analytics``). Summaries are read from it instead
+of from each summary.json, and the stats tool is a few queries over its
+``runs``, ``node_runs`` and ``tool_calls`` tables.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import sqlite3
 from pathlib import Path
 
 from fastmcp import FastMCP
@@ -76,6 +85,150 @@ def _get_run_dirs(agent_work_dir: Path) -> list[tuple[str, Path]]:
     return run_dirs
 
 
+def _load_summary(run_id: str, log_dir: Path) -> dict | None:
+    """Read a run's summary.json; runs without one are in progress."""
+    summary_path = log_dir / "summary.json"
+    if not summary_path.exists():
+        return {
+            "run_id": run_id,
+            "status": "in_progress",
+            "started_at": "",
+            "needs_attention": False,
+        }
+    try:
+        return json.loads(summary_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+ANALYTICS_FILENAME = "run_analytics.db"
+
+# Nearest-rank percentile: the row at rank ceil(n * p / 100) of each group
+_P95_SQL = """
+WITH ranked AS (
+    SELECT {key} AS key, latency_ms,
+           ROW_NUMBER() OVER (PARTITION BY {key} ORDER BY latency_ms) AS rank,
+           COUNT(*) OVER (PARTITION BY {key}) AS n
+    FROM {table}{where}
+)
+SELECT key, latency_ms FROM ranked WHERE rank = (n * 95 + 99) / 100
+"""
+
+
+def _open_analytics(agent_work_dir: Path) -> sqlite3.Connection | None:
+    """Open the run analytics store read-only, or None if there is none."""
+    path = agent_work_dir / ANALYTICS_FILENAME
+    if not path.is_file():
+        return None
+    try:
+        conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, timeout=10)
+        conn.execute("SELECT 1 FROM runs LIMIT 1")
+        return conn
+    except sqlite3.Error as e:
+        logger.warning("Run analytics store %s unusable: %s", path, e)
+        return None
+
+
+def _indexed_summaries(agent_work_dir: Path) -> dict[str, tuple[str, str]]:
+    """Map run_id -> (started_at, summary JSON) for every run in the analytics store."""
+    conn = _open_analytics(agent_work_dir)
+    if conn is None:
+        return {}
+    try:
+        rows = conn.execute("SELECT run_id, started_at, summary FROM runs").fetchall()
+    except sqlite3.Error as e:
+        logger.warning("Failed to read run analytics: %s", e)
+        return {}
+    finally:
+        conn.close()
+    return {run_id: (started_at, summary) for run_id, started_at, summary in rows}
+
+
+def _goal_filter(goal_id: str, table: str) -> tuple[str, tuple[str, ...]]:
+    if not goal_id:
+        return "", ()
+    return f" WHERE {table}.run_id IN (SELECT run_id FROM runs WHERE goal_id = ?)", (goal_id,)
+
+
+def _p95(conn: sqlite3.Connection, key: str, table: str, where: str, params: tuple) -> dict:
+    return dict(conn.execute(_P95_SQL.format(key=key, table=table, where=where), params))
+
+
+def _node_stats(conn: sqlite3.Connection, goal_id: str) -> list[dict]:
+    where, params = _goal_filter(goal_id, "node_runs")
+    p95 = _p95(conn, "node_id", "node_runs", where, params)
+    rows = conn.execute(
+        f"SELECT node_id, COUNT(*), SUM(success = 0), AVG(latency_ms), "
+        f"SUM(input_tokens), SUM(output_tokens) FROM node_runs{where} GROUP BY node_id",
+        params,
+    )
+    stats = [
+        {
+            "node_id": node_id,
+            "executions": executions,
+            "failures": failures,
+            "failure_rate": failures / executions,
+            "avg_latency_ms": avg_latency,
+            "p95_latency_ms": p95.get(node_id, 0),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+        }
+        for node_id, executions, failures, avg_latency, input_tokens, output_tokens in rows
+    ]
+    stats.sort(key=lambda s: (-s["failure_rate"], -s["executions"], s["node_id"]))
+    return stats
+
+
+def _tool_stats(conn: sqlite3.Connection, goal_id: str) -> list[dict]:
+    where, params = _goal_filter(goal_id, "tool_calls")
+    p95 = _p95(conn, "tool_name", "tool_calls", where, params)
+    rows = conn.execute(
+        f"SELECT tool_name, COUNT(*), SUM(is_error), AVG(latency_ms) "
+        f"FROM tool_calls{where} GROUP BY tool_name",
+        params,
+    )
+    stats = [
+        {
+            "tool_name": tool_name,
+            "calls": calls,
+            "errors": errors,
+            "error_rate": errors / calls,
+            "avg_latency_ms": avg_latency,
+            "p95_latency_ms": p95.get(tool_name, 0),
+        }
+        for tool_name, calls, errors, avg_latency in rows
+    ]
+    stats.sort(key=lambda s: (-s["p95_latency_ms"], s["tool_name"]))
+    return stats
+
+
+def _goal_stats(conn: sqlite3.Connection, goal_id: str) -> list[dict]:
+    where, params = (" WHERE goal_id = ?", (goal_id,)) if goal_id else ("", ())
+    rows = conn.execute(
+        f"SELECT goal_id, COUNT(*), SUM(status = 'failure'), SUM(input_tokens), "
+        f"SUM(output_tokens), AVG(duration_ms) FROM runs{where} GROUP BY goal_id",
+        params,
+    )
+    stats = [
+        {
+            "goal_id": goal,
+            "runs": runs,
+            "failures": failures,
+            "failure_rate": failures / runs,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "avg_tokens_per_run": (input_tokens + output_tokens) / runs,
+            "avg_duration_ms": avg_duration,
+        }
+        for goal, runs, failures, input_tokens, output_tokens, avg_duration in rows
+    ]
+    stats.sort(key=lambda s: (-(s["input_tokens"] + s["output_tokens"]), s["goal_id"]))
+    return stats
+
+
+_STATS = {"node": _node_stats, "tool": _tool_stats, "goal": _goal_stats}
+
+
 def register_tools(mcp: FastMCP) -> None:
     """Register runtime log query tools with the MCP server."""
 
@@ -87,7 +240,8 @@ def query_runtime_logs(
     ) -> dict:
         """Query runtime log summaries. Returns high-level pass/fail for recent graph runs.
 
-        Scans both old (runtime_logs/runs/) and new (sessions/*/logs/) locations.
+        Scans both old (runtime_logs/runs/) and new (sessions/*/logs/) locations;
+        finished runs are read from the run analytics store when present.
         Use status='needs_attention' to find runs that need debugging.
         Other status values: 'success', 'failure', 'degraded', 'in_progress'.
         Leave status empty to see all runs.
@@ -106,22 +260,21 @@ def query_runtime_logs(
         if not run_dirs:
             return {"runs": [], "total": 0, "message": "No runtime logs found"}
 
-        summaries = []
+        # Finished runs come from the analytics store; only runs it doesn't
+        # know about (in progress, or older than the store) read summary.json
+        indexed = _indexed_summaries(work_dir)
+        entries: list[tuple[str, str | dict]] = []
         for run_id, log_dir in run_dirs:
-            summary_path = log_dir / "summary.json"
-            if summary_path.exists():
-                try:
-                    data = json.loads(summary_path.read_text(encoding="utf-8"))
-                except (json.JSONDecodeError, OSError):
+            if run_id in indexed:
+                started_at, summary_json = indexed[run_id]
+                if not status:
+                    entries.append((started_at, summary_json))
                     continue
+                data = json.loads(summary_json)
             else:
-                # In-progress run: no summary.json yet
-                data = {
-                    "run_id": run_id,
-                    "status": "in_progress",
-                    "started_at": "",
-                    "needs_attention": False,
-                }
+                data = _load_summary(run_id, log_dir)
+                if data is None:
+                    continue
 
             # Apply status filter
             if status == "needs_attention":
@@ -130,15 +283,57 @@ def query_runtime_logs(
             elif status and data.get("status") != status:
                 continue
 
-            summaries.append(data)
+            entries.append((data.get("started_at", ""), data))
 
         # Sort by started_at descending
-        summaries.sort(key=lambda s: s.get("started_at", ""), reverse=True)
-        total = len(summaries)
-        summaries = summaries[:limit]
+        entries.sort(key=lambda e: e[0], reverse=True)
+        total = len(entries)
+        summaries = [
+            json.loads(data) if isinstance(data, str) else data for _, data in entries[:limit]
+        ]
 
         return {"runs": summaries, "total": total}
 
+    @mcp.tool()
+    def query_runtime_log_stats(
+        agent_work_dir: str,
+        group_by: str = "node",
+        goal_id: str = "",
+    ) -> dict:
+        """Aggregate finished runs: failure rate by node, latency by tool, or tokens by goal.
+
+        Use this to find systemic problems across many runs before drilling
+        into single runs with query_runtime_logs.
+
+        Args:
+            agent_work_dir: Path to the agent's working directory
+            group_by: 'node' (failure rate, latency, tokens per node),
+                'tool' (calls, error rate, avg/p95 latency per tool) or
+                'goal' (runs, failure rate, token usage per goal)
+            goal_id: Only aggregate runs for this goal (empty for all)
+
+        Returns:
+            Dict with 'group_by' and 'stats' list, worst/most expensive first
+        """
+        stats_fn = _STATS.get(group_by)
+        if stats_fn is None:
+            return {"error": f"group_by must be one of {sorted(_STATS)}, got '{group_by}'"}
+
+        conn = _open_analytics(Path(agent_work_dir))
+        if conn is None:
+            return {
+                "error": (
+                    f"No run analytics found in {agent_work_dir}. "
+                    "It is written by the runtime when a run finishes."
+                )
+            }
+        try:
+            return {"group_by": group_by, "stats": stats_fn(conn, goal_id)}
+        except sqlite3.Error as e:
+            return {"error": f"Failed to query run analytics: {e}"}
+        finally:
+            conn.close()
+
     @mcp.tool()
     def query_runtime_log_details(
         agent_work_dir: str,
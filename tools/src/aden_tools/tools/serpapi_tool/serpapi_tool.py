@@ -23,10 +23,15 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
 SERPAPI_BASE = "https://serpapi.com/search.json"
+
+# Identical searches within a few minutes reuse the earlier (billed) result.
+http_client.set_cache_ttl(SERPAPI_BASE, 300.0)
 SERPAPI_ACCOUNT = "https://serpapi.com/account.json"
 
 
@@ -39,7 +44,7 @@ def __init__(self, api_key: str):
     def _request(self, params: dict[str, Any]) -> dict[str, Any]:
         """Make a GET request to SerpAPI."""
         params["api_key"] = self._api_key
-        response = httpx.get(SERPAPI_BASE, params=params, timeout=30.0)
+        response = http_client.get(SERPAPI_BASE, params=params, timeout=30.0)
 
         if response.status_code == 401:
             return {
@@ -15,6 +15,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -71,7 +73,7 @@ def send_message(
         if parse_mode:
             payload["parse_mode"] = parse_mode
 
-        response = httpx.post(
+        response = http_client.post(
             f"{self._base_url}/sendMessage",
             json=payload,
             timeout=30.0,
@@ -95,7 +97,7 @@ def send_document(
         if parse_mode:
             payload["parse_mode"] = parse_mode
 
-        response = httpx.post(
+        response = http_client.post(
             f"{self._base_url}/sendDocument",
             json=payload,
             timeout=30.0,
@@ -104,7 +106,7 @@ def send_document(
 
     def get_me(self) -> dict[str, Any]:
         """Get bot information (useful for health checks)."""
-        response = httpx.get(
+        response = http_client.get(
             f"{self._base_url}/getMe",
             timeout=30.0,
         )
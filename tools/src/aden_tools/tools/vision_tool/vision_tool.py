@@ -25,6 +25,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -76,7 +78,7 @@ def _call_api(
     ) -> dict[str, Any]:
         """Make request to Vision API."""
         try:
-            response = httpx.post(
+            response = http_client.post(
                 VISION_API_URL,
                 params={"key": self._api_key},
                 json={"requests": [{"image": image_data, "features": features}]},
@@ -1,16 +1,23 @@
 """
 Web Scrape Tool - Extract content from web pages.
 
-Uses Playwright with stealth for headless browser scraping,
-enabling JavaScript-rendered content and bot detection evasion.
+Tries a plain HTTP fetch (httpx) first and only falls back to Playwright
+with stealth when the page needs JavaScript rendering or the server turns
+away non-browser clients. Rendered fetches share one long-lived Chromium
+(``BrowserPool``) with a bounded number of pages, per-domain concurrency
+limits and idle eviction, instead of launching a browser per call; the
+pool is closed by the MCP server's shutdown hooks.
 Uses BeautifulSoup for HTML parsing and content extraction.
 """
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 from typing import Any
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
+import httpx
 from bs4 import BeautifulSoup
 from fastmcp import FastMCP
 from playwright.async_api import (
@@ -20,6 +27,8 @@
 )
 from playwright_stealth import Stealth
 
+from aden_tools.utils.shutdown import on_shutdown
+
 # Browser-like User-Agent for actual page requests
 BROWSER_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -27,9 +36,383 @@
     "Chrome/131.0.0.0 Safari/537.36"
 )
 
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# Static pages with less extracted text than this are re-fetched in the
+# browser: they are usually JS app shells or bot-check interstitials.
+MIN_STATIC_TEXT_LENGTH = 200
+
+# Statuses that a real browser won't fix; anything else non-200 retries rendered.
+TERMINAL_HTTP_STATUSES = {404, 410}
+
+MAX_BATCH_URLS = 50
+
+# Bytes of HTML read on the plain-HTTP path; longer pages are truncated
+MAX_STATIC_BYTES = 5 * 1024 * 1024
+
+
+@dataclass
+class _Page:
+    """A fetched page, from either path."""
+
+    status: int
+    url: str  # final URL after redirects
+    content_type: str
+    html: str
+
+
+class BrowserPool:
+    """
+    Long-lived headless Chromium shared by all web_scrape calls.
+
+    - The browser is launched on first use and closed after ``idle_timeout``
+      seconds without an open page.
+    - At most ``max_pages`` pages are open at once; browser contexts are
+      reused (up to ``max_contexts`` kept warm) instead of recreated.
+    - At most ``per_domain_limit`` concurrent fetches (static or rendered)
+      hit the same host.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = 4,
+        max_contexts: int = 2,
+        per_domain_limit: int = 2,
+        idle_timeout: float = 120.0,
+    ) -> None:
+        self.max_pages = max_pages
+        self.max_contexts = max_contexts
+        self.per_domain_limit = per_domain_limit
+        self.idle_timeout = idle_timeout
+
+        self._page_slots = asyncio.Semaphore(max_pages)
+        self._domain_slots: dict[str, asyncio.Semaphore] = {}
+        self._launch_lock = asyncio.Lock()
+        self._pw_cm: Any = None
+        self._browser: Any = None
+        self._idle_contexts: list[Any] = []
+        self._open_pages = 0
+        self._evict_handle: asyncio.TimerHandle | None = None
+        self._http: httpx.AsyncClient | None = None
+
+        self.launches = 0
+
+    # --- domain limits ---
+
+    def domain_slot(self, url: str) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent fetches to ``url``'s host."""
+        host = urlsplit(url).hostname or ""
+        slot = self._domain_slots.get(host)
+        if slot is None:
+            slot = self._domain_slots[host] = asyncio.Semaphore(self.per_domain_limit)
+        return slot
+
+    # --- static fetch ---
+
+    def http_client(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=httpx.Timeout(20.0, connect=10.0),
+                headers={"User-Agent": BROWSER_USER_AGENT, "Accept-Language": "en-US"},
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            )
+        return self._http
+
+    # --- rendered fetch ---
+
+    async def render(self, url: str) -> _Page | None:
+        """Load ``url`` in a pooled browser page. Returns None if navigation failed."""
+        async with self._page_slots:
+            context = await self._acquire_context()
+            page = None
+            try:
+                page = await context.new_page()
+                await Stealth().apply_stealth_async(page)
+                response = await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+                if response is None:
+                    return None
+                # Give JS a moment to render dynamic content, without a fixed sleep
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=3000)
+                except PlaywrightTimeout:
+                    pass
+                return _Page(
+                    status=response.status,
+                    url=str(response.url),
+                    content_type=response.headers.get("content-type", "").lower(),
+                    html=await page.content(),
+                )
+            finally:
+                if page is not None:
+                    await page.close()
+                self._release_context(context)
+
+    async def _acquire_context(self) -> Any:
+        self._open_pages += 1
+        try:
+            if self._idle_contexts:
+                return self._idle_contexts.pop()
+            browser = await self._ensure_browser()
+            return await browser.new_context(
+                viewport={"width": 1920, "height": 1080},
+                user_agent=BROWSER_USER_AGENT,
+                locale="en-US",
+            )
+        except BaseException:
+            self._open_pages -= 1
+            raise
+
+    def _release_context(self, context: Any) -> None:
+        self._open_pages -= 1
+        if self._browser is not None and len(self._idle_contexts) < self.max_contexts:
+            self._idle_contexts.append(context)
+        else:
+            asyncio.ensure_future(context.close())
+        self._schedule_eviction()
+
+    def _schedule_eviction(self) -> None:
+        """(Re)arm the idle timer; the browser closes when it fires with no open pages."""
+        if self._evict_handle is not None:
+            self._evict_handle.cancel()
+        self._evict_handle = asyncio.get_running_loop().call_later(
+            self.idle_timeout, self._evict_if_idle
+        )
+
+    def _evict_if_idle(self) -> None:
+        self._evict_handle = None
+        if self._open_pages == 0 and self._browser is not None:
+            asyncio.ensure_future(self._close_browser(only_if_idle=True))
+
+    async def _ensure_browser(self) -> Any:
+        async with self._launch_lock:
+            if self._browser is None:
+                self._pw_cm = async_playwright()
+                playwright = await self._pw_cm.__aenter__()
+                self._browser = await playwright.chromium.launch(
+                    headless=True,
+                    args=[
+                        "--no-sandbox",
+                        "--disable-setuid-sandbox",
+                        "--disable-dev-shm-usage",
+                        "--disable-blink-features=AutomationControlled",
+                    ],
+                )
+                self.launches += 1
+            return self._browser
+
+    async def _close_browser(self, only_if_idle: bool = False) -> None:
+        """Close the browser and its idle contexts.
+
+        Args:
+            only_if_idle: Skip the close if a render acquired a context after
+                the eviction was scheduled (it may hold a pooled one).
+        """
+        async with self._launch_lock:
+            if self._browser is None or (only_if_idle and self._open_pages):
+                return
+            contexts, self._idle_contexts = self._idle_contexts, []
+            browser, self._browser = self._browser, None
+            pw_cm, self._pw_cm = self._pw_cm, None
+            for context in contexts:
+                try:
+                    await context.close()
+                except PlaywrightError:
+                    pass
+            try:
+                await browser.close()
+            finally:
+                await pw_cm.__aexit__(None, None, None)
+
+    async def close(self) -> None:
+        """Close the browser and the HTTP client."""
+        if self._evict_handle is not None:
+            self._evict_handle.cancel()
+            self._evict_handle = None
+        await self._close_browser()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    @property
+    def browser_running(self) -> bool:
+        return self._browser is not None
+
+
+async def _fetch_static(client: httpx.AsyncClient, url: str) -> _Page | None:
+    """Plain HTTP GET. Returns None on transport errors (caller falls back to the browser).
+
+    The body is only read for 200 responses with an HTML content type, and
+    at most ``MAX_STATIC_BYTES`` of it.
+    """
+    try:
+        async with client.stream("GET", url) as response:
+            content_type = response.headers.get("content-type", "").lower()
+            body = bytearray()
+            if response.status_code == 200 and any(t in content_type for t in HTML_CONTENT_TYPES):
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    if len(body) >= MAX_STATIC_BYTES:
+                        del body[MAX_STATIC_BYTES:]
+                        break
+    except httpx.HTTPError:
+        return None
+    try:
+        html = body.decode(response.charset_encoding or "utf-8", errors="replace")
+    except LookupError:  # Unknown charset name
+        html = body.decode("utf-8", errors="replace")
+    return _Page(
+        status=response.status_code,
+        url=str(response.url),
+        content_type=content_type,
+        html=html,
+    )
+
+
+def _extract(
+    page: _Page,
+    url: str,
+    selector: str | None,
+    include_links: bool,
+    max_length: int,
+) -> dict:
+    """Parse HTML with BeautifulSoup into the web_scrape result dict."""
+    soup = BeautifulSoup(page.html, "html.parser")
+
+    # Remove noise elements
+    for tag in soup(["script", "style", "nav", "footer", "header", "aside", "noscript", "iframe"]):
+        tag.decompose()
+
+    # Get title and description
+    title = soup.title.get_text(strip=True) if soup.title else ""
+
+    description = ""
+    meta_desc = soup.find("meta", attrs={"name": "description"})
+    if meta_desc:
+        description = meta_desc.get("content", "")
+
+    # Target content
+    if selector:
+        content_elem = soup.select_one(selector)
+        if not content_elem:
+            return {"error": f"No elements found matching selector: {selector}"}
+        text = content_elem.get_text(separator=" ", strip=True)
+    else:
+        # Auto-detect main content
+        main_content = (
+            soup.find("article")
+            or soup.find("main")
+            or soup.find(attrs={"role": "main"})
+            or soup.find(class_=["content", "post", "entry", "article-body"])
+            or soup.find("body")
+        )
+        text = main_content.get_text(separator=" ", strip=True) if main_content else ""
+
+    # Clean up whitespace
+    text = " ".join(text.split())
+
+    # Truncate if needed
+    if len(text) > max_length:
+        text = text[:max_length] + "..."
+
+    result: dict[str, Any] = {
+        "url": url,
+        "title": title,
+        "description": description,
+        "content": text,
+        "length": len(text),
+    }
+
+    # Extract links if requested
+    if include_links:
+        links: list[dict[str, str]] = []
+        base_url = page.url  # Use final URL after redirects
+        for a in soup.find_all("a", href=True)[:50]:
+            href = a["href"]
+            # Convert relative URLs to absolute URLs
+            absolute_href = urljoin(base_url, href)
+            link_text = a.get_text(strip=True)
+            if link_text and absolute_href:
+                links.append({"text": link_text, "href": absolute_href})
+        result["links"] = links
+
+    return result
+
 
-def register_tools(mcp: FastMCP) -> None:
+def _non_html_result(page: _Page, url: str) -> dict | None:
+    if any(t in page.content_type for t in HTML_CONTENT_TYPES):
+        return None
+    return {
+        "error": f"Skipping non-HTML content (Content-Type: {page.content_type})",
+        "url": url,
+        "skipped": True,
+    }
+
+
+def register_tools(mcp: FastMCP, pool: BrowserPool | None = None) -> None:
     """Register web scrape tools with the MCP server."""
+    if pool is None:
+        pool = BrowserPool()
+        on_shutdown(pool.close)
+
+    async def _scrape(
+        url: str,
+        selector: str | None,
+        include_links: bool,
+        max_length: int,
+        force_browser: bool,
+    ) -> dict:
+        try:
+            # Validate URL
+            if not url.startswith(("http://", "https://")):
+                url = "https://" + url
+
+            # Validate max_length
+            max_length = max(1000, min(max_length, 500000))
+
+            async with pool.domain_slot(url):
+                # Fast path: plain HTTP, no browser
+                if not force_browser:
+                    page = await _fetch_static(pool.http_client(), url)
+                    if page is not None:
+                        if page.status in TERMINAL_HTTP_STATUSES:
+                            return {"error": f"HTTP {page.status}: Failed to fetch URL"}
+                        if page.status == 200:
+                            skipped = _non_html_result(page, url)
+                            if skipped:
+                                return skipped
+                            result = _extract(page, url, selector, include_links, max_length)
+                            if "error" not in result and result["length"] >= min(
+                                MIN_STATIC_TEXT_LENGTH, max_length
+                            ):
+                                result["rendered"] = False
+                                return result
+
+                # Rendered fallback in the pooled browser
+                page = await pool.render(url)
+
+            if page is None:
+                return {"error": "Navigation failed: no response received"}
+
+            if page.status != 200:
+                return {"error": f"HTTP {page.status}: Failed to fetch URL"}
+
+            # Validate Content-Type
+            skipped = _non_html_result(page, url)
+            if skipped:
+                return skipped
+
+            result = _extract(page, url, selector, include_links, max_length)
+            if "error" not in result:
+                result["rendered"] = True
+            return result
+
+        except PlaywrightTimeout:
+            return {"error": "Request timed out"}
+        except PlaywrightError as e:
+            return {"error": f"Browser error: {e!s}"}
+        except Exception as e:
+            return {"error": f"Scraping failed: {e!s}"}
 
     @mcp.tool()
     async def web_scrape(
@@ -37,11 +420,13 @@ async def web_scrape(
         selector: str | None = None,
         include_links: bool = False,
         max_length: int = 50000,
+        force_browser: bool = False,
     ) -> dict:
         """
         Scrape and extract text content from a webpage.
 
-        Uses a headless browser to render JavaScript and bypass bot detection.
+        Fetches the page over plain HTTP first and falls back to a headless
+        browser to render JavaScript and bypass bot detection when needed.
         Use when you need to read the content of a specific URL,
         extract data from a website, or read articles/documentation.
 
@@ -50,134 +435,47 @@ async def web_scrape(
             selector: CSS selector to target specific content (e.g., 'article', '.main-content')
             include_links: Include extracted links in the response
             max_length: Maximum length of extracted text (1000-500000)
+            force_browser: Skip the plain-HTTP attempt and always render in the browser
 
         Returns:
-            Dict with scraped content (url, title, description, content, length) or error dict
+            Dict with scraped content (url, title, description, content, length,
+            rendered) or error dict
         """
-        try:
-            # Validate URL
-            if not url.startswith(("http://", "https://")):
-                url = "https://" + url
+        return await _scrape(url, selector, include_links, max_length, force_browser)
 
-            # Validate max_length
-            max_length = max(1000, min(max_length, 500000))
+    @mcp.tool()
+    async def web_scrape_many(
+        urls: list[str],
+        selector: str | None = None,
+        include_links: bool = False,
+        max_length: int = 20000,
+        force_browser: bool = False,
+    ) -> dict:
+        """
+        Scrape several webpages in parallel.
 
-            # Launch headless browser with stealth
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--no-sandbox",
-                        "--disable-setuid-sandbox",
-                        "--disable-dev-shm-usage",
-                        "--disable-blink-features=AutomationControlled",
-                    ],
-                )
-                try:
-                    context = await browser.new_context(
-                        viewport={"width": 1920, "height": 1080},
-                        user_agent=BROWSER_USER_AGENT,
-                        locale="en-US",
-                    )
-                    page = await context.new_page()
-                    await Stealth().apply_stealth_async(page)
-
-                    response = await page.goto(
-                        url,
-                        wait_until="domcontentloaded",
-                        timeout=60000,
-                    )
-
-                    # Give JS a moment to render dynamic content
-                    await page.wait_for_timeout(2000)
-
-                    if response is None:
-                        return {"error": "Navigation failed: no response received"}
-
-                    if response.status != 200:
-                        return {"error": f"HTTP {response.status}: Failed to fetch URL"}
-
-                    # Validate Content-Type
-                    content_type = response.headers.get("content-type", "").lower()
-                    if not any(t in content_type for t in ["text/html", "application/xhtml+xml"]):
-                        return {
-                            "error": (f"Skipping non-HTML content (Content-Type: {content_type})"),
-                            "url": url,
-                            "skipped": True,
-                        }
-
-                    # Get fully rendered HTML
-                    html_content = await page.content()
-                finally:
-                    await browser.close()
-
-            # Parse rendered HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Remove noise elements
-            for tag in soup(
-                ["script", "style", "nav", "footer", "header", "aside", "noscript", "iframe"]
-            ):
-                tag.decompose()
-
-            # Get title and description
-            title = soup.title.get_text(strip=True) if soup.title else ""
-
-            description = ""
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            if meta_desc:
-                description = meta_desc.get("content", "")
-
-            # Target content
-            if selector:
-                content_elem = soup.select_one(selector)
-                if not content_elem:
-                    return {"error": f"No elements found matching selector: {selector}"}
-                text = content_elem.get_text(separator=" ", strip=True)
-            else:
-                # Auto-detect main content
-                main_content = (
-                    soup.find("article")
-                    or soup.find("main")
-                    or soup.find(attrs={"role": "main"})
-                    or soup.find(class_=["content", "post", "entry", "article-body"])
-                    or soup.find("body")
-                )
-                text = main_content.get_text(separator=" ", strip=True) if main_content else ""
-
-            # Clean up whitespace
-            text = " ".join(text.split())
-
-            # Truncate if needed
-            if len(text) > max_length:
-                text = text[:max_length] + "..."
-
-            result: dict[str, Any] = {
-                "url": url,
-                "title": title,
-                "description": description,
-                "content": text,
-                "length": len(text),
-            }
-
-            # Extract links if requested
-            if include_links:
-                links: list[dict[str, str]] = []
-                base_url = str(response.url)  # Use final URL after redirects
-                for a in soup.find_all("a", href=True)[:50]:
-                    href = a["href"]
-                    # Convert relative URLs to absolute URLs
-                    absolute_href = urljoin(base_url, href)
-                    link_text = a.get_text(strip=True)
-                    if link_text and absolute_href:
-                        links.append({"text": link_text, "href": absolute_href})
-                result["links"] = links
+        Same extraction as web_scrape, fetched concurrently (bounded per
+        domain and by the shared browser's page limit). Prefer this over
+        repeated web_scrape calls when you already have a list of URLs.
 
-            return result
+        Args:
+            urls: URLs to scrape (at most 50)
+            selector: CSS selector applied to every page
+            include_links: Include extracted links in each result
+            max_length: Maximum length of extracted text per page (1000-500000)
+            force_browser: Skip the plain-HTTP attempt and always render in the browser
 
-        except PlaywrightTimeout:
-            return {"error": "Request timed out"}
-        except PlaywrightError as e:
-            return {"error": f"Browser error: {e!s}"}
-        except Exception as e:
-            return {"error": f"Scraping failed: {e!s}"}
+        Returns:
+            Dict with results (one web_scrape result per URL, in input order),
+            succeeded and failed counts, or error dict
+        """
+        if not urls:
+            return {"error": "urls must not be empty"}
+        if len(urls) > MAX_BATCH_URLS:
+            return {"error": f"Too many URLs ({len(urls)}); maximum is {MAX_BATCH_URLS}"}
+
+        results = await asyncio.gather(
+            *(_scrape(u, selector, include_links, max_length, force_browser) for u in urls)
+        )
+        failed = sum(1 for r in results if "error" in r)
+        return {"results": list(results), "succeeded": len(results) - failed, "failed": failed}
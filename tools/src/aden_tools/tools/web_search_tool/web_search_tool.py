@@ -17,6 +17,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -38,7 +40,7 @@ def _search_google(
         """Execute search using Google Custom Search API."""
         max_retries = 3
         for attempt in range(max_retries + 1):
-            response = httpx.get(
+            response = http_client.get(
                 "https://www.googleapis.com/customsearch/v1",
                 params={
                     "key": api_key,
@@ -93,7 +95,7 @@ def _search_brave(
         """Execute search using Brave Search API."""
         max_retries = 3
         for attempt in range(max_retries + 1):
-            response = httpx.get(
+            response = http_client.get(
                 "https://api.search.brave.com/res/v1/web/search",
                 params={
                     "q": query,
@@ -0,0 +1,385 @@
+"""
+Shared HTTP transport for Aden Tools.
+
+Integration tools call ``http_client.get``/``post``/... with the same
+arguments as the module-level ``httpx`` functions, but requests go through a
+process-wide ``HttpClientPool``: one keep-alive (HTTP/2 when ``h2`` is
+installed) ``httpx.Client`` per base URL instead of a fresh TCP+TLS
+handshake per call.
+
+Tools can opt an API (a base URL, or a path prefix under it) into response
+caching with ``set_cache_ttl``. Cached GETs are served from memory while fresh and revalidated with
+``If-None-Match`` / ``If-Modified-Since`` once stale, so an unchanged
+resource costs a 304 (GitHub does not count those against the rate limit).
+The cache is LRU-bounded, keyed on URL, headers and auth (never shared
+across credentials) and invalidated by any write to the same base URL.
+APIs that report errors in 200 bodies pass a ``cacheable`` predicate so
+those responses are never stored.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import importlib.util
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_CACHE_ENTRIES = 512
+
+_CACHEABLE_METHODS = {"GET"}
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def _base_url(url: str | httpx.URL) -> str:
+    parts = urlsplit(str(url))
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def _cache_scope(url: str | httpx.URL) -> tuple[str, str]:
+    """Split *url* into its base URL and path (without a trailing slash)."""
+    return _base_url(url), urlsplit(str(url)).path.rstrip("/")
+
+
+def _path_in_scope(path: str, prefix: str) -> bool:
+    return not prefix or path == prefix or path.startswith(prefix + "/")
+
+
+class _StatelessClient(httpx.Client):
+    """``httpx.Client`` that never persists cookies between requests.
+
+    Pooled clients are shared by every tool and credential talking to the
+    same host, so a cookie set for one caller must not leak into the next.
+    """
+
+    @property
+    def cookies(self) -> httpx.Cookies:
+        return httpx.Cookies()
+
+    @cookies.setter
+    def cookies(self, cookies: Any) -> None:
+        pass
+
+
+@dataclass
+class _CacheEntry:
+    base: str
+    response: httpx.Response
+    stored_at: float
+    ttl: float
+    etag: str | None
+    last_modified: str | None
+
+    def is_fresh(self, now: float) -> bool:
+        return now - self.stored_at < self.ttl
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+@dataclass(frozen=True)
+class _CachePolicy:
+    ttl: float
+    cacheable: Callable[[httpx.Response], bool] | None = None
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of GET responses with TTLs and validators."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> _CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, base: str, response: httpx.Response, ttl: float) -> None:
+        entry = _CacheEntry(
+            base=base,
+            response=response,
+            stored_at=time.monotonic(),
+            ttl=ttl,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def touch(self, key: str) -> None:
+        """Mark an entry fresh again after a successful revalidation."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.stored_at = time.monotonic()
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self, base: str) -> int:
+        """Drop every entry for *base*. Returns the number removed."""
+        with self._lock:
+            stale = [k for k, e in self._entries.items() if e.base == base]
+            for k in stale:
+                del self._entries[k]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class HttpClientPool:
+    """
+    Process-wide pool of keep-alive ``httpx.Client`` instances, one per base URL.
+
+    Args:
+        http2: Negotiate HTTP/2 where the server supports it. Defaults to
+            on when the ``h2`` package is installed.
+        max_connections: Connection limit per base URL.
+        max_keepalive: Idle keep-alive connections kept per base URL.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        cache_entries: Maximum number of cached responses (LRU).
+        transport: Optional transport for every client (used by tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        cache_entries: int = DEFAULT_CACHE_ENTRIES,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        self._http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport = transport
+        self._clients: dict[str, httpx.Client] = {}
+        self._lock = threading.Lock()
+        # base URL -> {path prefix: policy}; an empty prefix covers the host
+        self._cache_policies: dict[str, dict[str, _CachePolicy]] = {}
+        self.cache = ResponseCache(cache_entries)
+        self._stats = {"requests": 0, "cache_hits": 0, "revalidated": 0, "cache_misses": 0}
+        self._stats_lock = threading.Lock()  # Tools call request() from worker threads
+
+    # --- Clients ---
+
+    def client_for(self, url: str | httpx.URL) -> httpx.Client:
+        """Return the pooled client for *url*'s base URL, creating it on first use."""
+        base = _base_url(url)
+        client = self._clients.get(base)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(base)
+            if client is None:
+                client = _StatelessClient(
+                    http2=self._http2, limits=self._limits, transport=self._transport
+                )
+                self._clients[base] = client
+            return client
+
+    def close(self) -> None:
+        """Close every pooled client and drop cached responses."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+        self.cache.clear()
+
+    # --- Cache policy ---
+
+    def set_cache_ttl(
+        self,
+        url: str,
+        ttl: float | None,
+        *,
+        cacheable: Callable[[httpx.Response], bool] | None = None,
+    ) -> None:
+        """Opt *url* into response caching for *ttl* seconds (``None`` opts out).
+
+        Args:
+            url: A base URL (caches the whole host) or an endpoint URL
+                (caches that path and the paths below it). The longest
+                matching prefix wins.
+            ttl: Seconds a response stays fresh; ``None`` or ``<= 0``
+                removes the prefix and drops the host's cached responses.
+            cacheable: Optional check run on each 200 response before it is
+                stored; return False for bodies that report an error.
+        """
+        base, prefix = _cache_scope(url)
+        with self._lock:
+            policies = dict(self._cache_policies.get(base, {}))
+            if ttl is None or ttl <= 0:
+                policies.pop(prefix, None)
+            else:
+                policies[prefix] = _CachePolicy(ttl, cacheable)
+            if policies:
+                self._cache_policies[base] = policies
+            else:
+                self._cache_policies.pop(base, None)
+        if ttl is None or ttl <= 0:
+            self.cache.invalidate(base)
+
+    def _cache_policy(self, base: str, path: str) -> _CachePolicy | None:
+        policies = self._cache_policies.get(base)
+        if not policies:
+            return None
+        matches = [p for p in policies if _path_in_scope(path, p)]
+        return policies[max(matches, key=len)] if matches else None
+
+    def _count(self, stat: str) -> None:
+        with self._stats_lock:
+            self._stats[stat] += 1
+
+    def get_stats(self) -> dict[str, int]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        return {
+            **stats,
+            "clients": len(self._clients),
+            "cached_responses": len(self.cache),
+            "cache_evictions": self.cache.evictions,
+        }
+
+    # --- Requests ---
+
+    def request(self, method: str, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        """Send a request through the pooled client for *url*.
+
+        Accepts the same keyword arguments as ``httpx.request``
+        (``params``, ``headers``, ``json``, ``data``, ``auth``, ``timeout``, ...).
+        """
+        method = method.upper()
+        self._count("requests")
+        client = self.client_for(url)
+        base, path = _cache_scope(url)
+
+        if base not in self._cache_policies:
+            return client.request(method, url, **kwargs)
+        if method not in _SAFE_METHODS:
+            # Writes may change anything we have cached for this API
+            self.cache.invalidate(base)
+            return client.request(method, url, **kwargs)
+        policy = self._cache_policy(base, path)
+        if policy is None or method not in _CACHEABLE_METHODS:
+            return client.request(method, url, **kwargs)
+
+        key = self._cache_key(method, url, kwargs)
+        entry = self.cache.get(key)
+        now = time.monotonic()
+        if entry is not None and entry.is_fresh(now):
+            self._count("cache_hits")
+            return entry.response
+
+        if entry is not None and entry.revalidatable:
+            headers = dict(kwargs.get("headers") or {})
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+            response = client.request(method, url, **{**kwargs, "headers": headers})
+            if response.status_code == 304:
+                self._count("revalidated")
+                self.cache.touch(key)
+                return entry.response
+        else:
+            response = client.request(method, url, **kwargs)
+
+        self._count("cache_misses")
+        if (
+            response.status_code == 200
+            and "no-store" not in response.headers.get("cache-control", "")
+            and (policy.cacheable is None or policy.cacheable(response))
+        ):
+            self.cache.put(key, base, response, policy.ttl)
+        else:
+            self.cache.discard(key)
+        return response
+
+    @staticmethod
+    def _cache_key(method: str, url: str | httpx.URL, kwargs: dict[str, Any]) -> str:
+        full_url = httpx.URL(str(url), params=kwargs.get("params"))
+        headers = sorted((str(k).lower(), str(v)) for k, v in (kwargs.get("headers") or {}).items())
+        material = repr((method, str(full_url), headers, repr(kwargs.get("auth"))))
+        return hashlib.sha256(material.encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Module-level API (drop-in for httpx.get/post/...)
+# ---------------------------------------------------------------------------
+
+_pool = HttpClientPool()
+atexit.register(_pool.close)
+
+
+def get_pool() -> HttpClientPool:
+    """Return the process-wide pool."""
+    return _pool
+
+
+def set_cache_ttl(
+    url: str,
+    ttl: float | None,
+    *,
+    cacheable: Callable[[httpx.Response], bool] | None = None,
+) -> None:
+    """Opt a tool's API (base URL or endpoint prefix) into caching on the shared pool."""
+    _pool.set_cache_ttl(url, ttl, cacheable=cacheable)
+
+
+def request(method: str, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+    return _pool.request(method, url, **kwargs)
+
+
+def get(url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+    return _pool.request("GET", url, **kwargs)
+
+
+def post(url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+    return _pool.request("POST", url, **kwargs)
+
+
+def put(url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+    return _pool.request("PUT", url, **kwargs)
+
+
+def patch(url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+    return _pool.request("PATCH", url, **kwargs)
+
+
+def delete(url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+    return _pool.request("DELETE", url, **kwargs)
@@ -0,0 +1,45 @@
+"""
+Async cleanup hooks for the MCP server.
+
+Tools that hold resources bound to the server's event loop (a browser, an
+``httpx.AsyncClient``) can't release them from ``atexit``: by then the loop
+is gone. They register an async hook with ``on_shutdown`` instead, and the
+server runs the hooks from its lifespan while the loop is still up::
+
+    mcp = FastMCP("tools", lifespan=shutdown_lifespan)
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_hooks: list[Callable[[], Awaitable[Any]]] = []
+
+
+def on_shutdown(hook: Callable[[], Awaitable[Any]]) -> None:
+    """Run ``await hook()`` when the MCP server shuts down."""
+    _hooks.append(hook)
+
+
+async def run_shutdown_hooks() -> None:
+    """Run and forget every registered hook, most recent first; errors are logged."""
+    while _hooks:
+        hook = _hooks.pop()
+        try:
+            await hook()
+        except Exception:
+            logger.warning("Shutdown hook %r failed", hook, exc_info=True)
+
+
+@asynccontextmanager
+async def shutdown_lifespan(server: Any) -> AsyncIterator[dict[str, Any]]:
+    """FastMCP lifespan that runs the shutdown hooks on exit."""
+    try:
+        yield {}
+    finally:
+        await run_shutdown_hooks()
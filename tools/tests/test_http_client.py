@@ -0,0 +1,151 @@
+"""Tests for the shared pooled HTTP client and its response cache."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from aden_tools.utils.http_client import HttpClientPool
+
+API = "https://api.example.test"
+
+
+class _Server:
+    """MockTransport handler serving an ETag-versioned resource."""
+
+    def __init__(self):
+        self.version = 1
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method != "GET":
+            self.version += 1
+            return httpx.Response(201, json={"ok": True})
+        etag = f'"v{self.version}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        return httpx.Response(
+            200,
+            headers={"etag": etag, "set-cookie": "session=abc"},
+            json={"version": self.version, "auth": request.headers.get("authorization")},
+        )
+
+
+@pytest.fixture
+def server():
+    return _Server()
+
+
+@pytest.fixture
+def pool(server):
+    pool = HttpClientPool(transport=httpx.MockTransport(server))
+    yield pool
+    pool.close()
+
+
+class TestHttpClientPool:
+    """Tests for HttpClientPool."""
+
+    def test_one_client_per_base_url(self, pool):
+        """Clients are reused per base URL and separate across hosts."""
+        assert pool.client_for(f"{API}/a") is pool.client_for(f"{API}/b?x=1")
+        assert pool.client_for(f"{API}/a") is not pool.client_for("https://other.test/a")
+
+    def test_uncached_by_default(self, pool, server):
+        """Without a TTL every GET reaches the server."""
+        pool.request("GET", f"{API}/items")
+        pool.request("GET", f"{API}/items")
+        assert len(server.requests) == 2
+
+    def test_cookies_not_persisted(self, pool, server):
+        """Cookies set by one response are not sent with the next request."""
+        pool.request("GET", f"{API}/items")
+        pool.request("GET", f"{API}/items")
+        assert "cookie" not in server.requests[1].headers
+
+    def test_stats_exact_under_threads(self, pool, server):
+        """Counters don't lose updates when tools share the pool across threads."""
+        pool.set_cache_ttl(API, 60)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: pool.request("GET", f"{API}/items"), range(400)))
+
+        stats = pool.get_stats()
+        assert stats["requests"] == 400
+        assert stats["cache_hits"] + stats["cache_misses"] == 400
+
+
+class TestResponseCache:
+    """Tests for opt-in conditional-request caching."""
+
+    def test_fresh_hit_then_etag_revalidation(self, pool, server):
+        """Fresh entries are served locally; stale ones revalidate with If-None-Match."""
+        pool.set_cache_ttl(API, 0.05)
+
+        first = pool.request("GET", f"{API}/items", params={"page": 1})
+        second = pool.request("GET", f"{API}/items", params={"page": 1})
+        assert second is first
+        assert len(server.requests) == 1
+
+        time.sleep(0.06)
+        third = pool.request("GET", f"{API}/items", params={"page": 1})
+        assert server.requests[-1].headers["if-none-match"] == '"v1"'
+        assert third.json() == {"version": 1, "auth": None}
+
+        stats = pool.get_stats()
+        assert (stats["cache_hits"], stats["revalidated"]) == (1, 1)
+
+    def test_key_includes_credentials(self, pool, server):
+        """Responses are never shared across different Authorization headers."""
+        pool.set_cache_ttl(API, 60)
+        a = pool.request("GET", f"{API}/me", headers={"Authorization": "Bearer a"})
+        b = pool.request("GET", f"{API}/me", headers={"Authorization": "Bearer b"})
+        assert (a.json()["auth"], b.json()["auth"]) == ("Bearer a", "Bearer b")
+        assert len(server.requests) == 2
+
+    def test_write_invalidates_base(self, pool, server):
+        """A non-GET request to the same API drops its cached reads."""
+        pool.set_cache_ttl(API, 60)
+        pool.request("GET", f"{API}/items")
+        pool.request("POST", f"{API}/items", json={"name": "x"})
+
+        assert pool.request("GET", f"{API}/items").json()["version"] == 2
+
+    def test_lru_eviction(self, server):
+        """The cache is bounded; the least recently used entry is evicted."""
+        pool = HttpClientPool(transport=httpx.MockTransport(server), cache_entries=2)
+        pool.set_cache_ttl(API, 60)
+        for path in ("a", "b", "a", "c"):
+            pool.request("GET", f"{API}/{path}")
+        pool.request("GET", f"{API}/a")  # still cached (recently used)
+        assert len(server.requests) == 3
+        pool.request("GET", f"{API}/b")  # evicted
+        assert len(server.requests) == 4
+        assert pool.get_stats()["cache_evictions"] >= 1
+        pool.close()
+
+    def test_ttl_scoped_to_path_prefix(self, pool, server):
+        """An endpoint TTL caches that path only, not the rest of the host."""
+        pool.set_cache_ttl(f"{API}/geocode/json", 60)
+        pool.request("GET", f"{API}/geocode/json", params={"address": "x"})
+        pool.request("GET", f"{API}/geocode/json", params={"address": "x"})
+        pool.request("GET", f"{API}/directions/json")
+        pool.request("GET", f"{API}/directions/json")
+        assert [r.url.path for r in server.requests] == [
+            "/geocode/json",
+            "/directions/json",
+            "/directions/json",
+        ]
+
+    def test_cacheable_rejects_error_bodies(self, pool, server):
+        """Responses the caller's predicate rejects are returned but not stored."""
+        pool.set_cache_ttl(API, 60, cacheable=lambda r: r.json()["version"] > 1)
+        pool.request("GET", f"{API}/items")
+        pool.request("GET", f"{API}/items")
+        assert len(server.requests) == 2
+
+        server.version = 2
+        pool.request("GET", f"{API}/items")
+        pool.request("GET", f"{API}/items")
+        assert len(server.requests) == 3
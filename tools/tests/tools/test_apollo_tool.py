@@ -69,7 +69,7 @@ def test_handle_response_generic_error(self):
         assert "error" in result
         assert "500" in result["error"]
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_enrich_person_by_email(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -117,7 +117,7 @@ def test_enrich_person_by_email(self, mock_post):
         assert result["person"]["title"] == "VP Sales"
         assert result["person"]["organization"]["name"] == "Acme Inc"
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_enrich_person_by_linkedin(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -142,7 +142,7 @@ def test_enrich_person_by_linkedin(self, mock_post):
         assert result["match_found"] is True
         assert result["person"]["title"] == "CTO"
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_enrich_person_by_name_and_domain(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -155,7 +155,7 @@ def test_enrich_person_by_name_and_domain(self, mock_post):
         assert call_json["name"] == "John Doe"
         assert call_json["domain"] == "acme.com"
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_enrich_person_with_reveal_flags(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -172,7 +172,7 @@ def test_enrich_person_with_reveal_flags(self, mock_post):
         assert call_json["reveal_personal_emails"] is True
         assert call_json["reveal_phone_number"] is True
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_enrich_person_with_optional_params(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -192,7 +192,7 @@ def test_enrich_person_with_optional_params(self, mock_post):
         assert call_json["last_name"] == "Doe"
         assert call_json["domain"] == "acme.com"
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_enrich_person_not_found(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -204,7 +204,7 @@ def test_enrich_person_not_found(self, mock_post):
         assert result["match_found"] is False
         assert "No matching person found" in result["message"]
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_enrich_company(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -251,7 +251,7 @@ def test_enrich_company(self, mock_post):
         assert result["organization"]["employee_count"] == 1500
         assert "python" in result["organization"]["technologies"]
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_enrich_company_not_found(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -263,7 +263,7 @@ def test_enrich_company_not_found(self, mock_post):
         assert result["match_found"] is False
         assert "No matching company found" in result["message"]
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_search_people(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -329,7 +329,7 @@ def test_search_people(self, mock_post):
         # Bob has no organization
         assert result["results"][1]["organization"]["name"] is None
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_search_people_limit_capped(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -341,7 +341,7 @@ def test_search_people_limit_capped(self, mock_post):
         call_json = mock_post.call_args.kwargs["json"]
         assert call_json["per_page"] == 100
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_search_companies(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -421,7 +421,7 @@ def test_credentials_from_credential_manager(self):
 
         enrich_fn = next(fn for fn in registered_fns if fn.__name__ == "apollo_enrich_company")
 
-        with patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post") as mock_post:
+        with patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"organization": {"id": "123", "name": "Test"}}
@@ -443,7 +443,7 @@ def test_credentials_from_env_var(self):
 
         with (
             patch.dict("os.environ", {"APOLLO_API_KEY": "env-api-key"}),
-            patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post") as mock_post,
         ):
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -478,7 +478,7 @@ def test_enrich_person_requires_email_or_linkedin(self):
         assert "error" in result
         assert "Invalid search criteria" in result["error"]
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_enrich_person_success(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -498,14 +498,14 @@ def test_enrich_person_success(self, mock_post):
         assert result["match_found"] is True
         assert result["person"]["title"] == "CEO"
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_enrich_person_timeout(self, mock_post):
         mock_post.side_effect = httpx.TimeoutException("timed out")
         result = self._fn("apollo_enrich_person")(email="test@test.com")
         assert "error" in result
         assert "timed out" in result["error"]
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_enrich_person_network_error(self, mock_post):
         mock_post.side_effect = httpx.RequestError("connection failed")
         result = self._fn("apollo_enrich_person")(email="test@test.com")
@@ -525,7 +525,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_enrich_company_success(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -544,7 +544,7 @@ def test_enrich_company_success(self, mock_post):
         assert result["match_found"] is True
         assert result["organization"]["name"] == "Acme Inc"
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_enrich_company_not_found(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"organization": None})
@@ -565,7 +565,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_search_people_success(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -580,7 +580,7 @@ def test_search_people_success(self, mock_post):
         assert result["total"] == 100
         assert len(result["results"]) == 1
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_search_people_with_all_filters(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"pagination": {}, "people": []})
@@ -613,7 +613,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_search_companies_success(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -629,7 +629,7 @@ def test_search_companies_success(self, mock_post):
         assert len(result["results"]) == 1
         assert result["results"][0]["industry"] == "Technology"
 
-    @patch("aden_tools.tools.apollo_tool.apollo_tool.httpx.post")
+    @patch("aden_tools.tools.apollo_tool.apollo_tool.http_client.post")
     def test_search_companies_with_all_filters(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"pagination": {}, "organizations": []})
@@ -890,3 +890,132 @@ def test_unicode_data(self, csv_tools, session_dir, tmp_path):
         assert result["success"] is True
         assert result["row_count"] == 1
         assert result["rows"][0]["名前"] == "商品B"
+
+
+class TestCsvRowIndex:
+    """Tests for the row index behind csv_read/csv_append/csv_info."""
+
+    @pytest.fixture
+    def indexed_csv(self, session_dir: Path) -> tuple[Path, list[dict]]:
+        """A CSV spanning several index blocks, with blank lines and multi-line fields."""
+        import csv
+
+        rows = [
+            {"id": str(i), "note": f"line one\nline two {i}" if i % 7 == 0 else f"n{i}"}
+            for i in range(2500)
+        ]
+        csv_file = session_dir / "indexed.csv"
+        with open(csv_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=["id", "note"])
+            writer.writeheader()
+            for i, row in enumerate(rows):
+                writer.writerow(row)
+                if i % 500 == 0:
+                    f.write("\r\n")  # blank line, skipped like csv.DictReader does
+        return csv_file, rows
+
+    @pytest.mark.parametrize("offset", [0, 999, 1000, 1001, 2499, 2500])
+    def test_offset_reads_match_full_scan(self, csv_tools, indexed_csv, tmp_path, offset):
+        """Seeking via the index returns the same rows as reading from the start."""
+        _, rows = indexed_csv
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = csv_tools["csv_read"](
+                path="indexed.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                offset=offset,
+                limit=3,
+            )
+
+        assert result["success"] is True
+        assert result["rows"] == rows[offset : offset + 3]
+        assert result["total_rows"] == 2500
+
+    def test_column_projection(self, csv_tools, basic_csv, tmp_path):
+        """Only the requested columns are returned."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = csv_tools["csv_read"](
+                path="basic.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                columns=["city", "name"],
+            )
+            unknown = csv_tools["csv_read"](
+                path="basic.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                columns=["salary"],
+            )
+
+        assert result["columns"] == ["city", "name"]
+        assert result["rows"][0] == {"city": "NYC", "name": "Alice"}
+        assert "salary" in unknown["error"]
+
+    def test_sidecar_reused_until_file_changes(self, csv_tools, indexed_csv, tmp_path):
+        """Large files persist their index and rebuild it only after a change."""
+        csv_file, _ = indexed_csv
+        from aden_tools.tools.csv_tool import csv_index
+
+        kwargs = {
+            "path": "indexed.csv",
+            "workspace_id": TEST_WORKSPACE_ID,
+            "agent_id": TEST_AGENT_ID,
+            "session_id": TEST_SESSION_ID,
+        }
+        with (
+            patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)),
+            patch.object(csv_index, "INDEX_MIN_BYTES", 0),
+        ):
+            csv_tools["csv_info"](**kwargs)
+            sidecar = csv_file.parent / ".indexed.csv.idx"
+            assert sidecar.exists()
+
+            csv_index._cache.clear()
+            with patch.object(csv_index, "build_index", side_effect=AssertionError("rebuilt")):
+                assert csv_tools["csv_info"](**kwargs)["total_rows"] == 2500
+
+            csv_file.write_text("id,note\n1,x\n")
+            assert csv_tools["csv_info"](**kwargs)["total_rows"] == 1
+
+    def test_append_extends_index(self, csv_tools, indexed_csv, tmp_path):
+        """Appending scans only the new rows."""
+        from aden_tools.tools.csv_tool import csv_index
+
+        kwargs = {
+            "path": "indexed.csv",
+            "workspace_id": TEST_WORKSPACE_ID,
+            "agent_id": TEST_AGENT_ID,
+            "session_id": TEST_SESSION_ID,
+        }
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            csv_tools["csv_info"](**kwargs)
+            with patch.object(csv_index, "build_index", side_effect=AssertionError("rebuilt")):
+                result = csv_tools["csv_append"](
+                    **kwargs, rows=[{"id": "2500", "note": "new"}, {"id": "2501", "note": "x"}]
+                )
+                last = csv_tools["csv_read"](**kwargs, offset=2501)
+
+        assert result["total_rows"] == 2502
+        assert last["rows"] == [{"id": "2501", "note": "x"}]
+
+    @pytest.mark.skipif(not duckdb_available, reason="duckdb not installed")
+    def test_where_filter(self, csv_tools, basic_csv, tmp_path):
+        """A where filter runs through DuckDB and pages over the matching rows."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = csv_tools["csv_read"](
+                path="basic.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                columns=["name"],
+                where="age >= 30",
+                limit=1,
+                offset=1,
+            )
+
+        assert result["success"] is True
+        assert result["total_rows"] == 2
+        assert result["rows"] == [{"name": "Charlie"}]
@@ -68,7 +68,7 @@ def test_handle_response_errors(self, status_code):
         assert "error" in result
         assert str(status_code) in result["error"]
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_list_guilds(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -86,7 +86,7 @@ def test_list_guilds(self, mock_request):
         assert len(result) == 2
         assert result[0]["name"] == "Test Server"
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_list_channels_text_only_default(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -104,7 +104,7 @@ def test_list_channels_text_only_default(self, mock_request):
         assert result[1]["name"] == "incidents"
         assert not any(c["type"] == 2 for c in result)
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_list_channels_all_types(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -120,7 +120,7 @@ def test_list_channels_all_types(self, mock_request):
         assert result[0]["type"] == 0
         assert result[1]["type"] == 2
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_send_message(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -139,7 +139,7 @@ def test_send_message(self, mock_request):
         assert result["content"] == "Hello world"
         assert result["channel_id"] == "c1"
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_get_messages(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -157,7 +157,7 @@ def test_get_messages(self, mock_request):
         assert result[0]["content"] == "First"
 
     @patch("aden_tools.tools.discord_tool.discord_tool.time.sleep")
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_retry_on_429_then_success(self, mock_request, mock_sleep):
         mock_request.side_effect = [
             MagicMock(
@@ -177,7 +177,7 @@ def test_retry_on_429_then_success(self, mock_request, mock_sleep):
         mock_sleep.assert_called_once_with(0.01)
 
     @patch("aden_tools.tools.discord_tool.discord_tool.time.sleep")
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_retry_exhausted_returns_error(self, mock_request, mock_sleep):
         mock_request.return_value = MagicMock(
             status_code=429,
@@ -205,7 +205,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_list_guilds_success(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -239,7 +239,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_list_channels_success(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -254,7 +254,7 @@ def test_list_channels_success(self, mock_request):
         assert len(result["channels"]) == 1
         assert result["channels"][0]["name"] == "general"
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_list_channels_text_only_filter(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -270,7 +270,7 @@ def test_list_channels_text_only_filter(self, mock_request):
         assert len(result["channels"]) == 1
         assert result["channels"][0]["name"] == "general"
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_list_channels_error(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=404,
@@ -294,7 +294,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_send_message_success(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -320,7 +320,9 @@ def test_send_message_length_validation(self):
 
     def test_send_message_exactly_at_limit(self):
         content = "x" * MAX_MESSAGE_LENGTH
-        with patch("aden_tools.tools.discord_tool.discord_tool.httpx.request") as mock_request:
+        with patch(
+            "aden_tools.tools.discord_tool.discord_tool.http_client.request"
+        ) as mock_request:
             mock_request.return_value = MagicMock(
                 status_code=200,
                 json=MagicMock(return_value={"id": "m1", "channel_id": "c1", "content": content}),
@@ -328,7 +330,7 @@ def test_send_message_exactly_at_limit(self):
             result = self._fn("discord_send_message")("c1", content)
         assert result["success"] is True
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_send_message_rate_limit_429_exhausted(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=429,
@@ -341,7 +343,7 @@ def test_send_message_rate_limit_429_exhausted(self, mock_request):
         assert result.get("retry_after") == 5
         assert mock_request.call_count == MAX_RETRIES + 1
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_send_message_rate_limit_then_success(self, mock_request):
         mock_request.side_effect = [
             MagicMock(
@@ -372,7 +374,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
+    @patch("aden_tools.tools.discord_tool.discord_tool.http_client.request")
     def test_get_messages_success(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
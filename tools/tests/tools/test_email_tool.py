@@ -384,7 +384,7 @@ def test_gmail_success(self, send_email_fn, monkeypatch):
         mock_response.status_code = 200
         mock_response.json.return_value = {"id": "gmail_msg_123"}
 
-        patch_target = "aden_tools.tools.email_tool.email_tool.httpx.post"
+        patch_target = "aden_tools.tools.email_tool.email_tool.http_client.post"
         with patch(patch_target, return_value=mock_response) as mock_post:
             result = send_email_fn(
                 to="recipient@example.com",
@@ -497,8 +497,8 @@ def test_missing_provider_raises_type_error(self, send_email_fn):
             send_email_fn(to="test@example.com", subject="Test", html="<p>Hi</p>")
 
 
-_HTTPX_GET = "aden_tools.tools.email_tool.email_tool.httpx.get"
-_HTTPX_POST = "aden_tools.tools.email_tool.email_tool.httpx.post"
+_HTTPX_GET = "aden_tools.tools.email_tool.email_tool.http_client.get"
+_HTTPX_POST = "aden_tools.tools.email_tool.email_tool.http_client.post"
 
 
 def _mock_original_message_response():
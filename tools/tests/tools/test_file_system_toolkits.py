@@ -1,5 +1,7 @@
 """Tests for file_system_toolkits tools (FastMCP)."""
 
+import gzip
+import json
 import os
 from unittest.mock import patch
 
@@ -533,6 +535,175 @@ def test_grep_search_multiple_matches_per_line(
         assert result["success"] is True
         assert result["total_matches"] == 2  # Line 1 and Line 3
 
+    def test_grep_search_respects_gitignore(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """Ignored files and directories, and .git, are not searched."""
+        (tmp_path / ".gitignore").write_text("build/\n*.log\n!keep.log\n")
+        (tmp_path / "main.py").write_text("needle\n")
+        (tmp_path / "debug.log").write_text("needle\n")
+        (tmp_path / "keep.log").write_text("needle\n")
+        for ignored in ("build", ".git"):
+            (tmp_path / ignored).mkdir()
+            (tmp_path / ignored / "out.txt").write_text("needle\n")
+
+        result = grep_search_fn(path=".", pattern="needle", recursive=True, **mock_workspace)
+        files = sorted(os.path.basename(m["file"]) for m in result["matches"])
+        assert files == ["keep.log", "main.py"]
+
+        result = grep_search_fn(
+            path=".", pattern="needle", recursive=True, respect_gitignore=False, **mock_workspace
+        )
+        assert result["total_matches"] == 4  # .git is always skipped
+
+    def test_grep_search_skips_binary_files(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """Files containing NUL bytes are skipped."""
+        (tmp_path / "blob.bin").write_bytes(b"needle\x00\x01\x02")
+        (tmp_path / "text.txt").write_text("needle\n")
+
+        result = grep_search_fn(path=".", pattern="needle", **mock_workspace)
+
+        assert [os.path.basename(m["file"]) for m in result["matches"]] == ["text.txt"]
+        assert result["files_skipped"] == 1
+
+    def test_grep_search_pagination(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """max_results stops the search early; offset fetches the next page."""
+        for i in range(3):
+            (tmp_path / f"f{i}.txt").write_text("".join(f"hit {j}\n" for j in range(4)))
+
+        first = grep_search_fn(path=".", pattern="hit", max_results=5, **mock_workspace)
+        assert first["total_matches"] == 5
+        assert first["truncated"] is True
+        assert first["next_offset"] == 5
+        assert first["files_searched"] == 2  # f2.txt never opened
+
+        rest = grep_search_fn(path=".", pattern="hit", offset=5, max_results=100, **mock_workspace)
+        assert rest["truncated"] is False
+        assert rest["next_offset"] is None
+        found = [(m["file"], m["line_number"]) for m in first["matches"] + rest["matches"]]
+        assert len(found) == len(set(found)) == 12
+
+    def test_grep_search_literal_matches_regex_search(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """The literal fast path reports the same lines as a regex search."""
+        content = "alpha\r\n  beta needle  \r\n\nneedle\ngamma needle"
+        (tmp_path / "mixed.txt").write_bytes(content.encode())
+
+        literal = grep_search_fn(path="mixed.txt", pattern="needle", **mock_workspace)
+        regex = grep_search_fn(path="mixed.txt", pattern="need[l]e", **mock_workspace)
+
+        assert literal["matches"] == regex["matches"]
+        assert [m["line_number"] for m in literal["matches"]] == [2, 4, 5]
+        assert literal["matches"][0]["line_content"] == "beta needle"
+
+    def test_grep_search_large_file(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """Files above the mmap threshold are searched correctly."""
+        from aden_tools.tools.file_system_toolkits.grep_search.search_engine import MMAP_MIN_BYTES
+
+        lines = ["filler line of text"] * (MMAP_MIN_BYTES // 20 + 10)
+        lines[-3] = "the needle"
+        (tmp_path / "big.txt").write_text("\n".join(lines) + "\n")
+
+        result = grep_search_fn(path="big.txt", pattern="needle", **mock_workspace)
+
+        assert result["total_matches"] == 1
+        assert result["matches"][0]["line_number"] == len(lines) - 2
+
+    def test_grep_search_missing_path(self, grep_search_fn, mock_workspace, mock_secure_path):
+        """A path that does not exist is reported as an error."""
+        result = grep_search_fn(path="missing", pattern="x", recursive=True, **mock_workspace)
+
+        assert "error" in result
+        assert "not found" in result["error"]
+
+
+class TestLoadDataRecords:
+    """Tests for record-based paging in load_data."""
+
+    @pytest.fixture
+    def load_data_fn(self, mcp):
+        from aden_tools.tools.file_system_toolkits.data_tools import register_tools
+
+        register_tools(mcp)
+        return mcp._tool_manager._tools["load_data"].fn
+
+    @staticmethod
+    def _spill(tmp_path, name, records, compress=False):
+        """Write a spill file and record index the way the framework does."""
+        parts, spans, pos = ["["], [], 1
+        for i, record in enumerate(records):
+            separator = ("," if i else "") + "\n  "
+            body = json.dumps(record, indent=2).replace("\n", "\n  ")
+            start = pos + len(separator)
+            spans.append([start, start + len(body)])
+            parts += [separator, body]
+            pos = start + len(body)
+        data = "".join([*parts, "\n]"]).encode()
+        assert json.loads(data) == records
+
+        (tmp_path / name).write_bytes(gzip.compress(data) if compress else data)
+        index = {"version": 1, "path": "$", "records": len(records), "size": len(data)}
+        (tmp_path / f".{name}.idx").write_text(json.dumps({**index, "spans": spans}))
+        return data
+
+    def test_pages_by_record(self, load_data_fn, tmp_path):
+        records = [{"id": i, "name": f"n{i}"} for i in range(25)]
+        self._spill(tmp_path, "tool_x.txt", records)
+
+        page = load_data_fn("tool_x.txt", str(tmp_path), offset_records=20, limit_records=10)
+
+        assert json.loads(page["content"]) == records[20:]
+        assert page["records_read"] == 5
+        assert page["total_records"] == 25
+        assert page["has_more"] is False
+
+    def test_reads_compressed_files(self, load_data_fn, tmp_path):
+        records = [{"id": i} for i in range(10)]
+        data = self._spill(tmp_path, "tool_x.txt.gz", records, compress=True)
+
+        page = load_data_fn("tool_x.txt.gz", str(tmp_path), offset_records=3, limit_records=2)
+        assert json.loads(page["content"]) == records[3:5]
+        assert page["next_offset_records"] == 5
+
+        chunk = load_data_fn("tool_x.txt.gz", str(tmp_path), offset_bytes=0, limit_bytes=50)
+        assert chunk["content"] == data[:50].decode()
+        assert chunk["file_size_bytes"] == len(data)
+
+    def test_record_pages_respect_limit_bytes(self, load_data_fn, tmp_path):
+        records = [{"id": i, "blob": "x" * 100} for i in range(10)]
+        self._spill(tmp_path, "tool_x.txt", records)
+
+        page = load_data_fn("tool_x.txt", str(tmp_path), offset_records=0, limit_bytes=450)
+
+        assert json.loads(page["content"]) == records[:3]
+        assert page["next_offset_records"] == 3
+        assert page["has_more"] is True
+
+        too_big = load_data_fn("tool_x.txt", str(tmp_path), offset_records=0, limit_bytes=50)
+        assert "limit_bytes" in too_big["error"]
+
+    def test_negative_offset_records_rejected(self, load_data_fn, tmp_path):
+        self._spill(tmp_path, "tool_x.txt", [{"id": i} for i in range(5)])
+
+        result = load_data_fn("tool_x.txt", str(tmp_path), offset_records=-2)
+
+        assert result == {"error": "offset_records must be non-negative"}
+
+    def test_without_index_returns_error(self, load_data_fn, tmp_path):
+        (tmp_path / "notes.txt").write_text("hello")
+
+        result = load_data_fn("notes.txt", str(tmp_path), offset_records=0)
+
+        assert "error" in result
+        assert "offset_bytes" in result["error"]
+
 
 class TestExecuteCommandTool:
     """Tests for execute_command_tool."""
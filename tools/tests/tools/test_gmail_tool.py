@@ -8,7 +8,7 @@
 
 from aden_tools.tools.gmail_tool import register_tools
 
-HTTPX_MODULE = "aden_tools.tools.gmail_tool.gmail_tool.httpx.request"
+HTTPX_MODULE = "aden_tools.tools.gmail_tool.gmail_tool.http_client.request"
 
 
 @pytest.fixture
@@ -2,11 +2,13 @@
 Tests for PostgreSQL MCP tools (refactored single-file version).
 """
 
+import csv
+
 import psycopg2 as psycopg
 import pytest
 from fastmcp import FastMCP
 
-from aden_tools.tools.postgres_tool import register_tools
+from aden_tools.tools.postgres_tool import postgres_tool, register_tools
 
 
 @pytest.fixture
@@ -56,7 +58,7 @@ class FakeConn:
         def set_session(self, **kwargs):
             pass  # needed because readonly=True is called
 
-        def cursor(self):
+        def cursor(self, name=None):
             return FakeCursor()
 
         def __enter__(self):
@@ -147,7 +149,7 @@ class TimeoutConn:
             def set_session(self, **kwargs):
                 pass
 
-            def cursor(self):
+            def cursor(self, name=None):
                 return TimeoutCursor()
 
             def __enter__(self):
@@ -167,6 +169,187 @@ def __exit__(self, *args):
         assert "timed out" in result["error"].lower()
 
 
+class _RowsCursor:
+    """Named-cursor stand-in serving *total* rows through fetchmany."""
+
+    description = [type("D", (), {"name": "id"}), type("D", (), {"name": "payload"})]
+
+    def __init__(self, total: int):
+        self.total = total
+        self.position = 0
+        self.fetches = 0
+
+    def execute(self, *args, **kwargs):
+        pass
+
+    def fetchmany(self, n):
+        self.fetches += 1
+        end = min(self.position + n, self.total)
+        rows = [(i, {"n": i}) for i in range(self.position, end)]
+        self.position = end
+        return rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+def _mock_rows(monkeypatch, total: int) -> _RowsCursor:
+    cursor = _RowsCursor(total)
+
+    class RowsConn:
+        def cursor(self, name=None):
+            assert name, "pg_query must use a server-side cursor"
+            return cursor
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+    monkeypatch.setattr(
+        "aden_tools.tools.postgres_tool.postgres_tool._get_connection",
+        lambda database_url: RowsConn(),
+    )
+    return cursor
+
+
+class TestPgQueryStreaming:
+    def test_large_result_spilled_to_csv(self, pg_query_fn, monkeypatch, tmp_path):
+        total = postgres_tool.MAX_ROWS + 2500
+        cursor = _mock_rows(monkeypatch, total)
+
+        result = pg_query_fn(sql="SELECT * FROM big", data_dir=str(tmp_path))
+
+        assert result["success"] is True
+        assert result["row_count"] == total
+        assert result["truncated"] is False
+        assert len(result["rows"]) == postgres_tool.PREVIEW_ROWS
+        with open(tmp_path / result["file"], newline="") as f:
+            written = list(csv.reader(f))
+        assert written[0] == ["id", "payload"]
+        assert len(written) == total + 1
+        assert written[-1] == [str(total - 1), f'{{"n": {total - 1}}}']
+        assert cursor.fetches > 1  # streamed in batches
+
+    def test_large_result_without_data_dir_truncated(self, pg_query_fn, monkeypatch):
+        cursor = _mock_rows(monkeypatch, postgres_tool.MAX_ROWS * 5)
+
+        result = pg_query_fn(sql="SELECT * FROM big")
+
+        assert result["row_count"] == postgres_tool.MAX_ROWS
+        assert result["truncated"] is True
+        assert "file" not in result
+        assert cursor.position == postgres_tool.MAX_ROWS + 1  # nothing more fetched
+
+    def test_small_result_stays_inline(self, pg_query_fn, monkeypatch, tmp_path):
+        _mock_rows(monkeypatch, 3)
+
+        result = pg_query_fn(sql="SELECT * FROM small", data_dir=str(tmp_path))
+
+        assert result["row_count"] == 3
+        assert result["truncated"] is False
+        assert "file" not in result
+        assert list(tmp_path.iterdir()) == []
+
+
+class _FakeConnection:
+    def __init__(self, broken: bool = False):
+        self.closed = 0
+        self.broken = broken
+
+    def cursor(self):
+        conn = self
+
+        class Cursor:
+            def execute(self, *args):
+                if conn.broken:
+                    raise psycopg.OperationalError("server closed the connection")
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                pass
+
+        return Cursor()
+
+    def rollback(self):
+        pass
+
+    def set_session(self, **kwargs):
+        pass
+
+
+class _FakePool:
+    def __init__(self, url):
+        self.url = url
+        self.closed = False
+        self.idle = [_FakeConnection()]
+        self.discarded = []
+
+    def getconn(self):
+        return self.idle.pop() if self.idle else _FakeConnection()
+
+    def putconn(self, conn, close=False):
+        (self.discarded if close else self.idle).append(conn)
+
+    def closeall(self):
+        self.closed = True
+
+
+class TestConnectionPools:
+    @pytest.fixture(autouse=True)
+    def fake_pools(self, monkeypatch):
+        created = {}
+
+        def create(url):
+            created[url] = _FakePool(url)
+            return created[url]
+
+        monkeypatch.setattr(postgres_tool, "_create_pool", create)
+        monkeypatch.setattr(postgres_tool, "_pools", postgres_tool.OrderedDict())
+        return created
+
+    def test_pool_reused_per_url(self, fake_pools):
+        for url in ("postgresql://a", "postgresql://b", "postgresql://a"):
+            with postgres_tool._get_connection(url):
+                pass
+
+        assert sorted(fake_pools) == ["postgresql://a", "postgresql://b"]
+        assert not any(p.closed for p in fake_pools.values())
+
+    def test_least_recently_used_pool_closed(self, fake_pools, monkeypatch):
+        monkeypatch.setattr(postgres_tool, "MAX_POOLS", 2)
+
+        with postgres_tool._get_connection("postgresql://a"):
+            with postgres_tool._get_connection("postgresql://b"):
+                pass
+            with postgres_tool._get_connection("postgresql://c"):
+                pass
+            # "a" was evicted but is still in use
+            assert not fake_pools["postgresql://a"].closed
+
+        assert fake_pools["postgresql://a"].closed
+        assert not fake_pools["postgresql://b"].closed
+        assert list(postgres_tool._pools) == ["postgresql://b", "postgresql://c"]
+
+    def test_idle_broken_connection_replaced(self, fake_pools, monkeypatch):
+        url = "postgresql://a"
+        with postgres_tool._get_connection(url) as first:
+            pass
+        first.broken = True
+        monkeypatch.setattr(postgres_tool, "HEALTH_CHECK_AFTER_S", 0)
+
+        with postgres_tool._get_connection(url) as second:
+            assert second is not first
+
+        assert fake_pools[url].discarded == [first]
+
+
 class TestPgListSchemas:
     def test_list_schemas_success(self, pg_list_schemas_fn):
         result = pg_list_schemas_fn()
@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -202,6 +203,65 @@ def runtime_logs_dir_with_in_progress(runtime_logs_dir: Path) -> Path:
     return runtime_logs_dir
 
 
+@pytest.fixture
+def analytics_dir(runtime_logs_dir: Path) -> Path:
+    """Add a run_analytics.db with the columns the tools read.
+
+    Run 1's summary differs from its summary.json so tests can tell which was read.
+    """
+    run1 = json.loads(
+        (runtime_logs_dir / "runtime_logs/runs/20250101T000001_abc12345/summary.json").read_text()
+    )
+    run1["execution_quality"] = "from-index"
+    conn = sqlite3.connect(runtime_logs_dir / "run_analytics.db")
+    conn.executescript(
+        """
+        CREATE TABLE runs (run_id TEXT, goal_id TEXT, status TEXT, started_at TEXT,
+            duration_ms INTEGER, input_tokens INTEGER, output_tokens INTEGER, summary TEXT);
+        CREATE TABLE node_runs (run_id TEXT, node_id TEXT, success INTEGER,
+            latency_ms INTEGER, input_tokens INTEGER, output_tokens INTEGER);
+        CREATE TABLE tool_calls (run_id TEXT, tool_name TEXT, is_error INTEGER,
+            latency_ms INTEGER);
+        """
+    )
+    conn.execute(
+        "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            "20250101T000001_abc12345",
+            "goal-1",
+            "success",
+            run1["started_at"],
+            3000,
+            200,
+            100,
+            json.dumps(run1),
+        ),
+    )
+    conn.execute("INSERT INTO runs VALUES ('other', 'goal-2', 'failure', '', 1000, 50, 5, '{}')")
+    conn.executemany(
+        "INSERT INTO node_runs VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            ("20250101T000001_abc12345", "node-1", 1, 100, 10, 1),
+            ("20250101T000001_abc12345", "node-2", 0, 300, 20, 2),
+            ("other", "node-1", 0, 200, 30, 3),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO tool_calls VALUES (?, ?, ?, ?)",
+        [("20250101T000001_abc12345", "web_search", 0, ms) for ms in range(10, 210, 10)]
+        + [("other", "web_scrape", 1, 5)],
+    )
+    conn.commit()
+    conn.close()
+    return runtime_logs_dir
+
+
+@pytest.fixture
+def query_stats_fn(mcp: FastMCP):
+    register_tools(mcp)
+    return mcp._tool_manager._tools["query_runtime_log_stats"].fn
+
+
 @pytest.fixture
 def query_logs_fn(mcp: FastMCP):
     register_tools(mcp)
@@ -261,6 +321,52 @@ def test_in_progress_runs_visible(self, query_logs_fn, runtime_logs_dir_with_in_
         assert result_ip["total"] == 1
         assert result_ip["runs"][0]["status"] == "in_progress"
 
+    def test_indexed_summaries_used(self, query_logs_fn, analytics_dir: Path):
+        result = query_logs_fn(agent_work_dir=str(analytics_dir))
+        assert result["total"] == 2  # Indexed runs without a log directory are not listed
+        by_id = {r["run_id"]: r for r in result["runs"]}
+        assert by_id["20250101T000001_abc12345"]["execution_quality"] == "from-index"
+        # Run 2 is not in the index; its summary.json is read
+        assert by_id["20250101T000002_def67890"]["status"] == "failure"
+
+        result = query_logs_fn(agent_work_dir=str(analytics_dir), status="success")
+        assert [r["execution_quality"] for r in result["runs"]] == ["from-index"]
+
+
+class TestQueryRuntimeLogStats:
+    def test_node_failure_rates(self, query_stats_fn, analytics_dir: Path):
+        result = query_stats_fn(agent_work_dir=str(analytics_dir), group_by="node")
+        nodes = {n["node_id"]: n for n in result["stats"]}
+        assert result["stats"][0]["node_id"] == "node-2"
+        assert nodes["node-1"]["executions"] == 2
+        assert nodes["node-1"]["failure_rate"] == 0.5
+        assert nodes["node-1"]["p95_latency_ms"] == 200
+
+    def test_tool_p95_latency(self, query_stats_fn, analytics_dir: Path):
+        result = query_stats_fn(agent_work_dir=str(analytics_dir), group_by="tool")
+        web_search = result["stats"][0]
+        assert web_search["tool_name"] == "web_search"
+        assert web_search["calls"] == 20
+        assert web_search["p95_latency_ms"] == 190
+        assert web_search["avg_latency_ms"] == pytest.approx(105)
+        assert result["stats"][1]["error_rate"] == 1.0
+
+    def test_goal_tokens_and_filter(self, query_stats_fn, analytics_dir: Path):
+        result = query_stats_fn(agent_work_dir=str(analytics_dir), group_by="goal")
+        assert [g["goal_id"] for g in result["stats"]] == ["goal-1", "goal-2"]
+        assert result["stats"][0]["avg_tokens_per_run"] == 300
+
+        result = query_stats_fn(
+            agent_work_dir=str(analytics_dir), group_by="node", goal_id="goal-2"
+        )
+        assert [(n["node_id"], n["failures"]) for n in result["stats"]] == [("node-1", 1)]
+
+    def test_errors(self, query_stats_fn, runtime_logs_dir: Path, analytics_dir: Path):
+        assert "error" in query_stats_fn(agent_work_dir=str(analytics_dir), group_by="day")
+        (analytics_dir / "run_analytics.db").unlink()
+        result = query_stats_fn(agent_work_dir=str(runtime_logs_dir))
+        assert "No run analytics found" in result["error"]
+
 
 class TestQueryRuntimeLogDetails:
     def test_load_details(self, query_details_fn, runtime_logs_dir: Path):
@@ -75,7 +75,7 @@ def test_handle_response_429(self):
         assert "error" in result
         assert "Rate limit" in result["error"]
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool.http_client.post")
     def test_send_message(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -91,7 +91,7 @@ def test_send_message(self, mock_post):
         assert result["ok"] is True
         assert result["result"]["message_id"] == 456
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool.http_client.post")
     def test_send_message_with_parse_mode(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -103,7 +103,7 @@ def test_send_message_with_parse_mode(self, mock_post):
         call_kwargs = mock_post.call_args.kwargs
         assert call_kwargs["json"]["parse_mode"] == "HTML"
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool.http_client.post")
     def test_send_document(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -123,7 +123,7 @@ def test_send_document(self, mock_post):
         assert result["ok"] is True
         assert result["result"]["message_id"] == 789
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.get")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool.http_client.get")
     def test_get_me(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -170,7 +170,7 @@ def test_send_message_no_token_error(self):
         assert "error" in result
         assert "not configured" in result["error"]
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool.http_client.post")
     @patch("os.getenv", return_value="test_token")
     def test_send_message_success(self, mock_getenv, mock_post):
         mock_response = MagicMock()
@@ -194,7 +194,7 @@ def test_credentials_adapter_used(self):
         tools = {t.name: t for t in self.mcp._tool_manager._tools.values()}
 
         # The credentials should be used when tools are called
-        with patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post") as mock_post:
+        with patch("aden_tools.tools.telegram_tool.telegram_tool.http_client.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"ok": True, "result": {}}
@@ -214,7 +214,7 @@ class TestErrorHandling:
     def setup_method(self):
         self.client = _TelegramClient("test_token")
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool.http_client.post")
     def test_network_error(self, mock_post):
         import httpx
 
@@ -223,7 +223,7 @@ def test_network_error(self, mock_post):
         with pytest.raises(httpx.ConnectError):
             self.client.send_message(chat_id="123", text="test")
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool.http_client.post")
     def test_timeout_error(self, mock_post):
         import httpx
 
@@ -232,7 +232,7 @@ def test_timeout_error(self, mock_post):
         with pytest.raises(httpx.TimeoutException):
             self.client.send_message(chat_id="123", text="test")
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool.http_client.post")
     @patch("os.getenv", return_value="test_token")
     def test_tool_returns_error_on_timeout(self, mock_getenv, mock_post):
         """MCP tool should return error dict on timeout, not raise."""
@@ -249,7 +249,7 @@ def test_tool_returns_error_on_timeout(self, mock_getenv, mock_post):
         assert "error" in result
         assert "timed out" in result["error"].lower()
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool.http_client.post")
     @patch("os.getenv", return_value="test_token")
     def test_tool_returns_error_on_network_failure(self, mock_getenv, mock_post):
         """MCP tool should return error dict on network error, not raise."""
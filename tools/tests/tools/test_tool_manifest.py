@@ -0,0 +1,79 @@
+"""
+Tests for the tool manifest and lazy tool registration.
+
+Tests cover:
+- The bundled manifest matches what the tool modules register
+- Lazy registration advertises the same tools and schemas as eager registration
+- Lazy tools import their module on first call
+- ``include`` filtering in both modes
+"""
+
+import pytest
+from fastmcp import FastMCP
+
+from aden_tools.tools import register_all_tools
+from aden_tools.tools.manifest import build_manifest, load_manifest
+
+
+def _schemas(mcp: FastMCP) -> dict[str, dict]:
+    return {name: tool.parameters for name, tool in mcp._tool_manager._tools.items()}
+
+
+@pytest.fixture(scope="module")
+def eager_mcp():
+    mcp = FastMCP("eager")
+    register_all_tools(mcp)
+    return mcp
+
+
+class TestManifest:
+    """Tests for the bundled tool_manifest.json."""
+
+    def test_manifest_up_to_date(self):
+        """Regenerate with `python -m aden_tools.tools.manifest` if this fails."""
+        assert load_manifest() == build_manifest()
+
+    def test_lazy_matches_eager(self, eager_mcp):
+        """Lazy registration exposes the same names, order and schemas."""
+        lazy_mcp = FastMCP("lazy")
+        names = register_all_tools(lazy_mcp, lazy=True)
+
+        assert names == list(eager_mcp._tool_manager._tools)
+        assert _schemas(lazy_mcp) == _schemas(eager_mcp)
+
+    def test_cache_metadata_carried(self, eager_mcp):
+        """Lazy tools advertise the same cache policy metadata."""
+        lazy_mcp = FastMCP("lazy")
+        register_all_tools(lazy_mcp, lazy=True)
+
+        eager = eager_mcp._tool_manager._tools
+        lazy = lazy_mcp._tool_manager._tools
+        assert lazy["maps_geocode"].meta == eager["maps_geocode"].meta == {"cache": {"ttl": 86400}}
+        assert lazy["pg_query"].meta is None
+
+
+class TestLazyTools:
+    """Tests for tools registered from the manifest."""
+
+    async def test_first_call_loads_module(self):
+        """Calling a lazy tool imports and runs the real implementation."""
+        mcp = FastMCP("lazy")
+        register_all_tools(mcp, lazy=True, include=["get_current_time"])
+        tool = mcp._tool_manager._tools["get_current_time"]
+        assert not tool._loader.loaded
+
+        result = await tool.run({"timezone": "UTC"})
+
+        assert tool._loader.loaded
+        assert result.structured_content["timezone"] == "UTC"
+
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_include_patterns(self, lazy):
+        """Only tools matching an include pattern are registered."""
+        mcp = FastMCP("subset")
+        names = register_all_tools(mcp, lazy=lazy, include=["get_current_time", "csv_*"])
+
+        assert "get_current_time" in names
+        assert "csv_read" in names
+        assert all(n == "get_current_time" or n.startswith("csv_") for n in names)
+        assert set(names) == set(mcp._tool_manager._tools)
@@ -62,7 +62,7 @@ def test_credentials_from_env(mcp: FastMCP):
     mock_response = {"responses": [{"labelAnnotations": []}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -128,7 +128,7 @@ def test_detect_labels_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/dog.jpg", max_labels=5)
 
@@ -156,7 +156,7 @@ def test_detect_text_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/text.jpg")
 
@@ -189,7 +189,7 @@ def test_detect_faces_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/face.jpg")
 
@@ -224,7 +224,7 @@ def test_localize_objects_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/cat.jpg")
 
@@ -250,7 +250,7 @@ def test_detect_logos_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/logos.jpg")
 
@@ -279,7 +279,7 @@ def test_detect_landmarks_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/paris.jpg")
 
@@ -316,7 +316,7 @@ def test_image_properties_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/colorful.jpg")
 
@@ -346,7 +346,7 @@ def test_web_detection_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/sunset.jpg")
 
@@ -376,7 +376,7 @@ def test_safe_search_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/photo.jpg")
 
@@ -396,7 +396,7 @@ def test_local_file_success(mcp: FastMCP, sample_image: Path):
     mock_response = {"responses": [{"labelAnnotations": [{"description": "Image", "score": 0.9}]}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source=str(sample_image))
 
@@ -416,7 +416,7 @@ def test_api_error_401(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(401)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -430,7 +430,7 @@ def test_api_error_403(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(403)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -444,7 +444,7 @@ def test_api_error_429(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(429)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -458,7 +458,7 @@ def test_timeout_error(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.side_effect = httpx.TimeoutException("Timeout")
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -472,7 +472,7 @@ def test_network_error(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.side_effect = httpx.RequestError("Network error")
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -486,7 +486,7 @@ def test_empty_response(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json={"responses": []})
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -502,7 +502,7 @@ def test_api_error_in_response(mcp: FastMCP):
     mock_response = {"responses": [{"error": {"message": "Image too small"}}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -521,7 +521,7 @@ def test_max_labels_clamped(mcp: FastMCP):
     mock_response = {"responses": [{"labelAnnotations": []}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             # Test with value > 100
             tool_fn(image_source="https://example.com/image.jpg", max_labels=200)
@@ -540,7 +540,7 @@ def test_detect_text_no_text_found(mcp: FastMCP):
     mock_response = {"responses": [{"textAnnotations": []}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch("aden_tools.utils.http_client.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -1,11 +1,24 @@
 """Tests for web_scrape tool (FastMCP)."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from fastmcp import FastMCP
 
 from aden_tools.tools.web_scrape_tool import register_tools
+from aden_tools.tools.web_scrape_tool.web_scrape_tool import BrowserPool, _fetch_static, _Page
+from aden_tools.utils import shutdown
+
+_STATIC_PATH = "aden_tools.tools.web_scrape_tool.web_scrape_tool._fetch_static"
+
+
+@pytest.fixture(autouse=True)
+def no_static_fetch():
+    """Make the plain-HTTP fast path fall through so tests exercise the browser path."""
+    with patch(_STATIC_PATH, AsyncMock(return_value=None)) as mock_static:
+        yield mock_static
 
 
 @pytest.fixture
@@ -349,3 +362,223 @@ async def test_empty_href_skipped(self, mock_pw, mock_stealth, web_scrape_fn):
         # Empty and whitespace-only text should be filtered
         assert "" not in texts
         assert len([t for t in texts if not t.strip()]) == 0
+
+
+def _static_page(html, status=200, content_type="text/html"):
+    return _Page(status=status, url="https://example.com", content_type=content_type, html=html)
+
+
+_LONG_HTML = f"<html><body><article>{'word ' * 100}</article></body></html>"
+
+
+class TestWebScrapeFastPath:
+    """Tests for the plain-HTTP fast path."""
+
+    @pytest.mark.asyncio
+    @patch(_PW_PATH)
+    async def test_static_page_skips_browser(self, mock_pw, no_static_fetch, web_scrape_fn):
+        no_static_fetch.return_value = _static_page(_LONG_HTML)
+
+        result = await web_scrape_fn(url="https://example.com")
+
+        assert result["rendered"] is False
+        assert result["length"] > 200
+        mock_pw.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_app_shell_falls_back_to_browser(
+        self, mock_pw, mock_stealth, no_static_fetch, web_scrape_fn
+    ):
+        no_static_fetch.return_value = _static_page('<html><body><div id="root"></div></body>')
+        mock_cm, _, _ = _make_playwright_mocks(_LONG_HTML, final_url="https://example.com")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        result = await web_scrape_fn(url="https://example.com")
+
+        assert result["rendered"] is True
+        mock_pw.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch(_PW_PATH)
+    async def test_not_found_does_not_launch_browser(self, mock_pw, no_static_fetch, web_scrape_fn):
+        no_static_fetch.return_value = _static_page("missing", status=404)
+
+        result = await web_scrape_fn(url="https://example.com/missing")
+
+        assert result == {"error": "HTTP 404: Failed to fetch URL"}
+        mock_pw.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(_PW_PATH)
+    async def test_non_html_skipped_without_browser(self, mock_pw, no_static_fetch, web_scrape_fn):
+        no_static_fetch.return_value = _static_page("%PDF", content_type="application/pdf")
+
+        result = await web_scrape_fn(url="https://example.com/doc.pdf")
+
+        assert result["skipped"] is True
+        mock_pw.assert_not_called()
+
+
+class _Body(httpx.AsyncByteStream):
+    """Response body that records how many chunks were read."""
+
+    def __init__(self, chunks: int, chunk: bytes = b"<p>" + b"x" * 1000 + b"</p>"):
+        self.chunks = chunks
+        self.chunk = chunk
+        self.read = 0
+
+    async def __aiter__(self):
+        for _ in range(self.chunks):
+            self.read += 1
+            yield self.chunk
+
+
+def _client(body: _Body, content_type: str, status: int = 200) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status, headers={"content-type": content_type}, stream=body)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestStaticFetch:
+    """Tests for the streamed plain-HTTP fetch."""
+
+    @pytest.mark.asyncio
+    async def test_non_html_body_not_read(self):
+        body = _Body(chunks=50)
+        async with _client(body, "application/pdf") as client:
+            page = await _fetch_static(client, "https://example.com/doc.pdf")
+
+        assert page.content_type == "application/pdf"
+        assert page.html == ""
+        assert body.read == 0
+
+    @pytest.mark.asyncio
+    async def test_html_body_capped(self):
+        body = _Body(chunks=50)
+        with patch("aden_tools.tools.web_scrape_tool.web_scrape_tool.MAX_STATIC_BYTES", 2500):
+            async with _client(body, "text/html; charset=utf-8") as client:
+                page = await _fetch_static(client, "https://example.com")
+
+        assert len(page.html) == 2500
+        assert body.read == 3
+
+
+class TestBrowserPool:
+    """Tests for the shared browser pool."""
+
+    @pytest.mark.asyncio
+    async def test_default_pool_closed_on_shutdown(self, mcp):
+        with patch.object(BrowserPool, "close", AsyncMock()) as close:
+            register_tools(mcp)
+            await shutdown.run_shutdown_hooks()
+
+        close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_browser_launched_once_and_contexts_reused(self, mock_pw, mock_stealth, mcp):
+        mock_cm, _, page = _make_playwright_mocks(_LONG_HTML, final_url="https://example.com")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+        pool = BrowserPool()
+        register_tools(mcp, pool=pool)
+        web_scrape = mcp._tool_manager._tools["web_scrape"].fn
+
+        for _ in range(3):
+            assert "error" not in await web_scrape(url="https://example.com")
+
+        assert pool.launches == 1
+        browser = mock_cm.__aenter__.return_value.chromium.launch.return_value
+        assert browser.new_context.await_count == 1
+        assert page.close.await_count == 3
+        await pool.close()
+        browser.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_idle_browser_evicted(self, mock_pw, mock_stealth, mcp):
+        mock_cm, _, _ = _make_playwright_mocks(_LONG_HTML, final_url="https://example.com")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+        pool = BrowserPool(idle_timeout=0.05)
+        register_tools(mcp, pool=pool)
+        web_scrape = mcp._tool_manager._tools["web_scrape"].fn
+
+        await web_scrape(url="https://example.com")
+        assert pool.browser_running
+        await asyncio.sleep(0.2)
+        assert not pool.browser_running
+
+        await web_scrape(url="https://example.com")
+        assert pool.launches == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    @patch(_PW_PATH)
+    async def test_eviction_skipped_when_render_acquires_context(self, mock_pw):
+        mock_cm, _, _ = _make_playwright_mocks(_LONG_HTML, final_url="https://example.com")
+        mock_pw.return_value = mock_cm
+        pool = BrowserPool(idle_timeout=60)
+        context = await pool._acquire_context()
+        pool._release_context(context)
+
+        # Eviction fires with no open pages, but a render takes the idle
+        # context before the scheduled close runs
+        pool._evict_if_idle()
+        acquired = await pool._acquire_context()
+        await asyncio.sleep(0)
+
+        assert acquired is context
+        assert pool.browser_running
+        context.close.assert_not_awaited()
+        pool._release_context(acquired)
+        await pool.close()
+        assert not pool.browser_running
+
+    @pytest.mark.asyncio
+    async def test_per_domain_limit(self):
+        pool = BrowserPool(per_domain_limit=2)
+        assert pool.domain_slot("https://a.com/x") is pool.domain_slot("https://a.com/y")
+        assert pool.domain_slot("https://a.com/x") is not pool.domain_slot("https://b.com/")
+
+
+class TestWebScrapeMany:
+    """Tests for the batch entry point."""
+
+    @pytest.fixture
+    def web_scrape_many_fn(self, mcp: FastMCP):
+        register_tools(mcp)
+        return mcp._tool_manager._tools["web_scrape_many"].fn
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self, no_static_fetch, web_scrape_many_fn):
+        async def fetch(client, url):
+            await asyncio.sleep(0.01 if url.endswith("a") else 0)
+            if url.endswith("missing"):
+                return _static_page("", status=404)
+            return _Page(200, url, "text/html", _LONG_HTML)
+
+        no_static_fetch.side_effect = fetch
+
+        result = await web_scrape_many_fn(
+            urls=["https://x.com/a", "https://y.com/missing", "https://z.com/c"]
+        )
+
+        assert [r.get("url") for r in result["results"]] == [
+            "https://x.com/a",
+            None,
+            "https://z.com/c",
+        ]
+        assert result["succeeded"] == 2
+        assert result["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_empty_and_oversized_batches(self, web_scrape_many_fn):
+        assert "error" in await web_scrape_many_fn(urls=[])
+        assert "error" in await web_scrape_many_fn(urls=["https://a.com"] * 51)